@@ -166,6 +166,13 @@ class EmailHunter:
         print(f"\n[+] Found/Generated {len(self.emails)} potential email addresses")
         return list(self.emails)
 
+def run(domain, company_name):
+    """
+    Structured entry point
+    Returns: Sorted list of found/generated email addresses
+    """
+    return sorted(EmailHunter(domain, company_name).run_full_enumeration())
+
 # Usage
 if __name__ == "__main__":
     if len(sys.argv) != 3:
@@ -6,10 +6,11 @@ from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 
 class GoogleDorker:
-    def __init__(self, domain, delay=2):
+    def __init__(self, domain, delay=2, session=None):
         self.domain = domain
         self.delay = delay  # Delay between requests to avoid rate limiting
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        self.session = session or requests.Session()
         self.results = []
     
     def build_dork(self, dork_type):
@@ -42,7 +43,7 @@ class GoogleDorker:
         headers = {'User-Agent': self.user_agent}
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             soup = BeautifulSoup(response.text, 'html.parser')
             
             # Parse search results
@@ -121,6 +122,13 @@ class GoogleDorker:
                 else:
                     f.write("No results found\n\n")
 
+def run(domain, delay=2, session=None):
+    """
+    Structured entry point
+    Returns: Dict of dork type -> list of {'title', 'url'}
+    """
+    return GoogleDorker(domain, delay=delay, session=session).run_all_dorks()
+
 # Usage
 if __name__ == "__main__":
     if len(sys.argv) != 2:
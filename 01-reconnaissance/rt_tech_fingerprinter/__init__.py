@@ -5,6 +5,6 @@ Tech Fingerprinter - Modular Version
 __version__ = '2.0.0'
 __author__ = 'Red Team Toolkit'
 
-from .core import TechFingerprinter
+from .core import TechFingerprinter, fingerprint
 from .analyzers import *
 from .utils import *
\ No newline at end of file
@@ -1,2 +1,2 @@
 from .http_client import HTTPClient
-from .fingerprinter import TechFingerprinter
\ No newline at end of file
+from .fingerprinter import TechFingerprinter, fingerprint
\ No newline at end of file
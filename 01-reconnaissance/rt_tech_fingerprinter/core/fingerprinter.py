@@ -3,7 +3,7 @@
 Main fingerprinting orchestrator
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..core.http_client import HTTPClient
 from ..analyzers import (
     HeaderAnalyzer,
@@ -17,9 +17,9 @@ from ..utils.output import OutputFormatter
 class TechFingerprinter:
     """Orchestrate technology fingerprinting"""
     
-    def __init__(self, url: str):
+    def __init__(self, url: str, session: Optional[Any] = None):
         self.url = url if url.startswith('http') else f'https://{url}'
-        self.http_client = HTTPClient(self.url)
+        self.http_client = HTTPClient(self.url, session)
         self.technologies = {}
     
     def run_fingerprint(self) -> Dict[str, Any]:
@@ -89,4 +89,17 @@ class TechFingerprinter:
         elif format == 'markdown':
             filename = f'{base_filename}_fingerprint.md'
             OutputFormatter.export_markdown(self.technologies, filename)
-            print(f"\n[+] Results saved to: {filename}")
\ No newline at end of file
+            print(f"\n[+] Results saved to: {filename}")
+
+def fingerprint(url: str, session: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    Structured entry point
+    
+    Args:
+        url: Target URL or domain
+        session: Optional requests.Session to reuse
+        
+    Returns:
+        Dictionary of detected technologies
+    """
+    return TechFingerprinter(url, session).run_fingerprint()
@@ -10,12 +10,15 @@ from ..config.settings import REQUEST_TIMEOUT
 class HTTPClient:
     """Handle HTTP requests with proper error handling"""
     
-    def __init__(self, url: str):
+    def __init__(self, url: str, session: Optional[requests.Session] = None):
         self.url = url if url.startswith('http') else f'https://{url}'
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        self.session = session
+        self._main_response = None
     
     def get(self, path: str = '', timeout: int = REQUEST_TIMEOUT) -> Optional[requests.Response]:
         """
@@ -55,17 +58,23 @@ class HTTPClient:
         except requests.RequestException:
             return None
     
+    def get_main(self) -> Optional[requests.Response]:
+        """Main URL response, fetched once and shared by the analyzers"""
+        if self._main_response is None:
+            self._main_response = self.get()
+        return self._main_response
+    
     def get_headers(self) -> Dict[str, str]:
         """Get response headers from main URL"""
-        response = self.get()
+        response = self.get_main()
         return dict(response.headers) if response else {}
     
     def get_cookies(self) -> Dict[str, str]:
         """Get cookies from main URL"""
-        response = self.get()
+        response = self.get_main()
         return dict(response.cookies) if response else {}
     
     def get_html(self) -> str:
         """Get HTML content from main URL"""
-        response = self.get()
+        response = self.get_main()
         return response.text if response else ""
\ No newline at end of file
@@ -2,26 +2,26 @@
 import dns.resolver
 import sys
 
-def enumerate_subdomains(domain, wordlist):
+def run(domain, wordlist, resolver=None):
     """
-    Enumerate subdomains using DNS queries
+    Structured entry point: resolve <word>.<domain> for each wordlist entry
+    Returns: List of {'subdomain': name, 'addresses': [ip, ...]}
     """
-    found_subdomains = []
+    resolver = resolver or dns.resolver.get_default_resolver()
+    found = []
     
     with open(wordlist, 'r') as f:
-        subdomains = f.read().splitlines()
-    
-    print(f"[*] Starting subdomain enumeration for {domain}")
-    print(f"[*] Testing {len(subdomains)} subdomains...\n")
+        subdomains = [line.strip() for line in f if line.strip()]
     
     for subdomain in subdomains:
         test_domain = f"{subdomain}.{domain}"
         try:
             # Try to resolve the subdomain
-            answers = dns.resolver.resolve(test_domain, 'A')
-            for rdata in answers:
-                print(f"[+] Found: {test_domain} -> {rdata}")
-                found_subdomains.append(test_domain)
+            answers = resolver.resolve(test_domain, 'A')
+            found.append({
+                'subdomain': test_domain,
+                'addresses': [str(rdata) for rdata in answers]
+            })
         except dns.resolver.NXDOMAIN:
             # Subdomain doesn't exist
             pass
@@ -32,6 +32,21 @@ def enumerate_subdomains(domain, wordlist):
             # Other DNS errors
             pass
     
+    return found
+
+def enumerate_subdomains(domain, wordlist):
+    """
+    Enumerate subdomains using DNS queries
+    """
+    print(f"[*] Starting subdomain enumeration for {domain}")
+    print(f"[*] Testing {wordlist}...\n")
+    
+    found_subdomains = []
+    for record in run(domain, wordlist):
+        for address in record['addresses']:
+            print(f"[+] Found: {record['subdomain']} -> {address}")
+        found_subdomains.append(record['subdomain'])
+    
     return found_subdomains
 
 if __name__ == "__main__":
@@ -85,6 +85,16 @@ class AdvancedObfuscator:
         print(f"[+] Obfuscated payload saved: {output_file}")
         print("\n[!] Note: Test against target AV before deployment")
         print("[!] Signatures change frequently")
+        
+        return output_file
+
+def run(input_file, output_file=None, include_bypasses=True):
+    """
+    Structured entry point
+    Returns: Path of the obfuscated loader
+    """
+    output_file = output_file or input_file.replace('.ps1', '_obfuscated.ps1')
+    return AdvancedObfuscator().obfuscate_file(input_file, output_file, include_bypasses)
 
 def main():
     if len(sys.argv) < 2:
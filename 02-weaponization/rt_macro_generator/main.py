@@ -18,7 +18,7 @@ class MacroGenerator:
         """Generate URL-based macros"""
         if not self.payload_url:
             print("[-] No payload URL provided")
-            return
+            return []
         
         os.makedirs(output_dir, exist_ok=True)
         
@@ -41,12 +41,14 @@ class MacroGenerator:
         with open(file2, 'w') as f:
             f.write(macro2)
         print(f"[+] Generated: {file2}")
+        
+        return [file1, file2]
     
     def generate_command_based(self, output_dir='macros'):
         """Generate command-based macros"""
         if not self.payload_command:
             print("[-] No command provided")
-            return
+            return []
         
         os.makedirs(output_dir, exist_ok=True)
         
@@ -69,6 +71,8 @@ class MacroGenerator:
         with open(file2, 'w') as f:
             f.write(macro2)
         print(f"[+] Generated: {file2}")
+        
+        return [file1, file2]
     
     def print_usage_instructions(self):
         """Print instructions for using generated macros"""
@@ -81,6 +85,19 @@ class MacroGenerator:
         print("\n[!] Test against target AV before deployment")
         print("[!] For authorized testing only")
 
+def run(payload_url=None, payload_command=None, output_dir='macros'):
+    """
+    Structured entry point
+    Returns: List of generated macro paths
+    """
+    generator = MacroGenerator(payload_url=payload_url, payload_command=payload_command)
+    generated = []
+    if payload_url:
+        generated += generator.generate_url_based(output_dir)
+    if payload_command:
+        generated += generator.generate_command_based(output_dir)
+    return generated
+
 def main():
     if len(sys.argv) < 2:
         print("=" * 60)
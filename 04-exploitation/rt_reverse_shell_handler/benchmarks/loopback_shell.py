@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Communicator benchmark over a loopback reverse shell.
+
+A local /bin/sh is connected back to a listener on 127.0.0.1 (stdin,
+stdout and stderr on the socket, as with a real reverse shell), then the
+same recon commands are run three ways: timeout-based reads, framed
+commands one at a time, and one pipelined framed batch. Outputs of the
+framed modes are checked against each other.
+
+Examples (from 04-exploitation/):
+    python -m rt_reverse_shell_handler.benchmarks.loopback_shell
+    python -m rt_reverse_shell_handler.benchmarks.loopback_shell --timeout 2 --repeat 5
+"""
+
+import argparse
+import socket
+import subprocess
+import time
+
+from ..config import SHELL_ID_COMMANDS
+from ..shell.communicator import Communicator
+
+COMMANDS = list(SHELL_ID_COMMANDS.values()) + [
+    'hostname',
+    'uname -r',
+    'uname -m',
+    'cat /etc/os-release 2>/dev/null || cat /etc/issue',
+    'ls -la /',
+    'seq 1 20000',   # ~100KB of output
+]
+
+
+def connect_shell():
+    """(communicator socket, shell process) for a fresh loopback reverse shell"""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+
+    victim = socket.create_connection(server.getsockname())
+    shell = subprocess.Popen(['/bin/sh'], stdin=victim, stdout=victim, stderr=victim)
+    victim.close()
+
+    client, _ = server.accept()
+    server.close()
+    return client, shell
+
+
+def run_mode(label, framed, batched, timeout, repeat):
+    client, shell = connect_shell()
+    communicator = Communicator(client, framed=framed)
+
+    latencies = []
+    outputs = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        if batched:
+            start = time.perf_counter()
+            outputs = communicator.execute_batch(COMMANDS, timeout)
+            latencies.append((time.perf_counter() - start) / len(COMMANDS))
+        else:
+            outputs = []
+            for command in COMMANDS:
+                start = time.perf_counter()
+                outputs.append(communicator.execute_command(command, timeout))
+                latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    client.close()
+    shell.wait(timeout=5)
+
+    latencies.sort()
+    print(f"{label:<22}{len(COMMANDS) * repeat:>9}{latencies[len(latencies) // 2] * 1000:>10.1f}"
+          f"{latencies[-1] * 1000:>10.1f}{elapsed:>10.2f}")
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reverse shell communicator loopback benchmark")
+    parser.add_argument('--timeout', type=float, default=0.5,
+                        help='Per-command timeout (the floor for timeout-based reads)')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the command list')
+    args = parser.parse_args()
+
+    print(f"[*] {len(COMMANDS)} commands x {args.repeat}, timeout {args.timeout}s\n")
+    print(f"{'Mode':<22}{'commands':>9}{'p50 ms':>10}{'max ms':>10}{'total s':>10}")
+
+    run_mode('timeout reads', False, False, args.timeout, args.repeat)
+    single = run_mode('framed', True, False, args.timeout, args.repeat)
+    batch = run_mode('framed, pipelined', True, True, args.timeout, args.repeat)
+
+    print(f"\n[{'+' if single == batch else '-'}] Framed outputs "
+          f"{'match' if single == batch else 'DIFFER'}")
+
+
+if __name__ == '__main__':
+    main()
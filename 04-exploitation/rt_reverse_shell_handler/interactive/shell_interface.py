@@ -3,30 +3,36 @@
 class ShellInterface:
     """Interactive shell interface with special commands"""
     
-    def __init__(self, communicator, upgrader, situational_awareness):
+    def __init__(self, communicator, upgrader, situational_awareness, background=False, prompt="shell> "):
+        """background: Offer !bg to leave the session open and return to the caller"""
         self.communicator = communicator
         self.upgrader = upgrader
         self.situational_awareness = situational_awareness
+        self.background = background
+        self.prompt = prompt
     
     def start(self):
-        """Start interactive shell session"""
+        """
+        Start interactive shell session
+        Returns: True if the session was backgrounded (still open), else False
+        """
         print("\n" + "=" * 60)
         print("INTERACTIVE REVERSE SHELL")
         print("=" * 60)
         print("Commands:")
-        print("  !upgrade  - Upgrade to PTY")
-        print("  !info     - Run situational awareness")
-        print("  !help     - Show this help")
-        print("  !exit     - Close connection")
+        self._print_commands()
         print("-" * 60 + "\n")
         
         while True:
             try:
-                command = input("shell> ")
+                command = input(self.prompt)
                 
                 if command == '!exit':
                     print("[*] Closing connection...")
                     break
+                elif command == '!bg' and self.background:
+                    print("[*] Session moved to background")
+                    return True
                 elif command == '!help':
                     self._show_help()
                     continue
@@ -53,11 +59,19 @@ class ShellInterface:
             except Exception as e:
                 print(f"[-] Error: {e}")
                 break
+        
+        return False
     
-    def _show_help(self):
-        """Show help message"""
-        print("\nCommands:")
+    def _print_commands(self):
         print("  !upgrade  - Upgrade to PTY")
         print("  !info     - Run situational awareness")
         print("  !help     - Show this help")
-        print("  !exit     - Close connection\n")
\ No newline at end of file
+        if self.background:
+            print("  !bg       - Background this session")
+        print("  !exit     - Close connection")
+    
+    def _show_help(self):
+        """Show help message"""
+        print("\nCommands:")
+        self._print_commands()
+        print()
\ No newline at end of file
@@ -1,17 +1,22 @@
 """Main entry point for reverse shell handler"""
 
 import argparse
-from .handler import ReverseShellHandler
+from .handler import ReverseShellHandler, MultiSessionHandler
 from .config import DEFAULT_LHOST, DEFAULT_LPORT
 
 def main():
     parser = argparse.ArgumentParser(description="Reverse Shell Handler")
     parser.add_argument('--lhost', default=DEFAULT_LHOST, help='Listen host')
     parser.add_argument('--lport', type=int, default=DEFAULT_LPORT, help='Listen port')
+    parser.add_argument('--framed', action='store_true',
+                        help='Frame commands with markers (POSIX shells): no per-command timeout wait')
+    parser.add_argument('--multi', action='store_true',
+                        help='Accept many sessions and manage them from a console')
     
     args = parser.parse_args()
     
-    handler = ReverseShellHandler(args.lhost, args.lport)
+    handler_class = MultiSessionHandler if args.multi else ReverseShellHandler
+    handler = handler_class(args.lhost, args.lport, framed=args.framed)
     handler.run()
 
 if __name__ == "__main__":
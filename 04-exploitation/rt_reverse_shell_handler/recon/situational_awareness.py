@@ -14,12 +14,20 @@ class SituationalAwareness:
         print("SITUATIONAL AWARENESS")
         print("=" * 60 + "\n")
         
-        for description, command in RECON_COMMANDS.items():
+        self.print_results(self.collect())
+    
+    def collect(self, commands=RECON_COMMANDS, timeout=5):
+        """Run recon commands without printing; returns {description: output}"""
+        # Sent as one batch: pipelined in a single round-trip in framed mode
+        outputs = self.communicator.execute_batch(list(commands.values()), timeout=timeout)
+        return dict(zip(commands, outputs))
+    
+    def print_results(self, results):
+        """Print collected recon output"""
+        for description, output in results.items():
             print(f"\n[*] {description}:")
             print("-" * 40)
             
-            output = self.communicator.execute_command(command, timeout=5)
-            
             if output:
                 self._print_output(output)
             else:
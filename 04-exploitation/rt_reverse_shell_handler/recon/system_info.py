@@ -12,23 +12,29 @@ class SystemInfo:
         """Determine what type of shell we have"""
         print("[*] Identifying shell type...")
         
+        # One batch (a single round-trip in framed mode)
+        results = dict(zip(
+            SHELL_ID_COMMANDS,
+            self.communicator.execute_batch(list(SHELL_ID_COMMANDS.values()))
+        ))
+        
         # Check OS
-        os_info = self.communicator.execute_command(SHELL_ID_COMMANDS['os'])
+        os_info = results['os']
         if os_info:
             print(f"[+] OS Info:\n{os_info}")
         
         # Check user
-        user = self.communicator.execute_command(SHELL_ID_COMMANDS['user'])
+        user = results['user']
         if user:
             print(f"[+] User: {user.strip()}")
         
         # Check privileges
-        id_info = self.communicator.execute_command(SHELL_ID_COMMANDS['id'])
+        id_info = results['id']
         if id_info:
             print(f"[+] ID: {id_info.strip()}")
         
         # Check sudo
-        sudo_info = self.communicator.execute_command(SHELL_ID_COMMANDS['sudo'])
+        sudo_info = results['sudo']
         if sudo_info and 'may run' in sudo_info:
             print(f"[+] Sudo privileges: YES")
             print(f"{sudo_info}")
@@ -36,6 +42,6 @@ class SystemInfo:
             print(f"[+] Sudo privileges: NO")
         
         # Check shell
-        shell = self.communicator.execute_command(SHELL_ID_COMMANDS['shell'])
+        shell = results['shell']
         if shell:
             print(f"[+] Shell: {shell.strip()}")
\ No newline at end of file
@@ -1,42 +1,162 @@
 """Handle communication with remote shell"""
 
+import secrets
 import socket
+import time
 from ..config import SOCKET_TIMEOUT, RECV_BUFFER_SIZE
 
+QUICKACK = hasattr(socket, 'TCP_QUICKACK')  # Linux only
+
 class Communicator:
-    """Send commands and receive output from remote shell"""
-    
-    def __init__(self, client_socket):
+    """
+    Send commands and receive output from remote shell
+
+    Default mode reads until the socket goes quiet for `timeout` seconds,
+    which works with any shell but costs the full timeout per command.
+
+    Framed mode (POSIX shells) wraps each command in unique begin/end
+    markers and returns as soon as the end marker arrives. Markers are
+    printed with printf so the echoed command line never contains them.
+    Several commands can be sent in one write and their output collected
+    in order (execute_batch); a command that reads stdin or the tty
+    (sudo's password prompt after a PTY upgrade) would swallow the ones
+    queued behind it, so batched commands must be non-interactive.
+    """
+
+    BEGIN = 'RTB_'
+    END = 'RTE_'
+
+    def __init__(self, client_socket, framed=False):
         self.client_socket = client_socket
-    
+        self.framed = framed
+        self._buffer = bytearray()
+        self._chunk = bytearray(RECV_BUFFER_SIZE)
+
     def send_command(self, command):
         """Send command to remote shell"""
         try:
-            self.client_socket.send(command.encode() + b'\n')
+            self.client_socket.sendall(command.encode() + b'\n')
             return True
         except:
             return False
-    
+
+    def _recv(self):
+        """Append one recv() into the buffer; returns bytes read (0 = closed)"""
+        if QUICKACK:
+            # Shells write output in small pieces; a delayed ACK stalls each
+            # one behind the sender's Nagle timer (~40ms per command)
+            self.client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        view = memoryview(self._chunk)
+        count = self.client_socket.recv_into(view)
+        self._buffer += view[:count]
+        return count
+
     def receive_output(self, timeout=SOCKET_TIMEOUT):
         """Receive output from remote shell"""
         self.client_socket.settimeout(timeout)
-        output = b''
-        
+
         try:
-            while True:
-                chunk = self.client_socket.recv(RECV_BUFFER_SIZE)
-                if not chunk:
-                    break
-                output += chunk
+            while self._recv():
+                pass
         except socket.timeout:
             pass
         except:
             return None
-        
+
+        output = self._buffer.decode(errors='ignore')
+        self._buffer.clear()
+        return output
+
+    def _frame(self, command, tag):
+        """Command line wrapped in begin/end markers for tag"""
+        return (f"printf '{self.BEGIN}%s\\n' {tag}\n"
+                f"{command}\n"
+                f"printf '\\n{self.END}%s\\n' {tag}")
+
+    def _wait_for(self, marker, deadline):
+        """
+        Read until marker is in the buffer; returns its offset or -1 on
+        timeout. Only the newly received tail is searched each time.
+        """
+        start = 0
+        while True:
+            offset = self._buffer.find(marker, start)
+            if offset != -1:
+                return offset
+            start = max(0, len(self._buffer) - len(marker) + 1)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return -1
+            self.client_socket.settimeout(remaining)
+            try:
+                if not self._recv():
+                    raise ConnectionError("Connection closed")
+            except socket.timeout:
+                return -1
+
+    def _receive_framed(self, tag, timeout):
+        """Output between tag's markers (None if the connection dropped)"""
+        begin = f"{self.BEGIN}{tag}".encode()
+        end = f"{self.END}{tag}".encode()
+        deadline = time.monotonic() + timeout
+
+        try:
+            offset = self._wait_for(begin, deadline)
+            if offset == -1:
+                return ''
+            # Anything before the begin marker is echo/prompt/stale output
+            del self._buffer[:offset + len(begin)]
+
+            offset = self._wait_for(end, deadline)
+        except (ConnectionError, OSError):
+            return None
+
+        if offset == -1:
+            # Timed out mid-command: hand back what arrived so far
+            output = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            output = bytes(self._buffer[:offset])
+            # Later responses of a pipelined batch stay buffered
+            del self._buffer[:offset + len(end)]
+            # Drop the newline printed before the end marker (\r\n under a PTY)
+            output = output[:-1] if output.endswith(b'\n') else output
+            output = output[:-1] if output.endswith(b'\r') else output
+
+        # ...and the one ending the begin marker line
+        for newline in (b'\r\n', b'\n'):
+            if output.startswith(newline):
+                output = output[len(newline):]
+                break
         return output.decode(errors='ignore')
-    
+
     def execute_command(self, command, timeout=SOCKET_TIMEOUT):
         """Execute command and return output"""
-        if not self.send_command(command):
-            return None
-        return self.receive_output(timeout)
\ No newline at end of file
+        if not self.framed:
+            if not self.send_command(command):
+                return None
+            return self.receive_output(timeout)
+        return self.execute_batch([command], timeout)[0]
+
+    def execute_batch(self, commands, timeout=SOCKET_TIMEOUT):
+        """
+        Execute several commands, returning their outputs in order.
+        Framed mode sends them in one write; timeout applies per command.
+        """
+        if not self.framed:
+            return [self.execute_command(command, timeout) for command in commands]
+
+        tags = [secrets.token_hex(8) for _ in commands]
+        script = '\n'.join(self._frame(command, tag) for command, tag in zip(commands, tags))
+        if not self.send_command(script):
+            return [None] * len(commands)
+
+        outputs = []
+        for tag in tags:
+            output = self._receive_framed(tag, timeout)
+            outputs.append(output)
+            if output is None:
+                outputs.extend([None] * (len(commands) - len(outputs)))
+                break
+        return outputs
@@ -1,8 +1,11 @@
 """Socket listener for incoming connections"""
 
+import selectors
 import socket
+import threading
 from datetime import datetime
-from ..config import SOCKET_TIMEOUT
+from ..config import SOCKET_TIMEOUT, RECV_BUFFER_SIZE, SESSION_BACKLOG, RING_BUFFER_SIZE
+from .session import Session
 
 class Listener:
     """Listen for incoming reverse shell connections"""
@@ -44,4 +47,124 @@ class Listener:
     def close(self):
         """Close the connection"""
         if self.client_socket:
-            self.client_socket.close()
\ No newline at end of file
+            self.client_socket.close()
+
+class MultiListener:
+    """
+    Accept and multiplex many reverse shell connections.
+
+    A single selectors event loop (background thread) accepts new
+    connections and reads every session's socket as data arrives, so
+    sessions keep filling their output rings while the operator works in
+    another one. Sessions are handed out as Session objects.
+    """
+    
+    def __init__(self, lhost, lport, ring_size=RING_BUFFER_SIZE, on_session=None, quiet=False):
+        self.lhost = lhost
+        self.lport = lport
+        self.ring_size = ring_size
+        self.on_session = on_session
+        self.quiet = quiet
+        self.sessions = {}
+        self.server_socket = None
+        
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._stop = threading.Event()
+        self._thread = None
+        self._chunk = bytearray(RECV_BUFFER_SIZE)
+    
+    def start(self):
+        """Bind and start the event loop; returns False on error"""
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        
+        try:
+            server_socket.bind((self.lhost, self.lport))
+            server_socket.listen(SESSION_BACKLOG)
+        except Exception as e:
+            print(f"[-] Error starting listener: {e}")
+            server_socket.close()
+            return False
+        
+        server_socket.setblocking(False)
+        self.server_socket = server_socket
+        self.lport = server_socket.getsockname()[1]
+        self._selector.register(server_socket, selectors.EVENT_READ, None)
+        
+        self._thread = threading.Thread(target=self._loop, name="listener", daemon=True)
+        self._thread.start()
+        
+        if not self.quiet:
+            print(f"[*] Listening on {self.lhost}:{self.lport} (multi-session)")
+            print(f"[*] Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        return True
+    
+    def _loop(self):
+        while not self._stop.is_set():
+            for key, _ in self._selector.select(timeout=0.5):
+                if key.data is None:
+                    self._accept()
+                else:
+                    self._read(key.data)
+    
+    def _accept(self):
+        try:
+            client_socket, client_address = self.server_socket.accept()
+        except (BlockingIOError, OSError):
+            return
+        # Reads only happen once select() reports data, so the socket can stay
+        # blocking for the operator's sendall()
+        client_socket.setblocking(True)
+        
+        with self._lock:
+            session = Session(self._next_id, client_socket, client_address, self.ring_size)
+            self.sessions[session.id] = session
+            self._next_id += 1
+        self._selector.register(client_socket, selectors.EVENT_READ, session)
+        
+        if not self.quiet:
+            print(f"\n[+] Session {session.id} opened from {session} "
+                  f"({datetime.now().strftime('%H:%M:%S')})")
+        if self.on_session:
+            self.on_session(session)
+    
+    def _read(self, session):
+        try:
+            count = session.socket.recv_into(self._chunk)
+        except OSError:
+            count = 0
+        
+        if count:
+            session.feed(memoryview(self._chunk)[:count])
+            return
+        
+        self._selector.unregister(session.socket)
+        session.socket.close()
+        session.mark_closed()
+        if not self.quiet:
+            print(f"\n[-] Session {session.id} ({session}) closed")
+    
+    def get(self, session_id):
+        with self._lock:
+            return self.sessions.get(session_id)
+    
+    def all_sessions(self):
+        with self._lock:
+            return list(self.sessions.values())
+    
+    def alive_sessions(self):
+        with self._lock:
+            return [s for s in self.sessions.values() if s.alive]
+    
+    def close(self):
+        """Stop the event loop and close every session"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()
+            if key.data is not None:
+                key.data.mark_closed()
+        self._selector.close()
@@ -0,0 +1,98 @@
+"""Reverse shell sessions multiplexed by MultiListener"""
+
+import socket
+import threading
+import time
+from ..config import RING_BUFFER_SIZE, SESSION_INBOX_LIMIT
+
+class RingBuffer:
+    """Last `size` bytes written to it"""
+
+    def __init__(self, size=RING_BUFFER_SIZE):
+        self.size = size
+        self.total = 0
+        self._data = bytearray()
+
+    def write(self, data):
+        self._data += data
+        self.total += len(data)
+        overflow = len(self._data) - self.size
+        if overflow > 0:
+            del self._data[:overflow]
+
+    def read(self):
+        return bytes(self._data)
+
+class Session:
+    """
+    One reverse shell connection owned by the listener's event loop.
+
+    The loop feeds received bytes into the session's output ring (history,
+    kept while the session is in the background) and its inbox. The inbox
+    is read through the small socket interface Communicator uses
+    (sendall/recv_into/settimeout/setsockopt), so a Communicator can drive
+    a session exactly like a plain socket.
+    """
+
+    def __init__(self, session_id, client_socket, address, ring_size=RING_BUFFER_SIZE):
+        self.id = session_id
+        self.socket = client_socket
+        self.address = address
+        self.opened = time.time()
+        self.last_seen = self.opened
+        self.alive = True
+        self.output = RingBuffer(ring_size)
+        self.communicator = None
+
+        self._inbox = bytearray()
+        self._cond = threading.Condition()
+        self._timeout = None
+
+    def __str__(self):
+        return f"{self.address[0]}:{self.address[1]}"
+
+    # Called from the event loop
+
+    def feed(self, data):
+        with self._cond:
+            self.output.write(data)
+            self._inbox += data
+            overflow = len(self._inbox) - SESSION_INBOX_LIMIT
+            if overflow > 0:
+                # Nobody is reading: keep the newest output only
+                del self._inbox[:overflow]
+            self.last_seen = time.time()
+            self._cond.notify_all()
+
+    def mark_closed(self):
+        with self._cond:
+            self.alive = False
+            self._cond.notify_all()
+
+    # Socket interface for Communicator
+
+    def settimeout(self, timeout):
+        self._timeout = timeout
+
+    def setsockopt(self, *args):
+        self.socket.setsockopt(*args)
+
+    def sendall(self, data):
+        self.socket.sendall(data)
+
+    def recv_into(self, buffer):
+        """Move inbox bytes into buffer; 0 once closed and drained, socket.timeout if idle"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._inbox or not self.alive, self._timeout):
+                raise socket.timeout("timed out")
+            count = min(len(buffer), len(self._inbox))
+            buffer[:count] = self._inbox[:count]
+            del self._inbox[:count]
+            return count
+
+    def close(self):
+        """Ask the event loop to drop the session (it sees EOF)"""
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
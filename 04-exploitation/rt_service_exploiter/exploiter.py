@@ -19,12 +19,24 @@ class ServiceExploiter:
     def __init__(self, target, port=None):
         self.target = target
         self.port = port
+        self.open_ports = []
         self.results = []
     
     def run_full_exploitation(self):
         """
         Scan and exploit all services
         """
+        self.exploit()
+        
+        # Generate report
+        if self.open_ports:
+            report_gen = ReportGenerator(self.target)
+            report_gen.generate_report(self.results)
+    
+    def exploit(self):
+        """
+        Scan and exploit all services, returning the successful results
+        """
         print(f"[*] Service Exploitation Framework")
         print(f"[*] Target: {self.target}")
         print("=" * 60 + "\n")
@@ -35,10 +47,11 @@ class ServiceExploiter:
         else:
             scanner = PortScanner(self.target)
             open_ports = scanner.scan()
+        self.open_ports = open_ports
         
         if not open_ports:
             print("\n[-] No open ports found")
-            return
+            return self.results
         
         print(f"\n[*] Found {len(open_ports)} open ports")
         print("[*] Beginning exploitation attempts...\n")
@@ -65,6 +78,12 @@ class ServiceExploiter:
                 except Exception as e:
                     print(f"    [-] Error exploiting port {port}: {e}")
         
-        # Generate report
-        report_gen = ReportGenerator(self.target)
-        report_gen.generate_report(self.results)
\ No newline at end of file
+        return self.results
+
+
+def run(target, port=None):
+    """
+    Structured entry point
+    Returns: List of successful exploitation result dicts
+    """
+    return ServiceExploiter(target, port).exploit()
\ No newline at end of file
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Scan engine benchmark against a local stub HTTP server.
+
+The stub serves N endpoints with query parameters on 127.0.0.1, adds a
+fixed latency to every response, and makes a known subset vulnerable
+(SQL error page on a quote, unencoded reflection, /etc/passwd contents). The
+same URL list is scanned once sequentially and once with the worker
+pool; the findings must match.
+
+Examples (from 04-exploitation/):
+    python -m rt_vulnerability_scanner.benchmarks.stub_scan
+    python -m rt_vulnerability_scanner.benchmarks.stub_scan --endpoints 200 --workers 32 --rate 0
+"""
+
+import argparse
+import socket
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from ..checks import sql_injection, xss, lfi, rce
+from ..engine import ScanEngine
+from ..scanner import print_detection_metrics
+from ..utils.rate_limiter import HostRateLimiter
+from ..utils.request_handler import RequestHandler
+
+CHECKS = [sql_injection.CHECK, xss.CHECK, lfi.CHECK, rce.CHECK]
+
+
+def make_handler(latency):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            parsed = urlparse(self.path)
+            n = int(parsed.path.rsplit('/', 1)[-1] or 0)
+            value = ' '.join(v for values in parse_qs(parsed.query).values() for v in values)
+
+            body = f"<html><body>Item {n}</body></html>"
+            if n % 10 == 1 and "'" in value:
+                # Served as 200: the checks skip 4xx/5xx pages
+                body = "You have an error in your SQL syntax; check the manual for MySQL"
+            elif n % 10 == 2:
+                body = f"<html><body>Search: {value}</body></html>"
+            elif n % 10 == 3 and 'passwd' in value:
+                body = "root:x:0:0:root:/root:/bin/bash\n"
+
+            data = body.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return StubHandler
+
+
+def scan(urls, workers, rate):
+    limiter = HostRateLimiter(rate, 5) if rate else None
+    handler = RequestHandler(rate_limiter=limiter, pool_size=workers)
+    engine = ScanEngine(handler, CHECKS, workers=workers, progress=False)
+    started = time.perf_counter()
+    findings = engine.run(urls)
+    return findings, time.perf_counter() - started, handler.requests_sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan engine benchmark against a local stub server")
+    parser.add_argument('--endpoints', type=int, default=100)
+    parser.add_argument('--params', type=int, default=2, help='Query parameters per endpoint')
+    parser.add_argument('--latency', type=float, default=0.01, help='Server response delay (seconds)')
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--rate', type=float, default=0, help='Requests/second per host (0 = unlimited)')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    query = '&'.join(f'p{i}=1' for i in range(args.params))
+    urls = [f'{base}/item/{n}?{query}' for n in range(args.endpoints)]
+
+    results = {}
+    for label, workers in (('sequential', 1), (f'{args.workers} workers', args.workers)):
+        print(f"\n[*] {label}")
+        findings, seconds, sent = scan(urls, workers, args.rate)
+        results[label] = findings
+        print(f"    {len(findings)} findings, {sent} requests in {seconds:.2f}s ({sent / seconds:.0f} req/s)")
+
+    server.shutdown()
+    print_detection_metrics()
+
+    signature = lambda findings: sorted((f['type'], f['url'], f['parameter']) for f in findings)
+    first, second = results.values()
+    print(f"\n[{'+' if signature(first) == signature(second) else '-'}] Findings "
+          f"{'match' if signature(first) == signature(second) else 'DIFFER'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Shared logic for payload injection checks"""
+
+from ..utils.url_parser import parse_url_params
+from .detection import Detector
+
+class ParameterCheck:
+    """
+    Injects payloads into one query parameter at a time.
+    
+    A check only defines its payloads and how to recognise a hit; the
+    sequential run() and the concurrent ScanEngine both go through probe().
+    """
+    
+    def __init__(self, name, vuln_type, severity, payloads, detect, label=None,
+                 payload_dependent=False):
+        """
+        name: Short identifier (e.g. 'sql_injection')
+        vuln_type / severity: Copied into findings
+        payloads: Values substituted into the parameter
+        detect: detect(text, payload) -> evidence (truthy) or None
+        label: Name used in console messages
+        payload_dependent: detect() looks for the payload itself (e.g. reflection)
+        """
+        self.name = name
+        self.vuln_type = vuln_type
+        self.severity = severity
+        self.payloads = payloads
+        self.detector = Detector(detect, payload_dependent)
+        self.label = label or vuln_type
+    
+    def probe(self, request_handler, base_url, params, param, payload):
+        """Send one payload in one parameter; returns a finding or None"""
+        test_params = params.copy()
+        test_params[param] = payload
+        
+        # Only 2xx pages are analysed (a Response is falsy for 4xx/5xx): error
+        # pages often echo the request back, which reads as reflected XSS
+        response = request_handler.get(base_url, params=test_params)
+        if not response:
+            return None
+        
+        evidence = self.detector.analyse(response, payload)
+        if not evidence:
+            return None
+        
+        finding = {
+            'type': self.vuln_type,
+            'severity': self.severity,
+            'url': base_url,
+            'parameter': param,
+            'payload': payload
+        }
+        if isinstance(evidence, str):
+            finding['evidence'] = evidence
+        return finding
+    
+    def run(self, request_handler, url):
+        """Test every parameter of a URL sequentially; returns the first finding"""
+        print(f"[*] Testing {self.label}: {url}")
+        
+        base_url, params = parse_url_params(url)
+        if not params:
+            return None
+        
+        for param in params:
+            for payload in self.payloads:
+                finding = self.probe(request_handler, base_url, params, param, payload)
+                if finding:
+                    print(f"    [+] FOUND: {self.label} in parameter '{param}'")
+                    return finding
+        
+        return None
@@ -0,0 +1,164 @@
+"""Precompiled matchers and cached response analysis"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from ..config import DETECTION_CACHE_SIZE
+
+_QUANTIFIERS = '*+?{'
+_SPECIAL = '.^$|'
+_CLOSING = {'(': ')', '[': ']'}
+
+
+def required_literal(pattern):
+    """
+    Longest plain substring every match of pattern must contain, or None.
+
+    Deliberately conservative: patterns with top-level alternation get no
+    literal, and a character followed by a quantifier is dropped because it
+    may be optional.
+    """
+    runs, current = [], []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped.isalnum():
+                # \d, \w, \s, \b ... are classes or assertions, not literals
+                runs.append(''.join(current))
+                current = []
+            else:
+                current.append(escaped)
+            i += 2
+        elif char == '|':
+            return None
+        elif char in _CLOSING:
+            runs.append(''.join(current))
+            current = []
+            depth, i = 1, i + 1
+            while i < len(pattern) and depth:
+                if pattern[i] == '\\':
+                    i += 1
+                elif pattern[i] == char:
+                    depth += 1
+                elif pattern[i] == _CLOSING[char]:
+                    depth -= 1
+                i += 1
+        elif char in _QUANTIFIERS:
+            if current:
+                current.pop()
+            runs.append(''.join(current))
+            current = []
+            i += 1
+            if char == '{':
+                while i < len(pattern) and pattern[i - 1] != '}':
+                    i += 1
+        elif char in _SPECIAL:
+            runs.append(''.join(current))
+            current = []
+            i += 1
+        else:
+            current.append(char)
+            i += 1
+    runs.append(''.join(current))
+    return max(runs, key=len) or None
+
+
+class PatternMatcher:
+    """
+    A pattern set compiled once per check.
+
+    Python's re has no multi-pattern automaton, and a single alternation
+    loses the literal-prefix optimisations of the individual patterns
+    (measured ~2x slower on large pages). Instead each pattern is compiled
+    on its own and guarded by the literal it requires: one lowercase pass
+    over the body plus substring tests rule out most patterns before any
+    regex runs.
+    """
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = list(patterns)
+        self.ignore_case = bool(flags & re.IGNORECASE)
+        self._compiled = []
+        for pattern in self.patterns:
+            literal = required_literal(pattern)
+            if literal and self.ignore_case:
+                literal = literal.lower()
+            self._compiled.append((pattern, re.compile(pattern, flags), literal))
+
+    def search(self, text):
+        """Return the first pattern (in list order) matching text, or None"""
+        haystack = text.lower() if self.ignore_case else text
+        for pattern, regex, literal in self._compiled:
+            if literal is not None and literal not in haystack:
+                continue
+            if regex.search(text):
+                return pattern
+        return None
+
+class Detector:
+    """
+    Runs a check's detect(text, payload) behind a response signature cache.
+
+    Identical bodies (common: every payload hitting the same error page)
+    are analysed once per check; only payload-dependent checks such as
+    reflection also key the cache on the payload. Tracks match time so the
+    CPU cost of detection can be compared with network time.
+    """
+
+    def __init__(self, detect, payload_dependent=False, cache_size=DETECTION_CACHE_SIZE):
+        self.detect = detect
+        self.payload_dependent = payload_dependent
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.analysed = 0
+        self.cache_hits = 0
+        self.matches = 0
+        self.match_time = 0.0
+
+    def analyse(self, response, payload):
+        """Evidence (truthy) if the response shows the vulnerability, else None"""
+        key = hashlib.blake2b(response.content, digest_size=16).digest()
+        if self.payload_dependent:
+            key = (key, payload)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                evidence = self._cache[key]
+                if evidence:
+                    self.matches += 1
+                return evidence
+
+        # Decoding (.text) is skipped entirely on a cache hit
+        start = time.perf_counter()
+        evidence = self.detect(response.text, payload) or None
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.analysed += 1
+            self.match_time += elapsed
+            if evidence:
+                self.matches += 1
+            self._cache[key] = evidence
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return evidence
+
+    def metrics(self):
+        total = self.analysed + self.cache_hits
+        return {
+            'responses': total,
+            'analysed': self.analysed,
+            'cache_hits': self.cache_hits,
+            'hit_rate': round(self.cache_hits / total, 3) if total else 0.0,
+            'matches': self.matches,
+            'match_time_ms': round(self.match_time * 1000, 3),
+            'avg_match_us': round(self.match_time / self.analysed * 1e6, 1) if self.analysed else 0.0
+        }
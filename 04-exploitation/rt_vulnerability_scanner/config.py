@@ -6,6 +6,20 @@ REQUEST_TIMEOUT = 10
 MAX_SPIDER_DEPTH = 2
 MAX_URLS_TO_TEST = 10
 
+# Spider
+SPIDER_WORKERS = 8            # pages fetched concurrently per depth level
+MAX_SPIDER_PAGES = 500        # pages fetched per crawl
+SPIDER_PAGE_BYTES = 512 * 1024  # bytes read from each page before giving up on it
+SPIDER_CHUNK_SIZE = 16 * 1024
+
+# Scan Engine
+SCAN_WORKERS = 10             # concurrent probes
+POOL_SIZE_PER_HOST = 10       # keep-alive connections per host
+REQUESTS_PER_SECOND = 20      # per host, 0 = unlimited
+RATE_LIMIT_BURST = 5          # requests allowed back to back before throttling
+PROGRESS_INTERVAL = 1.0       # seconds between progress updates
+DETECTION_CACHE_SIZE = 4096   # response signatures remembered per check
+
 # SQL Injection
 SQL_PAYLOADS = [
     "'",
@@ -0,0 +1,191 @@
+"""Concurrent scan engine"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from .config import SCAN_WORKERS, PROGRESS_INTERVAL
+from .utils.url_parser import parse_url_params
+
+class ScanStats:
+    """Live counters shared by the worker threads"""
+
+    def __init__(self, request_handler):
+        self.request_handler = request_handler
+        self.lock = threading.Lock()
+        self.total = 0
+        self.done = 0
+        self.skipped = 0
+        self.findings = 0
+        self.started = time.monotonic()
+
+    def line(self):
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        sent = self.request_handler.requests_sent
+        return (f"[*] Probes {self.done + self.skipped}/{self.total} | "
+                f"{sent} requests ({sent / elapsed:.1f} req/s) | "
+                f"{self.findings} found | {self.skipped} skipped | "
+                f"{self.request_handler.errors} errors | {elapsed:.1f}s")
+
+class ConsolePrinter:
+    """
+    Serializes console output from the worker threads.
+
+    On a terminal the progress line is redrawn in place; a message first
+    clears it, so findings never end up glued to a half-written counter.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.tty = self.stream.isatty()
+        self.lock = threading.Lock()
+        self._status_shown = False
+
+    def status(self, line):
+        with self.lock:
+            if self.tty:
+                self.stream.write("\r\033[K" + line)
+                self._status_shown = True
+            else:
+                self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def message(self, line):
+        with self.lock:
+            if self._status_shown:
+                self.stream.write("\r\033[K")
+                self._status_shown = False
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+class ScanEngine:
+    """
+    Runs parameter checks on a thread pool.
+
+    Work is split into probes (check, endpoint, parameter, payload). Once a
+    parameter is confirmed vulnerable to a check, the remaining payloads for
+    it are cancelled. Endpoint parameters seen in several URLs (?id=1,
+    ?id=2) are only tested once.
+    """
+
+    def __init__(self, request_handler, checks, workers=SCAN_WORKERS, progress=True):
+        self.request_handler = request_handler
+        self.checks = checks
+        self.workers = max(1, workers)
+        self.progress = progress
+        self.stats = ScanStats(request_handler)
+        self.printer = ConsolePrinter()
+        self._confirmed = set()
+        self._pending = {}
+        self._results = []
+
+    def _plan(self, urls):
+        """
+        Expand URLs into (index, key, check, base_url, params, param, payload)
+        probes. index keeps URL/check order for the results; the probes are
+        interleaved so a parameter's payloads are spread out over the run,
+        leaving time to cancel the rest once one of them hits.
+        """
+        by_key = {}
+        index = 0
+        for url in urls:
+            base_url, params = parse_url_params(url)
+            if not params:
+                continue
+            for check in self.checks:
+                for param in params:
+                    key = (check.name, base_url, param)
+                    if key in by_key:
+                        continue
+                    by_key[key] = [
+                        (index + i, key, check, base_url, params, param, payload)
+                        for i, payload in enumerate(check.payloads)
+                    ]
+                    index += len(check.payloads)
+
+        probes = []
+        rounds = max((len(p) for p in by_key.values()), default=0)
+        for position in range(rounds):
+            for key_probes in by_key.values():
+                if position < len(key_probes):
+                    probes.append(key_probes[position])
+        return probes
+
+    def _probe(self, index, key, check, base_url, params, param, payload):
+        if key in self._confirmed:
+            with self.stats.lock:
+                self.stats.skipped += 1
+            return
+
+        finding = check.probe(self.request_handler, base_url, params, param, payload)
+
+        with self.stats.lock:
+            self.stats.done += 1
+            if not finding or key in self._confirmed:
+                return
+            self._confirmed.add(key)
+            self.stats.findings += 1
+            self._results.append((index, finding))
+            pending = self._pending.pop(key, [])
+
+        self.printer.message(f"    [+] FOUND: {check.label} in parameter '{param}' ({base_url})")
+
+        # Early cancellation: drop this parameter's queued payloads
+        cancelled = sum(1 for future in pending if future.cancel())
+        with self.stats.lock:
+            self.stats.skipped += cancelled
+
+    def _site_check(self, index, func):
+        finding = func()
+        with self.stats.lock:
+            self.stats.done += 1
+            if finding:
+                self.stats.findings += 1
+                self._results.append((index, finding))
+
+    def _report_progress(self, stop):
+        while not stop.wait(PROGRESS_INTERVAL):
+            self.printer.status(self.stats.line())
+
+    def run(self, urls, site_checks=()):
+        """
+        Scan URLs with every check, plus site-wide checks (callables
+        returning a finding or None) on the same pool.
+
+        Returns: Findings in URL/check order
+        """
+        probes = self._plan(urls)
+        self.stats.total = len(probes) + len(site_checks)
+
+        print(f"[*] {len(probes)} probes across {len(urls)} URLs, {self.workers} workers")
+
+        stop = threading.Event()
+        reporter = None
+        if self.progress:
+            reporter = threading.Thread(target=self._report_progress, args=(stop,), daemon=True)
+            reporter.start()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scan") as pool:
+            # Site-wide checks start first but are reported after the URL findings
+            futures = [
+                pool.submit(self._site_check, index, func)
+                for index, func in enumerate(site_checks, len(probes))
+            ]
+
+            for index, key, *probe in probes:
+                future = pool.submit(self._probe, index, key, *probe)
+                with self.stats.lock:
+                    if key not in self._confirmed:
+                        self._pending.setdefault(key, []).append(future)
+                futures.append(future)
+
+            wait(futures)
+
+        stop.set()
+        if reporter:
+            reporter.join()
+
+        self.printer.message(self.stats.line())
+
+        self._results.sort(key=lambda item: item[0])
+        return [finding for _, finding in self._results]
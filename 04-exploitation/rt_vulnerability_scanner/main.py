@@ -1,17 +1,30 @@
 """Main entry point for vulnerability scanner"""
 
-import sys
+import argparse
 from .scanner import VulnerabilityScanner
+from .config import SCAN_WORKERS, REQUESTS_PER_SECOND
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 main.py <target_url>")
-        print("Example: python3 main.py https://example.com")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Web vulnerability scanner",
+        epilog="Example: python3 main.py https://example.com --workers 20 --rate 50"
+    )
+    parser.add_argument('target_url', help='Target URL')
+    parser.add_argument('--workers', '-w', type=int, default=SCAN_WORKERS,
+                        help=f'Concurrent probes (default: {SCAN_WORKERS})')
+    parser.add_argument('--rate', '-r', type=float, default=REQUESTS_PER_SECOND,
+                        help=f'Max requests/second per host, 0 = unlimited (default: {REQUESTS_PER_SECOND})')
+    parser.add_argument('--crawl-state', metavar='FILE',
+                        help='Save the spider frontier to FILE and resume from it if present')
+    parser.add_argument('--recrawl', action='store_true',
+                        help='Ignore a crawl of this target saved in --crawl-state and crawl again')
+    parser.add_argument('--no-progress', action='store_true', help='Disable live progress output')
+    args = parser.parse_args()
     
-    target = sys.argv[1]
-    scanner = VulnerabilityScanner(target)
+    scanner = VulnerabilityScanner(args.target_url, workers=args.workers,
+                                   rate_limit=args.rate, progress=not args.no_progress,
+                                   crawl_state=args.crawl_state, recrawl=args.recrawl)
     scanner.run_full_scan()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,26 +1,54 @@
 """Main vulnerability scanner class"""
 
 from .utils.request_handler import RequestHandler
+from .utils.rate_limiter import HostRateLimiter
 from .utils.spider import Spider
+from .engine import ScanEngine
 from .checks import sql_injection, xss, lfi, rce, weak_auth, security_headers
 from .reporting import report_generator, exploitation_guide
-from .config import MAX_URLS_TO_TEST
+from .config import MAX_URLS_TO_TEST, SCAN_WORKERS, SPIDER_WORKERS, REQUESTS_PER_SECOND, RATE_LIMIT_BURST
+
+PARAMETER_CHECKS = [sql_injection.CHECK, xss.CHECK, lfi.CHECK, rce.CHECK]
 
 class VulnerabilityScanner:
     """Main vulnerability scanner"""
     
-    def __init__(self, target_url):
+    def __init__(self, target_url, session=None, workers=SCAN_WORKERS,
+                 rate_limit=REQUESTS_PER_SECOND, progress=True, crawl_state=None,
+                 recrawl=False):
+        """
+        workers: Concurrent probes (1 = sequential)
+        rate_limit: Maximum requests per second per host (0 = unlimited)
+        progress: Print live progress/throughput counters
+        crawl_state: Optional file the spider saves its frontier to (and resumes from)
+        recrawl: Crawl again even if crawl_state holds a finished crawl of this target
+        """
         self.target_url = target_url if target_url.startswith('http') else f'https://{target_url}'
         self.vulnerabilities = []
-        self.request_handler = RequestHandler()
+        self.workers = workers
+        self.progress = progress
+        self.crawl_state = crawl_state
+        self.recrawl = recrawl
+        limiter = HostRateLimiter(rate_limit, RATE_LIMIT_BURST) if rate_limit else None
+        self.request_handler = RequestHandler(session, rate_limiter=limiter, pool_size=max(workers, 1))
     
     def run_full_scan(self):
         """Run complete vulnerability scan"""
+        self.scan()
+        
+        # Generate reports
+        report_generator.generate_report(self.vulnerabilities, self.target_url)
+        exploitation_guide.generate_exploitation_guide(self.vulnerabilities)
+    
+    def scan(self):
+        """Run all checks and return the findings (no reports)"""
         print(f"[*] Starting vulnerability scan on {self.target_url}")
         print("=" * 60 + "\n")
         
         # Spider to find URLs
-        spider = Spider(self.request_handler, self.target_url)
+        # Capped at the probe worker count, which sizes the connection pool
+        spider = Spider(self.request_handler, self.target_url,
+                        workers=min(self.workers, SPIDER_WORKERS), state_file=self.crawl_state, recrawl=self.recrawl)
         test_urls = spider.spider_website()
         
         if not test_urls:
@@ -30,34 +58,39 @@ class VulnerabilityScanner:
         print("\n[*] Testing for vulnerabilities...")
         print("-" * 60)
         
-        # Test each URL
-        for url in test_urls[:MAX_URLS_TO_TEST]:
-            self._check_url(url)
-        
-        # Test authentication
-        vuln = weak_auth.check_weak_authentication(self.request_handler, self.target_url)
-        if vuln:
-            self.vulnerabilities.append(vuln)
+        engine = ScanEngine(self.request_handler, PARAMETER_CHECKS, self.workers, self.progress)
+        self.vulnerabilities = engine.run(
+            test_urls[:MAX_URLS_TO_TEST],
+            site_checks=[
+                # Test authentication
+                lambda: weak_auth.check_weak_authentication(self.request_handler, self.target_url),
+                # Check security headers
+                lambda: security_headers.check_security_headers(self.request_handler, self.target_url),
+            ]
+        )
+        self.stats = engine.stats
         
-        # Check security headers
-        vuln = security_headers.check_security_headers(self.request_handler, self.target_url)
-        if vuln:
-            self.vulnerabilities.append(vuln)
-        
-        # Generate reports
-        report_generator.generate_report(self.vulnerabilities, self.target_url)
-        exploitation_guide.generate_exploitation_guide(self.vulnerabilities)
-    
-    def _check_url(self, url):
-        """Run all checks on a single URL"""
-        checks = [
-            sql_injection.check_sql_injection,
-            xss.check_xss,
-            lfi.check_lfi,
-            rce.check_rce
-        ]
+        if self.progress:
+            print_detection_metrics()
         
-        for check in checks:
-            vuln = check(self.request_handler, url)
-            if vuln:
-                self.vulnerabilities.append(vuln)
\ No newline at end of file
+        return self.vulnerabilities
+
+
+def detection_metrics():
+    """Per-check detection counters (responses, cache hits, match time)"""
+    return {check.name: check.detector.metrics() for check in PARAMETER_CHECKS}
+
+
+def print_detection_metrics():
+    print(f"\n{'Check':<16}{'responses':>10}{'analysed':>10}{'cached':>8}{'match ms':>10}{'avg us':>8}")
+    for name, m in detection_metrics().items():
+        print(f"{name:<16}{m['responses']:>10}{m['analysed']:>10}{m['hit_rate']:>8.0%}"
+              f"{m['match_time_ms']:>10.1f}{m['avg_match_us']:>8.1f}")
+
+
+def run(target_url, session=None, workers=SCAN_WORKERS, rate_limit=REQUESTS_PER_SECOND):
+    """
+    Structured entry point
+    Returns: List of vulnerability dicts ('type', 'severity', 'url', ...)
+    """
+    return VulnerabilityScanner(target_url, session, workers, rate_limit, progress=False).scan()
@@ -1,29 +1,54 @@
 """HTTP request handling utilities"""
 
+import threading
 import requests
 import urllib3
-from ..config import USER_AGENT, REQUEST_TIMEOUT
+from requests.adapters import HTTPAdapter
+from ..config import USER_AGENT, REQUEST_TIMEOUT, POOL_SIZE_PER_HOST
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class RequestHandler:
     """Handles HTTP requests with proper configuration"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.verify = False
-        self.session.headers.update({'User-Agent': USER_AGENT})
+    def __init__(self, session=None, rate_limiter=None, pool_size=POOL_SIZE_PER_HOST):
+        """
+        session: Optional requests.Session to reuse
+        rate_limiter: Optional HostRateLimiter applied to every request
+        pool_size: Keep-alive connections per host (should cover the worker count)
+        """
+        if session is None:
+            session = requests.Session()
+            session.verify = False
+            session.headers.update({'User-Agent': USER_AGENT})
+        if pool_size:
+            adapter = HTTPAdapter(pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self.rate_limiter = rate_limiter
+        
+        self.requests_sent = 0
+        self.errors = 0
+        self._lock = threading.Lock()
     
-    def get(self, url, params=None, timeout=REQUEST_TIMEOUT, **kwargs):
-        """Make GET request with error handling"""
+    def _request(self, method, url, timeout, **kwargs):
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
         try:
-            return self.session.get(url, params=params, timeout=timeout, **kwargs)
+            response = self.session.request(method, url, timeout=timeout, **kwargs)
         except Exception as e:
-            return None
+            response = None
+        with self._lock:
+            self.requests_sent += 1
+            if response is None:
+                self.errors += 1
+        return response
+    
+    def get(self, url, params=None, timeout=REQUEST_TIMEOUT, **kwargs):
+        """Make GET request with error handling"""
+        return self._request('GET', url, timeout, params=params, **kwargs)
     
     def post(self, url, data=None, timeout=REQUEST_TIMEOUT, **kwargs):
         """Make POST request with error handling"""
-        try:
-            return self.session.post(url, data=data, timeout=timeout, **kwargs)
-        except Exception as e:
-            return None
\ No newline at end of file
+        return self._request('POST', url, timeout, data=data, **kwargs)
@@ -1,59 +1,274 @@
 """Website spidering utilities"""
 
-import re
-from urllib.parse import urljoin, urlparse
-from ..config import MAX_SPIDER_DEPTH
+import codecs
+import json
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from ..config import (MAX_SPIDER_DEPTH, SPIDER_WORKERS, MAX_SPIDER_PAGES,
+                      SPIDER_PAGE_BYTES, SPIDER_CHUNK_SIZE)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Tag attributes that point at other pages
+LINK_ATTRIBUTES = {
+    'a': 'href',
+    'area': 'href',
+    'link': 'href',
+    'frame': 'src',
+    'iframe': 'src',
+    'form': 'action'
+}
+
+SKIP_SCHEMES = ('javascript:', 'mailto:', 'tel:', 'data:')
+
+def normalize_url(url):
+    """
+    Canonical form of an absolute http(s) URL, or None for anything else.
+
+    Lowercases scheme and host, drops default ports and fragments, resolves
+    dot segments and sorts query parameters, so equivalent spellings of a
+    page are only fetched once.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower()
+    if ':' in netloc:
+        # IPv6 literal: urlsplit strips the brackets
+        netloc = f"[{netloc}]"
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    path = parts.path or '/'
+    if '.' in path:
+        trailing = path.endswith('/')
+        path = posixpath.normpath(path)
+        path = '/' + path.lstrip('/') + ('/' if trailing and path != '/' else '')
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+def endpoint_signature(url):
+    """
+    (scheme://host/path, sorted parameter names) - ?id=1 and ?id=2 test the
+    same code, so only one URL per signature is kept
+    """
+    parts = urlsplit(url)
+    names = tuple(sorted({name for name, _ in parse_qsl(parts.query, keep_blank_values=True)}))
+    return f"{parts.scheme}://{parts.netloc}{parts.path}", names
+
+class LinkExtractor(HTMLParser):
+    """Collects link targets from HTML fed to it in chunks"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        attribute = LINK_ATTRIBUTES.get(tag)
+        if not attribute:
+            return
+        for name, value in attrs:
+            if name == attribute and value:
+                self.links.append(value)
+
+    handle_startendtag = handle_starttag
 
 class Spider:
-    """Web spider to find testable URLs"""
-    
-    def __init__(self, request_handler, target_url):
+    """
+    Web spider to find testable URLs
+
+    Crawls breadth first, fetching each depth level on a thread pool.
+    Pages are streamed into an HTML tokenizer and abandoned after
+    page_bytes, so a huge or endless response cannot stall the crawl.
+    With a state_file the frontier is saved after every level and an
+    interrupted crawl picks up where it stopped. The file holds one crawl
+    per target; a finished crawl is reused unless recrawl is set.
+    """
+
+    def __init__(self, request_handler, target_url, workers=SPIDER_WORKERS,
+                 max_pages=MAX_SPIDER_PAGES, page_bytes=SPIDER_PAGE_BYTES, state_file=None,
+                 recrawl=False):
         self.request_handler = request_handler
-        self.target_url = target_url
-        self.target_domain = urlparse(target_url).netloc
-    
+        self.target_url = normalize_url(target_url) or target_url
+        self.target_domain = urlsplit(self.target_url).netloc
+        self.workers = max(1, workers)
+        self.max_pages = max_pages
+        self.page_bytes = page_bytes
+        self.state_file = state_file
+        self.recrawl = recrawl
+        self.other_crawls = {}
+
+        self.depth = 0
+        self.frontier = [self.target_url]
+        self.visited = set()
+        self.queued = set(self.frontier)
+        self.endpoints = {}
+        self.pages_truncated = 0
+        self.complete = False
+
+    def _in_scope(self, url):
+        return urlsplit(url).netloc == self.target_domain
+
+    def _fetch_links(self, url):
+        """
+        Stream a page through the link extractor
+        Returns: (raw link targets, whether the page hit the byte budget)
+        """
+        response = self.request_handler.get(url, stream=True)
+        if response is None:
+            return [], False
+
+        try:
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type.lower():
+                return [], False
+
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+            parser = LinkExtractor()
+            received = 0
+            truncated = False
+            for chunk in response.iter_content(SPIDER_CHUNK_SIZE):
+                parser.feed(decoder.decode(chunk))
+                received += len(chunk)
+                if received >= self.page_bytes:
+                    truncated = True
+                    break
+            else:
+                parser.feed(decoder.decode(b'', final=True))
+            parser.close()
+            return parser.links, truncated
+        except Exception:
+            return [], False
+        finally:
+            response.close()
+
+    def _add_endpoint(self, url):
+        """Record a URL with parameters; returns False if its signature was already seen"""
+        if not urlsplit(url).query:
+            return True
+        signature = endpoint_signature(url)
+        if signature in self.endpoints:
+            return False
+        self.endpoints[signature] = url
+        return True
+
+    def _expand(self, page_url, links):
+        """Canonical, in-scope, unseen URLs linked from a page"""
+        new_urls = []
+        for link in links:
+            link = link.strip()
+            if not link or link.lower().startswith(SKIP_SCHEMES):
+                continue
+            url = normalize_url(urljoin(page_url, link))
+            if not url or url in self.queued or not self._in_scope(url):
+                continue
+            self.queued.add(url)
+            # Near-duplicates (?id=2 after ?id=1) are still fetched - they may
+            # link to pages nothing else does - but only one is kept for testing
+            self._add_endpoint(url)
+            new_urls.append(url)
+        return new_urls
+
+    def save_state(self):
+        """Write the frontier atomically (readers never see a partial file)"""
+        if not self.state_file:
+            return
+        crawls = dict(self.other_crawls)
+        crawls[self.target_url] = {
+            'complete': self.complete,
+            'depth': self.depth,
+            'frontier': self.frontier,
+            'visited': sorted(self.visited),
+            'queued': sorted(self.queued),
+            'endpoints': list(self.endpoints.values())
+        }
+        tmp = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(crawls, f)
+        os.replace(tmp, self.state_file)
+
+    def load_state(self):
+        """Resume this target's crawl from state_file; returns True if resumed"""
+        if not self.state_file:
+            return False
+        try:
+            with open(self.state_file, 'r') as f:
+                crawls = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(crawls, dict):
+            return False
+
+        state = crawls.pop(self.target_url, None)
+        self.other_crawls = crawls
+        if state is None:
+            return False
+        if self.recrawl:
+            print(f"    [*] Discarding saved crawl of {self.target_url}")
+            return False
+
+        self.complete = state.get('complete', False)
+        self.depth = state['depth']
+        self.frontier = state['frontier']
+        self.visited = set(state['visited'])
+        self.queued = set(state['queued'])
+        self.endpoints = {}
+        for url in state['endpoints']:
+            self._add_endpoint(url)
+        return True
+
     def spider_website(self, max_depth=MAX_SPIDER_DEPTH):
         """
         Spider website to find URLs with parameters
-        Returns: List of URLs with query parameters
+        Returns: List of URLs with query parameters, one per endpoint signature
         """
         print(f"[*] Spidering website to find testable URLs...")
-        
-        visited = set()
-        to_visit = {self.target_url}
-        found_urls = []
-        
-        depth = 0
-        while to_visit and depth < max_depth:
-            current_urls = to_visit.copy()
-            to_visit.clear()
-            
-            for url in current_urls:
-                if url in visited:
-                    continue
-                    
-                visited.add(url)
-                
-                response = self.request_handler.get(url)
-                if not response:
-                    continue
-                
-                # Store URLs with parameters for testing
-                if '?' in url and '=' in url:
-                    found_urls.append(url)
-                
-                # Find more links
-                links = re.findall(r'href=["\']([^"\']+)["\']', response.text)
-                
-                for link in links:
-                    absolute_url = urljoin(url, link)
-                    
-                    # Only follow links on same domain
-                    if urlparse(absolute_url).netloc == self.target_domain:
-                        if absolute_url not in visited:
-                            to_visit.add(absolute_url)
-            
-            depth += 1
-        
-        print(f"    [+] Found {len(found_urls)} testable URLs")
-        return found_urls
\ No newline at end of file
+
+        if self.load_state():
+            if self.complete:
+                print(f"    [*] Reusing finished crawl from {self.state_file} (--recrawl to crawl again)")
+            else:
+                print(f"    [*] Resuming crawl at depth {self.depth}: {len(self.frontier)} queued, "
+                      f"{len(self.visited)} visited")
+        self._add_endpoint(self.target_url)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="spider") as pool:
+            while not self.complete and self.frontier and self.depth < max_depth:
+                budget = self.max_pages - len(self.visited)
+                if budget <= 0:
+                    print(f"    [-] Page limit ({self.max_pages}) reached")
+                    self.complete = True
+                    self.save_state()
+                    break
+
+                level = [url for url in self.frontier if url not in self.visited][:budget]
+                # map() keeps page order, so the crawl is deterministic
+                pages = list(pool.map(self._fetch_links, level))
+
+                self.visited.update(level)
+                next_level = []
+                for url, (links, truncated) in zip(level, pages):
+                    self.pages_truncated += truncated
+                    next_level.extend(self._expand(url, links))
+
+                self.depth += 1
+                self.frontier = next_level
+                self.complete = not self.frontier or self.depth >= max_depth
+                self.save_state()
+
+        if self.pages_truncated:
+            print(f"    [*] {self.pages_truncated} pages cut off at {self.page_bytes} bytes")
+
+        found_urls = list(self.endpoints.values())
+        print(f"    [+] Crawled {len(self.visited)} pages, found {len(found_urls)} testable URLs")
+        return found_urls
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Beacon load test: runs the Flask app in-process on 127.0.0.1 with a temp
+database and drives N synthetic agents through the real EncryptionHandler.
+
+Reports p50/p95/p99 latency per endpoint, throughput, and database size
+(including the WAL file) sampled over time while the cleanup thread runs.
+
+Examples (from 01-c2-server/):
+    python -m rt_c2_server.benchmarks.beacon_load
+    python -m rt_c2_server.benchmarks.beacon_load --agents 300 --sleep 0.5 --duration 60
+    python -m rt_c2_server.benchmarks.beacon_load --cleanup-interval 0   # without cleanup
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+
+from flask import Flask
+from werkzeug.serving import make_server, WSGIRequestHandler
+
+from ..cleanup import start_cleanup_thread
+from ..config import derive_encryption_key
+from ..database import init_database, close_pool
+from ..encryption import EncryptionHandler
+from ..operator import C2Operator
+from ..routes import register_routes
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, endpoint, seconds, ok):
+        with self.lock:
+            self.latencies[endpoint].append(seconds)
+            if not ok:
+                self.errors[endpoint] += 1
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def db_size(db_path):
+    return sum(
+        os.path.getsize(db_path + suffix)
+        for suffix in ('', '-wal', '-shm')
+        if os.path.exists(db_path + suffix)
+    )
+
+
+def build_server(db_path, config, encryption_handler, logger):
+    app = Flask('rt_c2_server_bench')
+    register_routes(app, config, db_path, encryption_handler, logger)
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+class Agent(threading.Thread):
+    def __init__(self, index, base_url, token, encryption_handler, stats, stop, sleep, jitter, lifetime):
+        super().__init__(daemon=True)
+        self.index = index
+        self.base_url = base_url
+        self.token = token
+        self.crypto = encryption_handler
+        self.stats = stats
+        self.stop = stop
+        self.sleep = sleep
+        self.jitter = jitter
+        self.lifetime = lifetime
+        self.session_id = None
+        self.rng = random.Random(index)
+
+    def _post(self, path, payload):
+        body = json.dumps({'data': self.crypto.encrypt(payload)}).encode()
+        request = urllib.request.Request(
+            self.base_url + path, data=body, method='POST',
+            headers={'Content-Type': 'application/json', 'Authorization': f'Bearer {self.token}'}
+        )
+        start = time.perf_counter()
+        ok = True
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = json.loads(response.read())
+        except Exception:
+            ok = False
+            data = {}
+        self.stats.record(path, time.perf_counter() - start, ok)
+        return data
+
+    def run(self):
+        started = time.monotonic()
+        while not self.stop.is_set():
+            if self.lifetime and time.monotonic() - started > self.lifetime:
+                return  # Implant "dies" so cleanup has stale sessions to act on
+
+            response = self._post('/api/v1/sync', {
+                'session_id': self.session_id,
+                'hostname': f'bench-{self.index:04d}',
+                'username': 'bench',
+                'os_type': 'Linux',
+            })
+
+            if response.get('status') == 'success':
+                beacon = self.crypto.decrypt(response['data']) or {}
+                self.session_id = beacon.get('session_id', self.session_id)
+                for task in beacon.get('tasks', []):
+                    self._post('/api/v1/results', {
+                        'session_id': self.session_id,
+                        'task_id': task['task_id'],
+                        'output': f"output of {task['command']}\n" * 8,
+                    })
+
+            delay = self.sleep * (1 + self.rng.uniform(-self.jitter, self.jitter))
+            self.stop.wait(max(0.0, delay))
+
+
+def task_issuer(db_path, stop, rate, agents):
+    """Operator issuing commands to random live sessions"""
+    operator = C2Operator(db_path)
+    rng = random.Random(0)
+    while not stop.wait(1.0 / rate):
+        live = [a.session_id for a in agents if a.session_id and a.is_alive()]
+        if live:
+            operator.issue_command(rng.choice(live), 'whoami')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="C2 beacon endpoint load test")
+    parser.add_argument('--agents', type=int, default=200)
+    parser.add_argument('--sleep', type=float, default=1.0, help='Beacon interval (seconds)')
+    parser.add_argument('--jitter', type=float, default=0.2)
+    parser.add_argument('--duration', type=float, default=30.0)
+    parser.add_argument('--task-rate', type=float, default=20.0, help='Commands issued per second')
+    parser.add_argument('--churn', type=float, default=0.2,
+                        help='Fraction of agents that stop beaconing halfway through')
+    parser.add_argument('--cleanup-interval', type=float, default=5.0,
+                        help='Cleanup thread interval in seconds (0 disables it for an A/B run)')
+    parser.add_argument('--cleanup-age', type=float, default=5.0,
+                        help='Seconds of silence before cleanup deactivates a session')
+    parser.add_argument('--sample', type=float, default=5.0, help='DB size sample interval')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='c2_bench_')
+    db_path = os.path.join(workdir, 'c2_data', 'c2.db')
+
+    logger = logging.getLogger('C2ServerBench')
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    config = {'authentication': {'require_auth': True, 'auth_token': secrets.token_urlsafe(32)}}
+    encryption_handler = EncryptionHandler(derive_encryption_key(secrets.token_hex(32)))
+
+    init_database(db_path)
+    server, _ = build_server(db_path, config, encryption_handler, logger)
+    base_url = f'http://127.0.0.1:{server.server_port}'
+
+    if args.cleanup_interval > 0:
+        start_cleanup_thread(db_path, args.cleanup_age / 86400, logger, interval=args.cleanup_interval)
+
+    print(f"[*] Server: {base_url}  DB: {db_path}")
+    print(f"[*] Agents: {args.agents}, sleep {args.sleep}s ±{args.jitter * 100:.0f}%, "
+          f"duration {args.duration}s, cleanup every {args.cleanup_interval}s")
+
+    stats = Stats()
+    stop = threading.Event()
+    churned = int(args.agents * args.churn)
+    agents = [
+        Agent(i, base_url, config['authentication']['auth_token'], encryption_handler, stats, stop,
+              args.sleep, args.jitter, args.duration / 2 if i < churned else 0)
+        for i in range(args.agents)
+    ]
+
+    issuer = threading.Thread(target=task_issuer, args=(db_path, stop, args.task_rate, agents), daemon=True)
+
+    started = time.monotonic()
+    for agent in agents:
+        agent.start()
+    issuer.start()
+
+    print(f"\n{'t (s)':>6}{'beacons':>10}{'db size':>12}{'active':>8}")
+    samples = []
+    try:
+        while time.monotonic() - started < args.duration:
+            time.sleep(args.sample)
+            elapsed = time.monotonic() - started
+            active = len(C2Operator(db_path).list_sessions(active_only=True))
+            with stats.lock:
+                beacons = len(stats.latencies['/api/v1/sync'])
+            size = db_size(db_path)
+            samples.append((elapsed, beacons, size, active))
+            print(f"{elapsed:>6.0f}{beacons:>10}{size / 1024:>10.0f}KB{active:>8}")
+    finally:
+        stop.set()
+        for agent in agents:
+            agent.join(timeout=5)
+        elapsed = time.monotonic() - started
+        server.shutdown()
+
+    print(f"\n{'Endpoint':<18}{'count':>8}{'err':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}")
+    for endpoint, values in sorted(stats.latencies.items()):
+        values.sort()
+        print(f"{endpoint:<18}{len(values):>8}{stats.errors[endpoint]:>6}"
+              f"{percentile(values, 50) * 1000:>9.1f}{percentile(values, 95) * 1000:>9.1f}"
+              f"{percentile(values, 99) * 1000:>9.1f}{len(values) / elapsed:>9.1f}")
+
+    if len(samples) > 1:
+        (t0, _, s0, _), (t1, _, s1, _) = samples[0], samples[-1]
+        print(f"\n[+] DB growth: {(s1 - s0) / 1024 / max(t1 - t0, 1e-9):.1f} KB/s "
+              f"({s1 / 1024:.0f} KB total)")
+
+    close_pool(db_path)
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
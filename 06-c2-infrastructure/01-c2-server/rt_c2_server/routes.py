@@ -1,8 +1,7 @@
 from flask import request, jsonify, abort
-import secrets
 from datetime import datetime
 from functools import wraps
-from .database import create_session, update_session, get_pending_tasks, store_results
+from .database import check_in, store_results
 
 def require_auth(config):
     def decorator(f):
@@ -31,13 +30,9 @@ def register_routes(app, config, db_path, encryption_handler, logger):
             payload = encryption_handler.decrypt(encrypted)
             if not payload:
                 return jsonify({'status': 'error'}), 400
-            session_id = payload.get('session_id')
-            if not session_id:
-                session_id = secrets.token_hex(16)
-                create_session(db_path, session_id, payload, request.remote_addr)
-            else:
-                update_session(db_path, session_id, request.remote_addr)
-            tasks = get_pending_tasks(db_path, session_id)
+            session_id, tasks = check_in(
+                db_path, payload.get('session_id'), payload, request.remote_addr
+            )
             response_data = {
                 'session_id': session_id,
                 'tasks': tasks,
@@ -0,0 +1,35 @@
+"""
+RT GTFOBins Knowledge Base
+==========================
+
+Unified, indexed GTFOBins knowledge base shared by the SUID and sudo
+exploitation frameworks.
+
+Part of the 30 Days of Red Team toolkit.
+
+Author: Red Team Operator
+License: Educational Use Only
+"""
+
+__version__ = "1.0.0"
+__author__ = "Red Team Operator"
+__series__ = "30 Days of Red Team"
+
+from .knowledge_base import (
+    GTFOBinsKnowledgeBase,
+    load_knowledge_base,
+    compile_knowledge_base,
+    CONTEXTS
+)
+from .view import GTFOBinsView
+from .filetype import FileTypeClassifier, detect_magic
+
+__all__ = [
+    'GTFOBinsKnowledgeBase',
+    'GTFOBinsView',
+    'FileTypeClassifier',
+    'detect_magic',
+    'load_knowledge_base',
+    'compile_knowledge_base',
+    'CONTEXTS'
+]
@@ -0,0 +1,387 @@
+"""
+File Type Classifier
+====================
+
+Batched file-type detection without one ``file`` process per binary.
+
+ELF headers and shebang lines are decoded directly in Python. Anything
+not recognised is handed to a single ``file -b -f -`` invocation for the
+whole batch. Results are memoized by (device, inode, mtime) and can be
+persisted to disk so repeated scans of the same host reuse them.
+
+Shared by the SUID exploiter and the enumeration framework.
+"""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+ELF_MAGIC = b'\x7fELF'
+
+# e_machine values (subset)
+ELF_MACHINES: Dict[int, str] = {
+    2: 'SPARC',
+    3: 'Intel 80386',
+    8: 'MIPS',
+    20: 'PowerPC',
+    21: '64-bit PowerPC or cisco 7500',
+    22: 'IBM S/390',
+    40: 'ARM',
+    43: 'SPARC V9',
+    62: 'x86-64',
+    183: 'ARM aarch64',
+    243: 'UCB RISC-V',
+    258: 'LoongArch'
+}
+
+ELF_OSABI: Dict[int, str] = {
+    0: 'SYSV',
+    3: 'GNU/Linux',
+    9: 'FreeBSD'
+}
+
+ELF_TYPES: Dict[int, str] = {
+    1: 'relocatable',
+    2: 'executable',
+    3: 'shared object',
+    4: 'core file'
+}
+
+# Interpreter basename prefix -> script description
+SCRIPT_TYPES: List[Tuple[str, str]] = [
+    ('bash', 'Bourne-Again shell script'),
+    ('dash', 'POSIX shell script'),
+    ('sh', 'POSIX shell script'),
+    ('zsh', 'Paul Falstad\'s zsh script'),
+    ('python', 'Python script'),
+    ('perl', 'Perl script'),
+    ('ruby', 'Ruby script'),
+    ('php', 'PHP script'),
+    ('node', 'Node.js script'),
+    ('lua', 'Lua script'),
+    ('awk', 'awk or perl script'),
+    ('tclsh', 'Tcl script'),
+    ('expect', 'Expect script')
+]
+
+PT_INTERP = 3
+PT_DYNAMIC = 2
+
+# Dynamic section: DT_FLAGS_1 with DF_1_PIE marks a PIE executable (vs a library)
+DT_NULL = 0
+DT_FLAGS_1 = 0x6ffffffb
+DF_1_PIE = 0x08000000
+
+# Upper bound on program header bytes read per ELF
+MAX_PHDR_BYTES = 64 * 1024
+
+
+def _describe_elf(f, header: bytes) -> Optional[str]:
+    """Build a file(1)-style description from an ELF header"""
+    if len(header) < 52:
+        return None
+
+    elf_class = header[4]
+    elf_data = header[5]
+
+    if elf_class not in (1, 2) or elf_data not in (1, 2):
+        return None
+
+    endian = '<' if elf_data == 1 else '>'
+    bits = '32-bit' if elf_class == 1 else '64-bit'
+    order = 'LSB' if elf_data == 1 else 'MSB'
+
+    e_type, e_machine = struct.unpack_from(f'{endian}HH', header, 16)
+
+    if elf_class == 1:
+        e_phoff = struct.unpack_from(f'{endian}I', header, 28)[0]
+        e_phentsize, e_phnum = struct.unpack_from(f'{endian}HH', header, 42)
+    else:
+        if len(header) < 64:
+            return None
+        e_phoff = struct.unpack_from(f'{endian}Q', header, 32)[0]
+        e_phentsize, e_phnum = struct.unpack_from(f'{endian}HH', header, 54)
+
+    # Walk program headers for PT_INTERP / PT_DYNAMIC
+    interpreter = None
+    dynamic = False
+    pie = False
+
+    if e_phoff and e_phentsize and 0 < e_phnum * e_phentsize <= MAX_PHDR_BYTES:
+        f.seek(e_phoff)
+        table = f.read(e_phnum * e_phentsize)
+
+        for i in range(len(table) // e_phentsize):
+            entry = table[i * e_phentsize:(i + 1) * e_phentsize]
+            p_type = struct.unpack_from(f'{endian}I', entry, 0)[0]
+
+            if p_type not in (PT_DYNAMIC, PT_INTERP):
+                continue
+
+            if elf_class == 1:
+                p_offset, _, _, p_filesz = struct.unpack_from(f'{endian}IIII', entry, 4)
+            else:
+                p_offset = struct.unpack_from(f'{endian}Q', entry, 8)[0]
+                p_filesz = struct.unpack_from(f'{endian}Q', entry, 32)[0]
+
+            if p_type == PT_DYNAMIC:
+                dynamic = True
+                if e_type == 3 and 0 < p_filesz <= MAX_PHDR_BYTES:
+                    f.seek(p_offset)
+                    pie = _has_pie_flag(f.read(p_filesz), endian, elf_class)
+            elif 0 < p_filesz <= 4096:
+                f.seek(p_offset)
+                interpreter = f.read(p_filesz).rstrip(b'\x00').decode('utf-8', 'replace')
+
+    # ET_DYN covers both PIE executables and libraries (libc has an interpreter too)
+    type_name = ELF_TYPES.get(e_type, f'unknown type {e_type}')
+    if e_type == 3 and pie:
+        type_name = 'pie executable'
+
+    parts = [
+        f"ELF {bits} {order} {type_name}",
+        ELF_MACHINES.get(e_machine, f'machine {e_machine}'),
+        f"version {header[6]} ({ELF_OSABI.get(header[7], 'unknown ABI')})"
+    ]
+
+    if interpreter or dynamic:
+        parts.append('dynamically linked')
+    elif e_type == 2:
+        parts.append('statically linked')
+
+    if interpreter:
+        parts.append(f'interpreter {interpreter}')
+
+    return ', '.join(parts)
+
+
+def _has_pie_flag(dynamic: bytes, endian: str, elf_class: int) -> bool:
+    """Check a dynamic section for DT_FLAGS_1 & DF_1_PIE"""
+    entry_format = f'{endian}iI' if elf_class == 1 else f'{endian}qQ'
+    size = struct.calcsize(entry_format)
+
+    for offset in range(0, len(dynamic) - size + 1, size):
+        tag, value = struct.unpack_from(entry_format, dynamic, offset)
+        if tag == DT_NULL:
+            break
+        if tag == DT_FLAGS_1:
+            return bool(value & DF_1_PIE)
+
+    return False
+
+
+def _describe_script(header: bytes) -> Optional[str]:
+    """Build a file(1)-style description from a shebang line"""
+    line = header[2:].split(b'\n', 1)[0].strip()
+    if not line:
+        return None
+
+    words = line.decode('utf-8', 'replace').split()
+    interpreter = os.path.basename(words[0])
+
+    # #!/usr/bin/env python3
+    if interpreter == 'env' and len(words) > 1:
+        args = [w for w in words[1:] if not w.startswith('-')]
+        if args:
+            interpreter = os.path.basename(args[0])
+
+    for prefix, description in SCRIPT_TYPES:
+        if interpreter.startswith(prefix):
+            return f"{description}, text executable"
+
+    return f"a {words[0]} script, text executable"
+
+
+def detect_magic(path: str) -> Optional[str]:
+    """
+    Classify a file from its magic bytes.
+
+    Args:
+        path: File to inspect
+
+    Returns:
+        Description string, or None if not recognised
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(64)
+
+            if not header:
+                return 'empty'
+
+            if header.startswith(ELF_MAGIC):
+                return _describe_elf(f, header)
+
+            if header.startswith(b'#!'):
+                return _describe_script(header)
+    except (OSError, struct.error):
+        return None
+
+    return None
+
+
+class FileTypeClassifier:
+    """
+    Batched, memoizing file-type classifier.
+
+    Usage:
+        classifier = FileTypeClassifier(cache_file=Path('/tmp/out/filetype_cache.json'))
+        types = classifier.classify_many(['/usr/bin/passwd', '/opt/app/helper'])
+        classifier.save()
+
+    Results are only written to cache_file by save(), so call it once
+    when a scan is done rather than after every batch.
+    """
+
+    def __init__(
+            self,
+            cache_file: Optional[Path] = None,
+            use_file_command: bool = True,
+            timeout: int = 60
+    ):
+        """
+        Initialize the classifier.
+
+        Args:
+            cache_file: JSON file used to persist results between runs
+            use_file_command: Fall back to one batched 'file' call for unknown files
+            timeout: Timeout for the fallback 'file' invocation
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.use_file_command = use_file_command and shutil.which('file') is not None
+        self.timeout = timeout
+
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    @staticmethod
+    def _key(path: str) -> Optional[str]:
+        """Memoization key: (device, inode, mtime)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}"
+
+    def _load(self) -> None:
+        """Load persisted results"""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._cache.update(data)
+        except (OSError, ValueError):
+            pass
+
+    def save(self) -> None:
+        """Persist results (only if something changed)"""
+        if not self.cache_file or not self._dirty:
+            return
+
+        with self._lock:
+            try:
+                with open(self.cache_file, 'w') as f:
+                    json.dump(self._cache, f)
+                self._dirty = False
+            except OSError:
+                pass
+
+    def classify(self, path: str) -> str:
+        """Classify a single file"""
+        return self.classify_many([path]).get(path, 'unknown')
+
+    def classify_many(self, paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Classify a batch of files.
+
+        Args:
+            paths: Files to classify
+
+        Returns:
+            Mapping of path -> description ('unknown' if undetermined)
+        """
+        results: Dict[str, str] = {}
+        pending: List[Tuple[str, Optional[str]]] = []
+
+        for path in paths:
+            key = self._key(path)
+
+            with self._lock:
+                cached = self._cache.get(key) if key else None
+
+            if cached is not None:
+                self.hits += 1
+                results[path] = cached
+                continue
+
+            self.misses += 1
+            description = detect_magic(path)
+
+            if description is not None:
+                results[path] = description
+                self._remember(key, description)
+            else:
+                pending.append((path, key))
+
+        if pending:
+            fallback = self._run_file_command([p for p, _ in pending])
+
+            for path, key in pending:
+                description = fallback.get(path, 'unknown')
+                results[path] = description
+                if description != 'unknown':
+                    self._remember(key, description)
+
+        return results
+
+    def _remember(self, key: Optional[str], description: str) -> None:
+        """Store a result in the memo"""
+        if not key:
+            return
+        with self._lock:
+            self._cache[key] = description
+            self._dirty = True
+
+    def _run_file_command(self, paths: List[str]) -> Dict[str, str]:
+        """Classify many files with a single 'file -b -f -' process"""
+        if not self.use_file_command:
+            return {}
+
+        # Names containing newlines cannot be passed via -f
+        batch = [p for p in paths if '\n' not in p]
+        if not batch:
+            return {}
+
+        try:
+            result = subprocess.run(
+                ['file', '-b', '-f', '-'],
+                input='\n'.join(batch) + '\n',
+                capture_output=True,
+                text=True,
+                timeout=self.timeout
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return {}
+
+        lines = result.stdout.split('\n')
+
+        return {
+            path: lines[i].strip()
+            for i, path in enumerate(batch)
+            if i < len(lines) and lines[i].strip()
+        }
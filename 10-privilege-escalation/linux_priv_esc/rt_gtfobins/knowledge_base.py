@@ -0,0 +1,309 @@
+"""
+GTFOBins Knowledge Base
+=======================
+
+Unified, load-once GTFOBins knowledge base shared by the SUID and sudo
+exploitation frameworks.
+
+The canonical data lives in ``data/gtfobins.json``. On first use it is
+compiled into plain Python structures plus per-context lookup indexes
+(by exploit type and by capability) and cached on disk with ``marshal`` so later
+processes skip JSON parsing and index building. Within a process the
+compiled knowledge base is a singleton.
+
+Reference: https://gtfobins.github.io/
+"""
+
+import json
+import marshal
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Bump when the compiled layout changes
+KB_FORMAT_VERSION = 2
+
+DATA_FILE = Path(__file__).parent / 'data' / 'gtfobins.json'
+
+CONTEXTS = ('suid', 'sudo')
+
+# One trailing version component: python3.11 -> python3 -> python, gcc-12 -> gcc
+_VERSION_SUFFIX = re.compile(r'(?<=[A-Za-z0-9])[._-]?\d+$')
+
+# Distribution build flavours of the same binary (vim.basic, vim.tiny).
+# Other dotted names are different programs: mount.nfs is not mount and
+# nc.openbsd has none of the nc -e techniques.
+_FLAVOUR_SUFFIX = re.compile(r'\.(basic|tiny|nox|gtk3?|athena)$')
+
+_kb_instance: Optional['GTFOBinsKnowledgeBase'] = None
+_kb_lock = threading.Lock()
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache directory"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'rt_gtfobins'
+
+
+def _source_signature(path: Path) -> str:
+    """Signature used to invalidate the compiled cache"""
+    st = path.stat()
+    return f"{KB_FORMAT_VERSION}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def compile_knowledge_base(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compile raw JSON data into the indexed form.
+
+    Args:
+        raw: Parsed contents of gtfobins.json
+
+    Returns:
+        Dictionary with binaries and lookup indexes (plain types only)
+    """
+    binaries: Dict[str, Dict[str, Any]] = raw.get('binaries', {})
+
+    # context -> exploit type -> [binary]
+    by_type: Dict[str, Dict[str, List[str]]] = {ctx: {} for ctx in CONTEXTS}
+    # context -> capability -> [binary]
+    by_capability: Dict[str, Dict[str, List[str]]] = {ctx: {} for ctx in CONTEXTS}
+
+    for name in sorted(binaries):
+        for context, record in binaries[name].items():
+            # A capability only counts in the context that provides it
+            capabilities: Set[str] = {context}
+
+            for technique in record.get('techniques', []):
+                exploit_type = technique['type']
+                capabilities.add(exploit_type)
+
+                names = by_type.setdefault(context, {}).setdefault(exploit_type, [])
+                if not names or names[-1] != name:
+                    names.append(name)
+
+                if not technique.get('interactive'):
+                    capabilities.add('non_interactive')
+                if technique.get('test_command'):
+                    capabilities.add('testable')
+
+            for capability in capabilities:
+                by_capability.setdefault(context, {}).setdefault(capability, []).append(name)
+
+    return {
+        'version': KB_FORMAT_VERSION,
+        'binaries': binaries,
+        'by_type': by_type,
+        'by_capability': by_capability
+    }
+
+
+class GTFOBinsKnowledgeBase:
+    """
+    Indexed GTFOBins knowledge base.
+
+    Lookups are dictionary-backed; basename resolution (including
+    versioned names like ``python3.11`` or ``vim.basic``) is memoized.
+
+    Usage:
+        kb = load_knowledge_base()
+        kb.resolve('/usr/bin/python3.11', 'suid')    # -> 'python3'
+        kb.get('vim.basic', 'sudo')                  # -> raw technique record
+        kb.by_exploit_type('file_read', 'suid')      # -> ['base64', ...]
+        kb.by_capability('shell', 'suid')            # -> ['awk', 'bash', ...]
+    """
+
+    def __init__(self, compiled: Dict[str, Any]):
+        """
+        Initialize from compiled data.
+
+        Args:
+            compiled: Output of compile_knowledge_base()
+        """
+        self._binaries: Dict[str, Dict[str, Any]] = compiled['binaries']
+        self._by_type: Dict[str, Dict[str, List[str]]] = compiled['by_type']
+        self._by_capability: Dict[str, Dict[str, List[str]]] = compiled['by_capability']
+        self._resolved: Dict[tuple, Optional[str]] = {}
+
+    @staticmethod
+    def _candidates(name: str) -> List[str]:
+        """Generate progressively more generic names for a binary"""
+        candidates = [name]
+        current = _FLAVOUR_SUFFIX.sub('', name)
+
+        if current != name:
+            candidates.append(current)
+
+        while True:
+            # perl5.34.0 -> perl5.34 -> perl5 -> perl
+            stripped = _VERSION_SUFFIX.sub('', current)
+            if not stripped or stripped == current:
+                break
+            current = stripped
+
+            if current not in candidates:
+                candidates.append(current)
+
+        return candidates
+
+    def resolve(self, name: str, context: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve a binary name or path to its knowledge base entry name.
+
+        Args:
+            name: Binary name or full path
+            context: Restrict to entries with techniques for 'suid' or 'sudo'
+
+        Returns:
+            Canonical binary name or None if unknown
+        """
+        key = (name, context)
+
+        if key in self._resolved:
+            return self._resolved[key]
+
+        basename = os.path.basename(name.rstrip('/')) or name
+        result = None
+
+        for candidate in self._candidates(basename):
+            record = self._binaries.get(candidate)
+            if record and (context is None or context in record):
+                result = candidate
+                break
+
+        self._resolved[key] = result
+        return result
+
+    def get(self, name: str, context: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the raw record ({'techniques': [...], 'notes': ...}) for a binary.
+
+        Args:
+            name: Binary name or path (resolved)
+            context: 'suid' or 'sudo'
+        """
+        canonical = self.resolve(name, context)
+        if canonical is None:
+            return None
+        return self._binaries[canonical][context]
+
+    def has(self, name: str, context: Optional[str] = None) -> bool:
+        """Check if a binary (or versioned variant) is known"""
+        return self.resolve(name, context) is not None
+
+    def binaries(self, context: Optional[str] = None) -> List[str]:
+        """List known binaries, optionally restricted to a context"""
+        if context is None:
+            return list(self._binaries)
+        return self.by_capability(context, context)
+
+    def by_exploit_type(self, exploit_type: Any, context: Optional[str] = None) -> List[str]:
+        """
+        Binaries offering a given exploit type.
+
+        Args:
+            exploit_type: Exploit type value (or Enum with a .value)
+            context: 'suid', 'sudo' or None for both
+        """
+        value = getattr(exploit_type, 'value', exploit_type)
+        contexts = [context] if context else list(CONTEXTS)
+
+        names: List[str] = []
+        for ctx in contexts:
+            for name in self._by_type.get(ctx, {}).get(value, []):
+                if name not in names:
+                    names.append(name)
+
+        return names
+
+    def by_capability(self, capability: str, context: Optional[str] = None) -> List[str]:
+        """
+        Binaries with a capability.
+
+        Capabilities are context names ('suid', 'sudo'), exploit types
+        ('shell', 'file_read', ...), 'non_interactive' and 'testable'.
+        Each is indexed per context: a binary with file_read only under
+        sudo is not a suid file_read binary.
+
+        Args:
+            capability: Capability name
+            context: 'suid', 'sudo' or None for either
+        """
+        if context:
+            return list(self._by_capability.get(context, {}).get(capability, []))
+
+        names: Set[str] = set()
+        for ctx in CONTEXTS:
+            names.update(self._by_capability.get(ctx, {}).get(capability, []))
+        return sorted(names)
+
+    def capabilities(self, context: Optional[str] = None) -> List[str]:
+        """List indexed capabilities, optionally restricted to a context"""
+        contexts = [context] if context else list(CONTEXTS)
+        return sorted({c for ctx in contexts for c in self._by_capability.get(ctx, {})})
+
+    def __len__(self) -> int:
+        return len(self._binaries)
+
+    def __contains__(self, name: str) -> bool:
+        return self.has(name)
+
+
+def _load_compiled(data_file: Path, cache_dir: Path, refresh: bool) -> Dict[str, Any]:
+    """Load compiled data from the disk cache, rebuilding if stale"""
+    signature = _source_signature(data_file)
+    cache_file = cache_dir / 'gtfobins.marshal'
+
+    if not refresh:
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = marshal.load(f)
+            if cached.get('signature') == signature:
+                return cached['kb']
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            pass
+
+    with open(data_file, 'r', encoding='utf-8') as f:
+        compiled = compile_knowledge_base(json.load(f))
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'wb') as f:
+            marshal.dump({'signature': signature, 'kb': compiled}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Read-only home / temp dir - the in-process singleton still works
+        pass
+
+    return compiled
+
+
+def load_knowledge_base(
+        cache_dir: Optional[str] = None,
+        refresh: bool = False
+) -> GTFOBinsKnowledgeBase:
+    """
+    Get the process-wide knowledge base, loading it on first use.
+
+    Args:
+        cache_dir: Directory for the compiled cache (default: ~/.cache/rt_gtfobins)
+        refresh: Ignore the process singleton and disk cache and recompile
+
+    Returns:
+        GTFOBinsKnowledgeBase instance
+    """
+    global _kb_instance
+
+    if _kb_instance is not None and not refresh:
+        return _kb_instance
+
+    with _kb_lock:
+        if _kb_instance is None or refresh:
+            directory = Path(cache_dir) if cache_dir else _default_cache_dir()
+            _kb_instance = GTFOBinsKnowledgeBase(
+                _load_compiled(DATA_FILE, directory, refresh)
+            )
+
+    return _kb_instance
@@ -0,0 +1,77 @@
+"""
+GTFOBins Context View
+=====================
+
+Base class for the per-context databases of the exploitation frameworks
+(GTFOBinsDB for suid, GTFOBinsSudo for sudo). Lookups go through the
+shared knowledge base; subclasses only turn a raw record into their own
+dataclasses.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .knowledge_base import load_knowledge_base
+
+
+class GTFOBinsView:
+    """
+    Lookups restricted to one context of the shared knowledge base.
+
+    Subclasses set CONTEXT and implement _build(). Entries are resolved
+    from paths and versioned names (python3.11, vim.basic) and built on
+    first access only.
+    """
+
+    CONTEXT = ""
+
+    def __init__(self):
+        self._kb = load_knowledge_base()
+        self._db: Dict[str, Any] = {}
+
+    def _build(self, name: str, record: Dict[str, Any]) -> Any:
+        """
+        Materialize a knowledge base record.
+
+        Args:
+            name: Canonical binary name
+            record: Raw record ({'techniques': [...], 'notes': ...})
+        """
+        raise NotImplementedError
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Resolve a binary name or path to its GTFOBins entry name"""
+        return self._kb.resolve(name, self.CONTEXT)
+
+    def get(self, name: str) -> Optional[Any]:
+        """Get exploitation techniques for a binary"""
+        canonical = self.resolve(name)
+
+        if canonical is None:
+            return None
+
+        if canonical not in self._db:
+            self._db[canonical] = self._build(canonical, self._kb.get(canonical, self.CONTEXT))
+
+        return self._db[canonical]
+
+    def has(self, name: str) -> bool:
+        """Check if binary is in database"""
+        return self.resolve(name) is not None
+
+    def by_exploit_type(self, exploit_type: Any) -> List[str]:
+        """Get binaries offering a specific exploit type"""
+        return self._kb.by_exploit_type(exploit_type, self.CONTEXT)
+
+    def by_capability(self, capability: str) -> List[str]:
+        """Get binaries with a capability in this context (e.g. 'file_read', 'non_interactive')"""
+        return self._kb.by_capability(capability, self.CONTEXT)
+
+    def all_binaries(self) -> List[str]:
+        """Get list of all known binaries"""
+        return self._kb.binaries(self.CONTEXT)
+
+    def __len__(self) -> int:
+        return len(self._kb.binaries(self.CONTEXT))
+
+    def __contains__(self, name: str) -> bool:
+        return self.has(name)
@@ -35,6 +35,7 @@ Examples:
   %(prog)s --quiet             Minimal output (findings only)
   %(prog)s --list              List available enumerators
   %(prog)s --only suid sudo    Run only specific enumerators
+  %(prog)s --parallel -w 8     Run enumerators concurrently
 
 For authorized security testing only.
         """
@@ -66,6 +67,19 @@ For authorized security testing only.
         help='Command timeout in seconds (default: 60)'
     )
 
+    parser.add_argument(
+        '-p', '--parallel',
+        action='store_true',
+        help='Run enumerators concurrently on a thread pool'
+    )
+
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=4,
+        help='Worker threads for parallel mode (default: 4)'
+    )
+
     parser.add_argument(
         '--list',
         action='store_true',
@@ -97,7 +111,9 @@ def main():
         output_dir=Path(args.output),
         timeout=args.timeout,
         verbose=args.verbose,
-        quiet=args.quiet
+        quiet=args.quiet,
+        parallel=args.parallel,
+        max_workers=args.workers
     )
 
     # Initialize enumerator
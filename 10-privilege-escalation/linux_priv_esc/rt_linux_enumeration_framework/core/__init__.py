@@ -7,6 +7,7 @@ Core components for the Linux privilege escalation framework.
 
 from .findings import Finding, FindingSeverity, FindingsCollection
 from .config import Config
+from .snapshot import FilesystemSnapshot, FileEntry
 from .base import BaseEnumerator
 
 __all__ = [
@@ -14,5 +15,7 @@ __all__ = [
     'FindingSeverity',
     'FindingsCollection',
     'Config',
+    'FilesystemSnapshot',
+    'FileEntry',
     'BaseEnumerator'
 ]
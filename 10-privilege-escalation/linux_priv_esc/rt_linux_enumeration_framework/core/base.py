@@ -11,6 +11,7 @@ import subprocess
 
 from .findings import FindingsCollection, Finding, FindingSeverity
 from .config import Config
+from .snapshot import FilesystemSnapshot
 
 
 class BaseEnumerator(ABC):
@@ -25,16 +26,31 @@ class BaseEnumerator(ABC):
     name: str = "Base Enumerator"
     description: str = "Abstract base enumerator"
 
-    def __init__(self, config: Config, findings: FindingsCollection):
+    def __init__(
+            self,
+            config: Config,
+            findings: FindingsCollection,
+            snapshot: Optional[FilesystemSnapshot] = None
+    ):
         """
         Initialize the enumerator.
 
         Args:
             config: Framework configuration
             findings: Shared findings collection
+            snapshot: Shared filesystem snapshot (created lazily if not provided)
         """
         self.config = config
         self.findings = findings
+        self._snapshot = snapshot
+        self.findings_added = 0
+
+    @property
+    def snapshot(self) -> FilesystemSnapshot:
+        """Filesystem snapshot shared with the other enumerators"""
+        if self._snapshot is None:
+            self._snapshot = FilesystemSnapshot(self.config)
+        return self._snapshot
 
     @abstractmethod
     def enumerate(self) -> None:
@@ -116,6 +132,7 @@ class BaseEnumerator(ABC):
 
         Convenience wrapper around findings.add_finding().
         """
+        self.findings_added += 1
         return self.findings.add_finding(
             category=category,
             severity=severity,
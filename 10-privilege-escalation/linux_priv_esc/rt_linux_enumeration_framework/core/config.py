@@ -22,7 +22,11 @@ class Config:
         verbose: Enable verbose output
         quiet: Suppress non-critical output
         search_depth: Maximum directory depth for searches
+        parallel: Run enumerators concurrently on a thread pool
+        max_workers: Thread pool size for parallel mode
         excluded_dirs: Directories to skip during enumeration
+        prune_fstypes: Filesystem types pruned from the snapshot walk
+        snapshot_tracked_dirs: Directories fully indexed by the snapshot
         gtfobins_binaries: Known exploitable SUID/sudo binaries
         common_suid_binaries: Standard system SUID binaries (not exploitable)
         privileged_groups: Groups that grant elevated access
@@ -34,12 +38,32 @@ class Config:
     verbose: bool = False
     quiet: bool = False
     search_depth: int = 10
+    parallel: bool = False
+    max_workers: int = 4
 
     # Directories to exclude from searches (performance optimization)
     excluded_dirs: List[str] = field(default_factory=lambda: [
         '/proc', '/sys', '/dev', '/run', '/snap'
     ])
 
+    # Pseudo and network filesystems skipped by the filesystem snapshot
+    prune_fstypes: List[str] = field(default_factory=lambda: [
+        # Pseudo filesystems
+        'proc', 'sysfs', 'devtmpfs', 'devpts', 'cgroup', 'cgroup2',
+        'securityfs', 'debugfs', 'tracefs', 'pstore', 'bpf', 'configfs',
+        'fusectl', 'mqueue', 'hugetlbfs', 'binfmt_misc', 'autofs',
+        'efivarfs', 'selinuxfs', 'rpc_pipefs', 'nsfs',
+
+        # Network filesystems
+        'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs',
+        'afs', 'ceph', 'glusterfs', 'lustre', '9p'
+    ])
+
+    # Directories whose every regular file is indexed by the snapshot
+    snapshot_tracked_dirs: List[str] = field(default_factory=lambda: [
+        '/etc'
+    ])
+
     # GTFOBins - Binaries known to be exploitable for privilege escalation
     # Reference: https://gtfobins.github.io/
     gtfobins_binaries: List[str] = field(default_factory=lambda: [
@@ -141,7 +165,9 @@ class Config:
             output_dir=Path(os.environ.get('PRIVESC_OUTPUT', '/tmp/privesc_enum')),
             timeout=int(os.environ.get('PRIVESC_TIMEOUT', '60')),
             verbose=os.environ.get('PRIVESC_VERBOSE', '').lower() in ('1', 'true', 'yes'),
-            quiet=os.environ.get('PRIVESC_QUIET', '').lower() in ('1', 'true', 'yes')
+            quiet=os.environ.get('PRIVESC_QUIET', '').lower() in ('1', 'true', 'yes'),
+            parallel=os.environ.get('PRIVESC_PARALLEL', '').lower() in ('1', 'true', 'yes'),
+            max_workers=int(os.environ.get('PRIVESC_WORKERS', '4'))
         )
 
     def is_gtfobins(self, binary_name: str) -> bool:
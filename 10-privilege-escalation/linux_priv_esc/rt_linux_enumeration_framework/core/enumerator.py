@@ -6,18 +6,70 @@ Main orchestrator for automated Linux privilege escalation enumeration.
 Coordinates all individual enumerators and generates comprehensive reports.
 """
 
+import contextlib
+import io
 import os
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 
 from .config import Config
 from .findings import FindingsCollection, FindingSeverity
 from .base import BaseEnumerator
+from .snapshot import FilesystemSnapshot
 from ..enumerators import ENUMERATOR_CLASSES
 
 
+class _ModuleOutput:
+    """
+    sys.stdout stand-in used while modules run in parallel.
+
+    Each worker thread writes to its own buffer, which is printed in one
+    piece when its module finishes, so output from different modules does
+    not interleave. Other threads write straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def module(self):
+        """Buffer the calling thread's output until the block exits"""
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield
+        finally:
+            self._local.buffer = None
+            self._emit(buffer.getvalue())
+
+    def _emit(self, text):
+        with self._lock:
+            self.stream.write(text)
+            self.stream.flush()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            self._emit(text)
+        else:
+            buffer.write(text)
+        return len(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
 class LinuxPrivEscEnumerator:
     """
     Main privilege escalation enumeration orchestrator.
@@ -28,6 +80,9 @@ class LinuxPrivEscEnumerator:
         enumerator = LinuxPrivEscEnumerator()
         enumerator.run_all()
         enumerator.generate_report()
+
+        # Concurrent mode (bounded thread pool)
+        enumerator.run_all(parallel=True)
     """
 
     BANNER = '''
@@ -58,12 +113,17 @@ class LinuxPrivEscEnumerator:
             self.config.output_dir.mkdir(exist_ok=True, mode=0o755)
 
         self.findings = FindingsCollection()
+        self.snapshot = FilesystemSnapshot(self.config)
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
 
+        # Per-module timing (name -> duration/status/findings)
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self._timings_lock = threading.Lock()
+
         # Initialize all enumerators
         self.enumerators: List[BaseEnumerator] = [
-            enum_class(self.config, self.findings)
+            enum_class(self.config, self.findings, self.snapshot)
             for enum_class in ENUMERATOR_CLASSES
         ]
 
@@ -71,8 +131,13 @@ class LinuxPrivEscEnumerator:
         print(f"[+] Output directory: {self.config.output_dir}")
         print(f"[+] Loaded {len(self.enumerators)} enumeration modules")
 
-    def run_all(self) -> None:
-        """Run all enumeration modules"""
+    def run_all(self, parallel: Optional[bool] = None) -> None:
+        """
+        Run all enumeration modules.
+
+        Args:
+            parallel: Run modules concurrently (defaults to config.parallel)
+        """
         self.start_time = datetime.now()
 
         print(f"\n{'=' * 60}")
@@ -80,14 +145,8 @@ class LinuxPrivEscEnumerator:
         print(f"{'=' * 60}")
         print(f"[*] Start time: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        for enumerator in self.enumerators:
-            try:
-                enumerator.enumerate()
-            except Exception as e:
-                print(f"[-] Error in {enumerator.name}: {e}")
-                if self.config.verbose:
-                    import traceback
-                    traceback.print_exc()
+        self._build_snapshot()
+        self._dispatch(self.enumerators, parallel)
 
         self.end_time = datetime.now()
         duration = (self.end_time - self.start_time).total_seconds()
@@ -98,24 +157,148 @@ class LinuxPrivEscEnumerator:
         print(f"[*] End time: {self.end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"[*] Duration: {duration:.2f} seconds")
 
-    def run_specific(self, enumerator_names: List[str]) -> None:
+    def _build_snapshot(self) -> None:
+        """Walk the filesystem once before the enumerators query it"""
+        print("[*] Building filesystem snapshot (single pass)...")
+
+        start = time.perf_counter()
+
+        try:
+            self.snapshot.build()
+        except Exception as e:
+            print(f"[-] Filesystem snapshot failed: {e}")
+            self._record_timing("Filesystem Snapshot", time.perf_counter() - start, 'error', 0)
+            return
+
+        self._record_timing("Filesystem Snapshot", time.perf_counter() - start, 'ok', 0)
+
+        stats = self.snapshot.stats()
+        print(
+            f"[+] Snapshot: {stats['files_scanned']} files in {stats['dirs_scanned']} "
+            f"directories, {stats['indexed']} indexed ({stats['duration']:.2f}s)"
+        )
+
+    def run_specific(
+            self,
+            enumerator_names: List[str],
+            parallel: Optional[bool] = None
+    ) -> None:
         """
         Run specific enumeration modules.
 
         Args:
             enumerator_names: List of enumerator names to run
+            parallel: Run modules concurrently (defaults to config.parallel)
         """
         self.start_time = datetime.now()
 
-        for enumerator in self.enumerators:
-            if enumerator.name.lower() in [n.lower() for n in enumerator_names]:
-                try:
-                    enumerator.enumerate()
-                except Exception as e:
-                    print(f"[-] Error in {enumerator.name}: {e}")
+        names = [n.lower() for n in enumerator_names]
+        selected = [e for e in self.enumerators if e.name.lower() in names]
+
+        if selected:
+            self._build_snapshot()
+        self._dispatch(selected, parallel)
 
         self.end_time = datetime.now()
 
+    def _dispatch(
+            self,
+            enumerators: List[BaseEnumerator],
+            parallel: Optional[bool] = None
+    ) -> None:
+        """Run enumerators sequentially or on a bounded thread pool"""
+        if parallel is None:
+            parallel = self.config.parallel
+
+        if not parallel or len(enumerators) < 2:
+            for enumerator in enumerators:
+                self._run_enumerator(enumerator)
+            return
+
+        workers = max(1, min(self.config.max_workers, len(enumerators)))
+        print(f"[*] Running {len(enumerators)} modules in parallel ({workers} workers)")
+
+        output = _ModuleOutput(sys.stdout)
+
+        def run(enumerator: BaseEnumerator) -> None:
+            with output.module():
+                self._run_enumerator(enumerator)
+
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enum') as pool:
+                # Results are recorded by _run_enumerator; list() waits for completion
+                list(pool.map(run, enumerators))
+        finally:
+            sys.stdout = output.stream
+
+    def _run_enumerator(self, enumerator: BaseEnumerator) -> None:
+        """Run a single enumerator, recording its duration and status"""
+        start = time.perf_counter()
+        before = enumerator.findings_added
+        status = 'ok'
+
+        try:
+            enumerator.enumerate()
+        except Exception as e:
+            status = 'error'
+            print(f"[-] Error in {enumerator.name}: {e}")
+            if self.config.verbose:
+                import traceback
+                traceback.print_exc()
+
+        self._record_timing(
+            enumerator.name,
+            time.perf_counter() - start,
+            status,
+            enumerator.findings_added - before
+        )
+
+    def _record_timing(self, name: str, duration: float, status: str, findings: int) -> None:
+        """Store timing information for a module"""
+        with self._timings_lock:
+            self.timings[name] = {
+                'duration': round(duration, 3),
+                'status': status,
+                'findings': findings
+            }
+
+    def get_timing_table(self) -> List[str]:
+        """
+        Format per-module timings as table lines (slowest first).
+
+        Returns:
+            List of formatted lines
+        """
+        with self._timings_lock:
+            rows = sorted(self.timings.items(), key=lambda kv: kv[1]['duration'], reverse=True)
+
+        if not rows:
+            return []
+
+        width = max(len(name) for name, _ in rows)
+        total = sum(t['duration'] for _, t in rows)
+
+        lines = [
+            f"{'Module':<{width}}  {'Time (s)':>9}  {'Findings':>8}  Status",
+            "-" * (width + 30)
+        ]
+
+        for name, timing in rows:
+            lines.append(
+                f"{name:<{width}}  {timing['duration']:>9.2f}  "
+                f"{timing['findings']:>8}  {timing['status']}"
+            )
+
+        lines.append("-" * (width + 30))
+        lines.append(f"{'Sum of module time':<{width}}  {total:>9.2f}")
+
+        if self.start_time and self.end_time:
+            wall = (self.end_time - self.start_time).total_seconds()
+            lines.append(f"{'Wall clock':<{width}}  {wall:>9.2f}")
+
+        return lines
+
     def generate_report(self) -> Path:
         """
         Generate comprehensive privilege escalation report.
@@ -136,6 +319,12 @@ class LinuxPrivEscEnumerator:
         print(f"    LOW:      {counts['low']}")
         print(f"    INFO:     {counts['info']}")
 
+        timing_table = self.get_timing_table()
+        if timing_table:
+            print("\n[*] Module timing:")
+            for line in timing_table:
+                print(f"    {line}")
+
         # Print critical findings
         critical_findings = self.findings.get_critical()
 
@@ -176,9 +365,11 @@ class LinuxPrivEscEnumerator:
                 'start_time': self.start_time.isoformat() if self.start_time else None,
                 'end_time': self.end_time.isoformat() if self.end_time else None,
                 'hostname': os.uname().nodename,
-                'user': os.environ.get('USER', 'unknown')
+                'user': os.environ.get('USER', 'unknown'),
+                'filesystem_snapshot': self.snapshot.stats()
             },
             'summary': self.findings.count_by_severity(),
+            'timings': self.timings,
             'findings': self.findings.to_dict()
         }
 
@@ -210,6 +401,14 @@ class LinuxPrivEscEnumerator:
             f.write(f"Low: {counts['low']}\n")
             f.write(f"Info: {counts['info']}\n\n")
 
+            timing_table = self.get_timing_table()
+            if timing_table:
+                f.write("MODULE TIMING\n")
+                f.write("-" * 60 + "\n")
+                for line in timing_table:
+                    f.write(line + "\n")
+                f.write("\n")
+
             for severity in [FindingSeverity.CRITICAL, FindingSeverity.HIGH,
                              FindingSeverity.MEDIUM, FindingSeverity.LOW]:
                 findings = self.findings.get_by_severity(severity)
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+import threading
 
 
 class FindingSeverity(Enum):
@@ -85,14 +86,19 @@ class Finding:
 class FindingsCollection:
     """
     Collection of privilege escalation findings with filtering and sorting.
+
+    Thread-safe: enumerators running concurrently may add findings to
+    the same collection.
     """
 
     def __init__(self):
         self._findings: List[Finding] = []
+        self._lock = threading.Lock()
 
     def add(self, finding: Finding) -> None:
         """Add a finding to the collection"""
-        self._findings.append(finding)
+        with self._lock:
+            self._findings.append(finding)
 
     def add_finding(
             self,
@@ -114,12 +120,12 @@ class FindingsCollection:
             target=target,
             metadata=metadata
         )
-        self._findings.append(new_finding)
+        self.add(new_finding)
         return new_finding
 
     def get_by_severity(self, severity: FindingSeverity) -> List[Finding]:
         """Get all findings of a specific severity"""
-        return [f for f in self._findings if f.severity == severity]
+        return [f for f in self.all if f.severity == severity]
 
     def get_critical(self) -> List[Finding]:
         """Get critical findings (exploit these first!)"""
@@ -131,7 +137,7 @@ class FindingsCollection:
 
     def get_by_category(self, category: str) -> List[Finding]:
         """Get findings by category"""
-        return [f for f in self._findings if f.category == category]
+        return [f for f in self.all if f.category == category]
 
     def count_by_severity(self) -> Dict[str, int]:
         """Count findings by severity level"""
@@ -154,12 +160,14 @@ class FindingsCollection:
         }
 
     def __len__(self) -> int:
-        return len(self._findings)
+        with self._lock:
+            return len(self._findings)
 
     def __iter__(self):
-        return iter(self._findings)
+        return iter(self.all)
 
     @property
     def all(self) -> List[Finding]:
         """Get all findings"""
-        return self._findings.copy()
\ No newline at end of file
+        with self._lock:
+            return self._findings.copy()
\ No newline at end of file
@@ -0,0 +1,393 @@
+"""
+Filesystem Snapshot
+===================
+
+Single-pass filesystem walker shared by all enumerators.
+
+The tree is walked once with os.scandir and the facts the enumerators
+care about (SUID/SGID bits, ownership, file capabilities and the contents
+of tracked directories such as /etc) are kept in a compact in-memory
+index. Enumerators query the snapshot instead of spawning their own
+``find`` / ``getcap -r`` sweeps.
+"""
+
+import os
+import re
+import stat
+import struct
+import threading
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .config import Config
+
+
+# Linux capability numbers (see linux/capability.h)
+CAPABILITY_NAMES: List[str] = [
+    'cap_chown', 'cap_dac_override', 'cap_dac_read_search', 'cap_fowner',
+    'cap_fsetid', 'cap_kill', 'cap_setgid', 'cap_setuid', 'cap_setpcap',
+    'cap_linux_immutable', 'cap_net_bind_service', 'cap_net_broadcast',
+    'cap_net_admin', 'cap_net_raw', 'cap_ipc_lock', 'cap_ipc_owner',
+    'cap_sys_module', 'cap_sys_rawio', 'cap_sys_chroot', 'cap_sys_ptrace',
+    'cap_sys_pacct', 'cap_sys_admin', 'cap_sys_boot', 'cap_sys_nice',
+    'cap_sys_resource', 'cap_sys_time', 'cap_sys_tty_config', 'cap_mknod',
+    'cap_lease', 'cap_audit_write', 'cap_audit_control', 'cap_setfcap',
+    'cap_mac_override', 'cap_mac_admin', 'cap_syslog', 'cap_wake_alarm',
+    'cap_block_suspend', 'cap_audit_read', 'cap_perfmon', 'cap_bpf',
+    'cap_checkpoint_restore'
+]
+
+CAPABILITY_XATTR = 'security.capability'
+
+# vfs_cap_data revisions
+_VFS_CAP_REVISION_MASK = 0xFF000000
+_VFS_CAP_REVISION_1 = 0x01000000
+_VFS_CAP_REVISION_2 = 0x02000000
+_VFS_CAP_REVISION_3 = 0x03000000
+_VFS_CAP_FLAGS_EFFECTIVE = 0x000001
+
+# The kernel escapes space, tab, newline and backslash in mount paths as \NNN
+_MOUNT_ESCAPE = re.compile(rb'\\([0-7]{3})')
+
+
+def decode_capabilities(raw: bytes) -> Optional[str]:
+    """
+    Decode a raw security.capability xattr into getcap-style text.
+
+    Args:
+        raw: Raw vfs_cap_data bytes
+
+    Returns:
+        Capability string (e.g. 'cap_net_raw,cap_setuid+ep') or None
+    """
+    if len(raw) < 4:
+        return None
+
+    magic = struct.unpack_from('<I', raw)[0]
+    revision = magic & _VFS_CAP_REVISION_MASK
+    effective = bool(magic & _VFS_CAP_FLAGS_EFFECTIVE)
+
+    if revision == _VFS_CAP_REVISION_1 and len(raw) >= 12:
+        permitted, inheritable = struct.unpack_from('<II', raw, 4)
+    elif revision in (_VFS_CAP_REVISION_2, _VFS_CAP_REVISION_3) and len(raw) >= 20:
+        p_lo, i_lo, p_hi, i_hi = struct.unpack_from('<IIII', raw, 4)
+        permitted = p_lo | (p_hi << 32)
+        inheritable = i_lo | (i_hi << 32)
+    else:
+        return None
+
+    # Group capabilities sharing the same flag set, like getcap does
+    groups: Dict[str, List[str]] = {}
+
+    for bit, name in enumerate(CAPABILITY_NAMES):
+        flags = ''
+        if effective and permitted & (1 << bit):
+            flags += 'e'
+        if inheritable & (1 << bit):
+            flags += 'i'
+        if permitted & (1 << bit):
+            flags += 'p'
+        if flags:
+            groups.setdefault(flags, []).append(name)
+
+    if not groups:
+        return None
+
+    return ' '.join(f"{','.join(names)}+{flags}" for flags, names in groups.items())
+
+
+def _unescape_mount_path(path: str) -> str:
+    """Decode octal escapes (e.g. \\040) used in /proc/self/mounts"""
+    if '\\' not in path:
+        return path
+    raw = _MOUNT_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8) & 0xFF]), os.fsencode(path))
+    return os.fsdecode(raw)
+
+
+class FileEntry(NamedTuple):
+    """Facts recorded for a single indexed file"""
+    path: str
+    mode: int
+    uid: int
+    gid: int
+    size: int
+    inode: int
+    mtime: float
+    capabilities: Optional[str] = None
+
+    @property
+    def is_suid(self) -> bool:
+        return bool(self.mode & stat.S_ISUID)
+
+    @property
+    def is_sgid(self) -> bool:
+        return bool(self.mode & stat.S_ISGID)
+
+    @property
+    def is_world_writable(self) -> bool:
+        return bool(self.mode & stat.S_IWOTH)
+
+
+class FilesystemSnapshot:
+    """
+    One-shot, lazily built index of interesting filesystem facts.
+
+    Only a small subset of the tree is stored:
+    - SUID / SGID regular files
+    - Executables carrying a security.capability xattr
+    - World-writable regular files
+    - Every regular file under ``config.snapshot_tracked_dirs``
+
+    Usage:
+        snapshot = FilesystemSnapshot(config)
+        for entry in snapshot.suid_files():
+            print(entry.path)
+    """
+
+    def __init__(self, config: Config, root: str = '/'):
+        """
+        Initialize the snapshot.
+
+        Args:
+            config: Framework configuration
+            root: Directory to start walking from
+        """
+        self.config = config
+        self.root = root
+
+        self._entries: Dict[str, FileEntry] = {}
+        self._suid: List[str] = []
+        self._sgid: List[str] = []
+        self._capabilities: List[str] = []
+        self._world_writable: List[str] = []
+        self._tracked: Dict[str, List[str]] = {}
+
+        self._lock = threading.Lock()
+        self._built = False
+        self._error: Optional[BaseException] = None
+
+        self.supports_xattr = hasattr(os, 'getxattr')
+        self.pruned_paths: Set[str] = set()
+        self.files_scanned = 0
+        self.dirs_scanned = 0
+        self.duration = 0.0
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def build(self) -> 'FilesystemSnapshot':
+        """
+        Walk the filesystem once (no-op if already built).
+
+        A failed walk is not retried: later calls re-raise its error.
+
+        Returns:
+            self, for chaining
+        """
+        with self._lock:
+            if self._built:
+                return self
+            if self._error is not None:
+                raise self._error
+
+            start = time.monotonic()
+            try:
+                self.pruned_paths = self._get_pruned_paths()
+                self._walk()
+            except Exception as e:
+                self._error = e
+                raise
+            self.duration = time.monotonic() - start
+            self._built = True
+
+        return self
+
+    def _get_pruned_paths(self) -> Set[str]:
+        """Collect excluded directories and mount points of pruned filesystems"""
+        pruned = {os.path.normpath(p) for p in self.config.excluded_dirs}
+        prune_fstypes = set(self.config.prune_fstypes)
+
+        try:
+            with open('/proc/self/mounts', 'r') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) < 3:
+                        continue
+
+                    mount_point = _unescape_mount_path(parts[1])
+                    if parts[2] in prune_fstypes:
+                        pruned.add(mount_point)
+        except OSError:
+            pass
+
+        # Never prune the walk root itself
+        pruned.discard(os.path.normpath(self.root))
+
+        return pruned
+
+    def _is_tracked_dir(self, path: str) -> Optional[str]:
+        """Return the tracked directory a path belongs to, if any"""
+        for tracked in self.config.snapshot_tracked_dirs:
+            tracked = tracked.rstrip('/') or '/'
+            if path == tracked or path.startswith(tracked + '/'):
+                return tracked
+        return None
+
+    def _walk(self) -> None:
+        """Iterative scandir walk, never following symlinks"""
+        root = os.path.normpath(self.root)
+        stack: List[Tuple[str, Optional[str]]] = [(root, self._is_tracked_dir(root))]
+
+        for tracked in self.config.snapshot_tracked_dirs:
+            self._tracked.setdefault(tracked.rstrip('/') or '/', [])
+
+        while stack:
+            directory, tracked = stack.pop()
+
+            try:
+                iterator = os.scandir(directory)
+            except OSError:
+                continue
+
+            self.dirs_scanned += 1
+
+            with iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path not in self.pruned_paths:
+                                child_tracked = tracked or self._is_tracked_dir(entry.path)
+                                stack.append((entry.path, child_tracked))
+                            continue
+
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+                    self.files_scanned += 1
+                    self._record(entry.path, st, tracked)
+
+    def _record(self, path: str, st: os.stat_result, tracked: Optional[str]) -> None:
+        """Index a regular file if it is interesting"""
+        mode = st.st_mode
+        special = mode & (stat.S_ISUID | stat.S_ISGID)
+        world_writable = mode & stat.S_IWOTH
+
+        capabilities = None
+        if self.supports_xattr and mode & 0o111:
+            capabilities = self._read_capabilities(path)
+
+        if not (special or world_writable or capabilities or tracked):
+            return
+
+        self._entries[path] = FileEntry(
+            path=path,
+            mode=mode,
+            uid=st.st_uid,
+            gid=st.st_gid,
+            size=st.st_size,
+            inode=st.st_ino,
+            mtime=st.st_mtime,
+            capabilities=capabilities
+        )
+
+        if mode & stat.S_ISUID:
+            self._suid.append(path)
+        if mode & stat.S_ISGID:
+            self._sgid.append(path)
+        if capabilities:
+            self._capabilities.append(path)
+        if world_writable:
+            self._world_writable.append(path)
+        if tracked:
+            self._tracked[tracked].append(path)
+
+    @staticmethod
+    def _read_capabilities(path: str) -> Optional[str]:
+        """Read and decode file capabilities, if any"""
+        try:
+            raw = os.getxattr(path, CAPABILITY_XATTR, follow_symlinks=False)
+        except OSError:
+            return None
+        return decode_capabilities(raw)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, path: str) -> Optional[FileEntry]:
+        """Get the indexed entry for a path"""
+        self.build()
+        return self._entries.get(path)
+
+    def suid_files(self) -> Iterator[FileEntry]:
+        """SUID regular files"""
+        self.build()
+        return (self._entries[p] for p in self._suid)
+
+    def sgid_files(self) -> Iterator[FileEntry]:
+        """SGID regular files"""
+        self.build()
+        return (self._entries[p] for p in self._sgid)
+
+    def capability_files(self) -> Iterator[FileEntry]:
+        """Executables with file capabilities"""
+        self.build()
+        return (self._entries[p] for p in self._capabilities)
+
+    def world_writable_files(self) -> Iterator[FileEntry]:
+        """World-writable regular files"""
+        self.build()
+        return (self._entries[p] for p in self._world_writable)
+
+    def files_under(self, directory: str) -> Iterator[FileEntry]:
+        """
+        All regular files under a tracked directory.
+
+        Args:
+            directory: One of config.snapshot_tracked_dirs (or a subdirectory);
+                nothing is returned for an untracked directory
+        """
+        self.build()
+        directory = directory.rstrip('/') or '/'
+        tracked = self._is_tracked_dir(directory)
+
+        if tracked is None:
+            return iter([])
+
+        prefix = directory + '/' if directory != '/' else '/'
+        return (
+            self._entries[p] for p in self._tracked.get(tracked, [])
+            if directory == tracked or p.startswith(prefix)
+        )
+
+    def writable_files(self, directory: str) -> List[str]:
+        """
+        Regular files under a tracked directory writable by the current user.
+
+        Uses os.access so ACLs and read-only mounts are honoured, like
+        ``find -writable``.
+        """
+        return [
+            entry.path for entry in self.files_under(directory)
+            if os.access(entry.path, os.W_OK)
+        ]
+
+    def stats(self) -> Dict[str, float]:
+        """Summary statistics for reporting"""
+        return {
+            'files_scanned': self.files_scanned,
+            'dirs_scanned': self.dirs_scanned,
+            'indexed': len(self._entries),
+            'suid': len(self._suid),
+            'sgid': len(self._sgid),
+            'capabilities': len(self._capabilities),
+            'duration': round(self.duration, 3)
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
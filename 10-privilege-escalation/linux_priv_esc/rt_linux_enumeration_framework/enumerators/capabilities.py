@@ -137,6 +137,11 @@ class CapabilitiesEnumerator(BaseEnumerator):
         """Run capabilities enumeration"""
         self.print_header()
 
+        # Capabilities are read from xattrs during the filesystem snapshot
+        if self.snapshot.supports_xattr:
+            self._enumerate_snapshot_capabilities()
+            return
+
         # Check if getcap is available
         if not self._check_getcap():
             self.log("getcap not available - skipping capabilities check", "warning")
@@ -149,6 +154,22 @@ class CapabilitiesEnumerator(BaseEnumerator):
         output = self.run_command("which getcap 2>/dev/null")
         return bool(output)
 
+    def _enumerate_snapshot_capabilities(self) -> None:
+        """Analyze files with capabilities from the filesystem snapshot"""
+        self.log("Searching for files with capabilities...")
+
+        entries = list(self.snapshot.capability_files())
+
+        if not entries:
+            self.log("No files with capabilities found")
+            return
+
+        self.log("Files with capabilities:", "success")
+
+        for entry in entries:
+            print(f"{entry.path} {entry.capabilities}")
+            self._analyze_capability_line(f"{entry.path} = {entry.capabilities}")
+
     def _enumerate_capabilities(self) -> None:
         """Find files with capabilities"""
         self.log("Searching for files with capabilities...")
@@ -206,10 +227,10 @@ class CapabilitiesEnumerator(BaseEnumerator):
         # Remove permission flags (+ep, +eip, etc.)
         caps_clean = re.sub(r'\+\w+', '', caps_string)
 
-        # Split on comma
+        # Split on comma (and whitespace between flag groups)
         capabilities = []
 
-        for part in caps_clean.split(','):
+        for part in re.split(r'[,\s]+', caps_clean):
             part = part.strip()
             if part:
                 capabilities.append(part)
@@ -14,6 +14,7 @@ from typing import List, Set
 
 from ..core.base import BaseEnumerator
 from ..core.findings import FindingSeverity
+from ..utils import FileTypeClassifier
 
 
 class SUIDEnumerator(BaseEnumerator):
@@ -30,6 +31,21 @@ class SUIDEnumerator(BaseEnumerator):
     name = "SUID/SGID Binary Enumerator"
     description = "Find SUID and SGID binaries for privilege escalation"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._classifier = None
+        self._file_types = {}
+
+    @property
+    def classifier(self) -> FileTypeClassifier:
+        """Batched file-type classifier, memoized across runs in the output dir"""
+        if self._classifier is None:
+            self._classifier = FileTypeClassifier(
+                cache_file=self.config.output_dir / "filetype_cache.json",
+                timeout=self.config.timeout
+            )
+        return self._classifier
+
     def enumerate(self) -> None:
         """Run SUID/SGID enumeration"""
         self.print_header()
@@ -37,21 +53,20 @@ class SUIDEnumerator(BaseEnumerator):
         self._enumerate_suid_binaries()
         self._enumerate_sgid_binaries()
 
+        if self._classifier is not None:
+            self._classifier.save()
+
     def _enumerate_suid_binaries(self) -> None:
         """Find and analyze SUID binaries"""
-        self.log("Searching for SUID binaries (this may take a minute)...")
+        self.log("Searching for SUID binaries...")
 
-        # Find all SUID binaries
-        output = self.run_command(
-            "find / -type f -perm -4000 2>/dev/null",
-            timeout=120
-        )
+        # Query the shared filesystem snapshot instead of walking the tree
+        suid_binaries = [entry.path for entry in self.snapshot.suid_files()]
 
-        if not output:
-            self.log("No SUID binaries found or search failed", "warning")
+        if not suid_binaries:
+            self.log("No SUID binaries found", "warning")
             return
 
-        suid_binaries = [line.strip() for line in output.split('\n') if line.strip()]
         self.log(f"Found {len(suid_binaries)} SUID binaries", "success")
 
         # Categorize binaries
@@ -88,6 +103,10 @@ class SUIDEnumerator(BaseEnumerator):
                 gtfobins_url=gtfobins_url
             )
 
+        # Classify all unusual binaries in one batch
+        if unusual:
+            self._file_types.update(self.classifier.classify_many(unusual))
+
         # Report unusual binaries (HIGH - worth investigating)
         for binary_path in unusual:
             binary_name = os.path.basename(binary_path)
@@ -121,16 +140,12 @@ class SUIDEnumerator(BaseEnumerator):
         """Find and analyze SGID binaries"""
         self.log("Searching for SGID binaries...")
 
-        output = self.run_command(
-            "find / -type f -perm -2000 2>/dev/null",
-            timeout=120
-        )
+        sgid_binaries = [entry.path for entry in self.snapshot.sgid_files()]
 
-        if not output:
-            self.log("No SGID binaries found or search failed", "warning")
+        if not sgid_binaries:
+            self.log("No SGID binaries found", "warning")
             return
 
-        sgid_binaries = [line.strip() for line in output.split('\n') if line.strip()]
         self.log(f"Found {len(sgid_binaries)} SGID binaries", "success")
 
         # Check for exploitable SGID binaries
@@ -157,18 +172,16 @@ class SUIDEnumerator(BaseEnumerator):
         """Get detailed file information"""
         info = {}
 
-        try:
-            stat_info = os.stat(path)
-            info['owner_uid'] = stat_info.st_uid
-            info['group_gid'] = stat_info.st_gid
-            info['mode'] = oct(stat_info.st_mode)
-            info['size'] = stat_info.st_size
-        except:
-            pass
-
-        # Get file type
-        file_output = self.run_command(f"file {path}")
-        if file_output:
-            info['file_type'] = file_output.split(':')[1].strip() if ':' in file_output else file_output
+        entry = self.snapshot.get(path)
+        if entry:
+            info['owner_uid'] = entry.uid
+            info['group_gid'] = entry.gid
+            info['mode'] = oct(entry.mode)
+            info['size'] = entry.size
+
+        # Get file type (batched by the caller, single lookup otherwise)
+        file_type = self._file_types.get(path) or self.classifier.classify(path)
+        if file_type != 'unknown':
+            info['file_type'] = file_type
 
         return info
\ No newline at end of file
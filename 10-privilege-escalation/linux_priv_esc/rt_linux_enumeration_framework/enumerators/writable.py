@@ -90,35 +90,28 @@ class WritableFilesEnumerator(BaseEnumerator):
         """Check for writable files in /etc"""
         self.log("Checking for writable files in /etc...")
 
-        output = self.run_command(
-            "find /etc -type f -writable 2>/dev/null",
-            timeout=30
-        )
-
-        if not output:
-            self.log("No writable files in /etc (or search failed)")
-            return
-
         writable_files = [
-            line.strip()
-            for line in output.split('\n')
-            if line.strip() and line.strip() not in self.CRITICAL_FILES
+            path for path in self.snapshot.writable_files('/etc')
+            if path not in self.CRITICAL_FILES
         ]
 
-        if writable_files:
-            self.log(f"Found {len(writable_files)} writable files in /etc", "warning")
+        if not writable_files:
+            self.log("No writable files in /etc")
+            return
+
+        self.log(f"Found {len(writable_files)} writable files in /etc", "warning")
 
-            for file_path in writable_files[:20]:  # Limit output
-                self.log(f"  {file_path}")
+        for file_path in writable_files[:20]:  # Limit output
+            self.log(f"  {file_path}")
 
-                self.add_finding(
-                    category="Writable /etc File",
-                    severity=FindingSeverity.HIGH,
-                    finding=f"Configuration file writable: {file_path}",
-                    exploitation=self._get_etc_exploitation(file_path),
-                    impact="High - Configuration manipulation",
-                    target=file_path
-                )
+            self.add_finding(
+                category="Writable /etc File",
+                severity=FindingSeverity.HIGH,
+                finding=f"Configuration file writable: {file_path}",
+                exploitation=self._get_etc_exploitation(file_path),
+                impact="High - Configuration manipulation",
+                target=file_path
+            )
 
     def _get_etc_exploitation(self, path: str) -> str:
         """Get exploitation method for /etc file"""
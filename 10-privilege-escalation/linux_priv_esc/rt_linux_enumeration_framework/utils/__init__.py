@@ -17,6 +17,11 @@ from .helpers import (
     get_kernel_version,
     get_distribution_info
 )
+try:
+    from ...rt_gtfobins.filetype import FileTypeClassifier, detect_magic
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from linux_priv_esc/
+    from rt_gtfobins.filetype import FileTypeClassifier, detect_magic
 
 __all__ = [
     'get_file_hash',
@@ -28,5 +33,7 @@ __all__ = [
     'find_files_by_permission',
     'is_world_writable',
     'get_kernel_version',
-    'get_distribution_info'
+    'get_distribution_info',
+    'FileTypeClassifier',
+    'detect_magic'
 ]
\ No newline at end of file
@@ -11,6 +11,12 @@ import hashlib
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
+try:
+    from ...rt_gtfobins.filetype import FileTypeClassifier
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from linux_priv_esc/
+    from rt_gtfobins.filetype import FileTypeClassifier
+
 
 def get_file_hash(path: str, algorithm: str = 'md5') -> Optional[str]:
     """
@@ -57,18 +63,10 @@ def get_binary_info(path: str) -> Dict[str, str]:
     """
     info = {}
 
-    # File command
-    try:
-        result = subprocess.run(
-            ['file', path],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            info['type'] = result.stdout.split(':', 1)[1].strip() if ':' in result.stdout else result.stdout
-    except:
-        pass
+    # File type (magic bytes, 'file' only as fallback)
+    file_type = FileTypeClassifier(timeout=5).classify(path)
+    if file_type != 'unknown':
+        info['type'] = file_type
 
     # Strings (first 20 interesting strings)
     try:
@@ -151,7 +151,8 @@ class SudoExploiter:
                     print(f"[+] EXPLOITABLE: sudo {cmd.name}{nopasswd_str}")
 
                     exploits = self.parser.get_exploits(cmd)
-                    url = f"https://gtfobins.github.io/gtfobins/{cmd.name}/#sudo"
+                    gtfobins_name = self.gtfobins.resolve(cmd.name) or cmd.name
+                    url = f"https://gtfobins.github.io/gtfobins/{gtfobins_name}/#sudo"
 
                     exploitable.append(ExploitableCommand(
                         permission=perm,
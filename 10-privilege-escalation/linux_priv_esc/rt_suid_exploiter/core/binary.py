@@ -34,6 +34,7 @@ class SUIDFinding:
         is_unusual: Whether binary is non-standard
         permissions: Permission string (e.g., -rwsr-xr-x)
         file_type: Output from 'file' command
+        gtfobins_name: GTFOBins entry the binary resolved to (e.g. python3.11 -> python3)
     """
     path: str
     name: str
@@ -43,6 +44,7 @@ class SUIDFinding:
     is_unusual: bool = False
     permissions: str = ""
     file_type: str = ""
+    gtfobins_name: str = ""
     discovered_at: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -56,13 +58,14 @@ class SUIDFinding:
             'is_unusual': self.is_unusual,
             'permissions': self.permissions,
             'file_type': self.file_type,
+            'gtfobins_name': self.gtfobins_name,
             'discovered_at': self.discovered_at.isoformat()
         }
 
     @property
     def gtfobins_url(self) -> str:
         """Get GTFOBins URL for this binary"""
-        return f"https://gtfobins.github.io/gtfobins/{self.name}/#suid"
+        return f"https://gtfobins.github.io/gtfobins/{self.gtfobins_name or self.name}/#suid"
 
     def __str__(self) -> str:
         status = "EXPLOITABLE" if self.is_exploitable else "UNUSUAL" if self.is_unusual else "STANDARD"
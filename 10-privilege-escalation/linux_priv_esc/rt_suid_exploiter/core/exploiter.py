@@ -16,6 +16,12 @@ from .gtfobins import GTFOBinsDB, ExploitType
 from .binary import SUIDFinding, ExploitResult, ExploitStatus, SUIDScanResult
 from .scanner import SUIDScanner
 
+try:
+    from ...rt_gtfobins.filetype import FileTypeClassifier
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from linux_priv_esc/
+    from rt_gtfobins.filetype import FileTypeClassifier
+
 
 class SUIDExploiter:
     """
@@ -47,13 +53,17 @@ class SUIDExploiter:
             output_dir: Directory for reports
             verbose: Enable verbose output
         """
-        self.gtfobins = GTFOBinsDB()
-        self.scanner = SUIDScanner(self.gtfobins)
         self.verbose = verbose
 
         self.output_dir = Path(output_dir) if output_dir else Path("/tmp/suid_exploit")
         self.output_dir.mkdir(exist_ok=True, mode=0o755)
 
+        self.gtfobins = GTFOBinsDB()
+        self.scanner = SUIDScanner(
+            self.gtfobins,
+            classifier=FileTypeClassifier(cache_file=self.output_dir / "filetype_cache.json")
+        )
+
         print(self.BANNER)
         print(f"[+] Loaded {len(self.gtfobins)} GTFOBins exploit techniques")
         print(f"[+] Output directory: {self.output_dir}")
@@ -303,7 +313,8 @@ class SUIDExploiter:
             finding = SUIDFinding(
                 path=binary_path,
                 name=binary_name,
-                is_exploitable=self.gtfobins.has(binary_name)
+                is_exploitable=self.gtfobins.has(binary_name),
+                gtfobins_name=self.gtfobins.resolve(binary_name) or ""
             )
 
         return self.exploit_binary(finding, test_only)
@@ -15,6 +15,12 @@ from pathlib import Path
 from .binary import SUIDFinding
 from .gtfobins import GTFOBinsDB
 
+try:
+    from ...rt_gtfobins.filetype import FileTypeClassifier
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from linux_priv_esc/
+    from rt_gtfobins.filetype import FileTypeClassifier
+
 
 class SUIDScanner:
     """
@@ -37,14 +43,20 @@ class SUIDScanner:
         'snap-confine', 'chrome-sandbox', 'Xorg.wrap'
     }
 
-    def __init__(self, gtfobins_db: Optional[GTFOBinsDB] = None):
+    def __init__(
+            self,
+            gtfobins_db: Optional[GTFOBinsDB] = None,
+            classifier: Optional[FileTypeClassifier] = None
+    ):
         """
         Initialize scanner.
 
         Args:
             gtfobins_db: GTFOBins database (created if not provided)
+            classifier: Batched file-type classifier (created if not provided)
         """
         self.gtfobins = gtfobins_db or GTFOBinsDB()
+        self.classifier = classifier or FileTypeClassifier()
 
     def scan(
             self,
@@ -73,8 +85,11 @@ class SUIDScanner:
         unusual: List[SUIDFinding] = []
         standard: List[SUIDFinding] = []
 
+        # Classify every binary in one batch (magic bytes, single 'file' fallback)
+        file_types = self.classifier.classify_many(suid_paths)
+
         for binary_path in suid_paths:
-            finding = self._analyze_binary(binary_path)
+            finding = self._analyze_binary(binary_path, file_types.get(binary_path))
 
             if finding.is_exploitable:
                 exploitable.append(finding)
@@ -85,6 +100,8 @@ class SUIDScanner:
             else:
                 standard.append(finding)
 
+        self.classifier.save()
+
         return exploitable, unusual, standard
 
     def _find_suid_binaries(
@@ -121,7 +138,7 @@ class SUIDScanner:
             print(f"[-] Error searching for SUID binaries: {e}")
             return []
 
-    def _analyze_binary(self, path: str) -> SUIDFinding:
+    def _analyze_binary(self, path: str, file_type: Optional[str] = None) -> SUIDFinding:
         """Analyze a single SUID binary"""
         name = os.path.basename(path)
 
@@ -145,11 +162,13 @@ class SUIDScanner:
         except Exception:
             pass
 
-        # Get file type
-        file_type = self._get_file_type(path)
+        # Get file type (pre-classified in batch mode)
+        if file_type is None:
+            file_type = self._get_file_type(path)
 
-        # Determine category
-        is_exploitable = self.gtfobins.has(name)
+        # Determine category (resolves versioned names like python3.11)
+        gtfobins_name = self.gtfobins.resolve(name)
+        is_exploitable = gtfobins_name is not None
         is_unusual = not is_exploitable and name not in self.STANDARD_BINARIES
 
         return SUIDFinding(
@@ -160,25 +179,13 @@ class SUIDScanner:
             is_exploitable=is_exploitable,
             is_unusual=is_unusual,
             permissions=permissions,
-            file_type=file_type
+            file_type=file_type,
+            gtfobins_name=gtfobins_name or ""
         )
 
     def _get_file_type(self, path: str) -> str:
-        """Get file type using 'file' command"""
-        try:
-            result = subprocess.run(
-                ['file', path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0 and ':' in result.stdout:
-                return result.stdout.split(':', 1)[1].strip()
-        except:
-            pass
-
-        return "unknown"
+        """Get file type (magic bytes, memoized by inode/mtime)"""
+        return self.classifier.classify(path)
 
     def quick_check(self, binary_name: str) -> Optional[SUIDFinding]:
         """
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Offline task store ingestion and analysis benchmark.
+
+Replicates the exported task tree in benchmarks/fixtures/Tasks into a
+temporary store of several thousand tasks, then times:
+
+  - ingestion of the directory tree and of the equivalent combined
+    `schtasks /query /xml ONE` document
+  - analysis with memoized path checks, and with the caches dropped
+    before every task (the previous per-task behaviour)
+
+Writability comes from benchmarks/fixtures/host_facts.json, so each
+"writability check" counted below stands for one icacls process on a
+live host.
+
+Usage:
+    python benchmarks/task_store.py
+    python benchmarks/task_store.py --copies 500
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+FRAMEWORK = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(FRAMEWORK / 'core'))
+
+from analyzer import TaskAnalyzer
+from task_store import TaskStore
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+
+
+class PerTaskAnalyzer(TaskAnalyzer):
+    """Forgets every path check between tasks"""
+
+    def _analyze_task(self, task):
+        self._writable_cache.clear()
+        self._exists_cache.clear()
+        self._resolve_cache.clear()
+        self._path_dirs_checked = False
+        self._writable_path_dir = None
+        return super()._analyze_task(task)
+
+    def path_writable(self, path):
+        self.checks += 1
+        return super().path_writable(path)
+
+
+class MemoAnalyzer(TaskAnalyzer):
+
+    def path_writable(self, path):
+        if self._path_key(path) not in self._writable_cache:
+            self.checks += 1
+        return super().path_writable(path)
+
+
+def build_store(target: Path, copies: int) -> int:
+    """Copy the fixture tree `copies` times under distinct folders"""
+    count = 0
+    for copy in range(copies):
+        for source in (FIXTURES / 'Tasks').rglob('*'):
+            if not source.is_file():
+                continue
+            relative = source.relative_to(FIXTURES / 'Tasks')
+            dest = target / f'Copy{copy:04d}' / relative
+            dest.parent.mkdir(parents=True, exist_ok=True)
+
+            xml = source.read_bytes().decode('utf-16')
+            uri = '\\' + f'Copy{copy:04d}\\' + str(relative).replace('/', '\\')
+            xml = re.sub(r'<URI>[^<]*</URI>', lambda _: f'<URI>{uri}</URI>', xml)
+            dest.write_bytes(xml.encode('utf-16'))
+            count += 1
+    return count
+
+
+def combined_document(store: TaskStore) -> str:
+    """What `schtasks /query /xml ONE` returns for the same tasks"""
+    parts = ['<?xml version="1.0" encoding="UTF-16"?>\n<Tasks>\n']
+    for task in store.tasks:
+        xml = Path(task['source_file']).read_bytes().decode('utf-16')
+        parts.append(f"  <!-- {task['name']} -->\n")
+        parts.append(xml.split('?>', 1)[1])
+    parts.append('</Tasks>\n')
+    return ''.join(parts)
+
+
+def run_analysis(label, analyzer_class, source, facts, output_dir):
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = analyzer_class(output_dir, task_source=source, host_facts=facts)
+        analyzer.checks = 0
+        analyzer.enumerator.enumerate_all_tasks()
+
+        start = time.perf_counter()
+        opportunities = analyzer.analyze_all_tasks()
+        elapsed = time.perf_counter() - start
+
+    print(f"{label:<26}{elapsed * 1000:>10.1f}{analyzer.checks:>14}{len(opportunities):>10}")
+    return sorted((o.task_name, o.opportunity_type, o.target_path) for o in opportunities)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task store ingestion/analysis benchmark")
+    parser.add_argument('--copies', type=int, default=250,
+                        help='Copies of the fixture tree (12 tasks each)')
+    args = parser.parse_args()
+
+    facts = json.loads((FIXTURES / 'host_facts.json').read_text())
+    workdir = Path(tempfile.mkdtemp(prefix='task_store_'))
+
+    try:
+        tasks_dir = workdir / 'Tasks'
+        count = build_store(tasks_dir, args.copies)
+        print(f"[*] {count} task definitions ({args.copies} copies of the fixture tree)\n")
+
+        start = time.perf_counter()
+        store = TaskStore.from_directory(tasks_dir)
+        tree_time = time.perf_counter() - start
+
+        document = workdir / 'tasks.xml'
+        document.write_text(combined_document(store), encoding='utf-8')
+        start = time.perf_counter()
+        combined = TaskStore.load(str(document))
+        doc_time = time.perf_counter() - start
+
+        same = [dict(t, source_file=None) for t in store.tasks] == \
+               [dict(t, source_file=None) for t in combined.tasks]
+        print(f"{'Ingestion':<26}{'ms':>10}{'tasks':>14}")
+        print(f"{'task tree':<26}{tree_time * 1000:>10.1f}{len(store):>14}")
+        print(f"{'schtasks /xml ONE':<26}{doc_time * 1000:>10.1f}{len(combined):>14}")
+        print(f"[{'+' if same else '-'}] Both sources {'parse identically' if same else 'DIFFER'}\n")
+
+        print(f"{'Analysis':<26}{'ms':>10}{'write checks':>14}{'findings':>10}")
+        output_dir = str(workdir / 'out')
+        uncached = run_analysis('per-task checks', PerTaskAnalyzer, str(tasks_dir), facts, output_dir)
+        cached = run_analysis('memoized checks', MemoAnalyzer, str(tasks_dir), facts, output_dir)
+        print(f"[{'+' if uncached == cached else '-'}] Findings "
+              f"{'match' if uncached == cached else 'DIFFER'}\n")
+
+        print("[*] Findings for one copy of the fixture:")
+        for name, kind, target in cached:
+            if name.startswith('\\Copy0000\\'):
+                print(f"    {kind:<24}{name[9:]} -> {target}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
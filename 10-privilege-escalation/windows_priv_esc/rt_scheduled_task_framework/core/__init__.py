@@ -1,5 +1,6 @@
 from .enumerator import TaskEnumerator
 from .analyzer import TaskAnalyzer
 from .base import TaskExploitBase
+from .task_store import TaskStore
 
-__all__ = ["TaskEnumerator", "TaskAnalyzer", "TaskExploitBase"]
\ No newline at end of file
+__all__ = ["TaskEnumerator", "TaskAnalyzer", "TaskExploitBase", "TaskStore"]
\ No newline at end of file
@@ -1,5 +1,7 @@
+import ntpath
 import os
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -36,19 +38,58 @@ class ExploitOpportunity:
         }
 
 
+# Used to expand task commands when analysing another host's tasks
+DEFAULT_ENVIRONMENT = {
+    'SYSTEMDRIVE': 'C:',
+    'SYSTEMROOT': 'C:\\Windows',
+    'WINDIR': 'C:\\Windows',
+    'PROGRAMFILES': 'C:\\Program Files',
+    'PROGRAMFILES(X86)': 'C:\\Program Files (x86)',
+    'PROGRAMDATA': 'C:\\ProgramData',
+    'COMMONPROGRAMFILES': 'C:\\Program Files\\Common Files',
+}
+
+ENV_VAR = re.compile(r'%([^%]+)%')
+
+
 class TaskAnalyzer(TaskExploitBase):
     """Analyze scheduled tasks for exploitation opportunities."""
 
-    def __init__(self, output_dir: str = "task_exploits", verbose: bool = False):
+    def __init__(self, output_dir: str = "task_exploits", verbose: bool = False,
+                 task_source: Optional[str] = None, host_facts: Optional[Dict] = None):
         """
         Initialize the task analyzer.
 
         Args:
             output_dir: Directory for storing output files
             verbose: Enable verbose logging
+            task_source: Task store to analyse (see TaskEnumerator)
+            host_facts: Filesystem facts of the target for offline analysis:
+                        {"writable": [paths], "path": [PATH dirs],
+                        "environment": {VAR: value}}. Listed paths are the
+                        only writable ones and every task path is assumed to exist.
         """
         super().__init__(output_dir, verbose)
-        self.enumerator = TaskEnumerator(output_dir, verbose)
+        self.enumerator = TaskEnumerator(output_dir, verbose, task_source)
+        self.host_facts = host_facts
+
+        environment = dict(DEFAULT_ENVIRONMENT)
+        if host_facts:
+            environment.update({k.upper(): v for k, v in host_facts.get('environment', {}).items()})
+            self.known_writable = {self._path_key(p) for p in host_facts.get('writable', [])}
+            self.path_dirs = host_facts.get('path', [])
+        else:
+            environment.update({k.upper(): v for k, v in os.environ.items()})
+            self.known_writable = None
+            self.path_dirs = os.environ.get('PATH', '').split(';')
+        self.environment = environment
+
+        # Many tasks share binaries and directories: check each path once
+        self._writable_cache: Dict[str, bool] = {}
+        self._exists_cache: Dict[str, bool] = {}
+        self._resolve_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._writable_path_dir: Optional[str] = None
+        self._path_dirs_checked = False
 
         self.findings = {
             'high': [],
@@ -82,8 +123,60 @@ class TaskAnalyzer(TaskExploitBase):
             self.findings[opp.severity].append(opp.to_dict())
 
         self.log(f"Found {len(opportunities)} exploitation opportunities", "SUCCESS")
+        if self.verbose:
+            self.log(f"Writability checks: {len(self._writable_cache)} distinct paths", "INFO")
         return opportunities
 
+    @staticmethod
+    def _path_key(path: str) -> str:
+        return path.rstrip('\\/').replace('/', '\\').lower()
+
+    def _expand(self, command: str) -> str:
+        """Expand %VARIABLE% references in a task command"""
+        return ENV_VAR.sub(lambda m: self.environment.get(m.group(1).upper(), m.group(0)), command)
+
+    def resolve_command(self, command: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        (script path, executable path) of a task command, environment
+        variables expanded. Memoized per command.
+        """
+        if command not in self._resolve_cache:
+            expanded = self._expand(command)
+            script = None
+            if self.enumerator.is_script_command(expanded):
+                script = self.enumerator.extract_script_path(expanded)
+            self._resolve_cache[command] = (script, self.enumerator.extract_exe_path(expanded))
+        return self._resolve_cache[command]
+
+    def path_exists(self, path: str) -> bool:
+        """Memoized existence check (always True when analysing offline)"""
+        if self.known_writable is not None:
+            return True
+        key = self._path_key(path)
+        if key not in self._exists_cache:
+            self._exists_cache[key] = os.path.exists(path)
+        return self._exists_cache[key]
+
+    def path_writable(self, path: str) -> bool:
+        """Memoized writability check (one icacls per distinct path)"""
+        key = self._path_key(path)
+        if key not in self._writable_cache:
+            if self.known_writable is not None:
+                self._writable_cache[key] = key in self.known_writable
+            else:
+                self._writable_cache[key] = self.is_writable(path)
+        return self._writable_cache[key]
+
+    def writable_path_dir(self) -> Optional[str]:
+        """First writable directory in PATH, looked up once per analysis"""
+        if not self._path_dirs_checked:
+            for path_dir in self.path_dirs:
+                if path_dir and self.path_exists(path_dir) and self.path_writable(path_dir):
+                    self._writable_path_dir = path_dir
+                    break
+            self._path_dirs_checked = True
+        return self._writable_path_dir
+
     def _analyze_task(self, task: Dict) -> List[ExploitOpportunity]:
         """
         Analyze a single task for vulnerabilities.
@@ -95,26 +188,28 @@ class TaskAnalyzer(TaskExploitBase):
             List of opportunities for this task
         """
         opportunities = []
-        command = task.get('command', '')
 
-        if not command:
-            return opportunities
+        # Task XML can hold several actions; schtasks output only the first
+        commands = [f"{action['command']} {action['arguments']}".strip()
+                    for action in task.get('actions', []) if action['type'] == 'Exec']
+        if not commands and task.get('command'):
+            commands = [task['command']]
 
-        # Check for writable scripts
-        if self.enumerator.is_script_command(command):
+        for command in commands:
+            # Check for writable scripts
             script_opp = self._check_writable_script(task, command)
             if script_opp:
                 opportunities.append(script_opp)
 
-        # Check for writable executable directory
-        exe_opp = self._check_writable_exe_directory(task, command)
-        if exe_opp:
-            opportunities.append(exe_opp)
+            # Check for writable executable directory
+            exe_opp = self._check_writable_exe_directory(task, command)
+            if exe_opp:
+                opportunities.append(exe_opp)
 
-        # Check for DLL hijacking opportunities
-        dll_opp = self._check_dll_hijacking(task, command)
-        if dll_opp:
-            opportunities.append(dll_opp)
+            # Check for DLL hijacking opportunities
+            dll_opp = self._check_dll_hijacking(task, command)
+            if dll_opp:
+                opportunities.append(dll_opp)
 
         return opportunities
 
@@ -129,17 +224,17 @@ class TaskAnalyzer(TaskExploitBase):
         Returns:
             ExploitOpportunity or None
         """
-        script_path = self.enumerator.extract_script_path(command)
+        script_path, _ = self.resolve_command(command)
 
         if not script_path:
             return None
 
-        if not os.path.exists(script_path):
+        if not self.path_exists(script_path):
             if self.verbose:
                 self.log(f"Script not found: {script_path}", "WARNING")
             return None
 
-        if self.is_writable(script_path):
+        if self.path_writable(script_path):
             self.log(f"FOUND: Writable script - {task['name']}", "SUCCESS")
 
             return ExploitOpportunity(
@@ -166,17 +261,18 @@ class TaskAnalyzer(TaskExploitBase):
         Returns:
             ExploitOpportunity or None
         """
-        exe_path = self.enumerator.extract_exe_path(command)
+        _, exe_path = self.resolve_command(command)
 
         if not exe_path:
             return None
 
-        if not os.path.exists(exe_path):
+        if not self.path_exists(exe_path):
             return None
 
-        exe_dir = os.path.dirname(exe_path)
+        # A bare name (no directory) has nothing to check
+        exe_dir = ntpath.dirname(exe_path)
 
-        if self.is_writable(exe_dir):
+        if exe_dir and self.path_writable(exe_dir):
             self.log(f"FOUND: Writable exe directory - {task['name']}", "SUCCESS")
 
             return ExploitOpportunity(
@@ -203,42 +299,40 @@ class TaskAnalyzer(TaskExploitBase):
         Returns:
             ExploitOpportunity or None
         """
-        exe_path = self.enumerator.extract_exe_path(command)
+        _, exe_path = self.resolve_command(command)
 
         if not exe_path:
             return None
 
-        if not os.path.exists(exe_path):
+        if not self.path_exists(exe_path):
             return None
 
-        exe_dir = os.path.dirname(exe_path)
+        exe_dir = ntpath.dirname(exe_path)
 
         # Check if we can write to the exe directory for DLL planting
-        if self.is_writable(exe_dir):
+        if exe_dir and self.path_writable(exe_dir):
             # This is already covered by writable_exe_directory
             # but we note the specific DLL hijacking potential
             return None
 
-        # Check PATH directories for hijacking
-        path_dirs = os.environ.get('PATH', '').split(';')
-
-        for path_dir in path_dirs:
-            if path_dir and os.path.exists(path_dir):
-                if self.is_writable(path_dir):
-                    # Found writable PATH directory before system dirs
-                    if self.verbose:
-                        self.log(f"Writable PATH dir: {path_dir}", "INFO")
-
-                    return ExploitOpportunity(
-                        task_name=task['name'],
-                        task_user=task.get('user', 'Unknown'),
-                        opportunity_type='path_dll_hijacking',
-                        severity='low',
-                        target_path=path_dir,
-                        description=f"Writable directory in PATH before system directories",
-                        exploitation_method="Plant malicious DLL in writable PATH directory",
-                        next_run=task.get('next_run', 'Unknown')
-                    )
+        # Check PATH directories for hijacking (same answer for every task)
+        path_dir = self.writable_path_dir()
+
+        if path_dir:
+            # Found writable PATH directory before system dirs
+            if self.verbose:
+                self.log(f"Writable PATH dir: {path_dir}", "INFO")
+
+            return ExploitOpportunity(
+                task_name=task['name'],
+                task_user=task.get('user', 'Unknown'),
+                opportunity_type='path_dll_hijacking',
+                severity='low',
+                target_path=path_dir,
+                description=f"Writable directory in PATH before system directories",
+                exploitation_method="Plant malicious DLL in writable PATH directory",
+                next_run=task.get('next_run', 'Unknown')
+            )
 
         return None
 
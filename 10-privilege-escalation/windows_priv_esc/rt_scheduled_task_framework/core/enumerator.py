@@ -9,6 +9,7 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from base import TaskExploitBase
+from task_store import TaskStore
 
 
 class TaskEnumerator(TaskExploitBase):
@@ -20,18 +21,57 @@ class TaskEnumerator(TaskExploitBase):
     # Script extensions
     SCRIPT_EXTENSIONS = ['.bat', '.cmd', '.ps1', '.vbs', '.js', '.wsf']
 
-    def __init__(self, output_dir: str = "task_exploits", verbose: bool = False):
+    def __init__(self, output_dir: str = "task_exploits", verbose: bool = False,
+                 task_source: Optional[str] = None):
         """
         Initialize the task enumerator.
 
         Args:
             output_dir: Directory for storing output files
             verbose: Enable verbose logging
+            task_source: Task store to read instead of querying schtasks: an
+                         exported System32\\Tasks tree, a saved
+                         `schtasks /query /xml ONE` file, or "live" for one
+                         live XML query
         """
         super().__init__(output_dir, verbose)
+        self.task_source = task_source
+        self.task_store: Optional[TaskStore] = None
         self.tasks_cache: List[Dict] = []
         self.log("Task Enumerator initialized", "SUCCESS")
 
+    def load_task_store(self, source: Optional[str] = None) -> Optional[TaskStore]:
+        """
+        Read every task definition in one pass.
+
+        Args:
+            source: Exported task tree or saved XML document; None (or "live")
+                    runs a single `schtasks /query /xml ONE` and saves its
+                    output for offline analysis
+
+        Returns:
+            TaskStore or None on failure
+        """
+        if source and source != 'live':
+            self.log(f"Loading task store from {source}...")
+            self.task_store = TaskStore.load(source)
+        else:
+            self.log("Querying all task definitions (XML)...")
+            result = self.execute_command('schtasks /query /xml ONE', timeout=120)
+
+            if not result['success']:
+                self.log("Failed to query task XML", "ERROR")
+                return None
+
+            saved = self.output_dir / f"task_store_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xml"
+            saved.write_text(result['stdout'], encoding='utf-8')
+            self.task_store = TaskStore.from_xml(result['stdout'], str(saved))
+            self.log(f"Task XML saved to: {saved}", "INFO")
+
+        self.tasks_cache = self.task_store.tasks
+        self.log(f"Loaded {len(self.task_store)} task definitions", "SUCCESS")
+        return self.task_store
+
     def enumerate_all_tasks(self, refresh: bool = False) -> List[Dict]:
         """
         Enumerate all scheduled tasks on the system.
@@ -45,6 +85,10 @@ class TaskEnumerator(TaskExploitBase):
         if self.tasks_cache and not refresh:
             return self.tasks_cache
 
+        if self.task_source:
+            store = self.load_task_store(self.task_source)
+            return store.tasks if store else []
+
         self.log("Enumerating scheduled tasks...")
 
         cmd = 'schtasks /query /fo LIST /v'
@@ -139,6 +183,9 @@ class TaskEnumerator(TaskExploitBase):
         Returns:
             Task dictionary or None
         """
+        if self.task_store:
+            return self.task_store.get(task_name)
+
         cmd = f'schtasks /query /tn "{task_name}" /fo LIST /v'
         result = self.execute_command(cmd)
 
@@ -158,6 +205,13 @@ class TaskEnumerator(TaskExploitBase):
         Returns:
             XML string or None
         """
+        task = self.task_store.get(task_name) if self.task_store else None
+        if task and task.get('source_file'):
+            # Task files are UTF-16 with a BOM
+            with open(task['source_file'], 'rb') as f:
+                data = f.read()
+            return data.decode('utf-16' if data[:2] in (b'\xff\xfe', b'\xfe\xff') else 'utf-8-sig')
+
         cmd = f'schtasks /query /tn "{task_name}" /xml'
         result = self.execute_command(cmd)
 
@@ -0,0 +1,298 @@
+import os
+import xml.etree.ElementTree as ET
+from urllib.parse import quote, unquote
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# Principals in task XML are often SIDs
+WELL_KNOWN_ACCOUNTS = {
+    'S-1-5-18': 'NT AUTHORITY\\SYSTEM',
+    'S-1-5-19': 'NT AUTHORITY\\LOCAL SERVICE',
+    'S-1-5-20': 'NT AUTHORITY\\NETWORK SERVICE',
+    'S-1-5-32-544': 'BUILTIN\\Administrators',
+    'S-1-5-32-545': 'BUILTIN\\Users',
+    'S-1-5-4': 'NT AUTHORITY\\INTERACTIVE',
+    'S-1-5-11': 'NT AUTHORITY\\Authenticated Users',
+    'S-1-1-0': 'Everyone',
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+TASK_NAMESPACE = '{http://schemas.microsoft.com/windows/2004/02/mit/task}'
+
+# <?source PATH?> (percent-encoded) in a combined document marks the file
+# the following tasks came from
+SOURCE_PI = 'source'
+
+# Elements handled when they close (with or without the schema namespace)
+_SECTIONS = {}
+for _name in ('Task', 'RegistrationInfo', 'Triggers', 'Principals', 'Settings', 'Actions'):
+    _SECTIONS[_name] = _SECTIONS[TASK_NAMESPACE + _name] = _name
+
+
+def _local(tag) -> str:
+    """Tag name without the task schema namespace"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _children(elem) -> Dict[str, str]:
+    """{local tag: text} of an element's direct children"""
+    return {_local(child.tag): (child.text or '').strip() for child in elem}
+
+
+def _new_task(name: str) -> Dict:
+    return {
+        'name': name,
+        'command': '',
+        'user': '',
+        'status': 'Ready',
+        'schedule_type': '',
+        'author': '',
+        'comment': '',
+        'run_level': 'LeastPrivilege',
+        'logon_type': '',
+        'hidden': False,
+        'actions': [],
+        'triggers': [],
+    }
+
+
+def _read_section(task: Dict, section: str, elem) -> None:
+    """Copy the fields of a closed section element into task"""
+    if section == 'RegistrationInfo':
+        info = _children(elem)
+        if info.get('URI'):
+            task['name'] = info['URI']
+        task['author'] = info.get('Author', '')
+        task['comment'] = info.get('Description', '')
+
+    elif section == 'Triggers':
+        task['triggers'] = [_local(trigger.tag) for trigger in elem]
+
+    elif section == 'Principals':
+        for principal in elem:
+            fields = _children(principal)
+            task['user'] = fields.get('UserId') or fields.get('GroupId', '')
+            task['run_level'] = fields.get('RunLevel', task['run_level'])
+            task['logon_type'] = fields.get('LogonType', '')
+            break
+
+    elif section == 'Settings':
+        settings = _children(elem)
+        if settings.get('Enabled', '').lower() == 'false':
+            task['status'] = 'Disabled'
+        task['hidden'] = settings.get('Hidden', '').lower() == 'true'
+
+    elif section == 'Actions':
+        for action in elem:
+            kind = _local(action.tag)
+            fields = _children(action)
+            if kind == 'Exec':
+                task['actions'].append({
+                    'type': kind,
+                    'command': fields.get('Command', ''),
+                    'arguments': fields.get('Arguments', ''),
+                    'working_directory': fields.get('WorkingDirectory', '')
+                })
+            elif kind == 'ComHandler':
+                task['actions'].append({'type': kind, 'class_id': fields.get('ClassId', '')})
+
+
+def _finish_task(task: Dict) -> Dict:
+    execs = [action for action in task['actions'] if action['type'] == 'Exec']
+    if execs:
+        first = execs[0]
+        task['command'] = f"{first['command']} {first['arguments']}".strip()
+    elif task['actions']:
+        task['command'] = f"COM handler {task['actions'][0].get('class_id', '')}"
+
+    task['user'] = WELL_KNOWN_ACCOUNTS.get(task['user'].upper(), task['user']) or 'N/A'
+    task['schedule_type'] = ', '.join(task['triggers']) or 'On demand only'
+    return task
+
+
+def iter_task_xml(chunks: Iterable[Union[bytes, str]], default_name: str = '') -> Iterator[Dict]:
+    """
+    Stream task dictionaries out of task XML.
+
+    Accepts a single task definition (a file from System32\\Tasks) or the
+    combined document from `schtasks /query /xml ONE`, where each <Task> is
+    preceded by a comment holding its name. A <?source PATH?> processing
+    instruction sets 'source_file' on the tasks after it. Each section is read when it
+    closes and a task's elements are discarded once it is complete, so
+    memory stays flat for any store size.
+
+    Args:
+        chunks: XML as an iterable of bytes or str pieces
+        default_name: Task name if the XML carries neither URI nor name comment
+
+    Yields:
+        Task dictionaries in the same shape as TaskEnumerator's schtasks parser
+    """
+    parser = ET.XMLPullParser(events=('end', 'comment', 'pi'))
+    pending_name = default_name
+    source = None
+    task = None
+
+    def events():
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    for event, elem in events():
+        if event == 'comment':
+            pending_name = (elem.text or '').strip() or pending_name
+            continue
+
+        if event == 'pi':
+            target, _, data = (elem.text or '').partition(' ')
+            if target == SOURCE_PI:
+                source = unquote(data.strip())
+            continue
+
+        section = _SECTIONS.get(elem.tag)
+        if section is None:
+            continue
+
+        if task is None:
+            task = _new_task(pending_name)
+            if source is not None:
+                task['source_file'] = source
+
+        if section == 'Task':
+            yield _finish_task(task)
+            task = None
+            pending_name = default_name
+            elem.clear()
+        else:
+            _read_section(task, section, elem)
+
+
+def _decode(data: bytes) -> str:
+    """Task files are UTF-16 with a BOM; saved schtasks output is UTF-8"""
+    if data[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        return data.decode('utf-16')
+    return data.decode('utf-8-sig')
+
+
+def _task_files(root: str) -> Iterator[Tuple[str, str, str]]:
+    """(path, task name, XML without declaration) for each task definition under root"""
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                # Task definitions are a few KB: read each in one go
+                with open(path, 'rb') as f:
+                    xml = _decode(f.read())
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            if xml.startswith('<?xml'):
+                xml = xml[xml.find('?>') + 2:]
+            xml = xml.lstrip()
+
+            # Skip anything that is not a task definition (desktop.ini...)
+            if xml.startswith('<Task'):
+                yield path, '\\' + os.path.relpath(path, root).replace('/', '\\'), xml
+
+
+def _read_chunks(path: str) -> Iterator[str]:
+    """
+    File contents as decoded text in chunks. Text is fed to the parser so
+    the (often wrong) encoding in the XML declaration is ignored, and
+    decoding UTF-16 here is much faster than leaving it to expat.
+    """
+    with open(path, 'rb') as f:
+        encoding = 'utf-16' if f.read(2) in (b'\xff\xfe', b'\xfe\xff') else 'utf-8-sig'
+
+    with open(path, encoding=encoding) as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+class TaskStore:
+    """
+    Whole task store read in one pass: an exported System32\\Tasks tree,
+    a saved `schtasks /query /xml ONE` document, or that command's output.
+    """
+
+    def __init__(self, tasks: List[Dict], source: str):
+        self.tasks = tasks
+        self.source = source
+        self.by_name = {task['name'].lower(): task for task in tasks}
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def get(self, task_name: str) -> Optional[Dict]:
+        """Task by name, with or without the leading backslash"""
+        name = task_name.lower()
+        return self.by_name.get(name) or self.by_name.get('\\' + name.lstrip('\\'))
+
+    @classmethod
+    def from_directory(cls, root: str) -> 'TaskStore':
+        """
+        Load an exported task tree (a copy of C:\\Windows\\System32\\Tasks).
+
+        Args:
+            root: Directory holding the task definition files
+
+        Returns:
+            TaskStore with one task per parseable file
+        """
+        root = str(root)
+
+        def document():
+            # The whole tree as one combined document, like schtasks /xml ONE;
+            # a file may hold zero or several tasks, so each carries its path
+            yield '<Tasks>'
+            for path, name, xml in _task_files(root):
+                yield f"<?{SOURCE_PI} {quote(path)}?>"
+                yield f"<!-- {name.replace('--', '-')} -->"
+                yield xml
+            yield '</Tasks>'
+
+        try:
+            tasks = list(iter_task_xml(document()))
+        except ET.ParseError:
+            # A damaged file breaks the stream: parse files one by one instead
+            tasks = []
+            for path, name, xml in _task_files(root):
+                try:
+                    parsed = list(iter_task_xml((xml,), name))
+                except ET.ParseError:
+                    continue
+                for task in parsed:
+                    task['source_file'] = path
+                tasks.extend(parsed)
+
+        tasks.sort(key=lambda task: task['name'].lower())
+        return cls(tasks, root)
+
+    @classmethod
+    def from_xml(cls, xml: Union[str, bytes], source: str = 'schtasks') -> 'TaskStore':
+        """
+        Load the combined XML document from `schtasks /query /xml ONE`.
+
+        Args:
+            xml: Document text (or bytes)
+            source: Description of where the document came from
+
+        Returns:
+            TaskStore with every task in the document
+        """
+        pieces = (xml[i:i + CHUNK_SIZE] for i in range(0, len(xml), CHUNK_SIZE))
+        return cls(list(iter_task_xml(pieces)), source)
+
+    @classmethod
+    def load(cls, source: str) -> 'TaskStore':
+        """Load a task tree directory or a saved combined XML file"""
+        if os.path.isdir(source):
+            return cls.from_directory(source)
+        return cls(list(iter_task_xml(_read_chunks(source))), source)
@@ -9,9 +9,11 @@ Usage:
     python task_exploit.py --analyze                # Analyze for vulnerabilities
     python task_exploit.py --exploit --task NAME --script PATH --payload PAYLOAD
     python task_exploit.py --auto --payload PAYLOAD # Fully automated
+    python task_exploit.py --analyze --task-store Tasks/ --host-facts facts.json  # Offline
 """
 
 import argparse
+import json
 import sys
 import os
 from pathlib import Path
@@ -39,6 +41,12 @@ Examples:
   Analyze tasks for vulnerabilities:
     python task_exploit.py --analyze
 
+  Analyze every task definition from one XML query:
+    python task_exploit.py --analyze --task-store live
+
+  Analyze an exported System32\\Tasks tree offline (any platform):
+    python task_exploit.py --analyze --task-store ./Tasks --host-facts facts.json
+
   Exploit a specific task:
     python task_exploit.py --exploit --task "BackupTask" --script "C:\\Scripts\\backup.bat" --payload payload.exe
 
@@ -64,6 +72,14 @@ Examples:
     mode_group.add_argument('--auto', action='store_true',
                             help='Automated enumeration and exploitation')
 
+    # Task store options
+    store_group = parser.add_argument_group('Task Store')
+    store_group.add_argument('--task-store', type=str, metavar='SOURCE',
+                             help='Read all task XML in one pass: "live" (schtasks /xml ONE), '
+                                  'an exported System32\\Tasks tree or a saved XML file')
+    store_group.add_argument('--host-facts', type=str, metavar='FILE',
+                             help='JSON of writable paths, PATH and environment for offline analysis')
+
     # Exploitation options
     exploit_group = parser.add_argument_group('Exploitation Options')
     exploit_group.add_argument('--task', '-t', type=str,
@@ -124,8 +140,10 @@ Examples:
 
     args = parser.parse_args()
 
-    # Check if on Windows
-    if not check_windows():
+    offline = args.task_store not in (None, 'live')
+
+    # Check if on Windows (saved task stores can be analysed anywhere)
+    if not check_windows() and not offline:
         print("[-] This tool only works on Windows systems")
         sys.exit(1)
 
@@ -140,7 +158,7 @@ Examples:
 
     # Handle enumerate mode
     if args.enumerate:
-        enumerator = TaskEnumerator(args.output_dir, args.verbose)
+        enumerator = TaskEnumerator(args.output_dir, args.verbose, args.task_store)
         tasks = enumerator.enumerate_all_tasks()
 
         print(f"\n[+] Found {len(tasks)} scheduled tasks")
@@ -153,7 +171,12 @@ Examples:
 
     # Handle analyze mode
     elif args.analyze:
-        analyzer = TaskAnalyzer(args.output_dir, args.verbose)
+        host_facts = None
+        if args.host_facts:
+            with open(args.host_facts) as f:
+                host_facts = json.load(f)
+
+        analyzer = TaskAnalyzer(args.output_dir, args.verbose, args.task_store, host_facts)
         opportunities = analyzer.analyze_all_tasks()
         analyzer.display_findings()
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Offline service ACL analysis benchmark.
+
+Runs against saved collector output (default: the recorded fixture in
+benchmarks/fixtures/), replicated to simulate larger or multiple hosts.
+Compares the old substring check on the raw SDDL with the SDDL parser,
+with and without memoization, and lists the services where the substring
+check and the parser disagree.
+
+Examples (from 10-privilege-escalation/windows_priv_esc/):
+    python -m rt_service_exploitation_framework.benchmarks.sddl_analysis
+    python -m rt_service_exploitation_framework.benchmarks.sddl_analysis --copies 200
+    python -m rt_service_exploitation_framework.benchmarks.sddl_analysis --inventory services.json
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from ..core.collector import ServiceCollector
+from ..core.sddl import LOW_PRIVILEGE_SIDS, analyze_sddl
+from ..core import sddl as sddl_module
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'services.json'
+
+
+def substring_check(sddl):
+    """The check this framework used before the parser (any DACL/SACL text match)"""
+    for sid in ('WD', 'BU', 'AU'):
+        if sid in sddl:
+            if 'DC' in sddl or 'WD' in sddl or 'GA' in sddl:
+                return True
+    return False
+
+
+def parser_check(sddl):
+    return analyze_sddl(sddl, LOW_PRIVILEGE_SIDS)['can_modify']
+
+
+def clear_caches():
+    for cached in (sddl_module.parse_sddl, sddl_module.effective_rights, sddl_module._analyze):
+        cached.cache_clear()
+
+
+def uncached_parser_check(sddl):
+    clear_caches()
+    return parser_check(sddl)
+
+
+def run_mode(label, check, services):
+    clear_caches()
+
+    start = time.perf_counter()
+    flagged = [service['name'] for service in services if service['sddl'] and check(service['sddl'])]
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<20}{len(services):>10}{elapsed * 1000:>12.1f}"
+          f"{elapsed / len(services) * 1e6:>12.2f}{len(flagged):>9}")
+    return flagged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline service ACL analysis benchmark")
+    parser.add_argument('--inventory', type=str, default=str(FIXTURE),
+                        help='Saved collector output (default: recorded fixture)')
+    parser.add_argument('--copies', type=int, default=50,
+                        help='Times to replicate the inventory (simulated hosts)')
+    args = parser.parse_args()
+
+    inventory = ServiceCollector.load(args.inventory)
+    services = [dict(service, name=f"{service['name']}#{copy}")
+                for copy in range(args.copies) for service in inventory]
+    distinct = len({service['sddl'] for service in inventory})
+
+    print(f"[*] {len(inventory)} services ({distinct} distinct descriptors) x {args.copies}\n")
+    print(f"{'Check':<20}{'services':>10}{'total ms':>12}{'us/service':>12}{'flagged':>9}")
+
+    naive = run_mode('substring', substring_check, services)
+    uncached = run_mode('parser', uncached_parser_check, services)
+    cached = run_mode('parser, memoized', parser_check, services)
+
+    print(f"\n[{'+' if uncached == cached else '-'}] Memoized results "
+          f"{'match' if uncached == cached else 'DIFFER'}")
+
+    # Per-service verdicts of the first copy
+    old = {name.split('#')[0] for name in naive}
+    new = {name.split('#')[0] for name in cached}
+    print(f"\n[*] Exploitable per parser: {', '.join(sorted(new)) or 'none'}")
+    for name in sorted(old - new):
+        print(f"    - false positive of substring check: {name}")
+    for name in sorted(new - old):
+        print(f"    - missed by substring check: {name}")
+
+
+if __name__ == '__main__':
+    main()
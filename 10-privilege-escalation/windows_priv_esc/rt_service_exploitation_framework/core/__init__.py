@@ -2,7 +2,8 @@
 Core module for service enumeration and base functionality.
 """
 
+from .collector import ServiceCollector
 from .enumerator import ServiceEnumerator
 from .base import ServiceExploitBase
 
-__all__ = ["ServiceEnumerator", "ServiceExploitBase"]
\ No newline at end of file
+__all__ = ["ServiceCollector", "ServiceEnumerator", "ServiceExploitBase"]
\ No newline at end of file
@@ -0,0 +1,174 @@
+import base64
+import json
+import socket
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Union
+
+
+# One PowerShell process collects every service's configuration (Win32_Service)
+# and DACL. The DACL is read with QueryServiceObjectSecurity, which only needs
+# READ_CONTROL on the service - the same access `sc sdshow` uses - so it works
+# as a standard user, unlike reading the Services\<name>\Security registry value.
+COLLECTOR_SCRIPT = r"""
+$ErrorActionPreference = 'SilentlyContinue'
+Add-Type -TypeDefinition @'
+using System;
+using System.Runtime.InteropServices;
+using System.Security.AccessControl;
+public static class RtServiceSecurity {
+    [DllImport("advapi32.dll", SetLastError = true)]
+    static extern IntPtr OpenSCManager(string machine, string database, uint access);
+    [DllImport("advapi32.dll", SetLastError = true, CharSet = CharSet.Unicode)]
+    static extern IntPtr OpenService(IntPtr manager, string name, uint access);
+    [DllImport("advapi32.dll", SetLastError = true)]
+    static extern bool QueryServiceObjectSecurity(IntPtr service, uint info, byte[] sd, uint size, out uint needed);
+    [DllImport("advapi32.dll")]
+    static extern bool CloseServiceHandle(IntPtr handle);
+
+    static readonly IntPtr Manager = OpenSCManager(null, null, 0x1);
+
+    public static string GetSddl(string name) {
+        IntPtr service = OpenService(Manager, name, 0x20000);
+        if (service == IntPtr.Zero) { return null; }
+        try {
+            uint needed;
+            QueryServiceObjectSecurity(service, 0x4, new byte[0], 0, out needed);
+            if (needed == 0) { return null; }
+            byte[] sd = new byte[needed];
+            if (!QueryServiceObjectSecurity(service, 0x4, sd, needed, out needed)) { return null; }
+            return new RawSecurityDescriptor(sd, 0).GetSddlForm(AccessControlSections.Access);
+        } finally {
+            CloseServiceHandle(service);
+        }
+    }
+}
+'@
+$deps = @{}
+Get-Service | ForEach-Object { $deps[$_.Name] = @($_.ServicesDependedOn | ForEach-Object { $_.Name }) }
+$services = @(Get-CimInstance Win32_Service | ForEach-Object {
+    [pscustomobject]@{
+        name = $_.Name
+        display = $_.DisplayName
+        state = $_.State
+        start_type = $_.StartMode
+        binary_path = $_.PathName
+        account = $_.StartName
+        dependencies = @($deps[$_.Name])
+        sddl = [RtServiceSecurity]::GetSddl($_.Name)
+    }
+})
+ConvertTo-Json -InputObject $services -Depth 3 -Compress
+"""
+
+SERVICE_FIELDS = ('name', 'display', 'state', 'start_type', 'binary_path', 'account', 'sddl')
+
+
+class ServiceCollector:
+    """
+    Bulk service collection: configuration and security descriptors for
+    every service in one structured query, instead of `sc qc` and
+    `sc sdshow` per service.
+
+    The output can be saved and loaded back, so analysis (see core.sddl)
+    can run offline on any platform.
+    """
+
+    def __init__(self, timeout: int = 300):
+        """
+        Initialize the collector.
+
+        Args:
+            timeout: Seconds to allow the PowerShell collection to run
+        """
+        self.timeout = timeout
+
+    def collect(self) -> List[Dict]:
+        """
+        Collect all services on the local host.
+
+        Returns:
+            List of service dictionaries (name, display, state, start_type,
+            binary_path, account, dependencies, sddl). sddl is empty when
+            Add-Type is blocked (Constrained Language Mode, AppLocker).
+
+        Raises:
+            RuntimeError: PowerShell is missing or the collection failed
+        """
+        print("[*] Collecting service configurations and security descriptors...")
+
+        encoded = base64.b64encode(COLLECTOR_SCRIPT.encode('utf-16-le')).decode()
+        try:
+            result = subprocess.run(
+                ['powershell', '-NoProfile', '-NonInteractive', '-EncodedCommand', encoded],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            # No powershell.exe on PATH, or the query hung
+            raise RuntimeError(f"Service collection failed: {e}")
+
+        if result.returncode != 0 or not result.stdout.strip():
+            raise RuntimeError(f"Service collection failed: {result.stderr.strip()}")
+
+        try:
+            services = self.normalize(json.loads(result.stdout))
+        except ValueError as e:
+            raise RuntimeError(f"Service collection returned invalid JSON: {e}")
+        print(f"[+] Collected {len(services)} services")
+        return services
+
+    @staticmethod
+    def normalize(records: Union[List, Dict]) -> List[Dict]:
+        """
+        Normalize collector records (a single service may be serialized
+        as a bare object) so every field is present.
+        """
+        if isinstance(records, dict):
+            records = records.get('services', [records])
+
+        services = []
+        for record in records:
+            service = {field: record.get(field) or '' for field in SERVICE_FIELDS}
+            service['dependencies'] = [d for d in record.get('dependencies') or [] if d]
+            services.append(service)
+        return services
+
+    @staticmethod
+    def save(services: List[Dict], path: str) -> str:
+        """
+        Save collected services for offline analysis.
+
+        Args:
+            services: Output of collect()
+            path: Destination JSON file
+
+        Returns:
+            Path to the saved file
+        """
+        path = Path(path)
+        document = {
+            'host': socket.gethostname(),
+            'collected': datetime.now().isoformat(timespec='seconds'),
+            'services': services
+        }
+        path.write_text(json.dumps(document, indent=1))
+        print(f"[+] Service inventory saved to: {path}")
+        return str(path)
+
+    @classmethod
+    def load(cls, path: str) -> List[Dict]:
+        """
+        Load a saved inventory (or raw collector JSON output).
+
+        Args:
+            path: JSON file written by save() or by the collector script
+
+        Returns:
+            List of service dictionaries
+        """
+        # PowerShell redirection writes UTF-8 with a BOM
+        with open(path, encoding='utf-8-sig') as f:
+            return cls.normalize(json.load(f))
@@ -1,22 +1,28 @@
 import subprocess
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
 from datetime import datetime
 
+from .collector import ServiceCollector
+from .sddl import LOW_PRIVILEGE_SIDS, analyze_sddl
+
 
 class ServiceEnumerator:
     """Enumerate Windows services and their configurations."""
 
-    def __init__(self, output_dir: str = "service_exploits"):
+    def __init__(self, output_dir: str = "service_exploits", inventory: Optional[str] = None):
         """
         Initialize the service enumerator.
 
         Args:
             output_dir: Directory for storing enumeration results
+            inventory: Saved collector output to analyse instead of the local host
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.inventory = inventory
         self.services_cache: List[Dict] = []
+        self.details_cache: List[Dict] = []
 
     def get_all_services(self, refresh: bool = False) -> List[Dict]:
         """
@@ -31,6 +37,10 @@ class ServiceEnumerator:
         if self.services_cache and not refresh:
             return self.services_cache
 
+        if self.inventory:
+            self.services_cache = self.get_service_details(refresh)
+            return self.services_cache
+
         print("[*] Enumerating all Windows services...")
 
         cmd = 'sc query type= service state= all'
@@ -64,6 +74,87 @@ class ServiceEnumerator:
 
         return services
 
+    def get_service_details(self, refresh: bool = False) -> List[Dict]:
+        """
+        Get configuration and security descriptor of every service in one
+        bulk collection (or from the saved inventory).
+
+        Args:
+            refresh: Force a new collection
+
+        Returns:
+            List of service dictionaries including binary_path, start_type,
+            account, dependencies and sddl
+        """
+        if self.details_cache and not refresh:
+            return self.details_cache
+
+        if self.inventory:
+            self.details_cache = ServiceCollector.load(self.inventory)
+            print(f"[+] Loaded {len(self.details_cache)} services from {self.inventory}")
+            return self.details_cache
+
+        try:
+            services = ServiceCollector().collect()
+        except RuntimeError as e:
+            print(f"[-] {e}")
+            print("[*] Falling back to per-service sc qc / sc sdshow...")
+            services = self._collect_per_service()
+
+        # Add-Type is blocked under Constrained Language Mode / AppLocker,
+        # which leaves every descriptor empty; sc sdshow still works
+        missing = [service for service in services if not service['sddl']]
+        if missing:
+            print(f"[!] {len(missing)} services have no collected security descriptor, "
+                  f"querying sc sdshow per service...")
+            for service in missing:
+                service['sddl'] = self.query_sddl(service['name'])
+
+        self.details_cache = services
+        return self.details_cache
+
+    def _collect_per_service(self) -> List[Dict]:
+        """
+        Service details from sc query / sc qc, one service at a time
+        (sddl left empty for get_service_details to fill in).
+        """
+        records = []
+        for service in self.get_all_services(refresh=True):
+            record = dict(service)
+            record.update(self.get_service_config(service['name']))
+            records.append(record)
+        return ServiceCollector.normalize(records)
+
+    def find_weak_service_acls(self, sids: Iterable[str] = LOW_PRIVILEGE_SIDS) -> List[Dict]:
+        """
+        Find services whose DACL lets the given principals reconfigure them.
+
+        Args:
+            sids: SIDs or SDDL aliases held by the current user
+                  (default: Everyone, Authenticated Users, Users, Interactive)
+
+        Returns:
+            List of permission dictionaries for exploitable services
+        """
+        sids = tuple(sids)
+        weak = []
+
+        for service in self.get_service_details():
+            if not service['sddl']:
+                continue
+
+            permissions = self.get_service_permissions(service['name'], service['sddl'], sids)
+            if permissions['can_modify']:
+                permissions.update({
+                    'binary_path': service['binary_path'],
+                    'start_type': service['start_type'],
+                    'account': service['account'],
+                    'state': service['state']
+                })
+                weak.append(permissions)
+
+        return weak
+
     @staticmethod
     def get_service_config(service_name: str) -> Dict:
         """
@@ -107,18 +198,44 @@ class ServiceEnumerator:
         return config
 
     @staticmethod
-    def get_service_permissions(service_name: str) -> Dict:
+    def query_sddl(service_name: str) -> str:
+        """
+        Query a service's security descriptor with sc sdshow.
+
+        Returns:
+            SDDL string, or '' when it could not be read
+        """
+        result = subprocess.run(
+            f'sc sdshow "{service_name}"',
+            shell=True,
+            capture_output=True,
+            text=True
+        )
+        # Failures ("[SC] OpenService FAILED 5: ...") are printed on stdout
+        if result.returncode != 0:
+            return ''
+        return result.stdout.strip()
+
+    @staticmethod
+    def get_service_permissions(service_name: str, sddl: Optional[str] = None,
+                                sids: Iterable[str] = LOW_PRIVILEGE_SIDS) -> Dict:
         """
         Get security permissions for a service.
 
         Args:
             service_name: Name of the service
+            sddl: Security descriptor already collected (queried with sc sdshow if omitted)
+            sids: Principals to evaluate the DACL for
 
         Returns:
             Dictionary with permission information
         """
+        if sddl is None:
+            sddl = ServiceEnumerator.query_sddl(service_name)
+
         permissions = {
             'service_name': service_name,
+            'sddl': sddl,
             'can_modify': False,
             'can_start': False,
             'can_stop': False,
@@ -126,34 +243,25 @@ class ServiceEnumerator:
             'raw_permissions': []
         }
 
-        result = subprocess.run(
-            f'sc sdshow "{service_name}"',
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-
-        sddl = result.stdout.strip()
-        permissions['sddl'] = sddl
-
-        # Parse SDDL for common permission patterns
-        # D:(A;;CCLCSWRPWPDTLOCRRC;;;SY) - typical admin permissions
-        # Look for permissions granted to Users, Everyone, or Authenticated Users
-
-        vulnerable_sids = ['WD', 'BU', 'AU']  # Everyone, BUILTIN\Users, Authenticated Users
-
-        for sid in vulnerable_sids:
-            if sid in sddl:
-                # Check what permissions are granted
-                # RPWP = Start/Stop, DC = Change Config, WD = Write DAC
-                if 'DC' in sddl or 'WD' in sddl:
-                    permissions['can_modify'] = True
-                if 'RP' in sddl:
-                    permissions['can_start'] = True
-                if 'WP' in sddl:
-                    permissions['can_stop'] = True
-                if 'GA' in sddl:  # Generic All
-                    permissions['full_control'] = True
+        # Empty when the descriptor could not be read (no READ_CONTROL)
+        if not sddl:
+            return permissions
+
+        try:
+            analysis = analyze_sddl(sddl, sids)
+        except ValueError as e:
+            print(f"[-] Could not parse security descriptor of {service_name}: {e}")
+            return permissions
+
+        permissions.update({
+            'can_modify': analysis['can_modify'],
+            'can_start': analysis['can_start'],
+            'can_stop': analysis['can_stop'],
+            'full_control': analysis['full_control'],
+            'rights': analysis['rights_codes'],
+            'takeover_rights': analysis['takeover_rights'],
+            'raw_permissions': analysis['granting_aces']
+        })
 
         return permissions
 
@@ -173,7 +281,7 @@ class ServiceEnumerator:
 
         filepath = self.output_dir / filename
 
-        services = self.get_all_services()
+        services = self.get_service_details()
 
         with open(filepath, 'w') as f:
             f.write("=" * 60 + "\n")
@@ -182,14 +290,13 @@ class ServiceEnumerator:
             f.write("=" * 60 + "\n\n")
 
             for service in services:
-                config = self.get_service_config(service['name'])
-
                 f.write(f"Service: {service['name']}\n")
-                f.write(f"  Display: {service.get('display', 'N/A')}\n")
-                f.write(f"  State: {service.get('state', 'N/A')}\n")
-                f.write(f"  Binary: {config.get('binary_path', 'N/A')}\n")
-                f.write(f"  Start Type: {config.get('start_type', 'N/A')}\n")
-                f.write(f"  Account: {config.get('account', 'N/A')}\n")
+                f.write(f"  Display: {service.get('display') or 'N/A'}\n")
+                f.write(f"  State: {service.get('state') or 'N/A'}\n")
+                f.write(f"  Binary: {service.get('binary_path') or 'N/A'}\n")
+                f.write(f"  Start Type: {service.get('start_type') or 'N/A'}\n")
+                f.write(f"  Account: {service.get('account') or 'N/A'}\n")
+                f.write(f"  SDDL: {service.get('sddl') or 'N/A'}\n")
                 f.write("-" * 40 + "\n")
 
         print(f"[+] Enumeration exported to: {filepath}")
@@ -0,0 +1,264 @@
+"""
+SDDL parsing and access evaluation for service security descriptors.
+
+Pure Python, so saved collector output can be analysed on any platform.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# Service-specific access rights
+SERVICE_QUERY_CONFIG = 0x0001
+SERVICE_CHANGE_CONFIG = 0x0002
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_ENUMERATE_DEPENDENTS = 0x0008
+SERVICE_START = 0x0010
+SERVICE_STOP = 0x0020
+SERVICE_PAUSE_CONTINUE = 0x0040
+SERVICE_INTERROGATE = 0x0080
+SERVICE_USER_DEFINED_CONTROL = 0x0100
+
+# Standard rights
+DELETE = 0x00010000
+READ_CONTROL = 0x00020000
+WRITE_DAC = 0x00040000
+WRITE_OWNER = 0x00080000
+
+SERVICE_ALL_ACCESS = 0x000F01FF
+
+# Generic rights as mapped by the service control manager
+GENERIC_MAPPING = {
+    0x10000000: SERVICE_ALL_ACCESS,                                     # GA
+    0x20000000: READ_CONTROL | SERVICE_START | SERVICE_STOP             # GX
+                | SERVICE_PAUSE_CONTINUE | SERVICE_USER_DEFINED_CONTROL,
+    0x40000000: READ_CONTROL | SERVICE_CHANGE_CONFIG,                   # GW
+    0x80000000: READ_CONTROL | SERVICE_QUERY_CONFIG | SERVICE_QUERY_STATUS  # GR
+                | SERVICE_INTERROGATE | SERVICE_ENUMERATE_DEPENDENTS,
+}
+
+# Two-letter right codes (service meaning for the object-specific ones)
+RIGHT_CODES = {
+    'GA': 0x10000000, 'GX': 0x20000000, 'GW': 0x40000000, 'GR': 0x80000000,
+    'SD': DELETE, 'RC': READ_CONTROL, 'WD': WRITE_DAC, 'WO': WRITE_OWNER,
+    'CC': SERVICE_QUERY_CONFIG, 'DC': SERVICE_CHANGE_CONFIG,
+    'LC': SERVICE_QUERY_STATUS, 'SW': SERVICE_ENUMERATE_DEPENDENTS,
+    'RP': SERVICE_START, 'WP': SERVICE_STOP, 'DT': SERVICE_PAUSE_CONTINUE,
+    'LO': SERVICE_INTERROGATE, 'CR': SERVICE_USER_DEFINED_CONTROL,
+    'FA': SERVICE_ALL_ACCESS, 'KA': SERVICE_ALL_ACCESS,
+}
+
+# Rights that let the holder take over the service
+TAKEOVER_RIGHTS = {
+    'change_config': SERVICE_CHANGE_CONFIG,
+    'write_dac': WRITE_DAC,
+    'write_owner': WRITE_OWNER,
+}
+
+SID_ALIASES = {
+    'WD': 'Everyone',
+    'AU': 'Authenticated Users',
+    'BU': 'BUILTIN\\Users',
+    'IU': 'INTERACTIVE',
+    'SU': 'SERVICE',
+    'NU': 'NETWORK',
+    'BA': 'BUILTIN\\Administrators',
+    'SY': 'LOCAL SYSTEM',
+    'LS': 'LOCAL SERVICE',
+    'NS': 'NETWORK SERVICE',
+    'PU': 'Power Users',
+    'BO': 'Backup Operators',
+    'SO': 'Server Operators',
+    'CO': 'CREATOR OWNER',
+}
+
+# Alias to well-known SID string, so ACEs written either way compare equal
+WELL_KNOWN_SIDS = {
+    'WD': 'S-1-1-0', 'CO': 'S-1-3-0', 'NU': 'S-1-5-2', 'IU': 'S-1-5-4',
+    'SU': 'S-1-5-6', 'AU': 'S-1-5-11', 'SY': 'S-1-5-18', 'LS': 'S-1-5-19',
+    'NS': 'S-1-5-20', 'BA': 'S-1-5-32-544', 'BU': 'S-1-5-32-545',
+    'PU': 'S-1-5-32-547', 'SO': 'S-1-5-32-549', 'BO': 'S-1-5-32-551',
+}
+_ALIAS_BY_SID = {sid: alias for alias, sid in WELL_KNOWN_SIDS.items()}
+
+# Groups a standard, non-admin interactive user is a member of
+LOW_PRIVILEGE_SIDS = ('WD', 'AU', 'BU', 'IU')
+
+INHERIT_ONLY = 'IO'
+
+
+class Ace(NamedTuple):
+    """One access control entry"""
+    ace_type: str
+    flags: str
+    rights: int
+    sid: str
+
+    @property
+    def flag_codes(self) -> FrozenSet[str]:
+        """Two-letter ACE flags ('CIOI' -> {'CI', 'OI'})"""
+        return frozenset(self.flags[i:i + 2] for i in range(0, len(self.flags), 2))
+
+
+class SecurityDescriptor(NamedTuple):
+    owner: Optional[str]
+    group: Optional[str]
+    dacl: Optional[Tuple[Ace, ...]]     # None = NULL DACL (everyone has full access)
+    dacl_flags: str
+
+
+_COMPONENT = re.compile(r'([OGDS]):')
+
+
+def normalize_sid(sid: str) -> str:
+    """Two-letter alias for a well-known SID string, otherwise the SID itself"""
+    sid = sid.strip().upper()
+    return _ALIAS_BY_SID.get(sid, sid)
+
+
+def parse_rights(text: str) -> int:
+    """
+    Access mask from an ACE rights field ('CCLCSWRPWPDTLOCRRC' or '0x2001ff').
+    Generic rights are mapped to their service equivalents.
+    """
+    text = text.strip()
+    if text.lower().startswith('0x'):
+        mask = int(text, 16)
+    elif text.isdigit():
+        mask = int(text)
+    else:
+        mask = 0
+        for i in range(0, len(text), 2):
+            code = text[i:i + 2].upper()
+            if code not in RIGHT_CODES:
+                raise ValueError(f"Unknown access right '{code}' in '{text}'")
+            mask |= RIGHT_CODES[code]
+
+    for generic, mapped in GENERIC_MAPPING.items():
+        if mask & generic:
+            mask = (mask & ~generic) | mapped
+    return mask
+
+
+def _split_aces(body: str) -> Tuple[str, List[str]]:
+    """('PAI' style flags, ['A;;CC;;;SY', ...]) for a DACL/SACL body"""
+    start = body.find('(')
+    if start == -1:
+        return body, []
+    return body[:start], re.findall(r'\(([^)]*)\)', body[start:])
+
+
+def parse_ace(text: str) -> Ace:
+    fields = text.split(';')
+    if len(fields) < 6:
+        raise ValueError(f"Malformed ACE '({text})'")
+    ace_type, flags, rights, _object_guid, _inherit_guid, sid = fields[:6]
+    return Ace(ace_type.upper(), flags.upper(), parse_rights(rights), normalize_sid(sid))
+
+
+@lru_cache(maxsize=4096)
+def parse_sddl(sddl: str) -> SecurityDescriptor:
+    """
+    Parse an SDDL string (O:, G:, D:, S: components). Memoized: most
+    services share a handful of default descriptors.
+    """
+    sddl = sddl.strip()
+    parts = {}
+    matches = list(_COMPONENT.finditer(sddl))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(sddl)
+        parts[match.group(1)] = sddl[match.end():end]
+
+    dacl = None
+    dacl_flags = ''
+    if 'D' in parts:
+        dacl_flags, aces = _split_aces(parts['D'])
+        if dacl_flags.upper() != 'NO_ACCESS_CONTROL':
+            dacl = tuple(parse_ace(ace) for ace in aces)
+
+    return SecurityDescriptor(
+        owner=normalize_sid(parts['O']) if 'O' in parts else None,
+        group=normalize_sid(parts['G']) if 'G' in parts else None,
+        dacl=dacl,
+        dacl_flags=dacl_flags
+    )
+
+
+@lru_cache(maxsize=16384)
+def effective_rights(sddl: str, sids: FrozenSet[str]) -> int:
+    """
+    Access mask granted to a token holding `sids`, following Windows DACL
+    evaluation: ACEs in order, a deny ACE removes bits not already granted.
+    Memoized on (sddl, sids).
+    """
+    descriptor = parse_sddl(sddl)
+    if descriptor.dacl is None:
+        return SERVICE_ALL_ACCESS
+
+    granted = 0
+    denied = 0
+    for ace in descriptor.dacl:
+        if INHERIT_ONLY in ace.flag_codes or ace.sid not in sids:
+            continue
+        if ace.ace_type == 'A':
+            granted |= ace.rights & ~denied
+        elif ace.ace_type == 'D':
+            denied |= ace.rights & ~granted
+    return granted
+
+
+_DISPLAY_ORDER = ('CC', 'DC', 'LC', 'SW', 'RP', 'WP', 'DT', 'LO', 'CR', 'SD', 'RC', 'WD', 'WO')
+
+
+def rights_to_codes(mask: int) -> str:
+    """Readable form of a service access mask ('CCDCLCRPWP...')"""
+    if mask & SERVICE_ALL_ACCESS == SERVICE_ALL_ACCESS:
+        return 'FA'
+    return ''.join(code for code in _DISPLAY_ORDER if mask & RIGHT_CODES[code])
+
+
+@lru_cache(maxsize=16384)
+def _analyze(sddl: str, sids: FrozenSet[str]) -> Tuple:
+    mask = effective_rights(sddl, sids)
+
+    takeover = tuple(name for name, bit in TAKEOVER_RIGHTS.items() if mask & bit)
+    granting = ()
+    descriptor = parse_sddl(sddl)
+    if descriptor.dacl is None:
+        granting = ('NULL DACL (no access control)',)
+    elif mask:
+        granting = tuple(
+            f"{SID_ALIASES.get(ace.sid, ace.sid)}: {rights_to_codes(ace.rights)}"
+            for ace in descriptor.dacl
+            if ace.ace_type == 'A' and ace.sid in sids and INHERIT_ONLY not in ace.flag_codes
+        )
+    return mask, takeover, granting
+
+
+@lru_cache(maxsize=64)
+def _principals(sids: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(normalize_sid(sid) for sid in sids)
+
+
+def analyze_sddl(sddl: str, sids: Iterable[str] = LOW_PRIVILEGE_SIDS) -> Dict:
+    """
+    What principals holding `sids` may do with a service. Memoized per
+    (sddl, sids), so each distinct descriptor is evaluated once.
+
+    Returns:
+        Dictionary with can_modify/can_start/can_stop/full_control flags,
+        the granted mask, the takeover rights held and the ACEs that grant them
+    """
+    mask, takeover, granting = _analyze(sddl, _principals(tuple(sids)))
+
+    return {
+        'rights': mask,
+        'rights_codes': rights_to_codes(mask),
+        'can_modify': bool(takeover),
+        'can_start': bool(mask & SERVICE_START),
+        'can_stop': bool(mask & SERVICE_STOP),
+        'full_control': mask & SERVICE_ALL_ACCESS == SERVICE_ALL_ACCESS,
+        'takeover_rights': list(takeover),
+        'granting_aces': list(granting)
+    }
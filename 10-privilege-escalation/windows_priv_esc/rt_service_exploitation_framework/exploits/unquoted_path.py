@@ -8,19 +8,22 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from ..core.base import ServiceExploitBase
+from ..core.enumerator import ServiceEnumerator
 
 
 class UnquotedPathExploit(ServiceExploitBase):
     """Exploit unquoted service paths for privilege escalation."""
 
-    def __init__(self, output_dir: str = "service_exploits"):
+    def __init__(self, output_dir: str = "service_exploits", inventory: Optional[str] = None):
         """
         Initialize the unquoted path exploit module.
 
         Args:
             output_dir: Directory for storing output files
+            inventory: Saved collector output to analyse instead of the local host
         """
         super().__init__(output_dir)
+        self.inventory = inventory
         self.vulnerable_services: List[Dict] = []
         self.log("Unquoted Path Exploit module initialized", "SUCCESS")
 
@@ -33,19 +36,9 @@ class UnquotedPathExploit(ServiceExploitBase):
         """
         self.log("Searching for unquoted service paths...")
 
-        cmd = 'wmic service get name,displayname,pathname,startmode'
-        result = self.run_command(cmd)
-
         self.vulnerable_services = []
 
-        lines = result.stdout.split('\n')[1:]  # Skip header
-
-        for line in lines:
-            if not line.strip():
-                continue
-
-            service_info = self._parse_wmic_line(line)
-
+        for service_info in self._services():
             if service_info and self._is_vulnerable(service_info['path']):
                 self.vulnerable_services.append(service_info)
 
@@ -55,6 +48,22 @@ class UnquotedPathExploit(ServiceExploitBase):
         self.log(f"Found {len(self.vulnerable_services)} vulnerable services", "INFO")
         return self.vulnerable_services
 
+    def _services(self) -> List[Optional[Dict]]:
+        """Service name/path/start mode from the inventory or from WMIC"""
+        if self.inventory:
+            return [
+                {'name': service['name'], 'path': service['binary_path'],
+                 'start_mode': service['start_type']}
+                for service in ServiceEnumerator(self.output_dir, self.inventory).get_service_details()
+                if service['binary_path']
+            ]
+
+        cmd = 'wmic service get name,displayname,pathname,startmode'
+        result = self.run_command(cmd)
+
+        lines = result.stdout.split('\n')[1:]  # Skip header
+        return [self._parse_wmic_line(line) for line in lines if line.strip()]
+
     def _parse_wmic_line(self, line: str) -> Optional[Dict]:
         """
         Parse a WMIC output line to extract service information.
@@ -23,15 +23,16 @@ class WeakPermissionsExploit(ServiceExploitBase):
         'INTERACTIVE'
     ]
 
-    def __init__(self, output_dir: str = "service_exploits"):
+    def __init__(self, output_dir: str = "service_exploits", inventory: Optional[str] = None):
         """
         Initialize the weak permissions exploit module.
 
         Args:
             output_dir: Directory for storing output files
+            inventory: Saved collector output to analyse instead of the local host
         """
         super().__init__(output_dir)
-        self.enumerator = ServiceEnumerator(output_dir)
+        self.enumerator = ServiceEnumerator(output_dir, inventory)
         self.vulnerable_services: List[Dict] = []
         self.log("Weak Permissions Exploit module initialized", "SUCCESS")
 
@@ -44,13 +45,13 @@ class WeakPermissionsExploit(ServiceExploitBase):
         """
         self.log("Searching for services with weak permissions...")
 
-        services = self.enumerator.get_all_services()
+        services = self.enumerator.get_service_details()
         self.log(f"Checking {len(services)} services...")
 
         self.vulnerable_services = []
 
         for service in services:
-            vuln_info = self._check_service_permissions(service['name'])
+            vuln_info = self._check_service_permissions(service)
 
             if vuln_info:
                 self.vulnerable_services.append(vuln_info)
@@ -62,18 +63,17 @@ class WeakPermissionsExploit(ServiceExploitBase):
         self.log(f"Found {len(self.vulnerable_services)} vulnerable services", "INFO")
         return self.vulnerable_services
 
-    def _check_service_permissions(self, service_name: str) -> Optional[Dict]:
+    def _check_service_permissions(self, service: Dict) -> Optional[Dict]:
         """
         Check if a service has exploitable permissions.
 
         Args:
-            service_name: Name of the service to check
+            service: Collected service details (see ServiceEnumerator.get_service_details)
 
         Returns:
             Vulnerability info dict or None if not vulnerable
         """
-        config = self.enumerator.get_service_config(service_name)
-        binary_path = config.get('binary_path')
+        binary_path = service.get('binary_path')
 
         if not binary_path:
             return None
@@ -81,33 +81,31 @@ class WeakPermissionsExploit(ServiceExploitBase):
         # Clean up the path - remove quotes and arguments
         clean_path = binary_path.strip('"').split()[0]
 
-        if not os.path.exists(clean_path):
-            return None
-
-        # Check binary permissions
-        binary_vuln = self._check_binary_permissions(clean_path)
+        # Check binary permissions (only possible on the host itself)
+        if os.path.exists(clean_path):
+            binary_vuln = self._check_binary_permissions(clean_path)
 
-        if binary_vuln:
-            return {
-                'name': service_name,
-                'binary_path': clean_path,
-                'vuln_type': 'weak_binary_permissions',
-                'vulnerable_acl': binary_vuln,
-                'start_type': config.get('start_type'),
-                'account': config.get('account')
-            }
+            if binary_vuln:
+                return {
+                    'name': service['name'],
+                    'binary_path': clean_path,
+                    'vuln_type': 'weak_binary_permissions',
+                    'vulnerable_acl': binary_vuln,
+                    'start_type': service.get('start_type'),
+                    'account': service.get('account')
+                }
 
         # Check service configuration permissions
-        service_vuln = self._check_service_acl(service_name)
+        service_vuln = self._check_service_acl(service['name'], service.get('sddl'))
 
         if service_vuln:
             return {
-                'name': service_name,
+                'name': service['name'],
                 'binary_path': clean_path,
                 'vuln_type': 'weak_service_permissions',
                 'vulnerable_acl': service_vuln,
-                'start_type': config.get('start_type'),
-                'account': config.get('account')
+                'start_type': service.get('start_type'),
+                'account': service.get('account')
             }
 
         return None
@@ -134,33 +132,24 @@ class WeakPermissionsExploit(ServiceExploitBase):
 
         return None
 
-    def _check_service_acl(self, service_name: str) -> Optional[str]:
+    def _check_service_acl(self, service_name: str, sddl: Optional[str] = None) -> Optional[str]:
         """
         Check if a service has weak service-level permissions.
 
         Args:
             service_name: Name of the service
+            sddl: Collected security descriptor (queried with sc sdshow if None)
 
         Returns:
             Vulnerable permission indicator or None
         """
-        result = self.run_command(f'sc sdshow "{service_name}"')
-        sddl = result.stdout.strip()
-
-        # Look for dangerous permissions granted to vulnerable SIDs
-        # WD = Everyone, BU = BUILTIN\Users, AU = Authenticated Users
-        vulnerable_sids = {
-            'WD': 'Everyone',
-            'BU': 'BUILTIN\\Users',
-            'AU': 'Authenticated Users'
-        }
-
-        for sid, name in vulnerable_sids.items():
-            if sid in sddl:
-                # Check for CONFIG_CHANGE (DC) or WRITE_DAC (WD) permissions
-                # These would allow modifying the service configuration
-                if 'DC' in sddl or 'WD' in sddl or 'GA' in sddl:
-                    return f"{name} has configuration change access"
+        permissions = self.enumerator.get_service_permissions(service_name, sddl)
+
+        # SERVICE_CHANGE_CONFIG, WRITE_DAC or WRITE_OWNER for a low-privileged
+        # principal allows repointing the binary path
+        if permissions['can_modify']:
+            return (f"{', '.join(permissions['takeover_rights'])} via "
+                    f"{'; '.join(permissions['raw_permissions'])}")
 
         return None
 
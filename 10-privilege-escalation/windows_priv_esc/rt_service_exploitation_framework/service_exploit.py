@@ -5,6 +5,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from core.collector import ServiceCollector
 from core.enumerator import ServiceEnumerator
 from exploits.unquoted_path import UnquotedPathExploit
 from exploits.weak_permissions import WeakPermissionsExploit
@@ -12,7 +13,7 @@ from payloads.generator import PayloadGenerator
 from utils.helpers import print_banner, print_status, check_admin
 
 
-def enumerate_all(output_dir: str):
+def enumerate_all(output_dir: str, inventory: str = None):
     """Run full enumeration of all vulnerable services."""
     print("\n" + "=" * 60)
     print("FULL SERVICE VULNERABILITY ENUMERATION")
@@ -21,13 +22,13 @@ def enumerate_all(output_dir: str):
     # Unquoted paths
     print("\n[PHASE 1] Unquoted Service Paths")
     print("-" * 40)
-    unquoted = UnquotedPathExploit(output_dir)
+    unquoted = UnquotedPathExploit(output_dir, inventory)
     unquoted_results = unquoted.enumerate()
 
     # Weak permissions
     print("\n[PHASE 2] Weak Service Permissions")
     print("-" * 40)
-    weak = WeakPermissionsExploit(output_dir)
+    weak = WeakPermissionsExploit(output_dir, inventory)
     weak_results = weak.enumerate()
 
     # Summary
@@ -58,6 +59,12 @@ Examples:
   Enumerate all vulnerable services:
     python service_exploit.py --enumerate
 
+  Collect all services and security descriptors for offline analysis:
+    python service_exploit.py --collect services.json
+
+  Analyse a saved collection (any platform):
+    python service_exploit.py --enumerate-weak --inventory services.json
+
   Find unquoted path services only:
     python service_exploit.py --enumerate-unquoted
 
@@ -80,6 +87,10 @@ Examples:
                             help='Find unquoted service path vulnerabilities')
     enum_group.add_argument('--enumerate-weak', action='store_true',
                             help='Find weak service permission vulnerabilities')
+    enum_group.add_argument('--collect', type=str, metavar='FILE',
+                            help='Save all service configs and security descriptors to FILE')
+    enum_group.add_argument('--inventory', type=str, metavar='FILE',
+                            help='Analyse a saved --collect FILE instead of the local host')
 
     # Exploitation options
     exploit_group = parser.add_argument_group('Exploitation')
@@ -121,11 +132,15 @@ Examples:
         print_status()
 
     # Handle enumeration
-    if args.enumerate:
-        enumerate_all(args.output_dir)
+    if args.collect:
+        # Falls back to per-service sc qc / sc sdshow if the bulk query fails
+        ServiceCollector.save(ServiceEnumerator(args.output_dir).get_service_details(), args.collect)
+
+    elif args.enumerate:
+        enumerate_all(args.output_dir, args.inventory)
 
     elif args.enumerate_unquoted:
-        exploit = UnquotedPathExploit(args.output_dir)
+        exploit = UnquotedPathExploit(args.output_dir, args.inventory)
         results = exploit.enumerate()
 
         if results:
@@ -141,7 +156,7 @@ Examples:
                         print(f"    -> {loc['malicious_path']}")
 
     elif args.enumerate_weak:
-        exploit = WeakPermissionsExploit(args.output_dir)
+        exploit = WeakPermissionsExploit(args.output_dir, args.inventory)
         results = exploit.enumerate()
 
         if results:
@@ -3,6 +3,7 @@ Exploitation Path Analyzer
 Identify and prioritize exploitation paths from discovered trusts
 """
 
+from dataclasses import replace
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
@@ -15,6 +16,12 @@ from ..models import (
 )
 from ..utils import determine_parent_child
 
+try:
+    from ...rt_trust_graph import TrustGraph, TrustRoute, edge_weight
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from 13-trust-exploitation/
+    from rt_trust_graph import TrustGraph, TrustRoute, edge_weight
+
 
 class PathAnalyzer:
     """
@@ -29,6 +36,7 @@ class PathAnalyzer:
             verbose: Print status messages
         """
         self.verbose = verbose
+        self.graph = TrustGraph()
 
     def log(self, message: str, level: str = "info") -> None:
         """Print status message"""
@@ -70,10 +78,96 @@ class PathAnalyzer:
 
         paths.sort(key=lambda p: priority_order.get(p.priority, 99))
 
+        # A fresh analysis starts from an empty graph; add_trusts() extends it
+        self.graph = TrustGraph()
+        self.add_trusts(trusts)
+
         self.log(f"Identified {len(paths)} exploitation paths", "success")
 
         return paths
 
+    def add_trusts(self, trusts: List[TrustInfo]) -> int:
+        """
+        Add trusts to the multi-hop trust graph
+
+        Every direction a trust can be traversed becomes an edge, regardless
+        of the current domain, so routes can chain through domains that are
+        not compromised yet. Cached routes are updated incrementally.
+
+        Args:
+            trusts: Newly discovered trusts
+
+        Returns:
+            Number of graph edges added or improved
+        """
+        changed = 0
+        for trust in trusts:
+            for path in self._traversal_paths(trust):
+                changed += self.graph.add_edge(
+                    path.source_domain,
+                    path.target_domain,
+                    self.path_weight(path),
+                    data=path,
+                )
+        return changed
+
+    def _traversal_paths(self, trust: TrustInfo) -> List[ExploitPath]:
+        """Exploit paths for every direction the trust can be traversed"""
+        if trust.category == TrustCategory.PARENT_CHILD:
+            child_domain, parent_domain = determine_parent_child(
+                trust.source_domain,
+                trust.target_domain
+            )
+            return (self._analyze_parent_child(trust, child_domain) +
+                    self._analyze_parent_child(trust, parent_domain))
+
+        paths = self._analyze_single_trust(trust, trust.source_domain)
+        if trust.is_bidirectional:
+            reverse = replace(
+                trust,
+                source_domain=trust.target_domain,
+                target_domain=trust.source_domain,
+            )
+            paths.extend(self._analyze_single_trust(reverse, reverse.source_domain))
+        return paths
+
+    @staticmethod
+    def path_weight(path: ExploitPath) -> int:
+        """Graph cost of a single exploitation hop"""
+        trust = path.trust_info
+        if trust is None:
+            return edge_weight(path.priority)
+        return edge_weight(
+            path.priority,
+            sid_filtering=trust.sid_filtering_enabled,
+            transitive=trust.is_transitive,
+            category=trust.category,
+        )
+
+    def find_routes(
+            self,
+            current_domain: str,
+            max_hops: Optional[int] = None
+    ) -> List[TrustRoute]:
+        """
+        Cheapest exploitation route to every reachable domain
+
+        Args:
+            current_domain: Currently compromised domain
+            max_hops: Only include domains reachable within this many hops
+
+        Returns:
+            TrustRoute objects (edge data is the ExploitPath per hop), cheapest first
+        """
+        routes = self.graph.cheapest_paths(current_domain)
+        if max_hops is not None:
+            routes = [r for r in routes if r.hops <= max_hops]
+        return routes
+
+    def reachable_domains(self, current_domain: str, max_hops: int) -> Dict[str, int]:
+        """Domains reachable within max_hops trust hops -> hop count"""
+        return self.graph.reachable_within(current_domain, max_hops)
+
     def _analyze_single_trust(
             self,
             trust: TrustInfo,
@@ -311,6 +405,25 @@ class PathAnalyzer:
                 for prereq in path.prerequisites:
                     print(f"      - {prereq}")
 
+    def print_routes(self, routes: List[TrustRoute]) -> None:
+        """
+        Print multi-hop routes (single hops are covered by print_analysis)
+        """
+        chained = [r for r in routes if r.hops > 1]
+        if not chained:
+            return
+
+        print("\n" + "=" * 60)
+        print("MULTI-HOP ROUTES")
+        print("=" * 60)
+
+        for i, route in enumerate(chained, 1):
+            print(f"\n[{i}] {' -> '.join(route.domains)} (cost {route.cost}, {route.hops} hops)")
+            for edge in route.edges:
+                path = edge.data
+                print(f"    {edge.source_domain} -> {edge.target_domain}: "
+                      f"{path.method.value} [{path.priority.value.upper()}]")
+
     def get_attack_order(self, paths: List[ExploitPath]) -> List[ExploitPath]:
         """
         Get recommended attack order
@@ -231,6 +231,7 @@ class WorkflowState:
     domains: Dict[str, DomainTarget] = field(default_factory=dict)
     trusts: List[TrustInfo] = field(default_factory=list)
     exploit_paths: List[ExploitPath] = field(default_factory=list)
+    attack_routes: List[Any] = field(default_factory=list)  # TrustRoute, cheapest first
 
     # Execution history
     attempts: List[ExploitAttempt] = field(default_factory=list)
@@ -273,6 +274,7 @@ class WorkflowState:
             "domains_discovered": len(self.domains),
             "trusts_discovered": len(self.trusts),
             "exploit_paths_identified": len(self.exploit_paths),
+            "multi_hop_routes": len([r for r in self.attack_routes if r.hops > 1]),
             "attempts_total": len(self.attempts),
             "attempts_successful": len(self.successful_attempts),
             "started_at": self.started_at.isoformat() if self.started_at else None,
@@ -172,10 +172,16 @@ class ExploitationWorkflow:
         for path in paths:
             self.state.add_exploit_path(path)
 
+        # Multi-hop routes through the trust graph
+        self.state.attack_routes = self.analyzer.find_routes(current_domain)
+
         # Print analysis
         self.analyzer.print_analysis(paths)
+        self.analyzer.print_routes(self.state.attack_routes)
 
-        self.log(f"Analysis complete: {len(paths)} paths identified", "success")
+        chained = len([r for r in self.state.attack_routes if r.hops > 1])
+        self.log(f"Analysis complete: {len(paths)} paths identified, "
+                 f"{chained} multi-hop routes", "success")
 
     def _run_exploitation_phase(
             self,
@@ -189,21 +195,74 @@ class ExploitationWorkflow:
 
         self.state.phase = WorkflowPhase.EXPLOITATION
 
-        # Get ordered paths
-        ordered_paths = self.analyzer.get_attack_order(self.state.exploit_paths)
+        # Get ordered paths, then the onward hops of multi-hop routes
+        pending = self.analyzer.get_attack_order(self.state.exploit_paths)
+        pending.extend(self._route_hops(pending))
+
+        # A hop only runs once its source domain has been compromised;
+        # each success can unlock the next hop of a route
+        while True:
+            path = next((p for p in pending if self._is_compromised(p.source_domain)), None)
+            if path is None:
+                break
+            pending.remove(path)
 
-        for path in ordered_paths:
             self.log(f"\nExploiting: {path.source_domain} -> {path.target_domain}")
             self.log(f"Method: {path.method.value}")
 
             attempt = self._exploit_path(path, username, password, dc_ip)
             self.state.add_attempt(attempt)
 
+            if attempt.is_successful:
+                self._mark_compromised(path.target_domain)
+
             # If we gained EA, we might want to stop or continue
             if attempt.access_gained == "Enterprise Admin":
                 self.log("Enterprise Admin achieved!", "success")
                 # Continue to exploit other trusts for maximum access
 
+        # Onward hops out of domains we never reached are reported, not run
+        for path in pending:
+            self.log(f"Not executed: {path.source_domain} -> {path.target_domain} "
+                     f"({path.method.value}), {path.source_domain} not compromised", "warning")
+
+    def _is_compromised(self, domain: str) -> bool:
+        """Check whether a domain is in the compromised set"""
+        target = self.state.domains.get(domain.lower())
+        return bool(target and target.is_compromised)
+
+    def _mark_compromised(self, domain: str) -> None:
+        """Add a domain to the compromised set"""
+        target = self.state.domains.get(domain.lower())
+        if target is None:
+            target = DomainTarget(name=domain)
+            self.state.add_domain(target)
+        target.is_compromised = True
+
+    def _route_hops(self, scheduled: List[ExploitPath]) -> List[ExploitPath]:
+        """
+        Hops of multi-hop routes that are not already scheduled
+
+        Routes are cheapest first and each route's hops are kept in order.
+        The exploitation phase holds every hop until the previous one has
+        compromised its source domain.
+        """
+        seen = {
+            (p.source_domain.lower(), p.target_domain.lower(), p.method)
+            for p in scheduled
+        }
+        hops = []
+
+        for route in self.state.attack_routes:
+            for edge in route.edges:
+                path = edge.data
+                key = (path.source_domain.lower(), path.target_domain.lower(), path.method)
+                if key not in seen:
+                    seen.add(key)
+                    hops.append(path)
+
+        return hops
+
     def _exploit_path(
             self,
             path: ExploitPath,
@@ -314,4 +373,5 @@ class ExploitationWorkflow:
     def reset(self) -> None:
         """Reset workflow state"""
         self.state = WorkflowState()
+        self.analyzer.graph.clear()
         self.log("Workflow state reset", "info")
\ No newline at end of file
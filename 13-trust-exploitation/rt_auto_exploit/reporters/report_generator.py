@@ -60,6 +60,7 @@ class ReportGenerator:
             "workflow_summary": state.to_dict(),
             "trusts_discovered": [t.to_dict() for t in state.trusts],
             "exploit_paths": [p.to_dict() for p in state.exploit_paths],
+            "attack_routes": [r.to_dict() for r in state.attack_routes],
             "exploitation_attempts": [a.to_dict() for a in state.attempts],
             "statistics": self._calculate_statistics(state),
         }
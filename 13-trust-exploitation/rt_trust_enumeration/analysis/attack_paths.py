@@ -3,12 +3,21 @@ Attack Path Analyzer
 Identify potential attack paths through trust relationships
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 from ..models.trust import Trust, TrustCollection, TrustCategory
 
+try:
+    from ...rt_trust_graph import TrustGraph, TrustRoute, edge_weight
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from 13-trust-exploitation/
+    from rt_trust_graph import TrustGraph, TrustRoute, edge_weight
+
+# trustAttributes TRUST_ATTRIBUTE_NON_TRANSITIVE
+NON_TRANSITIVE = 0x00000001
+
 
 class AttackPriority(Enum):
     """Attack path priority levels"""
@@ -51,6 +60,7 @@ class AttackPathAnalyzer:
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
         self.attack_paths: List[AttackPath] = []
+        self.graph = TrustGraph()
 
     def log(self, message: str, level: str = "info") -> None:
         if not self.verbose:
@@ -69,6 +79,7 @@ class AttackPathAnalyzer:
             List of AttackPath objects
         """
         self.attack_paths = []
+        self.graph = TrustGraph()
 
         self.log("Analyzing trust relationships for attack paths...")
 
@@ -130,7 +141,7 @@ class AttackPathAnalyzer:
                     ],
                     mitre_ids=["T1550.001", "T1134.005", "T1558.001"]
                 )
-                self.attack_paths.append(path)
+                self._add_path(path, trust)
 
                 # ExtraSids attack
                 path2 = AttackPath(
@@ -153,7 +164,7 @@ class AttackPathAnalyzer:
                     ],
                     mitre_ids=["T1550.001", "T1558.003"]
                 )
-                self.attack_paths.append(path2)
+                self._add_path(path2, trust)
 
     def _analyze_forest(self, trusts: List[Trust]) -> None:
         """
@@ -184,7 +195,7 @@ class AttackPathAnalyzer:
                         ],
                         mitre_ids=["T1550.001", "T1134.005"]
                     )
-                    self.attack_paths.append(path)
+                    self._add_path(path, trust)
 
                 # Standard forest trust attack (SID filtering enabled)
                 else:
@@ -208,7 +219,7 @@ class AttackPathAnalyzer:
                         ],
                         mitre_ids=["T1550.001", "T1558.003"]
                     )
-                    self.attack_paths.append(path)
+                    self._add_path(path, trust)
 
     def _analyze_external(self, trusts: List[Trust]) -> None:
         """
@@ -236,7 +247,62 @@ class AttackPathAnalyzer:
                     ],
                     mitre_ids=["T1550.001"]
                 )
-                self.attack_paths.append(path)
+                self._add_path(path, trust)
+
+    def _add_path(self, path: AttackPath, trust: Trust) -> None:
+        """Record an attack path and add it as a hop in the trust graph"""
+        self.attack_paths.append(path)
+        self.graph.add_edge(
+            path.source_domain,
+            path.target_domain,
+            edge_weight(
+                path.priority,
+                sid_filtering=trust.sid_filtering_enabled,
+                transitive=not trust.trust_attributes & NON_TRANSITIVE,
+                category=trust.category,
+            ),
+            data=path,
+        )
+
+    def find_routes(
+            self,
+            source_domain: str,
+            max_hops: Optional[int] = None
+    ) -> List[TrustRoute]:
+        """
+        Cheapest chain of attack paths to every reachable domain
+
+        Args:
+            source_domain: Domain the operator controls
+            max_hops: Only include routes with at most this many hops
+
+        Returns:
+            TrustRoute objects (edge data is the AttackPath per hop), cheapest first
+        """
+        routes = self.graph.cheapest_paths(source_domain)
+        if max_hops is not None:
+            routes = [r for r in routes if r.hops <= max_hops]
+        return routes
+
+    def reachable_domains(self, source_domain: str, max_hops: int) -> Dict[str, int]:
+        """Domains reachable within max_hops trust hops -> hop count"""
+        return self.graph.reachable_within(source_domain, max_hops)
+
+    def print_routes(self, source_domain: str) -> None:
+        """Print multi-hop attack routes from a domain"""
+        chained = [r for r in self.find_routes(source_domain) if r.hops > 1]
+        if not chained:
+            return
+
+        print("\n" + "=" * 70)
+        print(f"MULTI-HOP ATTACK ROUTES FROM {source_domain.upper()}")
+        print("=" * 70)
+
+        for route in chained:
+            print(f"\n  Route: {' --> '.join(route.domains)} (cost {route.cost})")
+            for edge in route.edges:
+                print(f"    {edge.source_domain} --> {edge.target_domain}: "
+                      f"{edge.data.attack_type} [{edge.data.priority.value}]")
 
     def print_attack_paths(self) -> None:
         """Print attack paths in formatted output"""
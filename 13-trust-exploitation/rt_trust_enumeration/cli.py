@@ -9,6 +9,11 @@ import sys
 from .framework import TrustEnumerationFramework
 from .enumerators import get_available_enumerators
 
+try:
+    from rt_directory_cache import DirectoryCache
+except ImportError:
+    DirectoryCache = None
+
 
 def main():
     """Main CLI entry point"""
@@ -28,6 +33,9 @@ Examples:
 
   # Output to custom directory
   python -m rt_trust_enumeration --domain corp.local --output ./results
+
+  # Read LDAP trusts through the shared directory cache (14-ad-enumeration/)
+  PYTHONPATH=../14-ad-enumeration python -m rt_trust_enumeration --domain corp.local --method ldap -u admin -p P@ssw0rd --cache
         """
     )
 
@@ -81,6 +89,14 @@ Examples:
         help='Suppress status messages'
     )
 
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const='',
+        metavar='PATH',
+        help='Read LDAP trusts through the shared directory cache (optional cache file)'
+    )
+
     # Analysis options
     parser.add_argument(
         '--no-analysis',
@@ -97,6 +113,12 @@ Examples:
     # Parse arguments
     args = parser.parse_args()
 
+    cache = None
+    if args.cache is not None:
+        if DirectoryCache is None:
+            parser.error("--cache needs rt_directory_cache (add 14-ad-enumeration/ to PYTHONPATH)")
+        cache = DirectoryCache(args.cache or None, verbose=not args.quiet)
+
     # Check available methods
     available = get_available_enumerators()
     if not args.quiet:
@@ -105,7 +127,8 @@ Examples:
     # Initialize framework
     framework = TrustEnumerationFramework(
         output_dir=args.output,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        cache=cache
     )
 
     # Run enumeration based on method
@@ -156,6 +179,7 @@ Examples:
     if not args.no_analysis:
         framework.identify_attack_paths()
         framework.print_attack_paths()
+        framework.print_attack_routes(args.domain)
 
     # Generate report
     framework.generate_report(
@@ -3,7 +3,9 @@ LDAP Trust Enumerator
 Enumerate AD trusts via LDAP queries - works from Linux
 """
 
-from typing import Optional, List
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, List
 
 from .base import BaseEnumerator
 from ..models.trust import Trust
@@ -17,6 +19,13 @@ except ImportError:
     import ldap3
     LDAP3_AVAILABLE = False
 
+try:
+    from rt_directory_cache import PagedSource, attr_value
+except ImportError:
+    # Attribute helpers are shared with the other AD tools (14-ad-enumeration/)
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "14-ad-enumeration"))
+    from rt_directory_cache import PagedSource, attr_value
+
 
 class LDAPEnumerator(BaseEnumerator):
     """
@@ -24,17 +33,19 @@ class LDAPEnumerator(BaseEnumerator):
     Best for: Cross-platform, works from Linux/Mac
     """
 
-    def __init__(self, verbose: bool = True, use_ssl: bool = False):
+    def __init__(self, verbose: bool = True, use_ssl: bool = False, cache=None):
         """
         Initialize LDAP enumerator
 
         Args:
             verbose: Print status messages
             use_ssl: Use LDAPS (port 636)
+            cache: rt_directory_cache.DirectoryCache to read trusts through
         """
         super().__init__(verbose)
         self.use_ssl = use_ssl
         self.port = 636 if use_ssl else 389
+        self.cache = cache
 
     def is_available(self) -> bool:
         """Check if ldap3 library is available"""
@@ -68,12 +79,54 @@ class LDAPEnumerator(BaseEnumerator):
         trusts = []
 
         try:
-            # Connect to DC
-            target_dc = dc if dc else domain
-            conn = self._connect(target_dc, domain, username, password)
+            entries = self._trust_entries(domain, username, password, dc)
 
-            if not conn:
-                return []
+            if entries:
+                self.log(f"Found {len(entries)} trust(s) via LDAP", "success")
+
+                for attributes in entries:
+                    trust = self._parse_entry(attributes, domain)
+                    if trust:
+                        trusts.append(trust)
+                        self._log_trust(trust)
+            else:
+                self.log("No trusts found via LDAP", "info")
+
+        except Exception as e:
+            self.log(f"LDAP enumeration failed: {e}", "error")
+
+        return trusts
+
+    def _trust_entries(
+            self,
+            domain: str,
+            username: Optional[str],
+            password: Optional[str],
+            dc: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Attributes of the domain's trustedDomain objects
+
+        A fresh directory cache answers without connecting; a stale one is
+        refreshed with a uSNChanged delta query.
+
+        Returns:
+            List of attribute dicts
+        """
+        if self.cache is not None and self.cache.is_fresh(domain, "trusts"):
+            return [attributes for _, attributes in self.cache.sync(domain, "trusts")]
+
+        # Connect to DC
+        target_dc = dc if dc else domain
+        conn = self._connect(target_dc, domain, username, password)
+
+        if not conn:
+            return []
+
+        try:
+            if self.cache is not None:
+                source = PagedSource(conn, self._domain_to_dn(domain), target_dc)
+                return [attributes for _, attributes in self.cache.sync(domain, "trusts", source)]
 
             # Search for trustedDomain objects
             base_dn = self._domain_to_dn(domain, prefix="CN=System,")
@@ -87,25 +140,10 @@ class LDAPEnumerator(BaseEnumerator):
             ]
 
             conn.search(base_dn, search_filter, attributes=attributes)
-
-            if conn.entries:
-                self.log(f"Found {len(conn.entries)} trust(s) via LDAP", "success")
-
-                for entry in conn.entries:
-                    trust = self._parse_entry(entry, domain)
-                    if trust:
-                        trusts.append(trust)
-                        self._log_trust(trust)
-            else:
-                self.log("No trusts found via LDAP", "info")
-
+            return [entry.entry_attributes_as_dict for entry in conn.entries]
+        finally:
             conn.unbind()
 
-        except Exception as e:
-            self.log(f"LDAP enumeration failed: {e}", "error")
-
-        return trusts
-
     def _connect(
             self,
             dc: str,
@@ -167,22 +205,22 @@ class LDAPEnumerator(BaseEnumerator):
         dc_parts = ','.join([f"DC={p}" for p in parts])
         return f"{prefix}{dc_parts}"
 
-    def _parse_entry(self, entry, source_domain: str) -> Optional[Trust]:
+    def _parse_entry(self, attributes: Dict[str, Any], source_domain: str) -> Optional[Trust]:
         """
-        Parse LDAP entry into Trust object
+        Parse LDAP entry attributes into Trust object
 
         Args:
-            entry: ldap3 Entry object
+            attributes: Attribute dict of a live or cached trustedDomain entry
             source_domain: Source domain name
 
         Returns:
             Trust object or None
         """
         try:
-            target = str(entry.trustPartner) if entry.trustPartner else ""
-            trust_type = int(entry.trustType) if entry.trustType else 0
-            trust_dir = int(entry.trustDirection) if entry.trustDirection else 0
-            trust_attr = int(entry.trustAttributes) if entry.trustAttributes else 0
+            target = str(attr_value(attributes, "trustPartner") or "")
+            trust_type = int(attr_value(attributes, "trustType") or 0)
+            trust_dir = int(attr_value(attributes, "trustDirection") or 0)
+            trust_attr = int(attr_value(attributes, "trustAttributes") or 0)
 
             if not target:
                 return None
@@ -13,7 +13,7 @@ from .enumerators import (
     ImpacketEnumerator,
     get_available_enumerators
 )
-from .analysis.attack_paths import AttackPathAnalyzer, AttackPath
+from .analysis.attack_paths import AttackPathAnalyzer, AttackPath, TrustRoute
 from .analysis.visualizer import TrustVisualizer
 from .reporters.json_reporter import JSONReporter
 
@@ -27,7 +27,8 @@ class TrustEnumerationFramework:
     def __init__(
             self,
             output_dir: str = "trust_enum",
-            verbose: bool = True
+            verbose: bool = True,
+            cache=None
     ):
         """
         Initialize trust enumeration framework
@@ -35,10 +36,12 @@ class TrustEnumerationFramework:
         Args:
             output_dir: Directory for output files
             verbose: Print status messages
+            cache: rt_directory_cache.DirectoryCache for LDAP enumeration
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.verbose = verbose
+        self.cache = cache
 
         # Initialize collection
         self.collection = TrustCollection()
@@ -109,7 +112,7 @@ class TrustEnumerationFramework:
         Returns:
             Number of trusts found
         """
-        enumerator = LDAPEnumerator(verbose=self.verbose)
+        enumerator = LDAPEnumerator(verbose=self.verbose, cache=self.cache)
 
         if not enumerator.is_available():
             self.log("ldap3 library not available", "error")
@@ -237,6 +240,33 @@ class TrustEnumerationFramework:
 
         self.analyzer.print_attack_paths()
 
+    def find_attack_routes(
+            self,
+            source_domain: str,
+            max_hops: Optional[int] = None
+    ) -> List[TrustRoute]:
+        """
+        Cheapest multi-hop routes from a compromised domain
+
+        Args:
+            source_domain: Domain the operator controls
+            max_hops: Only include routes with at most this many hops
+
+        Returns:
+            List of TrustRoute objects, cheapest first
+        """
+        if not self.attack_paths:
+            self.identify_attack_paths()
+
+        return self.analyzer.find_routes(source_domain, max_hops)
+
+    def print_attack_routes(self, source_domain: str) -> None:
+        """Print multi-hop attack routes from a domain"""
+        if not self.attack_paths:
+            self.identify_attack_paths()
+
+        self.analyzer.print_routes(source_domain)
+
     def generate_report(
             self,
             metadata: Optional[Dict[str, Any]] = None
@@ -0,0 +1,27 @@
+"""
+RT Trust Graph
+Weighted, multi-hop trust graph shared by rt_trust_enumeration and
+rt_auto_exploit
+
+Author: Maxwell Cross
+Series: 30 Days of Red Team
+"""
+
+__version__ = "1.0.0"
+__author__ = "Maxwell Cross"
+
+from .graph import (
+    TrustGraph,
+    TrustEdge,
+    TrustRoute,
+    edge_weight,
+    PRIORITY_COST,
+)
+
+__all__ = [
+    "TrustGraph",
+    "TrustEdge",
+    "TrustRoute",
+    "edge_weight",
+    "PRIORITY_COST",
+]
@@ -0,0 +1,272 @@
+"""
+Trust Graph
+Directed, weighted graph of exploitable trust hops with memoized,
+incrementally maintained shortest-path trees
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Cost of one hop by priority (lower is easier)
+PRIORITY_COST = {
+    "critical": 1,
+    "high": 2,
+    "medium": 4,
+    "low": 8,
+}
+
+# Extra cost when SID filtering blocks ExtraSids across the hop
+SID_FILTERING_PENALTY = 4
+
+# Extra cost when the trust does not extend past its target
+NON_TRANSITIVE_PENALTY = 2
+
+COST = "cost"
+HOPS = "hops"
+
+INF = float("inf")
+
+
+def _value(item: Any) -> str:
+    """Enum value or plain string, lowercased"""
+    return str(getattr(item, "value", item)).lower()
+
+
+def edge_weight(
+        priority: Any,
+        sid_filtering: bool = False,
+        transitive: bool = True,
+        category: Any = None
+) -> int:
+    """
+    Cost of traversing one trust hop
+
+    Args:
+        priority: ExploitPriority / AttackPriority member or its name
+        sid_filtering: SID filtering enabled on the trust
+        transitive: Trust is transitive
+        category: Trust category (SID filtering is ignored inside a forest)
+
+    Returns:
+        Integer hop cost
+    """
+    weight = PRIORITY_COST.get(_value(priority), PRIORITY_COST["low"])
+
+    if sid_filtering and _value(category) != "parent_child":
+        weight += SID_FILTERING_PENALTY
+    if not transitive:
+        weight += NON_TRANSITIVE_PENALTY
+
+    return weight
+
+
+@dataclass
+class TrustEdge:
+    """One traversable hop between two domains"""
+    source_domain: str
+    target_domain: str
+    weight: int
+    data: Any = None  # ExploitPath / AttackPath behind the hop
+
+
+@dataclass
+class TrustRoute:
+    """Cheapest chain of hops from one domain to another"""
+    source_domain: str
+    target_domain: str
+    cost: int
+    edges: List[TrustEdge] = field(default_factory=list)
+
+    @property
+    def hops(self) -> int:
+        return len(self.edges)
+
+    @property
+    def domains(self) -> List[str]:
+        """Domains along the route, source first"""
+        if not self.edges:
+            return [self.source_domain]
+        return [self.edges[0].source_domain] + [e.target_domain for e in self.edges]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source_domain,
+            "target": self.target_domain,
+            "cost": self.cost,
+            "hops": self.hops,
+            "domains": self.domains,
+        }
+
+
+class TrustGraph:
+    """
+    Domain graph keyed by lowercase domain name
+
+    Only the cheapest edge per (source, target) pair is kept. Shortest-path
+    trees are built lazily per source and metric, then kept up to date as
+    edges arrive: a new or cheaper edge only re-relaxes the part of each
+    cached tree it actually improves, so queries stay O(route length) while
+    trusts keep streaming in.
+    """
+
+    def __init__(self):
+        self.names: Dict[str, str] = {}                       # key -> display name
+        self._edges: Dict[str, Dict[str, TrustEdge]] = {}     # source -> target -> edge
+        self._trees: Dict[Tuple[str, str], Tuple[dict, dict]] = {}  # (source, metric) -> (dist, prev)
+        self._tiebreak = count()
+
+    # Building
+
+    def _remember(self, domain: str) -> str:
+        key = domain.strip().lower()
+        self.names.setdefault(key, domain.strip())
+        return key
+
+    def add_edge(
+            self,
+            source_domain: str,
+            target_domain: str,
+            weight: int,
+            data: Any = None
+    ) -> bool:
+        """
+        Add a hop, keeping the cheaper one if the pair already exists
+
+        Returns:
+            True if the graph changed
+        """
+        source = self._remember(source_domain)
+        target = self._remember(target_domain)
+        if source == target:
+            return False
+
+        targets = self._edges.setdefault(source, {})
+        existing = targets.get(target)
+        if existing is not None and existing.weight <= weight:
+            return False
+
+        edge = TrustEdge(self.names[source], self.names[target], weight, data)
+        targets[target] = edge
+        self._edges.setdefault(target, {})
+
+        for (root, metric), tree in self._trees.items():
+            dist = tree[0]
+            if source in dist:
+                self._relax(tree, target, dist[source] + self._cost(edge, metric), source, metric)
+
+        return True
+
+    def clear(self) -> None:
+        self.names.clear()
+        self._edges.clear()
+        self._trees.clear()
+
+    # Shortest-path trees
+
+    @staticmethod
+    def _cost(edge: TrustEdge, metric: str) -> int:
+        return 1 if metric == HOPS else edge.weight
+
+    def _relax(self, tree: Tuple[dict, dict], start: str, start_dist: int,
+               via: Optional[str], metric: str) -> None:
+        """Dijkstra from start, only touching nodes whose distance improves"""
+        dist, prev = tree
+        heap = [(start_dist, next(self._tiebreak), start, via)]
+
+        while heap:
+            d, _, node, parent = heapq.heappop(heap)
+            if d >= dist.get(node, INF):
+                continue
+            dist[node] = d
+            prev[node] = parent
+
+            for nxt, edge in self._edges.get(node, {}).items():
+                nd = d + self._cost(edge, metric)
+                if nd < dist.get(nxt, INF):
+                    heapq.heappush(heap, (nd, next(self._tiebreak), nxt, node))
+
+    def _tree(self, source: str, metric: str) -> Tuple[dict, dict]:
+        tree = self._trees.get((source, metric))
+        if tree is None:
+            tree = ({}, {})
+            self._relax(tree, source, 0, None, metric)
+            self._trees[(source, metric)] = tree
+        return tree
+
+    def _route(self, source: str, target: str, tree: Tuple[dict, dict]) -> TrustRoute:
+        dist, prev = tree
+        edges = []
+        node = target
+        while prev[node] is not None:
+            edges.append(self._edges[prev[node]][node])
+            node = prev[node]
+        edges.reverse()
+        return TrustRoute(self.names[source], self.names[target], dist[target], edges)
+
+    # Queries
+
+    def cheapest_path(self, source_domain: str, target_domain: str) -> Optional[TrustRoute]:
+        """
+        Cheapest route between two domains
+
+        Returns:
+            TrustRoute, or None if the target is unreachable
+        """
+        source = source_domain.strip().lower()
+        target = target_domain.strip().lower()
+        if source not in self._edges:
+            return None
+
+        tree = self._tree(source, COST)
+        if target not in tree[0]:
+            return None
+        return self._route(source, target, tree)
+
+    def cheapest_paths(self, source_domain: str) -> List[TrustRoute]:
+        """Cheapest route to every reachable domain, cheapest first"""
+        source = source_domain.strip().lower()
+        if source not in self._edges:
+            return []
+
+        tree = self._tree(source, COST)
+        routes = [self._route(source, t, tree) for t in tree[0] if t != source]
+        routes.sort(key=lambda r: (r.cost, r.hops, r.target_domain.lower()))
+        return routes
+
+    def reachable_within(self, source_domain: str, max_hops: int) -> Dict[str, int]:
+        """
+        Domains reachable in at most max_hops trust hops
+
+        Returns:
+            Dict of domain name -> minimum hop count
+        """
+        source = source_domain.strip().lower()
+        if source not in self._edges:
+            return {}
+
+        dist = self._tree(source, HOPS)[0]
+        return {
+            self.names[key]: hops
+            for key, hops in dist.items()
+            if 0 < hops <= max_hops
+        }
+
+    def edges_from(self, domain: str) -> List[TrustEdge]:
+        return list(self._edges.get(domain.strip().lower(), {}).values())
+
+    def __contains__(self, domain: str) -> bool:
+        return domain.strip().lower() in self._edges
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def stats(self) -> Dict[str, int]:
+        """Graph size summary"""
+        return {
+            "domains": len(self._edges),
+            "edges": sum(len(t) for t in self._edges.values()),
+            "cached_trees": len(self._trees),
+        }
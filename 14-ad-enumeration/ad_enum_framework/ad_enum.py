@@ -12,6 +12,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from .core.enumerator import ADEnumerator
 
+try:
+    from ..rt_directory_cache import DirectoryCache, DEFAULT_CACHE_PATH, DEFAULT_TTL
+except (ImportError, ValueError):
+    from rt_directory_cache import DirectoryCache, DEFAULT_CACHE_PATH, DEFAULT_TTL
+
 
 def print_banner():
     """Print tool banner"""
@@ -36,6 +41,7 @@ Examples:
   %(prog)s -d contoso.com -u jdoe -p Password123
   %(prog)s -d corp.local -u administrator -p Pass@123 --dc 10.0.0.10
   %(prog)s -d lab.local -u admin -p P@ssw0rd -o ./recon_output
+  %(prog)s -d corp.local -u jdoe -p Pass@123 --cache
         """
     )
 
@@ -49,16 +55,26 @@ Examples:
                         help='Domain controller IP address (optional)')
     parser.add_argument('--output', '-o', default='ad_enum',
                         help='Output directory (default: ad_enum)')
+    parser.add_argument('--cache', nargs='?', const=DEFAULT_CACHE_PATH, metavar='PATH',
+                        help=f'Read through the shared directory cache (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_TTL, metavar='SECONDS',
+                        help=f'Serve cached objects without a query for this long (default: {DEFAULT_TTL})')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='Full sweep instead of a uSNChanged delta refresh')
 
     args = parser.parse_args()
 
+    cache = DirectoryCache(args.cache, ttl=args.cache_ttl) if args.cache else None
+
     # Initialize enumerator
     enumerator = ADEnumerator(
         domain=args.domain,
         username=args.username,
         password=args.password,
         dc_ip=args.dc,
-        output_dir=args.output
+        output_dir=args.output,
+        cache=cache,
+        refresh_cache=args.refresh_cache
     )
 
     # Run enumeration
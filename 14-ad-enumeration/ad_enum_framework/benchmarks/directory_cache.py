@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Directory Cache Benchmark — Run the group/user/computer/trust enumerators
+against an ldap3 MOCK_SYNC directory without a cache, then through
+rt_directory_cache: a cold full sweep, a warm run inside the TTL, and a
+uSNChanged delta refresh after a batch of directory changes.
+
+The delta result is checked against a full sweep into a fresh cache.
+
+Examples (from 14-ad-enumeration/):
+    python -m ad_enum_framework.benchmarks.directory_cache
+    python -m ad_enum_framework.benchmarks.directory_cache --objects 50000 --changes 200
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from ldap3 import MODIFY_REPLACE
+
+from ..core.connection import LDAPConnection
+from ..core.membership import GroupMembershipIndex
+from ..modules.users import UserEnumerator
+from ..modules.groups import GroupEnumerator
+from ..modules.computers import ComputerEnumerator
+from ..modules.trusts import TrustEnumerator
+from .mock_directory import BASE_DN, DOMAIN, DOMAIN_SID, build_directory
+
+try:
+    from ...rt_directory_cache import DirectoryCache
+except (ImportError, ValueError):
+    from rt_directory_cache import DirectoryCache
+
+COLLECTIONS = ('groups', 'users', 'computers', 'trusts')
+
+
+def count_searches(conn):
+    """
+    Count successful search operations (one per page) on conn and the
+    time spent inside them: the mock's server side, which scans every
+    entry where a DC would use its uSNChanged index
+    """
+    counter = {'searches': 0, 'server': 0.0}
+    original_search = conn.search
+
+    def counting_search(*a, **kw):
+        start = time.perf_counter()
+        result = original_search(*a, **kw)
+        counter['server'] += time.perf_counter() - start
+        counter['searches'] += 1
+        return result
+
+    conn.search = counting_search
+    return counter
+
+
+def run_enumeration(label, ldap_conn, counter):
+    """Run the modules once; returns the UserEnumerator"""
+    membership = GroupMembershipIndex()
+    user_enum = UserEnumerator(ldap_conn, membership)
+    modules = [
+        GroupEnumerator(ldap_conn, membership),
+        user_enum,
+        ComputerEnumerator(ldap_conn),
+        TrustEnumerator(ldap_conn),
+    ]
+
+    fetched = 0
+    before = counter['searches']
+    server_before = counter['server']
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for module in modules:
+            module.enumerate()
+            if ldap_conn.cache is not None:
+                fetched += ldap_conn.cache.last_sync.get('fetched', 0)
+    elapsed = time.perf_counter() - start
+    server = counter['server'] - server_before
+
+    fetched = fetched if ldap_conn.cache is not None else '-'
+    print(f"{label:<28}{elapsed:>9.2f}s{server:>9.2f}s{elapsed - server:>9.2f}s"
+          f"{counter['searches'] - before:>10}{fetched:>10}{user_enum.user_count:>10,}")
+    return user_enum
+
+
+def apply_changes(conn, count, seed):
+    """Modify `count` users, add one user and flip the trust direction"""
+    rng = random.Random(seed)
+    usn = conn.highest_usn
+
+    conn.search(BASE_DN, '(&(objectClass=user)(objectCategory=person))', attributes=['cn'])
+    users = [entry.entry_dn for entry in conn.entries]
+
+    for dn in rng.sample(users, min(count, len(users))):
+        usn += 1
+        conn.modify(dn, {
+            'description': [(MODIFY_REPLACE, [f'changed at USN {usn}'])],
+            'servicePrincipalName': [(MODIFY_REPLACE, [f'HTTP/web{usn}.{DOMAIN}'])],
+            'uSNChanged': [(MODIFY_REPLACE, [str(usn)])],
+        })
+
+    usn += 1
+    conn.strategy.add_entry(f'CN=newhire,OU=Staff,{BASE_DN}', {
+        'objectClass': ['top', 'person', 'organizationalPerson', 'user'],
+        'objectCategory': 'person',
+        'sAMAccountName': 'newhire',
+        'userAccountControl': '512',
+        'objectGUID': '{ffffffff-0000-0000-0000-000000000001}',
+        'objectSid': f'{DOMAIN_SID}-99999',
+        'uSNChanged': str(usn),
+    })
+
+    usn += 1
+    conn.modify(f'CN=partner.com,CN=System,{BASE_DN}', {
+        'trustDirection': [(MODIFY_REPLACE, ['2'])],
+        'uSNChanged': [(MODIFY_REPLACE, [str(usn)])],
+    })
+    conn.highest_usn = usn
+
+
+def snapshot(cache):
+    return {
+        collection: sorted((dn, json.dumps(attributes, sort_keys=True))
+                           for dn, attributes in cache.entries(DOMAIN, collection))
+        for collection in COLLECTIONS
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared directory cache on a mock directory")
+    parser.add_argument('--objects', type=int, default=20_000)
+    parser.add_argument('--changes', type=int, default=50,
+                        help='Users modified between the cold and the delta run')
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=1337)
+    args = parser.parse_args()
+
+    print(f"[*] Building mock directory with {args.objects:,} objects...")
+    conn = build_directory(args.objects, args.seed)
+    counter = count_searches(conn)
+
+    ldap_conn = LDAPConnection.from_connection(conn, DOMAIN)
+    ldap_conn.page_size = args.page_size
+
+    workdir = tempfile.mkdtemp(prefix='directory_cache_')
+    try:
+        cache = DirectoryCache(os.path.join(workdir, 'directory.db'), verbose=False)
+
+        print(f"\n{'Run':<28}{'Time':>10}{'Server':>10}{'Client':>10}"
+              f"{'Searches':>10}{'Fetched':>10}{'Users':>10}")
+        run_enumeration('no cache', ldap_conn, counter)
+
+        ldap_conn.cache = cache
+        run_enumeration('cold cache (full sweep)', ldap_conn, counter)
+        run_enumeration('warm cache (inside TTL)', ldap_conn, counter)
+
+        apply_changes(conn, args.changes, args.seed)
+        cache.ttl = 0
+        user_enum = run_enumeration(f'delta ({args.changes} changes)', ldap_conn, counter)
+
+        # Same directory, fresh cache: the delta must match a full sweep
+        reference = DirectoryCache(os.path.join(workdir, 'reference.db'), verbose=False)
+        ldap_conn.cache = reference
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for module in (UserEnumerator(ldap_conn), GroupEnumerator(ldap_conn),
+                           ComputerEnumerator(ldap_conn), TrustEnumerator(ldap_conn)):
+                module.enumerate()
+
+        same = snapshot(cache) == snapshot(reference)
+        print(f"\n[{'+' if same else '-'}] Delta-refreshed cache {'matches' if same else 'DIFFERS from'} "
+              f"a full sweep")
+        print(f"[*] Kerberoastable after delta: {len(user_enum.kerberoastable):,}")
+        print(f"[*] Domain SID from cache (no lookupsid.py): {cache.domain_sid(DOMAIN)}")
+        print(f"[*] Cache file: {os.path.getsize(cache.path) / 1024 / 1024:.1f} MB")
+
+        cache.close()
+        reference.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
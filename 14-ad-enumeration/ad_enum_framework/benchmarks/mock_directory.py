@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Paged Search Benchmark — Populate an ldap3 MOCK_SYNC directory with a
+synthetic domain and run the user/group/computer/SPN enumerators against
+it through the paged search layer.
+
+Examples (from 14-ad-enumeration/):
+    python -m ad_enum_framework.benchmarks.mock_directory
+    python -m ad_enum_framework.benchmarks.mock_directory --objects 20000 --page-size 500
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import resource
+import sys
+import time
+import uuid
+
+from ldap3 import Server, Connection, MOCK_SYNC, OFFLINE_AD_2012_R2
+
+from ..core.config import UAC_FLAGS
+from ..core.connection import LDAPConnection
+from ..core.membership import GroupMembershipIndex
+from ..modules.users import UserEnumerator
+from ..modules.groups import GroupEnumerator
+from ..modules.computers import ComputerEnumerator
+from ..modules.spns import SPNEnumerator
+
+DOMAIN = 'corp.local'
+BASE_DN = 'DC=corp,DC=local'
+
+DOMAIN_SID = 'S-1-5-21-3623811015-3361044348-30300820'
+
+NORMAL_ACCOUNT = 0x200
+
+
+class _Tracked:
+    """objectGUID / objectSid / uSNChanged for each added object, as AD assigns them"""
+
+    def __init__(self):
+        self.usn = 10000
+        self.rid = 1000
+
+    def __call__(self, attributes):
+        self.usn += 1
+        self.rid += 1
+        attributes['objectGUID'] = str(uuid.UUID(int=self.rid))
+        attributes['objectSid'] = f'{DOMAIN_SID}-{self.rid}'
+        attributes['uSNChanged'] = str(self.usn)
+        return attributes
+
+
+def build_directory(objects, seed=1337):
+    """Return a bound MOCK_SYNC connection holding a synthetic domain"""
+    rng = random.Random(seed)
+    tracked = _Tracked()
+
+    server = Server('mock-dc', get_info=OFFLINE_AD_2012_R2)
+    conn = Connection(server, user=f'CN=bench,CN=Users,{BASE_DN}', password='bench',
+                      client_strategy=MOCK_SYNC)
+    strategy = conn.strategy
+
+    strategy.add_entry(BASE_DN, {'objectClass': ['top', 'domain'], 'dc': 'corp'})
+    strategy.add_entry(f'CN=bench,CN=Users,{BASE_DN}',
+                       {'objectClass': ['top', 'person', 'user'], 'userPassword': 'bench'})
+
+    groups = max(1, objects // 20)
+    computers = max(1, objects // 5)
+    users = max(1, objects - groups - computers)
+
+    user_dns = []
+    for i in range(users):
+        dn = f'CN=user{i:07d},OU=Staff,{BASE_DN}'
+        uac = NORMAL_ACCOUNT
+        if rng.random() < 0.01:
+            uac |= UAC_FLAGS['DONT_REQ_PREAUTH']
+
+        attributes = {
+            'objectClass': ['top', 'person', 'organizationalPerson', 'user'],
+            'objectCategory': 'person',
+            'sAMAccountName': f'user{i:07d}',
+            'userPrincipalName': f'user{i:07d}@{DOMAIN}',
+            'userAccountControl': str(uac),
+            'adminCount': '1' if rng.random() < 0.005 else '0',
+        }
+        if rng.random() < 0.02:
+            attributes['servicePrincipalName'] = [f'MSSQLSvc/sql{i}.{DOMAIN}:1433']
+
+        strategy.add_entry(dn, tracked(attributes))
+        user_dns.append(dn)
+
+    # Nested chain into Domain Admins: group0 -> group1 -> ... -> Domain Admins
+    strategy.add_entry(f'CN=Domain Admins,CN=Users,{BASE_DN}', tracked({
+        'objectClass': ['top', 'group'],
+        'sAMAccountName': 'Domain Admins',
+        'member': [user_dns[0], f'CN=group{min(groups, 50) - 1:06d},OU=Groups,{BASE_DN}'],
+    }))
+
+    for i in range(groups):
+        members = rng.sample(user_dns, min(len(user_dns), rng.randint(1, 25)))
+        if 0 < i < 50:
+            members.append(f'CN=group{i - 1:06d},OU=Groups,{BASE_DN}')
+        strategy.add_entry(f'CN=group{i:06d},OU=Groups,{BASE_DN}', tracked({
+            'objectClass': ['top', 'group'],
+            'sAMAccountName': f'group{i:06d}',
+            'member': members,
+        }))
+
+    for i in range(computers):
+        os_name = 'Windows Server 2019' if rng.random() < 0.1 else 'Windows 10 Enterprise'
+        strategy.add_entry(f'CN=HOST{i:06d},OU=Computers,{BASE_DN}', tracked({
+            'objectClass': ['top', 'person', 'organizationalPerson', 'user', 'computer'],
+            'objectCategory': 'computer',
+            'sAMAccountName': f'HOST{i:06d}$',
+            'dNSHostName': f'host{i:06d}.{DOMAIN}',
+            'operatingSystem': os_name,
+            'userAccountControl': '4096',
+        }))
+
+    strategy.add_entry(f'CN=partner.com,CN=System,{BASE_DN}', tracked({
+        'objectClass': ['top', 'leaf', 'trustedDomain'],
+        'cn': 'partner.com',
+        'trustPartner': 'partner.com',
+        'trustDirection': '3',
+        'trustType': '2',
+        'trustAttributes': '8',
+    }))
+
+    conn.bind()
+    conn.highest_usn = tracked.usn
+    return conn
+
+
+def _max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark paged LDAP enumeration on a mock directory")
+    parser.add_argument('--objects', type=int, default=200_000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=1337)
+    args = parser.parse_args()
+
+    print(f"[*] Building mock directory with {args.objects:,} objects...")
+    start = time.perf_counter()
+    conn = build_directory(args.objects, args.seed)
+    print(f"    Built in {time.perf_counter() - start:.2f}s")
+
+    ldap_conn = LDAPConnection.from_connection(conn, DOMAIN)
+    ldap_conn.page_size = args.page_size
+    rss_before = _max_rss_mb()
+
+    # Count pages by wrapping the paged generator
+    pages = {'count': 0}
+    original_search = conn.search
+
+    def counting_search(*a, **kw):
+        pages['count'] += 1
+        return original_search(*a, **kw)
+
+    conn.search = counting_search
+
+    membership = GroupMembershipIndex()
+    user_enum = UserEnumerator(ldap_conn, membership)
+    modules = [
+        ('groups', GroupEnumerator(ldap_conn, membership)),
+        ('users', user_enum),
+        ('computers', ComputerEnumerator(ldap_conn)),
+        ('spns', SPNEnumerator(ldap_conn, user_enum)),
+    ]
+
+    timings = []
+    with open(os.devnull, 'w') as devnull:
+        for name, module in modules:
+            before = pages['count']
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(devnull):
+                results = module.enumerate()
+            count = results.get(f'{name[:-1]}_count', len(results.get(name, ())))
+            timings.append((name, time.perf_counter() - start, pages['count'] - before, count))
+
+    print(f"\n{'Module':<12}{'Time':>10}{'Pages':>8}{'Objects':>10}")
+    for name, duration, page_count, count in timings:
+        print(f"{name:<12}{duration:>9.2f}s{page_count:>8}{count:>10,}")
+
+    print(f"\n[*] Kerberoastable: {len(user_enum.kerberoastable):,}, "
+          f"AS-REP roastable: {len(user_enum.asreproastable):,}, "
+          f"privileged (adminCount or nested): {len(user_enum.privileged_users):,}")
+    print(f"[*] Domain Admins effective members: "
+          f"{len(membership.effective_members('Domain Admins')):,} "
+          f"(direct: {len(membership.direct_members('Domain Admins'))})")
+    print(f"[+] Peak RSS: {_max_rss_mb():.0f} MB (+{_max_rss_mb() - rss_before:.0f} MB during enumeration)")
+
+
+if __name__ == '__main__':
+    main()
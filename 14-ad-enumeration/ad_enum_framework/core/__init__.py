@@ -4,6 +4,7 @@ AD Enumeration Framework - Core Module
 
 from .connection import LDAPConnection
 from .enumerator import ADEnumerator
+from .membership import GroupMembershipIndex
 from .config import *
 
-__all__ = ['LDAPConnection', 'ADEnumerator']
\ No newline at end of file
+__all__ = ['LDAPConnection', 'ADEnumerator', 'GroupMembershipIndex']
\ No newline at end of file
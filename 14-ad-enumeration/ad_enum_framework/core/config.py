@@ -2,6 +2,9 @@
 Configuration and constants for AD enumeration
 """
 
+# Simple Paged Results page size (AD default MaxPageSize is 1000)
+LDAP_PAGE_SIZE = 1000
+
 # Privileged groups to focus on during enumeration
 PRIVILEGED_GROUPS = [
     'Domain Admins',
@@ -5,11 +5,22 @@ LDAP connection management
 import sys
 
 try:
-    from ldap3 import Server, Connection, ALL, NTLM
+    from ldap3 import Server, Connection, ALL, NTLM, SUBTREE
 except ImportError:
     print("[!] ldap3 module required: pip install ldap3")
     sys.exit(1)
 
+from .config import LDAP_PAGE_SIZE
+
+try:
+    from ...rt_directory_cache import PagedSource, attr_value, attr_values
+except (ImportError, ValueError):
+    # Running as a top-level package (python -m ...) from 14-ad-enumeration/
+    from rt_directory_cache import PagedSource, attr_value, attr_values
+
+# attr_value/attr_values are shared with the modules from here
+__all__ = ['LDAPConnection', 'attr_value', 'attr_values']
+
 
 class LDAPConnection:
     """Manages LDAP connections to domain controllers"""
@@ -22,6 +33,19 @@ class LDAPConnection:
         self.base_dn = ','.join([f"DC={part}" for part in domain.split('.')])
         self.conn = None
         self.server = None
+        self.page_size = LDAP_PAGE_SIZE
+
+        # Optional rt_directory_cache.DirectoryCache read through by cached_search
+        self.cache = None
+        self.refresh_cache = False
+
+    @classmethod
+    def from_connection(cls, conn, domain, username='', password=''):
+        """Wrap an already bound ldap3 Connection (e.g. a MOCK_SYNC one)"""
+        ldap_conn = cls(domain, username, password)
+        ldap_conn.conn = conn
+        ldap_conn.server = conn.server
+        return ldap_conn
 
     def connect(self):
         """Establish LDAP connection to domain controller"""
@@ -63,4 +87,39 @@ class LDAPConnection:
 
     def get_base_dn(self):
         """Return the base DN"""
-        return self.base_dn
\ No newline at end of file
+        return self.base_dn
+
+    def _source(self, page_size=None):
+        return PagedSource(self.conn, self.base_dn, self.dc_ip, page_size or self.page_size)
+
+    def paged_search(self, search_filter, attributes, search_base=None,
+                     page_size=None, search_scope=SUBTREE):
+        """
+        Stream search results page by page (Simple Paged Results control).
+
+        Only one page is held in memory at a time and results are not
+        truncated at the server size limit; see PagedSource.paged_search.
+
+        Yields:
+            (dn, attributes) tuples
+        """
+        return self._source(page_size).paged_search(
+            search_filter, attributes, search_base, search_scope
+        )
+
+    def cached_search(self, collection, search_filter, attributes, search_base=None):
+        """
+        Search for one of the shared directory cache collections.
+
+        Without a cache this is a plain paged_search. With one, the cache
+        collection (a superset of the attributes) is served from disk or
+        refreshed with a uSNChanged delta query.
+
+        Returns:
+            Iterable of (dn, attributes) tuples
+        """
+        if self.cache is None:
+            return self.paged_search(search_filter, attributes, search_base)
+
+        source = self._source() if self.conn is not None else None
+        return self.cache.sync(self.domain, collection, source, full=self.refresh_cache)
@@ -2,7 +2,8 @@
 Main AD Enumeration orchestrator
 """
 
-from connection import LDAPConnection
+from .connection import LDAPConnection
+from .membership import GroupMembershipIndex
 from ..modules.domain import DomainEnumerator
 from ..modules.users import UserEnumerator
 from ..modules.groups import GroupEnumerator
@@ -15,7 +16,8 @@ from ..utils.reporter import ReportGenerator
 class ADEnumerator:
     """Main orchestrator for AD enumeration"""
 
-    def __init__(self, domain, username, password, dc_ip=None, output_dir="ad_enum"):
+    def __init__(self, domain, username, password, dc_ip=None, output_dir="ad_enum",
+                 cache=None, refresh_cache=False):
         self.domain = domain
         self.username = username
         self.password = password
@@ -25,6 +27,10 @@ class ADEnumerator:
         # Initialize connection
         self.ldap_conn = LDAPConnection(domain, username, password, dc_ip)
 
+        # Shared directory cache (rt_directory_cache.DirectoryCache)
+        self.ldap_conn.cache = cache
+        self.ldap_conn.refresh_cache = refresh_cache
+
         # Initialize modules
         self.domain_enum = None
         self.user_enum = None
@@ -33,12 +39,17 @@ class ADEnumerator:
         self.spn_enum = None
         self.trust_enum = None
 
+        # Group graph shared by groups, users and the reporter
+        self.membership = GroupMembershipIndex()
+
         # Results
         self.results = {}
 
         print(f"[+] AD Enumerator initialized")
         print(f"[+] Domain: {self.domain}")
         print(f"[+] Output: {self.output_dir}")
+        if cache is not None:
+            print(f"[+] Cache: {cache.path}")
 
     def run_full_enumeration(self):
         """Run complete AD enumeration"""
@@ -71,10 +82,12 @@ class ADEnumerator:
     def _initialize_modules(self):
         """Initialize all enumeration modules"""
         self.domain_enum = DomainEnumerator(self.ldap_conn)
-        self.user_enum = UserEnumerator(self.ldap_conn)
-        self.group_enum = GroupEnumerator(self.ldap_conn)
-        self.computer_enum = ComputerEnumerator(self.ldap_conn)
-        self.spn_enum = SPNEnumerator(self.ldap_conn)
+        # Users, groups and computers are streamed to .jsonl files in the output dir
+        self.user_enum = UserEnumerator(self.ldap_conn, self.membership, self.output_dir)
+        self.group_enum = GroupEnumerator(self.ldap_conn, self.membership, self.output_dir)
+        self.computer_enum = ComputerEnumerator(self.ldap_conn, self.output_dir)
+        # SPNs come from the combined user sweep
+        self.spn_enum = SPNEnumerator(self.ldap_conn, self.user_enum)
         self.trust_enum = TrustEnumerator(self.ldap_conn)
 
     def _run_enumeration(self):
@@ -83,14 +96,14 @@ class ADEnumerator:
         domain_results = self.domain_enum.enumerate()
         self.results['domain_info'] = domain_results
 
+        # Groups (first, so user categorization sees nested membership)
+        group_results = self.group_enum.enumerate()
+        self.results.update(group_results)
+
         # Users
         user_results = self.user_enum.enumerate()
         self.results.update(user_results)
 
-        # Groups
-        group_results = self.group_enum.enumerate()
-        self.results.update(group_results)
-
         # Computers
         computer_results = self.computer_enum.enumerate()
         self.results.update(computer_results)
@@ -107,4 +120,5 @@ class ADEnumerator:
         """Generate all reports"""
         reporter = ReportGenerator(self.output_dir, self.domain)
         reporter.set_results(self.results)
+        reporter.set_membership(self.membership)
         reporter.generate_all_reports()
\ No newline at end of file
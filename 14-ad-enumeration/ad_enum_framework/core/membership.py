@@ -0,0 +1,255 @@
+"""
+Transitive group membership index
+"""
+
+EMPTY = frozenset()
+
+
+def dn_key(dn):
+    """Normalized DN used as graph key"""
+    return dn.strip().lower()
+
+
+def dn_to_cn(dn):
+    """First RDN value of a DN (CN=John Smith,OU=... -> John Smith)"""
+    first = dn.split(',', 1)[0]
+    return first.split('=', 1)[-1]
+
+
+class GroupMembershipIndex:
+    """
+    DN-keyed group graph with memoized transitive closure.
+
+    Built once per enumeration run from group 'member' values and user
+    'memberOf' values. Closures are computed with an iterative Tarjan
+    pass, so nesting cycles and deep chains are handled without
+    recursion. A new edge only drops the cached closures it changes, so
+    interleaving additions and queries (one user at a time) stays cheap.
+    """
+
+    def __init__(self):
+        self.groups = {}          # group key -> original DN
+        self.by_name = {}         # lowercase sAMAccountName -> group key
+        self.names = {}           # key -> original DN (any object seen)
+        self._parents = {}        # key -> set of group keys it belongs to
+        self._children = {}       # group key -> set of member keys
+        self._ancestors = {}      # closure cache (parents direction)
+        self._descendants = {}    # closure cache (children direction)
+
+    # Building
+
+    def add_group(self, dn, name, members=(), memberof=()):
+        """Add a group and its direct member / memberOf edges"""
+        key = self._remember(dn)
+        self.groups[key] = dn
+        if name:
+            self.by_name[name.lower()] = key
+        self._children.setdefault(key, set())
+
+        for member in members:
+            self._add_edge(member, dn)
+        for parent in memberof:
+            self._add_edge(dn, parent)
+
+    def add_memberships(self, dn, memberof):
+        """Record an object's direct memberOf values (fills gaps in ranged 'member')"""
+        for parent in memberof:
+            self._add_edge(dn, parent)
+
+    def _remember(self, dn):
+        key = dn_key(dn)
+        self.names.setdefault(key, dn)
+        return key
+
+    def _add_edge(self, child_dn, parent_dn):
+        """Add a membership edge, returning True if it was new"""
+        child = self._remember(child_dn)
+        parent = self._remember(parent_dn)
+        parents = self._parents.setdefault(child, set())
+        if parent in parents:
+            return False
+        self._invalidate(child, parent)
+        parents.add(parent)
+        self._children.setdefault(parent, set()).add(child)
+        return True
+
+    def _invalidate(self, child, parent):
+        """
+        Drop the closures an edge child -> parent is about to change.
+
+        Called before the edge is added, so the caches still describe the
+        old graph: only child and what lies below it gain ancestors, only
+        parent and what lies above it gain descendants.
+        """
+        if not self._ancestors and not self._descendants:
+            return
+
+        below = {child}
+        if self._children.get(child):
+            below.update(self._closure(child, self._children, self._descendants))
+        above = {parent}
+        if self._parents.get(parent):
+            above.update(self._closure(parent, self._parents, self._ancestors))
+
+        # Both sets first: computing one may cache old closures the other drops
+        for key in below:
+            self._ancestors.pop(key, None)
+        for key in above:
+            self._descendants.pop(key, None)
+
+    # Queries
+
+    def resolve_group(self, group):
+        """Group key from a sAMAccountName or DN (None if unknown)"""
+        key = self.by_name.get(group.lower())
+        if key is None and dn_key(group) in self.groups:
+            key = dn_key(group)
+        return key
+
+    def direct_members(self, group):
+        """Direct member DNs of a group"""
+        key = self.resolve_group(group)
+        if key is None:
+            return []
+        return [self.names[k] for k in self._children.get(key, ())]
+
+    def effective_members(self, group, include_groups=False):
+        """
+        All transitive members of a group.
+
+        Args:
+            group: sAMAccountName or DN
+            include_groups: Also return nested groups, not just principals
+
+        Returns:
+            List of member DNs
+        """
+        key = self.resolve_group(group)
+        if key is None:
+            return []
+
+        closure = self._closure(key, self._children, self._descendants)
+        return [
+            self.names[k] for k in closure
+            if k != key and (include_groups or k not in self.groups)
+        ]
+
+    def effective_groups(self, dn):
+        """All groups an object belongs to, directly or through nesting (DNs)"""
+        key = dn_key(dn)
+        return [self.names[k] for k in self._group_ancestors(key) if k != key]
+
+    def is_effective_member(self, dn, group):
+        """Check (transitive) membership of an object in a group"""
+        group_key = self.resolve_group(group)
+        if group_key is None:
+            return False
+        return group_key in self._group_ancestors(dn_key(dn))
+
+    def member_of(self, dn, groups):
+        """
+        The groups an object belongs to (transitively) out of a list.
+
+        Args:
+            dn: Object DN
+            groups: sAMAccountNames or DNs to check
+
+        Returns:
+            The matching entries of groups, in order
+        """
+        reach = self._group_ancestors(dn_key(dn))
+        return [group for group in groups if self.resolve_group(group) in reach]
+
+    def _group_ancestors(self, key):
+        """
+        Ancestor groups of a key.
+
+        Only groups are memoized; users and computers are answered from
+        their parents' cached closures so the cache stays group-sized.
+        """
+        if key in self.groups:
+            return self._closure(key, self._parents, self._ancestors)
+
+        parents = self._parents.get(key)
+        if not parents:
+            return EMPTY
+
+        reach = set(parents)
+        for parent in parents:
+            reach.update(self._closure(parent, self._parents, self._ancestors))
+        return reach
+
+    def _closure(self, start, edges, cache):
+        """
+        Reachability set from start along edges, memoized in cache.
+
+        Iterative Tarjan SCC: each strongly connected component shares
+        one frozenset, built from its members' edges and the already
+        cached closures of the components they point to.
+        """
+        if start in cache:
+            return cache[start]
+
+        index = {start: 0}
+        low = {start: 0}
+        counter = 1
+        stack = [start]
+        on_stack = {start}
+        work = [(start, iter(edges.get(start, ())))]
+
+        while work:
+            node, successors = work[-1]
+            descended = False
+
+            for nxt in successors:
+                if nxt in cache:
+                    continue
+                if nxt not in index:
+                    index[nxt] = low[nxt] = counter
+                    counter += 1
+                    stack.append(nxt)
+                    on_stack.add(nxt)
+                    work.append((nxt, iter(edges.get(nxt, ()))))
+                    descended = True
+                    break
+                if nxt in on_stack:
+                    low[node] = min(low[node], index[nxt])
+
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+
+            if low[node] != index[node]:
+                continue
+
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == node:
+                    break
+
+            reach = set()
+            for member in component:
+                for nxt in edges.get(member, ()):
+                    reach.add(nxt)
+                    reach.update(cache.get(nxt, EMPTY))
+
+            result = frozenset(reach) if reach else EMPTY
+            for member in component:
+                cache[member] = result
+
+        return cache[start]
+
+    def stats(self):
+        """Graph size summary"""
+        return {
+            'groups': len(self.groups),
+            'objects': len(self.names),
+            'edges': sum(len(p) for p in self._parents.values())
+        }
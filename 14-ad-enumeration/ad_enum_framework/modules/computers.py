@@ -2,17 +2,22 @@
 Computer enumeration module
 """
 
-from ldap3 import SUBTREE
 from ..core.config import COMPUTER_ATTRIBUTES, UAC_FLAGS
+from ..core.connection import attr_value, attr_values
+from ..utils.object_writer import ObjectWriter
 
 
 class ComputerEnumerator:
     """Enumerates domain computers and identifies delegation vulnerabilities"""
 
-    def __init__(self, ldap_conn):
+    def __init__(self, ldap_conn, output_dir=None):
+        self.ldap_conn = ldap_conn
+        self.output_dir = output_dir
         self.conn = ldap_conn.get_connection()
         self.base_dn = ldap_conn.get_base_dn()
-        self.computers = []
+        # Every computer goes to computers.jsonl; only delegation targets stay in memory
+        self.computer_count = 0
+        self.computers_file = None
         self.unconstrained_delegation = []
         self.constrained_delegation = []
 
@@ -23,34 +28,32 @@ class ComputerEnumerator:
         print(f"{'=' * 60}")
 
         try:
-            self.conn.search(
-                search_base=self.base_dn,
-                search_filter='(objectClass=computer)',
-                search_scope=SUBTREE,
-                attributes=COMPUTER_ATTRIBUTES
-            )
-
-            computer_count = 0
-            servers = []
-            workstations = []
-
-            for entry in self.conn.entries:
-                comp_info = self._parse_computer_entry(entry)
-                self.computers.append(comp_info)
-                computer_count += 1
-
-                # Categorize by OS
-                if 'server' in comp_info['os'].lower():
-                    servers.append(comp_info)
-                else:
-                    workstations.append(comp_info)
-
-                # Check for delegation vulnerabilities
-                self._check_delegation(comp_info)
-
-            print(f"[+] Enumerated {computer_count} computers")
-            print(f"    Servers: {len(servers)}")
-            print(f"    Workstations: {len(workstations)}")
+            servers = 0
+            workstations = 0
+            # Only computers with a readable password, so this stays small
+            laps = self._laps_passwords() if self.ldap_conn.cache is not None else None
+
+            with ObjectWriter(self.output_dir, 'computers') as writer:
+                for dn, attributes in self.ldap_conn.cached_search('computers', '(objectClass=computer)', COMPUTER_ATTRIBUTES):
+                    comp_info = self._parse_computer_entry(attributes)
+                    if laps is not None:
+                        comp_info['laps_password'] = laps.get(comp_info['name'].lower(), '')
+
+                    # Categorize by OS
+                    if 'server' in comp_info['os'].lower():
+                        servers += 1
+                    else:
+                        workstations += 1
+
+                    # Check for delegation vulnerabilities
+                    self._check_delegation(comp_info)
+                    writer.write(comp_info)
+
+            self.computer_count = writer.count
+            self.computers_file = writer.path
+            print(f"[+] Enumerated {self.computer_count} computers")
+            print(f"    Servers: {servers}")
+            print(f"    Workstations: {workstations}")
             print(f"[+] Unconstrained Delegation: {len(self.unconstrained_delegation)}")
             print(f"[+] Constrained Delegation: {len(self.constrained_delegation)}")
 
@@ -58,20 +61,40 @@ class ComputerEnumerator:
             print(f"[-] Computer enumeration failed: {e}")
 
         return {
-            'computers': self.computers,
+            'computer_count': self.computer_count,
+            'computers_file': self.computers_file,
             'unconstrained_delegation': self.unconstrained_delegation,
             'constrained_delegation': self.constrained_delegation
         }
 
-    def _parse_computer_entry(self, entry):
-        """Parse LDAP entry into computer info dictionary"""
+    def _laps_passwords(self):
+        """
+        Readable LAPS passwords by lowercase computer name, queried live:
+        the directory cache never stores them
+        """
+        if self.conn is None:
+            return {}
+        try:
+            return {
+                str(attr_value(attributes, 'sAMAccountName')).rstrip('$').lower():
+                    str(attr_value(attributes, 'ms-MCS-AdmPwd'))
+                for dn, attributes in self.ldap_conn.paged_search(
+                    '(&(objectClass=computer)(ms-MCS-AdmPwd=*))',
+                    ['sAMAccountName', 'ms-MCS-AdmPwd'])
+            }
+        except Exception:
+            # No LAPS schema extension, or not readable
+            return {}
+
+    def _parse_computer_entry(self, attributes):
+        """Parse LDAP search result into computer info dictionary"""
         return {
-            'name': str(entry.sAMAccountName).rstrip('$'),
-            'hostname': str(entry.get('dNSHostName', '')),
-            'os': str(entry.get('operatingSystem', '')),
-            'uac': int(str(entry.get('userAccountControl', 0))),
-            'constrained_delegation': [str(d) for d in entry.get('msDS-AllowedToDelegateTo', [])],
-            'laps_password': str(entry.get('ms-MCS-AdmPwd', ''))
+            'name': str(attr_value(attributes, 'sAMAccountName')).rstrip('$'),
+            'hostname': str(attr_value(attributes, 'dNSHostName')),
+            'os': str(attr_value(attributes, 'operatingSystem')),
+            'uac': int(str(attr_value(attributes, 'userAccountControl', 0))),
+            'constrained_delegation': [str(d) for d in attr_values(attributes, 'msDS-AllowedToDelegateTo')],
+            'laps_password': str(attr_value(attributes, 'ms-MCS-AdmPwd'))
         }
 
     def _check_delegation(self, comp_info):
@@ -4,11 +4,14 @@ Domain information enumeration module
 
 from ldap3 import SUBTREE
 
+from ..core.connection import attr_value
+
 
 class DomainEnumerator:
     """Enumerates basic domain information"""
 
     def __init__(self, ldap_conn):
+        self.ldap_conn = ldap_conn
         self.conn = ldap_conn.get_connection()
         self.base_dn = ldap_conn.get_base_dn()
         self.domain = ldap_conn.domain
@@ -39,6 +42,15 @@ class DomainEnumerator:
                 }
                 print(f"[+] Domain: {self.domain}")
 
+                domain_sid = str(attr_value(domain_obj.entry_attributes_as_dict, 'objectSid'))
+                if domain_sid:
+                    self.results['sid'] = domain_sid
+                    print(f"[+] Domain SID: {domain_sid}")
+
+                    # Saves ticket_framework its lookupsid.py / rpcclient run
+                    if self.ldap_conn.cache is not None:
+                        self.ldap_conn.cache.set_fact(self.domain, 'domain_sid', domain_sid)
+
                 # Enumerate domain controllers
                 self._enumerate_domain_controllers()
 
@@ -2,17 +2,24 @@
 Group enumeration module
 """
 
-from ldap3 import SUBTREE
 from ..core.config import PRIVILEGED_GROUPS, GROUP_ATTRIBUTES
+from ..core.connection import attr_value, attr_values
+from ..core.membership import GroupMembershipIndex, dn_to_cn
+from ..utils.object_writer import ObjectWriter
 
 
 class GroupEnumerator:
     """Enumerates domain groups with focus on privileged groups"""
 
-    def __init__(self, ldap_conn):
+    def __init__(self, ldap_conn, membership=None, output_dir=None):
+        self.ldap_conn = ldap_conn
+        self.output_dir = output_dir
         self.conn = ldap_conn.get_connection()
         self.base_dn = ldap_conn.get_base_dn()
-        self.groups = []
+        # Groups go to groups.jsonl; the membership graph keeps what queries need
+        self.group_count = 0
+        self.groups_file = None
+        self.membership = membership if membership is not None else GroupMembershipIndex()
 
     def enumerate(self):
         """Enumerate domain groups"""
@@ -21,25 +28,23 @@ class GroupEnumerator:
         print(f"{'=' * 60}")
 
         try:
-            self.conn.search(
-                search_base=self.base_dn,
-                search_filter='(objectClass=group)',
-                search_scope=SUBTREE,
-                attributes=GROUP_ATTRIBUTES
-            )
-
-            group_count = 0
-            for entry in self.conn.entries:
-                group_info = {
-                    'name': str(entry.sAMAccountName),
-                    'members': [str(m) for m in entry.get('member', [])],
-                    'memberof': [str(g) for g in entry.get('memberOf', [])],
-                    'description': str(entry.get('description', ''))
-                }
-                self.groups.append(group_info)
-                group_count += 1
-
-            print(f"[+] Enumerated {group_count} groups")
+            with ObjectWriter(self.output_dir, 'groups') as writer:
+                for dn, attributes in self.ldap_conn.cached_search('groups', '(objectClass=group)', GROUP_ATTRIBUTES):
+                    group_info = {
+                        'dn': dn,
+                        'name': str(attr_value(attributes, 'sAMAccountName')),
+                        'members': [str(m) for m in attr_values(attributes, 'member')],
+                        'memberof': [str(g) for g in attr_values(attributes, 'memberOf')],
+                        'description': str(attr_value(attributes, 'description'))
+                    }
+                    self.membership.add_group(
+                        dn, group_info['name'], group_info['members'], group_info['memberof']
+                    )
+                    writer.write(group_info)
+
+            self.group_count = writer.count
+            self.groups_file = writer.path
+            print(f"[+] Enumerated {self.group_count} groups")
 
             # Display privileged group membership
             self._display_privileged_groups()
@@ -47,23 +52,27 @@ class GroupEnumerator:
         except Exception as e:
             print(f"[-] Group enumeration failed: {e}")
 
-        return {'groups': self.groups}
+        return {'group_count': self.group_count, 'groups_file': self.groups_file}
 
     def _display_privileged_groups(self):
-        """Display membership of privileged groups"""
+        """Display direct and effective (nested) membership of privileged groups"""
         print(f"\n[*] Privileged Group Membership:")
 
         for priv_group in PRIVILEGED_GROUPS:
-            for group in self.groups:
-                if group['name'].lower() == priv_group.lower():
-                    member_count = len(group['members'])
-                    print(f"    {group['name']}: {member_count} members")
-
-                    # Show first 5 members
-                    for member in group['members'][:5]:
-                        cn = member.split(',')[0].replace('CN=', '')
-                        print(f"        - {cn}")
-
-                    if member_count > 5:
-                        print(f"        ... and {member_count - 5} more")
-                    break
\ No newline at end of file
+            if self.membership.resolve_group(priv_group) is None:
+                continue
+
+            direct = self.membership.direct_members(priv_group)
+            effective = self.membership.effective_members(priv_group)
+            nested_only = len(set(effective) - set(direct))
+
+            print(f"    {priv_group}: {len(direct)} direct, {len(effective)} effective members")
+
+            # Show first 5 effective members
+            for member in effective[:5]:
+                print(f"        - {dn_to_cn(member)}")
+
+            if len(effective) > 5:
+                print(f"        ... and {len(effective) - 5} more")
+            if nested_only:
+                print(f"        [!] {nested_only} member(s) only via nested groups")
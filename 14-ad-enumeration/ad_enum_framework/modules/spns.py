@@ -2,13 +2,15 @@
 Service Principal Name (SPN) enumeration module
 """
 
-from ldap3 import SUBTREE
+from ..core.connection import attr_value, attr_values
 
 
 class SPNEnumerator:
     """Enumerates SPNs for Kerberoasting attacks"""
 
-    def __init__(self, ldap_conn):
+    def __init__(self, ldap_conn, user_enum=None):
+        self.ldap_conn = ldap_conn
+        self.user_enum = user_enum
         self.conn = ldap_conn.get_connection()
         self.base_dn = ldap_conn.get_base_dn()
         self.domain = ldap_conn.domain
@@ -23,19 +25,8 @@ class SPNEnumerator:
         print(f"{'=' * 60}")
 
         try:
-            self.conn.search(
-                search_base=self.base_dn,
-                search_filter='(&(objectClass=user)(servicePrincipalName=*))',
-                search_scope=SUBTREE,
-                attributes=['sAMAccountName', 'servicePrincipalName', 'adminCount', 'memberOf']
-            )
-
             spn_count = 0
-            for entry in self.conn.entries:
-                username = str(entry.sAMAccountName)
-                spns = [str(s) for s in entry.servicePrincipalName]
-                is_admin = str(entry.get('adminCount', 0)) == '1'
-
+            for username, spns, is_admin in self._iter_spn_accounts():
                 spn_info = {
                     'username': username,
                     'spns': spns,
@@ -58,6 +49,28 @@ class SPNEnumerator:
 
         return {'spns': self.spns}
 
+    def _iter_spn_accounts(self):
+        """
+        Yield (username, spns, is_admin) for accounts with SPNs.
+
+        Reuses the combined user sweep when UserEnumerator already ran,
+        otherwise falls back to its own paged query.
+        """
+        if self.user_enum is not None and self.user_enum.enumerated:
+            for user in self.user_enum.kerberoastable:
+                yield user['samaccountname'], user['spns'], user['admincount'] == '1'
+            return
+
+        for _, attributes in self.ldap_conn.paged_search(
+                '(&(objectClass=user)(servicePrincipalName=*))',
+                ['sAMAccountName', 'servicePrincipalName', 'adminCount', 'memberOf']
+        ):
+            yield (
+                str(attr_value(attributes, 'sAMAccountName')),
+                [str(s) for s in attr_values(attributes, 'servicePrincipalName')],
+                str(attr_value(attributes, 'adminCount', 0)) == '1'
+            )
+
     def _print_attack_guidance(self):
         """Print Kerberoasting attack commands"""
         print(f"\n[*] Kerberoasting with Impacket:")
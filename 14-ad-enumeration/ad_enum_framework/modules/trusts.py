@@ -2,14 +2,15 @@
 Trust relationship enumeration module
 """
 
-from ldap3 import SUBTREE
 from ..core.config import TRUST_DIRECTIONS, TRUST_TYPES
+from ..core.connection import attr_value
 
 
 class TrustEnumerator:
     """Enumerates domain trust relationships"""
 
     def __init__(self, ldap_conn):
+        self.ldap_conn = ldap_conn
         self.conn = ldap_conn.get_connection()
         self.base_dn = ldap_conn.get_base_dn()
         self.trusts = []
@@ -21,19 +22,19 @@ class TrustEnumerator:
         print(f"{'=' * 60}")
 
         try:
-            self.conn.search(
-                search_base=f"CN=System,{self.base_dn}",
-                search_filter='(objectClass=trustedDomain)',
-                search_scope=SUBTREE,
-                attributes=['cn', 'trustPartner', 'trustDirection', 'trustType']
+            entries = self.ldap_conn.cached_search(
+                'trusts',
+                '(objectClass=trustedDomain)',
+                ['cn', 'trustPartner', 'trustDirection', 'trustType'],
+                search_base=f"CN=System,{self.base_dn}"
             )
 
-            if self.conn.entries:
-                for entry in self.conn.entries:
-                    trust_info = self._parse_trust_entry(entry)
-                    self.trusts.append(trust_info)
-                    self._print_trust(trust_info)
+            for _, attributes in entries:
+                trust_info = self._parse_trust_entry(attributes)
+                self.trusts.append(trust_info)
+                self._print_trust(trust_info)
 
+            if self.trusts:
                 print(f"\n[+] Total trusts: {len(self.trusts)}")
             else:
                 print(f"[*] No trust relationships found")
@@ -43,13 +44,13 @@ class TrustEnumerator:
 
         return {'trusts': self.trusts}
 
-    def _parse_trust_entry(self, entry):
-        """Parse trust entry into trust info dictionary"""
-        direction_val = int(str(entry.trustDirection))
-        type_val = int(str(entry.trustType))
+    def _parse_trust_entry(self, attributes):
+        """Parse trust search result into trust info dictionary"""
+        direction_val = int(str(attr_value(attributes, 'trustDirection', 0)))
+        type_val = int(str(attr_value(attributes, 'trustType', 0)))
 
         return {
-            'partner': str(entry.trustPartner),
+            'partner': str(attr_value(attributes, 'trustPartner')),
             'direction': TRUST_DIRECTIONS.get(direction_val, 'Unknown'),
             'type': TRUST_TYPES.get(type_val, 'Unknown')
         }
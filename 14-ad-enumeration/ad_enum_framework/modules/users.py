@@ -2,20 +2,30 @@
 User enumeration module
 """
 
-from ldap3 import SUBTREE
-from ..core.config import USER_ATTRIBUTES, UAC_FLAGS, PASSWORD_KEYWORDS
+from ..core.config import USER_ATTRIBUTES, UAC_FLAGS, PASSWORD_KEYWORDS, PRIVILEGED_GROUPS
+from ..core.connection import attr_value, attr_values
+from ..utils.object_writer import ObjectWriter
+
+# One sweep covers users, Kerberoastable SPN accounts and AS-REP candidates
+USER_FILTER = '(&(objectClass=user)(objectCategory=person))'
 
 
 class UserEnumerator:
     """Enumerates domain users and identifies attack vectors"""
 
-    def __init__(self, ldap_conn):
+    def __init__(self, ldap_conn, membership=None, output_dir=None):
+        self.ldap_conn = ldap_conn
+        self.membership = membership
+        self.output_dir = output_dir
         self.conn = ldap_conn.get_connection()
         self.base_dn = ldap_conn.get_base_dn()
-        self.users = []
+        # Every user goes to users.jsonl; only the attack targets stay in memory
+        self.user_count = 0
+        self.users_file = None
         self.privileged_users = []
         self.kerberoastable = []
         self.asreproastable = []
+        self.enumerated = False
 
     def enumerate(self):
         """Enumerate all domain users"""
@@ -24,51 +34,49 @@ class UserEnumerator:
         print(f"{'=' * 60}")
 
         try:
-            self.conn.search(
-                search_base=self.base_dn,
-                search_filter='(&(objectClass=user)(objectCategory=person))',
-                search_scope=SUBTREE,
-                attributes=USER_ATTRIBUTES
-            )
-
-            user_count = 0
-            for entry in self.conn.entries:
-                user_info = self._parse_user_entry(entry)
-                self.users.append(user_info)
-                user_count += 1
-
-                # Categorize users
-                self._categorize_user(user_info)
+            with ObjectWriter(self.output_dir, 'users') as writer:
+                for dn, attributes in self.ldap_conn.cached_search('users', USER_FILTER, USER_ATTRIBUTES):
+                    user_info = self._parse_user_entry(dn, attributes)
+
+                    # Categorize users
+                    self._categorize_user(user_info)
+                    writer.write(user_info)
 
+            self.user_count = writer.count
+            self.users_file = writer.path
+            self.enumerated = True
             self._print_summary()
 
         except Exception as e:
             print(f"[-] User enumeration failed: {e}")
 
         return {
-            'users': self.users,
+            'user_count': self.user_count,
+            'users_file': self.users_file,
             'privileged_users': self.privileged_users,
             'kerberoastable': self.kerberoastable,
             'asreproastable': self.asreproastable
         }
 
-    def _parse_user_entry(self, entry):
-        """Parse LDAP entry into user info dictionary"""
+    def _parse_user_entry(self, dn, attributes):
+        """Parse LDAP search result into user info dictionary"""
         return {
-            'samaccountname': str(entry.sAMAccountName),
-            'upn': str(entry.get('userPrincipalName', '')),
-            'displayname': str(entry.get('displayName', '')),
-            'description': str(entry.get('description', '')),
-            'memberof': [str(g) for g in entry.get('memberOf', [])],
-            'admincount': str(entry.get('adminCount', 0)),
-            'spns': [str(s) for s in entry.get('servicePrincipalName', [])],
-            'uac': int(str(entry.get('userAccountControl', 0)))
+            'dn': dn,
+            'samaccountname': str(attr_value(attributes, 'sAMAccountName')),
+            'upn': str(attr_value(attributes, 'userPrincipalName')),
+            'displayname': str(attr_value(attributes, 'displayName')),
+            'description': str(attr_value(attributes, 'description')),
+            'memberof': [str(g) for g in attr_values(attributes, 'memberOf')],
+            'admincount': str(attr_value(attributes, 'adminCount', 0)),
+            'spns': [str(s) for s in attr_values(attributes, 'servicePrincipalName')],
+            'uac': int(str(attr_value(attributes, 'userAccountControl', 0)))
         }
 
     def _categorize_user(self, user_info):
         """Categorize user based on attributes"""
-        # Privileged users (adminCount = 1)
-        if user_info['admincount'] == '1':
+        # Privileged users (adminCount = 1 or nested into a privileged group)
+        user_info['privileged_groups'] = self._effective_privileged_groups(user_info)
+        if user_info['admincount'] == '1' or user_info['privileged_groups']:
             self.privileged_users.append(user_info)
 
         # Kerberoastable (has SPNs)
@@ -85,9 +93,17 @@ class UserEnumerator:
             print(f"[!] Potential password in description: {user_info['samaccountname']}")
             print(f"    Description: {user_info['description']}")
 
+    def _effective_privileged_groups(self, user_info):
+        """Privileged groups the user belongs to, including through nesting"""
+        if self.membership is None:
+            return []
+
+        self.membership.add_memberships(user_info['dn'], user_info['memberof'])
+        return self.membership.member_of(user_info['dn'], PRIVILEGED_GROUPS)
+
     def _print_summary(self):
         """Print enumeration summary"""
-        print(f"[+] Enumerated {len(self.users)} users")
+        print(f"[+] Enumerated {self.user_count} users")
         print(f"[+] Privileged users (adminCount=1): {len(self.privileged_users)}")
         print(f"[+] Kerberoastable users: {len(self.kerberoastable)}")
         print(f"[+] AS-REP Roastable users: {len(self.asreproastable)}")
@@ -0,0 +1,49 @@
+"""
+Streaming object output
+"""
+
+import json
+from pathlib import Path
+
+
+class ObjectWriter:
+    """
+    Writes enumerated objects to <output_dir>/<name>.jsonl as they arrive.
+
+    Enumerators keep only counts and the attack-relevant subsets in memory;
+    the full object list lives in this file. Without an output directory
+    objects are only counted.
+    """
+
+    def __init__(self, output_dir, name):
+        self.path = Path(output_dir) / f"{name}.jsonl" if output_dir else None
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'w')
+        return self
+
+    def write(self, obj):
+        """Record one object"""
+        self.count += 1
+        if self._file is not None:
+            self._file.write(json.dumps(obj, default=str) + '\n')
+
+    def __exit__(self, *exc):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return False
+
+
+def read_objects(path):
+    """Yield the objects of a .jsonl file written by ObjectWriter"""
+    if not path:
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -6,6 +6,10 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from ..core.config import PRIVILEGED_GROUPS
+from ..core.membership import dn_to_cn
+from .object_writer import read_objects
+
 
 class ReportGenerator:
     """Generates enumeration reports in various formats"""
@@ -15,20 +19,29 @@ class ReportGenerator:
         self.output_dir.mkdir(exist_ok=True)
         self.domain = domain
         self.results = {}
+        self.membership = None
 
     def set_results(self, results):
         """Set the enumeration results"""
         self.results = results
 
+    def set_membership(self, membership):
+        """Set the group membership index built during enumeration"""
+        self.membership = membership
+
     def generate_all_reports(self):
         """Generate all report formats"""
         print(f"\n{'=' * 60}")
         print(f"GENERATING REPORTS")
         print(f"{'=' * 60}")
 
+        if self.membership is not None:
+            self.results['privileged_membership'] = self._privileged_membership()
+
         self.generate_json_report()
         self.generate_user_list()
         self.generate_kerberoast_list()
+        self.generate_privileged_access()
         self.generate_summary()
 
         print(f"\n[+] All reports generated in: {self.output_dir}")
@@ -43,11 +56,11 @@ class ReportGenerator:
         print(f"[+] JSON report: {report_file}")
 
     def generate_user_list(self):
-        """Generate simple user list"""
+        """Generate simple user list (read back from users.jsonl, one user at a time)"""
         users_file = self.output_dir / "users.txt"
 
         with open(users_file, 'w') as f:
-            for user in self.results.get('users', []):
+            for user in read_objects(self.results.get('users_file')):
                 f.write(f"{user['samaccountname']}\n")
 
         print(f"[+] User list: {users_file}")
@@ -65,6 +78,31 @@ class ReportGenerator:
 
             print(f"[+] Kerberoastable users: {kerb_file}")
 
+    def _privileged_membership(self):
+        """Effective (nested) members of each privileged group"""
+        return {
+            group: self.membership.effective_members(group)
+            for group in PRIVILEGED_GROUPS
+            if self.membership.resolve_group(group) is not None
+        }
+
+    def generate_privileged_access(self):
+        """Generate effective privileged group membership list"""
+        membership = self.results.get('privileged_membership')
+
+        if membership:
+            access_file = self.output_dir / "privileged_access.txt"
+
+            with open(access_file, 'w') as f:
+                for group, members in membership.items():
+                    direct = set(self.membership.direct_members(group))
+                    f.write(f"{group} ({len(members)} effective members)\n")
+                    for member in members:
+                        via = "" if member in direct else "\t(nested)"
+                        f.write(f"  {dn_to_cn(member)}{via}\n")
+
+            print(f"[+] Privileged access: {access_file}")
+
     def generate_summary(self):
         """Generate executive summary"""
         summary_file = self.output_dir / "summary.txt"
@@ -75,9 +113,9 @@ class ReportGenerator:
             f.write(f"Enumeration Time: {datetime.now().isoformat()}\n\n")
 
             f.write(f"Total Objects:\n")
-            f.write(f"  Users: {len(self.results.get('users', []))}\n")
-            f.write(f"  Computers: {len(self.results.get('computers', []))}\n")
-            f.write(f"  Groups: {len(self.results.get('groups', []))}\n")
+            f.write(f"  Users: {self.results.get('user_count', 0)}\n")
+            f.write(f"  Computers: {self.results.get('computer_count', 0)}\n")
+            f.write(f"  Groups: {self.results.get('group_count', 0)}\n")
             f.write(f"  Trusts: {len(self.results.get('trusts', []))}\n\n")
 
             f.write(f"Attack Targets:\n")
@@ -0,0 +1,36 @@
+"""
+RT Directory Cache
+Persistent, incrementally refreshed directory cache shared by
+ad_enum_framework, kerberoast_framework, targeted_kerberoast,
+rt_trust_enumeration, ticket_framework and dcsync_framework
+
+Author: Maxwell Cross
+Series: 30 Days of Red Team
+"""
+
+__version__ = "1.0.0"
+__author__ = "Maxwell Cross"
+
+from .cache import (
+    DirectoryCache,
+    PagedSource,
+    Collection,
+    COLLECTIONS,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_TTL,
+    ACCOUNTDISABLE,
+    attr_value,
+    attr_values,
+)
+
+__all__ = [
+    "DirectoryCache",
+    "PagedSource",
+    "Collection",
+    "COLLECTIONS",
+    "DEFAULT_CACHE_PATH",
+    "DEFAULT_TTL",
+    "ACCOUNTDISABLE",
+    "attr_value",
+    "attr_values",
+]
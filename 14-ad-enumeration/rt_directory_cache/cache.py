@@ -0,0 +1,520 @@
+"""
+Directory Cache
+On-disk (SQLite) cache of directory objects shared by the AD enumeration,
+Kerberos, trust, ticket and DCSync frameworks, refreshed incrementally
+through uSNChanged
+"""
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Simple Paged Results control (RFC 2696)
+PAGED_RESULTS_OID = "1.2.840.113556.1.4.319"
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "rt_directory_cache", "directory.db"
+)
+
+# Serve a collection without contacting the DC for this long (seconds)
+DEFAULT_TTL = 15 * 60
+
+# Delta refreshes never see deletions: re-sweep fully after this long
+FULL_SWEEP_TTL = 24 * 60 * 60
+
+# Facts such as the domain SID practically never change
+FACT_TTL = 30 * 24 * 60 * 60
+
+# Requested on every collection: the cache key and the delta watermark
+TRACKING_ATTRIBUTES = ["objectGUID", "uSNChanged"]
+
+# Secrets are never written to disk; tools read them live (LAPS passwords)
+SENSITIVE_ATTRIBUTES = ("ms-MCS-AdmPwd", "msLAPS-Password", "msLAPS-EncryptedPassword")
+
+# Rows read from disk per query when streaming a collection back
+ENTRY_PAGE_SIZE = 1000
+
+# userAccountControl flags the tools filter cached sweeps on
+ACCOUNTDISABLE = 0x2
+
+
+@dataclass(frozen=True)
+class Collection:
+    """One cached directory sweep"""
+    name: str
+    search_filter: str
+    attributes: Tuple[str, ...]
+    container: str = ""     # RDN below the naming context, e.g. CN=System
+
+
+# Broad filters on purpose: an object that stops matching a narrower filter
+# (an SPN removed, an account disabled) would never show up in a delta query,
+# so tools filter the cached sweep locally instead.
+COLLECTIONS = {
+    "users": Collection(
+        "users",
+        "(&(objectClass=user)(objectCategory=person))",
+        (
+            "sAMAccountName", "userPrincipalName", "displayName", "memberOf",
+            "adminCount", "servicePrincipalName", "userAccountControl",
+            "pwdLastSet", "lastLogon", "description", "whenCreated", "title",
+            "department", "objectSid",
+        ),
+    ),
+    "groups": Collection(
+        "groups",
+        "(objectClass=group)",
+        ("sAMAccountName", "member", "memberOf", "description", "objectSid"),
+    ),
+    "computers": Collection(
+        "computers",
+        "(objectClass=computer)",
+        (
+            "sAMAccountName", "dNSHostName", "operatingSystem",
+            "operatingSystemVersion", "servicePrincipalName",
+            "userAccountControl", "msDS-AllowedToDelegateTo",
+            "description", "objectSid",
+        ),
+    ),
+    "trusts": Collection(
+        "trusts",
+        "(objectClass=trustedDomain)",
+        ("cn", "trustPartner", "trustDirection", "trustType",
+         "trustAttributes", "flatName"),
+        container="CN=System",
+    ),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    domain      TEXT NOT NULL,
+    collection  TEXT NOT NULL,
+    object_key  TEXT NOT NULL,      -- objectGUID, or lowercase DN without one
+    dn          TEXT NOT NULL,
+    usn         INTEGER,
+    fetched_at  REAL NOT NULL,
+    attributes  TEXT NOT NULL,
+    PRIMARY KEY (domain, collection, object_key)
+);
+CREATE INDEX IF NOT EXISTS objects_by_dn ON objects (domain, collection, dn, object_key);
+CREATE TABLE IF NOT EXISTS sync_state (
+    domain         TEXT NOT NULL,
+    collection     TEXT NOT NULL,
+    server         TEXT NOT NULL,   -- uSNChanged is only meaningful per DC
+    high_usn       INTEGER,
+    synced_at      REAL NOT NULL,
+    full_sweep_at  REAL NOT NULL,
+    PRIMARY KEY (domain, collection)
+);
+CREATE TABLE IF NOT EXISTS facts (
+    domain      TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (domain, name)
+);
+"""
+
+
+def attr_value(attributes: Dict[str, Any], name: str, default: Any = "") -> Any:
+    """Single value of an attribute from a search response or cached entry"""
+    value = attributes.get(name)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return default if value is None else value
+
+
+def attr_values(attributes: Dict[str, Any], name: str) -> List[Any]:
+    """All values of an attribute as a list"""
+    value = attributes.get(name)
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _plain(value: Any) -> Any:
+    """JSON-safe form of a (possibly schema-formatted) ldap3 value"""
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, bytes):
+        try:
+            return value.decode("utf-8")
+        except UnicodeDecodeError:
+            return value.hex()
+    return str(value)
+
+
+class PagedSource:
+    """
+    A bound ldap3 connection as the search side of a cache sync
+
+    Searches are paged (only one page in memory) and attributes missing
+    from the server schema are dropped, since ldap3 rejects the whole
+    search client-side on an unknown attribute.
+    """
+
+    def __init__(self, conn, base_dn: str, server_name: str = "", page_size: int = 1000):
+        """
+        Args:
+            conn: Bound ldap3 Connection
+            base_dn: Domain naming context (DC=corp,DC=local)
+            server_name: DC the connection points at
+            page_size: Simple Paged Results page size
+        """
+        self.conn = conn
+        self.base_dn = base_dn
+        self.server_name = server_name or getattr(conn.server, "host", "")
+        self.page_size = page_size
+
+    def _supported_attributes(self, attributes: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Drop attributes missing from the server schema
+
+        ldap3 rejects the whole search client-side on an unknown attribute
+        (e.g. ms-MCS-AdmPwd in domains without the LAPS schema extension).
+        """
+        schema = self.conn.server.schema if self.conn.server else None
+        if schema is None or not attributes:
+            return attributes
+        known = schema.attribute_types
+        return [a for a in attributes if a in ("*", "+") or a in known]
+
+    def paged_search(
+            self,
+            search_filter: str,
+            attributes: Optional[List[str]],
+            search_base: Optional[str] = None,
+            search_scope: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream (dn, attributes) page by page
+
+        Only one page is held in memory at a time and results are not
+        truncated at the server size limit.
+
+        Args:
+            search_filter: LDAP filter
+            attributes: Attributes to return
+            search_base: Defaults to the naming context
+            search_scope: ldap3 scope (default SUBTREE)
+
+        Raises:
+            RuntimeError: The server returned an error for the search
+        """
+        from ldap3 import SUBTREE
+
+        cookie = None
+        attributes = self._supported_attributes(attributes)
+
+        while True:
+            self.conn.search(
+                search_base=search_base or self.base_dn,
+                search_filter=search_filter,
+                search_scope=search_scope or SUBTREE,
+                attributes=attributes,
+                paged_size=self.page_size,
+                paged_cookie=cookie
+            )
+
+            result = self.conn.result or {}
+            if result.get("result", 0) != 0:
+                raise RuntimeError(
+                    f"LDAP search failed: {result.get('description')} {result.get('message', '')}".strip()
+                )
+
+            for item in self.conn.response or []:
+                if item.get("type") == "searchResEntry":
+                    yield item["dn"], item["attributes"]
+
+            cookie = (
+                result.get("controls", {})
+                .get(PAGED_RESULTS_OID, {})
+                .get("value", {})
+                .get("cookie")
+            )
+            if not cookie:
+                break
+
+    def watermark(self) -> Tuple[Optional[int], str]:
+        """
+        (highestCommittedUSN, DC identity) from the rootDSE
+
+        Read before a sweep, the USN is a safe watermark: anything changed
+        while the pages stream in gets a higher USN and is picked up by the
+        next delta. Falls back to (None, server_name) when the rootDSE
+        cannot be read.
+        """
+        from ldap3 import BASE
+
+        try:
+            self.conn.search("", "(objectClass=*)", BASE,
+                             attributes=["highestCommittedUSN", "dsServiceName"])
+            attributes = self.conn.response[0]["attributes"]
+            usn = int(str(attr_value(attributes, "highestCommittedUSN")))
+            server = str(attr_value(attributes, "dsServiceName")) or self.server_name
+            return usn, server
+        except Exception:
+            return None, self.server_name
+
+
+class DirectoryCache:
+    """
+    Directory objects keyed by (domain, collection, objectGUID)
+
+    A collection younger than `ttl` is served straight from disk. An older
+    one is refreshed with a single delta query, (uSNChanged>=watermark+1)
+    against the same DC, and only a missing, foreign-DC or day-old
+    collection costs a full sweep. Deleted objects are not visible to
+    delta queries; they drop out at the next full sweep.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            ttl: float = DEFAULT_TTL,
+            full_ttl: float = FULL_SWEEP_TTL,
+            verbose: bool = True
+    ):
+        """
+        Args:
+            path: SQLite file (default: ~/.cache/rt_directory_cache/directory.db)
+            ttl: Seconds a collection is served without contacting the DC
+            full_ttl: Seconds after which a full sweep replaces delta refreshes
+            verbose: Print a status line per sync
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self.full_ttl = full_ttl
+        self.verbose = verbose
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        # Cached sweeps map out the whole directory
+        new_file = not os.path.exists(self.path)
+        self.db = sqlite3.connect(self.path)
+        if new_file:
+            os.chmod(self.path, 0o600)
+        self.db.executescript(_SCHEMA)
+
+        # Outcome of the last sync() call: mode, fetched, total
+        self.last_sync: Dict[str, Any] = {}
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def log(self, message: str, level: str = "info") -> None:
+        if not self.verbose:
+            return
+        prefixes = {"info": "[*]", "success": "[+]", "error": "[-]", "warning": "[!]"}
+        print(f"{prefixes.get(level, '[*]')} {message}")
+
+    # ── Collections ─────────────────────────────────────────────
+
+    def _state(self, domain: str, collection: str) -> Optional[Tuple]:
+        return self.db.execute(
+            "SELECT server, high_usn, synced_at, full_sweep_at FROM sync_state "
+            "WHERE domain = ? AND collection = ?",
+            (domain, collection)
+        ).fetchone()
+
+    def is_fresh(self, domain: str, collection: str, max_age: Optional[float] = None) -> bool:
+        """Collection can be served without contacting the DC"""
+        state = self._state(domain.lower(), collection)
+        max_age = self.ttl if max_age is None else max_age
+        return state is not None and time.time() - state[2] < max_age
+
+    def has(self, domain: str, collection: str) -> bool:
+        """Collection was synced at least once (fresh or not)"""
+        return self._state(domain.lower(), collection) is not None
+
+    def count(self, domain: str, collection: str) -> int:
+        """Number of cached objects in a collection"""
+        return self.db.execute(
+            "SELECT COUNT(*) FROM objects WHERE domain = ? AND collection = ?",
+            (domain.lower(), collection)
+        ).fetchone()[0]
+
+    def entries(self, domain: str, collection: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream the cached (dn, attributes) of a collection, whatever its age
+
+        Rows come straight from the cursor, ENTRY_PAGE_SIZE per query
+        (keyset paging on dn), so the collection is never held in memory.
+        """
+        domain = domain.lower()
+        last_dn, last_key = "", ""
+        while True:
+            rows = self.db.execute(
+                "SELECT dn, object_key, attributes FROM objects "
+                "WHERE domain = ? AND collection = ? AND (dn, object_key) > (?, ?) "
+                "ORDER BY dn, object_key LIMIT ?",
+                (domain, collection, last_dn, last_key, ENTRY_PAGE_SIZE)
+            )
+            read = 0
+            for last_dn, last_key, attributes in rows:
+                read += 1
+                yield last_dn, json.loads(attributes)
+            if read < ENTRY_PAGE_SIZE:
+                return
+
+    def sync(
+            self,
+            domain: str,
+            collection: str,
+            source: Optional[PagedSource] = None,
+            max_age: Optional[float] = None,
+            full: bool = False
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Read a collection through the cache
+
+        Args:
+            domain: Domain the objects belong to
+            collection: Name in COLLECTIONS (users, groups, computers, trusts)
+            source: Search side (PagedSource); None serves whatever is cached
+            max_age: Override of the cache TTL for this call
+            full: Force a full sweep
+
+        Returns:
+            (dn, attributes) iterator over the whole collection (see entries())
+        """
+        spec = COLLECTIONS[collection]
+        domain = domain.lower()
+        state = self._state(domain, collection)
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+
+        if state and not full and (source is None or now - state[2] < max_age):
+            total = self.count(domain, collection)
+            age = (now - state[2]) / 60
+            self.last_sync = {"mode": "cached", "fetched": 0, "total": total}
+            self.log(f"Directory cache: {total} {collection} for {domain}, "
+                     f"synced {age:.0f} min ago")
+            if now - state[2] >= max_age:
+                # Read-only consumers cannot refresh: say what may be out of date
+                self.log(f"Directory cache: {collection} for {domain} is older than the "
+                         f"{max_age / 60:.0f} min TTL; disabled, deleted or changed accounts "
+                         f"may be out of date (refresh with an enumeration run using --cache)",
+                         "warning")
+            return self.entries(domain, collection)
+
+        if source is None:
+            self.last_sync = {"mode": "empty", "fetched": 0, "total": 0}
+            self.log(f"Directory cache: no {collection} cached for {domain}", "warning")
+            return iter([])
+
+        high_usn, server = source.watermark()
+        delta = (
+            state is not None and not full
+            and state[1] is not None
+            and state[0] == server
+            and now - state[3] < self.full_ttl
+        )
+
+        search_filter = spec.search_filter
+        if delta:
+            search_filter = f"(&{spec.search_filter}(uSNChanged>={state[1] + 1}))"
+        search_base = f"{spec.container},{source.base_dn}" if spec.container else None
+
+        insert = "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?)"
+        rows = []
+        fetched = 0
+        max_seen = state[1] if delta else 0
+        attributes = list(spec.attributes) + TRACKING_ATTRIBUTES
+
+        # Pages are written as they arrive; a failed search rolls the sweep back
+        with self.db:
+            if not delta:
+                self.db.execute(
+                    "DELETE FROM objects WHERE domain = ? AND collection = ?",
+                    (domain, collection)
+                )
+
+            for dn, values in source.paged_search(search_filter, attributes, search_base=search_base):
+                record = {name: _plain(value) for name, value in values.items()
+                          if name not in SENSITIVE_ATTRIBUTES}
+                usn = attr_value(record, "uSNChanged", None)
+                usn = int(usn) if usn not in (None, "") else None
+                if usn is not None:
+                    max_seen = max(max_seen or 0, usn)
+
+                key = str(attr_value(record, "objectGUID")) or dn.lower()
+                rows.append((domain, collection, key, dn, usn, now, json.dumps(record)))
+                fetched += 1
+                if len(rows) >= source.page_size:
+                    self.db.executemany(insert, rows)
+                    rows.clear()
+            self.db.executemany(insert, rows)
+
+            # Without the rootDSE, the highest USN seen is the best watermark available
+            watermark = high_usn if high_usn is not None else max_seen
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?, ?)",
+                (domain, collection, server, watermark, now, state[3] if delta else now)
+            )
+
+        total = self.count(domain, collection)
+        self.last_sync = {
+            "mode": "delta" if delta else "full",
+            "fetched": fetched,
+            "total": total,
+        }
+        if delta:
+            self.log(f"Directory cache: delta refresh of {collection} for {domain}, "
+                     f"{fetched} changed since USN {state[1]} ({total} cached)", "success")
+        else:
+            self.log(f"Directory cache: full sweep of {collection} for {domain}, "
+                     f"{fetched} objects cached", "success")
+        return self.entries(domain, collection)
+
+    # ── Facts ───────────────────────────────────────────────────
+
+    def get_fact(self, domain: str, name: str, max_age: float = FACT_TTL) -> Optional[str]:
+        """Cached value younger than max_age, or None"""
+        row = self.db.execute(
+            "SELECT value, fetched_at FROM facts WHERE domain = ? AND name = ?",
+            (domain.lower(), name)
+        ).fetchone()
+        if row and time.time() - row[1] < max_age:
+            return row[0]
+        return None
+
+    def set_fact(self, domain: str, name: str, value: str) -> None:
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO facts VALUES (?, ?, ?, ?)",
+                (domain.lower(), name, value, time.time())
+            )
+
+    def domain_sid(self, domain: str, max_age: float = FACT_TTL) -> Optional[str]:
+        """
+        Domain SID from the facts table, or derived from the objectSid of
+        any cached user, group or computer (the SID minus its RID)
+        """
+        sid = self.get_fact(domain, "domain_sid", max_age)
+        if sid:
+            return sid
+
+        rows = self.db.execute(
+            "SELECT attributes FROM objects WHERE domain = ? AND attributes LIKE ?",
+            (domain.lower(), '%"S-1-5-21-%')
+        )
+        for (attributes,) in rows:
+            object_sid = str(attr_value(json.loads(attributes), "objectSid"))
+            if object_sid.startswith("S-1-5-21-"):
+                sid = object_sid.rsplit("-", 1)[0]
+                self.set_fact(domain, "domain_sid", sid)
+                return sid
+        return None
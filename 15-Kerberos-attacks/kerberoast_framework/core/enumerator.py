@@ -2,12 +2,14 @@
 LDAP Enumeration — Phase 1 of the Roasting Framework.
 
 Handles connection to the Domain Controller and discovery of
-Kerberoastable and AS-REP Roastable accounts via LDAP queries.
+Kerberoastable and AS-REP Roastable accounts via LDAP queries, optionally
+read through the shared directory cache (rt_directory_cache).
 """
 
 import sys
 from datetime import datetime
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
 try:
     from ldap3 import Server, Connection, ALL, NTLM, SUBTREE
@@ -17,6 +19,19 @@ except ImportError:
 
 from ..core.target import RoastingTarget
 
+try:
+    from rt_directory_cache import ACCOUNTDISABLE, PagedSource, attr_value, attr_values
+except ImportError:
+    # Attribute helpers are shared with the other AD tools (14-ad-enumeration/)
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "14-ad-enumeration"))
+    from rt_directory_cache import ACCOUNTDISABLE, PagedSource, attr_value, attr_values
+
+DONT_REQ_PREAUTH = 0x400000
+
+
+def _uac(attributes: Dict) -> int:
+    return int(str(attr_value(attributes, "userAccountControl", 0)))
+
 
 class LDAPEnumerator:
     """Enumerates roastable accounts from Active Directory via LDAP."""
@@ -39,7 +54,15 @@ class LDAPEnumerator:
         "description", "pwdLastSet", "userAccountControl",
     ]
 
-    def __init__(self, domain: str, username: str, password: str, dc_ip: str):
+    def __init__(
+        self,
+        domain: str,
+        username: str,
+        password: str,
+        dc_ip: str,
+        cache=None,
+        refresh_cache: bool = False,
+    ):
         self.domain = domain
         self.username = username
         self.password = password
@@ -47,12 +70,21 @@ class LDAPEnumerator:
         self.base_dn = ",".join(f"DC={part}" for part in domain.split("."))
         self.conn: Optional[Connection] = None
 
+        # rt_directory_cache.DirectoryCache shared with the other frameworks
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+
     def connect(self) -> bool:
         """Establish LDAP connection to the Domain Controller."""
         print(f"\n{'=' * 60}")
         print("PHASE 1: LDAP ENUMERATION")
         print(f"{'=' * 60}")
 
+        if (self.cache is not None and not self.refresh_cache
+                and self.cache.is_fresh(self.domain, "users")):
+            print("[+] Directory cache is fresh — no LDAP connection needed")
+            return True
+
         try:
             server = Server(self.dc_ip, get_info=ALL, use_ssl=False)
             user_dn = f"{self.domain}\\{self.username}"
@@ -83,20 +115,18 @@ class LDAPEnumerator:
             ldap_filter = (
                 f"(&{self._USER_BASE}{self._HAS_SPN}{self._NOT_DISABLED})"
             )
-            self.conn.search(
-                search_base=self.base_dn,
-                search_filter=ldap_filter,
-                search_scope=SUBTREE,
-                attributes=self._KERBEROAST_ATTRS,
+            accounts = self._accounts(
+                ldap_filter, self._KERBEROAST_ATTRS,
+                lambda a: attr_values(a, "servicePrincipalName") and not _uac(a) & ACCOUNTDISABLE,
             )
 
-            for entry in self.conn.entries:
-                username = str(entry.sAMAccountName)
-                spns = [str(s) for s in entry.servicePrincipalName]
-                is_admin = str(entry.get("adminCount", 0)) == "1"
-                description = str(entry.get("description", ""))
-                pwd_last_set = str(entry.get("pwdLastSet", ""))
-                uac = int(str(entry.get("userAccountControl", 0)))
+            for attributes in accounts:
+                username = str(attr_value(attributes, "sAMAccountName"))
+                spns = [str(s) for s in attr_values(attributes, "servicePrincipalName")]
+                is_admin = str(attr_value(attributes, "adminCount", 0)) == "1"
+                description = str(attr_value(attributes, "description"))
+                pwd_last_set = str(attr_value(attributes, "pwdLastSet"))
+                uac = _uac(attributes)
 
                 target = RoastingTarget(
                     username=username, domain=self.domain, spns=spns,
@@ -111,7 +141,7 @@ class LDAPEnumerator:
                 print(f"       SPN: {spns[0]}")
                 print(f"       Admin: {'YES' if is_admin else 'No'} | Encryption: {enc_type}")
                 print(f"       Pwd Last Set: {pwd_last_set}")
-                if description and description != "[]":
+                if description:
                     print(f"       Description: {description}")
 
             self._print_kerberoast_summary(targets)
@@ -131,18 +161,16 @@ class LDAPEnumerator:
             ldap_filter = (
                 f"(&{self._USER_BASE}{self._NO_PREAUTH}{self._NOT_DISABLED})"
             )
-            self.conn.search(
-                search_base=self.base_dn,
-                search_filter=ldap_filter,
-                search_scope=SUBTREE,
-                attributes=self._ASREP_ATTRS,
+            accounts = self._accounts(
+                ldap_filter, self._ASREP_ATTRS,
+                lambda a: _uac(a) & DONT_REQ_PREAUTH and not _uac(a) & ACCOUNTDISABLE,
             )
 
-            for entry in self.conn.entries:
-                username = str(entry.sAMAccountName)
-                is_admin = str(entry.get("adminCount", 0)) == "1"
-                description = str(entry.get("description", ""))
-                pwd_last_set = str(entry.get("pwdLastSet", ""))
+            for attributes in accounts:
+                username = str(attr_value(attributes, "sAMAccountName"))
+                is_admin = str(attr_value(attributes, "adminCount", 0)) == "1"
+                description = str(attr_value(attributes, "description"))
+                pwd_last_set = str(attr_value(attributes, "pwdLastSet"))
 
                 target = RoastingTarget(
                     username=username, domain=self.domain,
@@ -162,6 +190,31 @@ class LDAPEnumerator:
 
         return targets
 
+    def _accounts(
+        self, ldap_filter: str, attributes: List[str], matches: Callable[[Dict], bool]
+    ) -> List[Dict]:
+        """
+        Attribute dicts of the accounts an LDAP filter selects.
+
+        Without a cache the filter runs on the DC. With one, the shared
+        user collection is read through the cache (a uSNChanged delta at
+        most) and `matches` applies the same filter locally.
+        """
+        if self.cache is None:
+            self.conn.search(
+                search_base=self.base_dn,
+                search_filter=ldap_filter,
+                search_scope=SUBTREE,
+                attributes=attributes,
+            )
+            return [entry.entry_attributes_as_dict for entry in self.conn.entries]
+
+        source = None
+        if self.conn is not None:
+            source = PagedSource(self.conn, self.base_dn, self.dc_ip)
+        users = self.cache.sync(self.domain, "users", source, full=self.refresh_cache)
+        return [values for _, values in users if matches(values)]
+
     @staticmethod
     def _print_kerberoast_summary(targets: List[RoastingTarget]):
         critical = sum(1 for t in targets if t.priority == "CRITICAL")
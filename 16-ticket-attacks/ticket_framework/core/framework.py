@@ -29,7 +29,9 @@ class TicketAttackFramework:
     5. Diamond Ticket: Modify legitimate TGTs
     """
 
-    def __init__(self, domain: str, dc_ip: str, output_dir: str = "ticket_attacks"):
+    def __init__(
+        self, domain: str, dc_ip: str, output_dir: str = "ticket_attacks", cache=None
+    ):
         self.domain = domain
         self.dc_ip = dc_ip
         self.output_dir = Path(output_dir)
@@ -37,7 +39,7 @@ class TicketAttackFramework:
         self.domain_sid = ""
 
         # Sub-components
-        self.sid_resolver = SIDResolver(domain, dc_ip)
+        self.sid_resolver = SIDResolver(domain, dc_ip, cache)
         self.overpass = OverpassTheHash(domain, dc_ip, self.output_dir)
         self.ptt = PassTheTicket(domain)
         self.diamond = DiamondTicketGuidance(domain, dc_ip)
@@ -3,6 +3,8 @@ Domain SID Resolver — Retrieves the domain SID required for ticket forging.
 
 Attempts Impacket lookupsid.py first, falls back to rpcclient.
 The domain SID is a prerequisite for Golden and Silver Ticket attacks.
+With the shared directory cache (rt_directory_cache) a SID already seen
+by any framework is reused and a resolved one is stored for the next run.
 """
 
 import subprocess
@@ -12,9 +14,10 @@ from typing import Optional
 class SIDResolver:
     """Resolve the domain SID via Impacket or rpcclient."""
 
-    def __init__(self, domain: str, dc_ip: str):
+    def __init__(self, domain: str, dc_ip: str, cache=None):
         self.domain = domain
         self.dc_ip = dc_ip
+        self.cache = cache
 
     def resolve(
         self,
@@ -23,7 +26,8 @@ class SIDResolver:
         ntlm_hash: str = "",
     ) -> str:
         """
-        Retrieve the domain SID. Tries lookupsid.py, then rpcclient.
+        Retrieve the domain SID. Tries the directory cache, then
+        lookupsid.py, then rpcclient.
 
         Returns the SID string or empty string on failure.
         """
@@ -31,17 +35,24 @@ class SIDResolver:
         print("GATHERING DOMAIN SID")
         print(f"{'=' * 60}")
 
+        if self.cache is not None:
+            sid = self.cache.domain_sid(self.domain)
+            if sid:
+                print(f"[+] Domain SID (directory cache): {sid}")
+                return sid
+
         if not password and not ntlm_hash:
             print("[-] Need password or hash")
             return ""
 
         sid = self._try_lookupsid(username, password, ntlm_hash)
-        if sid:
-            return sid
+        if not sid:
+            print("[*] Trying alternative SID lookup...")
+            sid = self._try_rpcclient(username, password, ntlm_hash)
 
-        print("[*] Trying alternative SID lookup...")
-        sid = self._try_rpcclient(username, password, ntlm_hash)
         if sid:
+            if self.cache is not None:
+                self.cache.set_fact(self.domain, "domain_sid", sid)
             return sid
 
         print("[-] Could not retrieve Domain SID")
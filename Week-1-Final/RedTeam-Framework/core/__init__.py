@@ -3,12 +3,15 @@
 Core framework components
 """
 
-from .framework import RedTeamFramework
 from .config import ConfigManager
 from .logger import EngagementLogger
 from .executor import CommandExecutor
 from .reporter import ReportGenerator
 from .parsers import OutputParsers
+from .cache import PhaseCache
+from .journal import EngagementJournal
+from .plugins import ToolRegistry
+from .framework import RedTeamFramework  # last: imports the modules above through 'core'
 
 __all__ = [
     'RedTeamFramework',
@@ -17,4 +20,7 @@ __all__ = [
     'CommandExecutor',
     'ReportGenerator',
     'OutputParsers',
+    'PhaseCache',
+    'EngagementJournal',
+    'ToolRegistry',
 ]
\ No newline at end of file
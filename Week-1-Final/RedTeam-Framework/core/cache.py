@@ -0,0 +1,91 @@
+"""
+Content-addressed cache for phase results
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+
+CACHE_FORMAT = 1
+DEFAULT_TTL = 24 * 3600
+
+
+class PhaseCache:
+    """
+    Stores phase results under a key derived from everything that can change them:
+    the phase name, the config values the phase reads and the contents of the
+    tool scripts it runs. Editing a tool or the relevant config yields a new key,
+    so stale results are never returned and nothing needs invalidating.
+    
+    The target can change without any of that changing, so results also
+    expire after ttl seconds (None = never).
+    """
+
+    def __init__(self, base_dir, cache_dir='results/.cache', enabled=True, ttl=DEFAULT_TTL):
+        self.base_dir = Path(base_dir)
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.ttl = ttl
+        self._file_hashes = {}
+
+    def key(self, phase_key, phase, extra=None):
+        """Cache key for a phase object (uses its CONFIG_KEYS and TOOLS)"""
+        material = {
+            'format': CACHE_FORMAT,
+            'phase': phase_key,
+            'config': {k: phase.config.get(k) for k in getattr(phase, 'CONFIG_KEYS', ())},
+            'tools': {t: self._hash_file(t) for t in getattr(phase, 'TOOLS', ())},
+            'extra': extra
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _hash_file(self, relative_path):
+        """
+        Content hash of a tool file or package directory (None if missing),
+        computed once per run. Packages hash every .py file below them.
+        """
+        if relative_path not in self._file_hashes:
+            path = self.base_dir / relative_path
+            files = sorted(path.rglob('*.py')) if path.is_dir() else [path]
+            digest = None
+            try:
+                h = hashlib.sha256()
+                for file in files:
+                    h.update(str(file.relative_to(self.base_dir)).encode())
+                    h.update(file.read_bytes())
+                digest = h.hexdigest() if files else None
+            except OSError:
+                pass
+            self._file_hashes[relative_path] = digest
+        return self._file_hashes[relative_path]
+
+    def _path(self, phase_key, key):
+        return self.cache_dir / phase_key / f"{key}.json"
+
+    def get(self, phase_key, key):
+        """Cached result for a key, or None if missing or older than the TTL"""
+        if not self.enabled:
+            return None
+        path = self._path(phase_key, key)
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, phase_key, key, result):
+        """Store a result (written atomically so readers never see partial files)"""
+        if not self.enabled:
+            return
+        path = self._path(phase_key, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(result, f, indent=2)
+        os.replace(tmp, path)
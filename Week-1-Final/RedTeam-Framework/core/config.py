@@ -26,7 +26,11 @@ class ConfigManager:
             'auto_exploit': False,
             'auto_lateral': False,
             'delay_between_phases': 60,
-            'continue_on_error': False
+            'continue_on_error': False,
+            'use_cache': True,
+            'cache_ttl': 86400,
+            'exploit_workers': 16,
+            'max_hosts': 1024
         },
         'scope': {
             'subdomains': True,
@@ -3,18 +3,62 @@ Command execution utilities
 """
 
 import subprocess
+import threading
 from pathlib import Path
 
+from .plugins import ToolRegistry, find_toolkit_root
+
 
 class CommandExecutor:
-    """Handles execution of system commands and scripts"""
+    """Handles execution of toolkit tools, system commands and scripts"""
     
-    def __init__(self, logger, base_dir=None):
+    def __init__(self, logger, base_dir=None, toolkit_dir=None):
         self.logger = logger
         self.base_dir = base_dir or Path(__file__).parent.parent
+        self.toolkit_dir = Path(toolkit_dir or find_toolkit_root(self.base_dir))
+        self.tools = ToolRegistry(self.toolkit_dir)
+        self.failed_commands = 0
+        self._lock = threading.Lock()
+    
+    def _failed(self):
+        """Count a failed command (tools may run on several threads)"""
+        with self._lock:
+            self.failed_commands += 1
+    
+    def toolkit_path(self, relative_path):
+        """Absolute path of a file inside the toolkit"""
+        return str(self.toolkit_dir / relative_path)
+    
+    def run_tool(self, name, *args, **kwargs):
+        """
+        Run a toolkit module's entry point in-process.
+        
+        Returns the same success/failure dict shape as run_command, with the
+        tool's structured return value under 'result'.
+        """
+        self.logger.debug(f"Running tool: {name}")
+        
+        try:
+            result, output, seconds = self.tools.call(name, *args, **kwargs)
+        except ImportError as e:
+            self._failed()
+            self.logger.error(f"Tool unavailable: {name} ({e})")
+            return {'success': False, 'error': str(e)}
+        except Exception as e:
+            self._failed()
+            self.logger.error(f"Tool error: {name}: {e}")
+            return {'success': False, 'error': str(e)}
+        
+        self.logger.success(f"Tool succeeded: {name} ({seconds:.2f}s)")
+        return {
+            'success': True,
+            'result': result,
+            'stdout': output,
+            'duration': seconds
+        }
     
     def run_command(self, command, timeout=300):
-        """Execute command and capture output"""
+        """Execute external command and capture output"""
         self.logger.debug(f"Executing: {command}")
         
         try:
@@ -36,6 +80,7 @@ class CommandExecutor:
                     'returncode': result.returncode
                 }
             else:
+                self._failed()
                 self.logger.error(f"Command failed: {command}")
                 return {
                     'success': False,
@@ -45,10 +90,12 @@ class CommandExecutor:
                 }
         
         except subprocess.TimeoutExpired:
+            self._failed()
             self.logger.error(f"Command timed out: {command}")
             return {'success': False, 'error': 'timeout'}
         
         except Exception as e:
+            self._failed()
             self.logger.error(f"Command error: {e}")
             return {'success': False, 'error': str(e)}
     
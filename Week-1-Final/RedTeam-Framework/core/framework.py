@@ -10,6 +10,8 @@ from core import ConfigManager
 from core import EngagementLogger
 from core import CommandExecutor
 from core.reporter import ReportGenerator
+from core.cache import PhaseCache, DEFAULT_TTL
+from core.journal import EngagementJournal
 from phases.reconnaissance import ReconnaissancePhase
 from phases.weaponization import WeaponizationPhase
 from phases.delivery import DeliveryPhase
@@ -23,23 +25,43 @@ class RedTeamFramework:
     Coordinates all phases and manages engagement lifecycle
     """
     
-    def __init__(self, config_file='config/engagement.json'):
+    def __init__(self, config_file='config/engagement.json', resume=None, use_cache=True):
+        """
+        Args:
+            config_file: Engagement configuration file
+            resume: Engagement ID to resume ('latest' for the most recent one)
+            use_cache: Reuse cached phase results from earlier engagements
+        """
         # Initialize core components
         self.config = ConfigManager(config_file)
-        self.engagement_id = self._generate_engagement_id()
+        
+        if resume == 'latest':
+            resume = EngagementJournal.latest()
+            if resume is None:
+                print("[!] No engagement to resume, starting a new one")
+        self.engagement_id = resume or self._generate_engagement_id()
+        
         self.logger = EngagementLogger(self.engagement_id)
         self.executor = CommandExecutor(self.logger, Path(__file__).parent.parent)
+        self.journal = EngagementJournal(self.engagement_id)
+        self.cache = PhaseCache(
+            self.executor.toolkit_dir,
+            enabled=use_cache and self.config.get('options.use_cache', True),
+            ttl=self.config.get('options.cache_ttl', DEFAULT_TTL)
+        )
         
         # Initialize results tracking
+        start = self.journal.start or {}
         self.results = {
             'engagement_id': self.engagement_id,
-            'start_time': datetime.now().isoformat(),
+            'start_time': start.get('start_time', datetime.now().isoformat()),
             'target': {
                 'domain': self.config.get('target.domain'),
                 'company': self.config.get('target.company_name')
             },
             'phases': {}
         }
+        self.reporter = ReportGenerator(self.results, self.config)
         
         # Initialize phases
         self.phases = self._initialize_phases()
@@ -80,23 +102,19 @@ class RedTeamFramework:
             ('rt_post_exploitation', 'Phase 5: Post-Exploitation')
         ]
         
+        self.journal.record_start(self.results)
+        
         for phase_key, phase_name in phase_sequence:
-            self.logger.info(f"\nStarting {phase_name}...")
-            
             try:
-                phase_results = self._execute_phase(phase_key)
-                self.results['phases'][phase_key] = phase_results
-                
-                # Generate phase report
-                reporter = ReportGenerator(self.results, self.config)
-                report_path = reporter.generate_phase_report(phase_key, phase_results)
-                self.logger.info(f"Phase report saved: {report_path}")
+                executed = self._run_phase(phase_key, phase_name)
                 
                 # Delay between phases if configured
-                self._phase_delay()
+                if executed:
+                    self._phase_delay()
             
             except Exception as e:
                 self.logger.error(f"Phase failed: {e}")
+                self.journal.record_phase(phase_key, 'failed', None)
                 
                 if not self.config.get('options.continue_on_error', False):
                     self.logger.error("Stopping engagement due to error")
@@ -105,6 +123,62 @@ class RedTeamFramework:
         # Generate final report
         self._finalize_engagement()
     
+    def _run_phase(self, phase_key, phase_name):
+        """
+        Run one phase of the full engagement, reusing earlier results.
+        
+        A phase the journal shows completed with the same cache key is
+        skipped and its report left as is; otherwise a cached result is
+        reused before falling back to executing the phase. Phases where a
+        command failed are neither cached nor skipped on resume, and a
+        stored result the phase's cache_valid() rejects (e.g. payload files
+        deleted since) is not reused.
+        
+        Returns:
+            True if the phase was actually executed
+        """
+        phase = self.phases[phase_key]
+        key = self.cache.key(phase_key, phase)
+        cacheable = getattr(phase, 'CACHEABLE', True)
+        
+        valid = getattr(phase, 'cache_valid', lambda result: True)
+        
+        record = self.journal.completed(phase_key, key)
+        if (record and record.get('report') and Path(record['report']).exists()
+                and valid(record['result'])):
+            self.results['phases'][phase_key] = record['result']
+            self.logger.info(f"Skipping {phase_name}: completed and unchanged")
+            return False
+        
+        phase_results = self.cache.get(phase_key, key) if cacheable else None
+        if phase_results is not None and not valid(phase_results):
+            phase_results = None
+        cached = phase_results is not None
+        
+        if cached:
+            self.logger.info(f"{phase_name}: reusing cached result ({key[:12]})")
+        else:
+            self.logger.info(f"\nStarting {phase_name}...")
+            failures = self.executor.failed_commands
+            phase_results = self._execute_phase(phase_key)
+            failed = self.executor.failed_commands - failures
+        
+        self.results['phases'][phase_key] = phase_results
+        
+        # Generate phase report
+        report_path = self.reporter.generate_phase_report(phase_key, phase_results)
+        self.logger.info(f"Phase report saved: {report_path}")
+        
+        if cached or not failed:
+            if cacheable and not cached:
+                self.cache.put(phase_key, key, phase_results)
+            self.journal.record_phase(phase_key, 'completed', key, phase_results, report_path, cached)
+        else:
+            self.logger.warning(f"{failed} command(s) failed, {phase_name} will re-run on resume")
+            self.journal.record_phase(phase_key, 'incomplete', key, phase_results, report_path)
+        
+        return not cached
+    
     def _print_engagement_header(self):
         """Print engagement header information"""
         self.logger.separator()
@@ -113,6 +187,8 @@ class RedTeamFramework:
         self.logger.info(f"Engagement ID: {self.engagement_id}")
         self.logger.info(f"Target: {self.config.get('target.domain')}")
         self.logger.info(f"Start Time: {self.results['start_time']}")
+        if self.journal.phases:
+            self.logger.info(f"Resuming: {len(self.journal.phases)} phase(s) in journal")
         self.logger.separator()
     
     def _execute_phase(self, phase_key):
@@ -134,8 +210,9 @@ class RedTeamFramework:
         """Finalize engagement and generate reports"""
         self.results['end_time'] = datetime.now().isoformat()
         
-        reporter = ReportGenerator(self.results, self.config)
-        json_report, md_report = reporter.generate_final_report()
+        json_report, md_report = self.reporter.generate_final_report()
+        self.executor.tools.close()
+        self.journal.record_finish(self.results['end_time'])
         
         self.logger.separator()
         self.logger.info("GENERATING FINAL REPORT")
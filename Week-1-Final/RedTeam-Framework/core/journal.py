@@ -0,0 +1,95 @@
+"""
+Resumable engagement journal
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+
+class EngagementJournal:
+    """
+    Append-only record of phase outcomes for one engagement.
+
+    Each line is a JSON record, flushed as soon as a phase finishes, so an
+    interrupted engagement can be resumed from the last completed phase.
+    A torn final line (crash mid-write) is ignored on load.
+    """
+
+    FILENAME = 'journal.jsonl'
+
+    def __init__(self, engagement_id, results_dir='results'):
+        self.engagement_id = engagement_id
+        self.path = Path(results_dir) / engagement_id / self.FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.start = None
+        self.phases = {}
+        self._load()
+
+    @classmethod
+    def latest(cls, results_dir='results'):
+        """Engagement ID of the most recently updated journal, or None"""
+        journals = sorted(
+            Path(results_dir).glob(f"ENG_*/{cls.FILENAME}"),
+            key=lambda p: p.stat().st_mtime
+        )
+        return journals[-1].parent.name if journals else None
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('event') == 'start' and self.start is None:
+                self.start = record
+            elif record.get('event') == 'phase':
+                self.phases[record['phase']] = record
+
+    def _append(self, record):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def record_start(self, results):
+        """Record engagement start (only the first start is kept)"""
+        if self.start is None:
+            self.start = {
+                'event': 'start',
+                'engagement_id': self.engagement_id,
+                'start_time': results['start_time'],
+                'target': results['target']
+            }
+            self._append(self.start)
+        else:
+            self._append({'event': 'resume', 'time': datetime.now().isoformat()})
+
+    def record_phase(self, phase_key, status, key, result=None, report=None, cached=False):
+        """Record a phase outcome"""
+        record = {
+            'event': 'phase',
+            'phase': phase_key,
+            'status': status,
+            'key': key,
+            'cached': cached,
+            'report': report,
+            'time': datetime.now().isoformat(),
+            'result': result
+        }
+        self.phases[phase_key] = record
+        self._append(record)
+
+    def completed(self, phase_key, key):
+        """Journal entry if the phase completed with this cache key, else None"""
+        record = self.phases.get(phase_key)
+        if record and record['status'] == 'completed' and record['key'] == key:
+            return record
+        return None
+
+    def record_finish(self, end_time):
+        self._append({'event': 'finish', 'end_time': end_time})
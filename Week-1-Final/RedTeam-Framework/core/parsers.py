@@ -1,5 +1,8 @@
 """
 Parsers for extracting structured data from tool outputs
+
+Toolkit modules run in-process through CommandExecutor.run_tool and return
+structured results; these parsers remain for external command output.
 """
 
 
@@ -0,0 +1,157 @@
+"""
+In-process tool plugins
+"""
+
+import contextlib
+import importlib
+import io
+import sys
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+
+# stage: toolkit directory added to sys.path
+# module: module imported from it
+# entry: structured entry point in that module
+# http: entry point accepts a shared requests session (session=...)
+ToolSpec = namedtuple('ToolSpec', ['stage', 'module', 'entry', 'http'])
+
+TOOLS = {
+    'subdomain_enum': ToolSpec('01-reconnaissance', 'subdomain_enum', 'run', False),
+    'email_hunter': ToolSpec('01-reconnaissance', 'email_hunter', 'run', False),
+    'google_dorker': ToolSpec('01-reconnaissance', 'google_dorker', 'run', True),
+    'tech_fingerprinter': ToolSpec('01-reconnaissance', 'rt_tech_fingerprinter', 'fingerprint', True),
+    'payload_generator': ToolSpec('02-weaponization', 'rt_payload_generator.main', 'run', False),
+    'obfuscator': ToolSpec('02-weaponization', 'rt_advanced_obfuscator.main', 'run', False),
+    'macro_generator': ToolSpec('02-weaponization', 'rt_macro_generator.main', 'run', False),
+    'vulnerability_scanner': ToolSpec('04-exploitation', 'rt_vulnerability_scanner.scanner', 'run', True),
+    'service_exploiter': ToolSpec('04-exploitation', 'rt_service_exploiter.exploiter', 'run', False),
+}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+class ThreadCapture:
+    """
+    sys.stdout stand-in that diverts writes to a per-thread buffer.
+    
+    contextlib.redirect_stdout swaps the process-wide sys.stdout, so a tool
+    running on one thread would swallow (or leak into) every other thread's
+    output. Only threads inside capture() are redirected here.
+    """
+    
+    _install_lock = threading.Lock()
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    @classmethod
+    def installed(cls):
+        """The ThreadCapture on sys.stdout, installing one if needed"""
+        with cls._install_lock:
+            if not isinstance(sys.stdout, cls):
+                sys.stdout = cls(sys.stdout)
+            return sys.stdout
+    
+    @contextlib.contextmanager
+    def capture(self, buffer):
+        previous = getattr(self._local, 'buffer', None)
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = previous
+    
+    def _target(self):
+        buffer = getattr(self._local, 'buffer', None)
+        return self._stream if buffer is None else buffer
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        return self._target().flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def find_toolkit_root(start):
+    """First directory at or above start that holds the toolkit stages"""
+    start = Path(start).resolve()
+    for candidate in (start, *start.parents):
+        if (candidate / '01-reconnaissance').is_dir():
+            return candidate
+    return start
+
+
+class ToolRegistry:
+    """
+    Imports toolkit modules once and calls their entry points in-process.
+
+    Entry points return structured results (lists/dicts), so no output
+    parsing is needed. Whatever a tool prints is captured and returned
+    alongside the result rather than written to the console; capture is
+    per thread, so tools may run concurrently.
+    """
+
+    def __init__(self, toolkit_dir, tools=None):
+        self.toolkit_dir = Path(toolkit_dir)
+        self.tools = dict(TOOLS if tools is None else tools)
+        self._entries = {}
+        self._session = None
+
+    @property
+    def session(self):
+        """HTTP session shared by every HTTP tool (connection reuse)"""
+        if self._session is None:
+            import requests
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+            self._session = requests.Session()
+            self._session.verify = False
+            self._session.headers.update({'User-Agent': USER_AGENT})
+        return self._session
+
+    def entry_point(self, name):
+        """Resolve (and cache) a tool's entry point, importing its module on first use"""
+        entry = self._entries.get(name)
+        if entry is None:
+            spec = self.tools.get(name)
+            if spec is None:
+                raise ValueError(f"Unknown tool: {name}")
+
+            stage_dir = str(self.toolkit_dir / spec.stage)
+            if stage_dir not in sys.path:
+                # Appended so toolkit modules never shadow the framework's own packages
+                sys.path.append(stage_dir)
+
+            module = importlib.import_module(spec.module)
+            entry = self._entries[name] = getattr(module, spec.entry)
+        return entry
+
+    def call(self, name, *args, **kwargs):
+        """
+        Run a tool in-process.
+
+        Returns (result, captured_output, seconds); exceptions (including
+        ImportError for a missing dependency) propagate to the caller.
+        """
+        entry = self.entry_point(name)
+        if self.tools[name].http:
+            kwargs.setdefault('session', self.session)
+
+        output = io.StringIO()
+        start = time.perf_counter()
+        with ThreadCapture.installed().capture(output):
+            result = entry(*args, **kwargs)
+        return result, output.getvalue(), time.perf_counter() - start
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
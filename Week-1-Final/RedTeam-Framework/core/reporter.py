@@ -98,8 +98,8 @@ weaponization, delivery, exploitation, and post-exploitation phases.
 
 ### Subdomains
 '''
-            for subdomain in recon.get('subdomains', [])[:10]:
-                section += f"- {subdomain}\n"
+            for record in recon.get('subdomains', [])[:10]:
+                section += f"- {record['subdomain']} ({', '.join(record['addresses'])})\n"
             
             section += "\n### Email Addresses\n"
             for email in recon.get('emails', [])[:10]:
@@ -132,10 +132,14 @@ weaponization, delivery, exploitation, and post-exploitation phases.
         
         if 'exploitation' in self.results['phases']:
             exploit = self.results['phases']['exploitation']
-            section += f"- **Vulnerabilities Found:** {len(exploit.get('vulnerabilities_found', []))}\n\n"
+            section += f"- **Vulnerabilities Found:** {len(exploit.get('vulnerabilities_found', []))}\n"
+            section += f"- **Services Exploited:** {len(exploit.get('shells_obtained', []))}\n\n"
             
             for vuln in exploit.get('vulnerabilities_found', [])[:5]:
-                section += f"  - {vuln}\n"
+                section += f"  - [{vuln['severity']}] {vuln['type']}: {vuln['url']}\n"
+            
+            for shell in exploit.get('shells_obtained', [])[:5]:
+                section += f"  - {shell['service']} on {shell['target']}:{shell['port']}\n"
         
         return section + "\n---\n\n"
     
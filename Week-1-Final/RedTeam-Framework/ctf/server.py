@@ -7,17 +7,91 @@ import http.server
 import socketserver
 import os
 import json
-from urllib.parse import parse_qs
+import threading
+from email import policy
+from email.parser import BytesParser
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
 
+MAX_FORM_BYTES = 64 * 1024          # login form body
+MAX_UPLOAD_BYTES = 2 * 1024 * 1024  # multipart upload body
+
+
+class ChallengeCache:
+    """
+    Flags and rendered pages shared by every request handler.
+
+    .flags.json is stat()ed on each lookup and reloaded only when its
+    mtime/size change; a reload bumps the generation and drops every
+    cached page, so regenerating the challenge never serves stale flags.
+    """
+    
+    def __init__(self, challenge_dir):
+        self.flag_file = Path(challenge_dir) / '.flags.json'
+        self.generation = 0
+        self._signature = None
+        self._flags = {}
+        self._pages = {}
+        self._lock = threading.Lock()
+    
+    def snapshot(self):
+        """Current (generation, flags), reloading the flag file if it changed"""
+        try:
+            stat = self.flag_file.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        
+        with self._lock:
+            if signature != self._signature:
+                flags = {}
+                if signature is not None:
+                    try:
+                        with open(self.flag_file, 'r') as f:
+                            flags = json.load(f)['flags']
+                    except (OSError, ValueError, KeyError):
+                        # Caught mid-write: keep the old flags, retry next request
+                        return self.generation, self._flags
+                self._signature = signature
+                self._flags = flags
+                self._pages.clear()
+                self.generation += 1
+            return self.generation, self._flags
+    
+    def page(self, name, generation, render):
+        """Encoded page body, rendering it once per flags generation"""
+        with self._lock:
+            body = self._pages.get(name)
+            if body is not None and generation == self.generation:
+                return body
+        
+        body = render().encode()
+        with self._lock:
+            if generation == self.generation:
+                self._pages[name] = body
+        return body
+
+
 class CTFRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom request handler for CTF challenge"""
     
-    def __init__(self, *args, challenge_dir=None, flags=None, **kwargs):
+    def __init__(self, *args, challenge_dir=None, flags=None, cache=None, quiet=False,
+                 keep_alive=False, **kwargs):
         self.challenge_dir = Path(challenge_dir) if challenge_dir else Path('06-integration/ctf_challenge')
-        self.flags = flags or self._load_flags()
+        self.cache = cache
+        self.quiet = quiet
+        if keep_alive:
+            # Only with a threaded server: one idle connection would block a serial one
+            self.protocol_version = 'HTTP/1.1'
+            # Headers and body go out as separate writes; don't let Nagle hold the body back
+            self.disable_nagle_algorithm = True
+
+        self.generation = None
+        if cache is not None:
+            self.generation, self.flags = cache.snapshot()
+        else:
+            self.flags = flags or self._load_flags()
         super().__init__(*args, directory=str(self.challenge_dir / 'www'), **kwargs)
     
     def _load_flags(self):
@@ -29,6 +103,42 @@ class CTFRequestHandler(http.server.SimpleHTTPRequestHandler):
                 return data['flags']
         return {}
     
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+    
+    def send_body(self, body, content_type='text/html', status=200):
+        """Send an encoded body (with Content-Length, so keep-alive works)"""
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_page(self, name, render, content_type='text/html'):
+        """Send a page that only depends on the flags, cached when a cache is shared"""
+        if self.cache is not None:
+            body = self.cache.page(name, self.generation, render)
+        else:
+            body = render().encode()
+        self.send_body(body, content_type)
+    
+    def read_body(self, limit):
+        """
+        Request body, or None after sending an error: 411 without
+        Content-Length, 413 when it is over limit (the body is not read)
+        """
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            self.send_error(411, "Length Required")
+            return None
+        if length < 0 or length > limit:
+            self.send_error(413, f"Request body over {limit} bytes")
+            self.close_connection = True
+            return None
+        return self.rfile.read(length)
+    
     def do_GET(self):
         """Handle GET requests"""
         parsed_path = urlparse(self.path)
@@ -67,7 +177,10 @@ class CTFRequestHandler(http.server.SimpleHTTPRequestHandler):
     
     def serve_index(self):
         """Serve main index page"""
-        html = f"""<!DOCTYPE html>
+        self.send_page('index', self._render_index)
+    
+    def _render_index(self):
+        return f"""<!DOCTYPE html>
 <html>
 <head>
     <title>TargetCorp - Home</title>
@@ -111,15 +224,13 @@ class CTFRequestHandler(http.server.SimpleHTTPRequestHandler):
     </div>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
     
     def serve_robots(self):
         """Serve robots.txt"""
-        robots = """User-agent: *
+        self.send_page('robots', self._render_robots, 'text/plain')
+    
+    def _render_robots(self):
+        return """User-agent: *
 Disallow: /admin/
 Disallow: /backup/
 Disallow: /secret-admin-portal-2024/
@@ -127,15 +238,13 @@ Disallow: /.git/
 
 # Flag hint: Look in the HTML source code!
 """
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/plain')
-        self.end_headers()
-        self.wfile.write(robots.encode())
     
     def serve_login(self):
         """Serve login page"""
-        html = f"""<!DOCTYPE html>
+        self.send_page('login', self._render_login)
+    
+    def _render_login(self):
+        return f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Admin Login - TargetCorp</title>
@@ -165,17 +274,13 @@ Disallow: /.git/
     </div>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
     
     def handle_login(self):
         """Handle login POST request"""
-        content_length = int(self.headers['Content-Length'])
-        post_data = self.rfile.read(content_length).decode('utf-8')
-        params = parse_qs(post_data)
+        post_data = self.read_body(MAX_FORM_BYTES)
+        if post_data is None:
+            return
+        params = parse_qs(post_data.decode('utf-8', errors='replace'))
         
         username = params.get('username', [''])[0]
         password = params.get('password', [''])[0]
@@ -185,7 +290,13 @@ Disallow: /.git/
         
         if any(payload in username or payload in password for payload in sql_payloads):
             # Successful SQL injection
-            html = f"""<!DOCTYPE html>
+            self.send_page('login_success', self._render_login_success)
+        else:
+            # Failed login
+            self.send_page('login_failed', self._render_login_failed)
+    
+    def _render_login_success(self):
+        return f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Login Successful</title>
@@ -210,9 +321,9 @@ Disallow: /.git/
     </div>
 </body>
 </html>"""
-        else:
-            # Failed login
-            html = """<!DOCTYPE html>
+    
+    def _render_login_failed(self):
+        return """<!DOCTYPE html>
 <html>
 <head>
     <title>Login Failed</title>
@@ -230,15 +341,13 @@ Disallow: /.git/
     </div>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
     
     def serve_upload(self):
         """Serve upload page"""
-        html = """<!DOCTYPE html>
+        self.send_page('upload', self._render_upload)
+    
+    def _render_upload(self):
+        return """<!DOCTYPE html>
 <html>
 <head>
     <title>File Upload - TargetCorp</title>
@@ -264,46 +373,38 @@ Disallow: /.git/
     </div>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
     
     def handle_upload(self):
-        """Handle file upload"""
-        content_type = self.headers['Content-Type']
+        """Handle file upload (body capped at MAX_UPLOAD_BYTES)"""
+        content_type = self.headers.get('Content-Type', '')
         
         if 'multipart/form-data' not in content_type:
             self.send_error(400, "Bad Request")
             return
         
-        # Parse multipart form data
-        form = parse_qs.FieldStorage(
-            fp=self.rfile,
-            headers=self.headers,
-            environ={'REQUEST_METHOD': 'POST'}
-        )
+        body = self.read_body(MAX_UPLOAD_BYTES)
+        if body is None:
+            return
+        
+        fileitem = self._parse_upload(content_type, body)
         
-        if 'file' in form:
-            fileitem = form['file']
-            filename = fileitem.filename
+        if fileitem:
+            filename, data = fileitem
             
-            # Save file
+            # Save file (via a temp name, so other players never fetch a partial upload)
             upload_dir = self.challenge_dir / 'www' / 'uploads'
             upload_dir.mkdir(exist_ok=True)
             
             filepath = upload_dir / filename
-            with open(filepath, 'wb') as f:
-                f.write(fileitem.file.read())
+            tmp = upload_dir / f".{filename}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, filepath)
             
             # Check if it's a web shell
-            with open(filepath, 'r', errors='ignore') as f:
-                content = f.read()
-                if 'FLAG{SHELL' in content or self.flags.get('flag3_shell') in content:
-                    flag_found = True
-                else:
-                    flag_found = False
+            content = data.decode('utf-8', errors='ignore')
+            shell_flag = self.flags.get('flag3_shell')
+            flag_found = 'FLAG{SHELL' in content or bool(shell_flag and shell_flag in content)
             
             html = f"""<!DOCTYPE html>
 <html>
@@ -332,14 +433,32 @@ Disallow: /.git/
             html = """<!DOCTYPE html>
 <html><body><h2>No file uploaded</h2><p><a href="/upload">Try Again</a></p></body></html>"""
         
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
+        self.send_body(html.encode())
+    
+    def _parse_upload(self, content_type, body):
+        """(filename, data) of the 'file' field in a multipart body, or None"""
+        message = BytesParser(policy=policy.HTTP).parsebytes(
+            b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+        )
+        if not message.is_multipart():
+            return None
+        
+        for part in message.iter_parts():
+            if part.get_param('name', header='content-disposition') != 'file':
+                continue
+            # Keep the name (extension tricks are part of the challenge) but not its directories
+            filename = os.path.basename((part.get_filename() or '').replace('\\', '/'))
+            if filename in ('', '.', '..'):
+                return None
+            return filename, part.get_payload(decode=True) or b''
+        return None
     
     def serve_admin(self):
         """Serve admin panel"""
-        html = """<!DOCTYPE html>
+        self.send_page('admin', self._render_admin)
+    
+    def _render_admin(self):
+        return """<!DOCTYPE html>
 <html>
 <head>
     <title>Admin Panel</title>
@@ -356,11 +475,6 @@ Disallow: /.git/
     </div>
 </body>
 </html>"""
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
     
     def serve_upload_file(self, path):
         """Serve uploaded files"""
@@ -368,16 +482,31 @@ Disallow: /.git/
         super().do_GET()
 
 
+class ThreadingCTFServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """One thread per connection, so players never queue behind each other"""
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
 class CTFServer:
     """
     CTF Challenge Server
+    
+    threaded (default) serves each connection on its own thread with
+    keep-alive, and shares one ChallengeCache between handlers. With
+    threaded=False requests are handled one at a time, flags and pages
+    built per request.
     """
     
-    def __init__(self, challenge_dir, host='0.0.0.0', port=8080):
+    def __init__(self, challenge_dir, host='0.0.0.0', port=8080, threaded=True, quiet=False):
         self.challenge_dir = Path(challenge_dir)
         self.host = host
         self.port = port
+        self.threaded = threaded
+        self.quiet = quiet
         self.flags = self._load_flags()
+        self.cache = ChallengeCache(self.challenge_dir)
     
     def _load_flags(self):
         """Load flags"""
@@ -388,22 +517,37 @@ class CTFServer:
                 return data['flags']
         return {}
     
-    def start(self):
-        """Start the server"""
+    def make_server(self):
+        """Bind (port 0 picks a free port) without serving"""
+        if self.threaded:
+            handler = lambda *args, **kwargs: CTFRequestHandler(
+                *args,
+                challenge_dir=self.challenge_dir,
+                cache=self.cache,
+                quiet=self.quiet,
+                keep_alive=True,
+                **kwargs
+            )
+            return ThreadingCTFServer((self.host, self.port), handler)
+        
         handler = lambda *args, **kwargs: CTFRequestHandler(
             *args, 
             challenge_dir=self.challenge_dir,
             flags=self.flags,
+            quiet=self.quiet,
             **kwargs
         )
-        
-        with socketserver.TCPServer((self.host, self.port), handler) as httpd:
-            print(f"[+] Server started successfully")
-            print(f"[+] Challenge URL: http://localhost:{self.port}")
+        return socketserver.TCPServer((self.host, self.port), handler)
+    
+    def start(self):
+        """Start the server"""
+        with self.make_server() as httpd:
+            print(f"[+] Server started successfully ({'threaded' if self.threaded else 'single-threaded'})")
+            print(f"[+] Challenge URL: http://localhost:{httpd.server_address[1]}")
             print(f"[+] Press Ctrl+C to stop\n")
             
             try:
                 httpd.serve_forever()
             except KeyboardInterrupt:
                 print("\n[*] Shutting down server...")
-                httpd.shutdown()
\ No newline at end of file
+                httpd.shutdown()
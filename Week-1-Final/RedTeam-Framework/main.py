@@ -15,10 +15,14 @@ def main():
                        help='Run specific phase only')
     parser.add_argument('--full', action='store_true',
                        help='Run full engagement')
+    parser.add_argument('--resume', nargs='?', const='latest', metavar='ENGAGEMENT_ID',
+                       help='Resume an engagement (default: the most recent one)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-run phases even if a cached result exists')
     
     args = parser.parse_args()
     
-    framework = RedTeamFramework(args.config)
+    framework = RedTeamFramework(args.config, resume=args.resume, use_cache=not args.no_cache)
     
     if args.phase == 'recon':
         framework.phase_1_reconnaissance()
@@ -30,7 +34,7 @@ def main():
         framework.phase_4_exploitation()
     elif args.phase == 'post':
         framework.phase_5_post_exploitation()
-    elif args.full:
+    elif args.full or args.resume:
         framework.run_full_engagement()
     else:
         print_usage()
@@ -46,6 +50,8 @@ def print_usage():
     print("  --phase deliver       Run delivery setup")
     print("  --phase exploit       Run exploitation")
     print("  --phase post          Run post-exploitation")
+    print("  --full --resume [ID]  Resume an engagement, skipping completed phases")
+    print("  --full --no-cache     Ignore cached phase results")
     print("\nExample:")
     print("  python3 main.py --full")
     print("  python3 main.py --phase recon")
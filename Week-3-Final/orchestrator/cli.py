@@ -40,6 +40,9 @@ Examples:
 
   # Specify output directory
   python -m week3_orchestrator --output my_operation
+
+  # Run the chain sequentially instead of on 4 workers
+  python -m week3_orchestrator --workers 1
         """
     )
 
@@ -82,6 +85,13 @@ Examples:
         help="Target network for pivoting (default: 10.0.0.0/24)"
     )
 
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=4,
+        help="Concurrent tasks for the full chain (1 = sequential, default: 4)"
+    )
+
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -131,7 +141,13 @@ def main(args: Optional[List[str]] = None) -> int:
             orchestrator.execute_phase(parsed.phase, **phase_args)
         else:
             # Run full chain
-            orchestrator.execute_full_chain(platform, parsed.targets)
+            orchestrator.execute_full_chain(
+                platform,
+                parsed.targets,
+                pivot_networks=[parsed.pivot_network],
+                domain=parsed.domain,
+                max_workers=parsed.workers,
+            )
 
         return 0
 
@@ -6,11 +6,16 @@ Core functionality for the Week 3 Orchestrator.
 """
 
 from .logger import OperationLogger
+from .log_writer import LogWriter
 from .reporter import ReportGenerator
+from .scheduler import TaskScheduler, Task
 from .orchestrator import Week3Orchestrator
 
 __all__ = [
     "OperationLogger",
+    "LogWriter",
     "ReportGenerator",
+    "TaskScheduler",
+    "Task",
     "Week3Orchestrator",
 ]
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+Background Log Writer
+=====================
+
+Queue-backed writer thread for the operation logs.
+
+Entries are written in batches to a plain-text log and an append-only
+JSON Lines stream (tail -F friendly). Both rotate together on size or age;
+rotated segments are kept unless a backup count is set.
+Byte offsets of each entry are indexed by level, so level queries read
+just those lines back from disk instead of keeping entries in memory.
+"""
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+import weakref
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+QUEUE_SIZE = 10000
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.5
+MAX_BYTES = 10 * 1024 * 1024
+BACKUP_COUNT = None     # keep every rotated segment
+
+_STOP = object()
+
+# Writers still open at exit; closed ones drop out, so nothing keeps them alive
+_open_writers: "weakref.WeakSet[LogWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    """Flush every writer left open when the interpreter exits"""
+    for writer in list(_open_writers):
+        writer.close()
+
+
+class LogWriter:
+    """
+    Batched, rotating writer running on a daemon thread.
+
+    The queue is bounded: when the writer falls behind, callers block
+    instead of growing memory. Rotated segments are renamed to
+    <name>.<n> with n increasing (continuing after segments left by
+    earlier runs), so byte offsets recorded for a segment stay valid
+    until it is pruned.
+    """
+
+    def __init__(
+            self,
+            jsonl_file: Path,
+            text_file: Optional[Path] = None,
+            max_bytes: int = MAX_BYTES,
+            rotate_interval: Optional[float] = None,
+            backup_count: Optional[int] = BACKUP_COUNT,
+            queue_size: int = QUEUE_SIZE,
+            batch_size: int = BATCH_SIZE,
+            flush_interval: float = FLUSH_INTERVAL,
+            text_header: str = ""
+    ):
+        """
+        Initialize and start the writer.
+
+        Args:
+            jsonl_file: JSON Lines stream path
+            text_file: Plain-text log path (None to skip)
+            max_bytes: Rotate when the JSONL segment exceeds this size (0 disables)
+            rotate_interval: Rotate segments older than this many seconds
+            backup_count: Rotated segments of this run to keep (None keeps
+                all; pruned segments take their entries out of queries)
+            queue_size: Maximum queued entries before log() blocks
+            batch_size: Maximum entries written per batch
+            flush_interval: Maximum seconds an entry waits before being written
+            text_header: Written at the top of every text log segment
+        """
+        self.jsonl_file = Path(jsonl_file)
+        self.text_file = Path(text_file) if text_file else None
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.text_header = text_header
+        self.text_enabled = True
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+
+        # level -> segment -> byte offsets of that level's lines
+        self._index: Dict[str, Dict[int, array]] = {}
+        self._segment = self._next_free_segment()
+        self._rotated: List[int] = []
+
+        self._open_segment()
+
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    # Producer side
+
+    def write(self, entry: dict, text_line: str) -> None:
+        """Queue one entry (blocks if the queue is full; dropped after close())"""
+        if self._thread.is_alive():
+            self._queue.put((entry, text_line))
+
+    def flush(self) -> None:
+        """Block until every queued entry is on disk"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush, stop the writer thread and close the files"""
+        _open_writers.discard(self)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    # Writer thread
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+
+            while item is not _STOP and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            stop = batch[-1] is _STOP
+            entries = batch[:-1] if stop else batch
+
+            try:
+                if entries:
+                    self._write_batch(entries)
+            except Exception as e:
+                # Never let the thread die: later entries would be dropped silently
+                print(f"[log-writer] write failed: {e}", file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                self._close_files()
+                return
+
+    def _write_batch(self, batch: List[Tuple[dict, str]]) -> None:
+        if self._should_rotate():
+            self._rotate()
+
+        lines = []
+        text = []
+        offsets: Dict[str, List[int]] = {}
+        position = self._position
+
+        for entry, text_line in batch:
+            line = (json.dumps(entry) + "\n").encode("utf-8")
+            offsets.setdefault(entry.get("level", "INFO"), []).append(position)
+            position += len(line)
+            lines.append(line)
+            text.append(text_line + "\n")
+
+        self._jsonl.write(b"".join(lines))
+        self._jsonl.flush()
+        if self._text is not None and self.text_enabled:
+            self._text.write("".join(text))
+            self._text.flush()
+
+        with self._lock:
+            self._position = position
+            for level, level_offsets in offsets.items():
+                segments = self._index.setdefault(level, {})
+                segments.setdefault(self._segment, array("Q")).extend(level_offsets)
+
+    # Segments
+
+    def _next_free_segment(self) -> int:
+        """First segment number after those left by earlier runs (kept)"""
+        highest = -1
+        for base in (self.jsonl_file, self.text_file):
+            if base is None:
+                continue
+            for old in base.parent.glob(base.name + ".*"):
+                if old.suffix[1:].isdigit():
+                    highest = max(highest, int(old.suffix[1:]))
+        return highest + 1
+
+    def _open_segment(self, append_jsonl: bool = False, append_text: bool = False) -> None:
+        """Start a segment; append mode resumes the current one instead"""
+        self._jsonl = open(self.jsonl_file, "ab" if append_jsonl else "wb")
+        if not append_jsonl:
+            self._position = 0
+        self._segment_started = time.monotonic()
+        self._text = None
+        if self.text_file is not None:
+            self._text = open(self.text_file, "a" if append_text else "w")
+            if not append_text:
+                self._text.write(self.text_header)
+                self._text.flush()
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes and self._position >= self.max_bytes:
+            return True
+        if self.rotate_interval and time.monotonic() - self._segment_started >= self.rotate_interval:
+            return self._position > 0
+        return False
+
+    def _rotate(self) -> None:
+        self._close_files()
+        with self._lock:
+            rotated = self._segment
+            try:
+                self.jsonl_file.rename(self.jsonl_file.with_name(f"{self.jsonl_file.name}.{rotated}"))
+            except OSError as e:
+                # Keep writing the current segment (offsets stay valid)
+                print(f"[log-writer] rotation failed, continuing segment: {e}", file=sys.stderr)
+                self._open_segment(append_jsonl=True, append_text=True)
+                return
+
+            text_rotated = True
+            if self.text_file is not None and self.text_file.exists():
+                try:
+                    self.text_file.rename(self.text_file.with_name(f"{self.text_file.name}.{rotated}"))
+                except OSError as e:
+                    print(f"[log-writer] text log rotation failed: {e}", file=sys.stderr)
+                    text_rotated = False
+
+            self._rotated.append(rotated)
+            self._segment += 1
+
+            while self.backup_count is not None and len(self._rotated) > self.backup_count:
+                pruned = self._rotated.pop(0)
+                for base in (self.jsonl_file, self.text_file):
+                    if base is not None:
+                        base.with_name(f"{base.name}.{pruned}").unlink(missing_ok=True)
+                for segments in self._index.values():
+                    segments.pop(pruned, None)
+
+        self._open_segment(append_text=not text_rotated)
+
+    def _close_files(self) -> None:
+        self._jsonl.close()
+        if self._text is not None:
+            self._text.close()
+
+    # Queries
+
+    def segments(self) -> List[Path]:
+        """JSONL segment paths, oldest first"""
+        with self._lock:
+            rotated = list(self._rotated)
+        return [self.jsonl_file.with_name(f"{self.jsonl_file.name}.{s}") for s in rotated] + [self.jsonl_file]
+
+    def iter_entries(self) -> Iterator[dict]:
+        """Stream every retained entry from disk, oldest first"""
+        self.flush()
+        for path in self.segments():
+            try:
+                with open(path, "rb") as f:
+                    for line in f:
+                        yield json.loads(line)
+            except FileNotFoundError:
+                continue
+
+    def entries_by_level(self, level: str) -> List[dict]:
+        """Read back the entries of one level using the offset index"""
+        self.flush()
+        with self._lock:
+            current = self._segment
+            wanted = [
+                (segment, array("Q", offsets))
+                for segment, offsets in sorted(self._index.get(level, {}).items())
+            ]
+
+        entries = []
+        for segment, offsets in wanted:
+            rotated = self.jsonl_file.with_name(f"{self.jsonl_file.name}.{segment}")
+            # The current segment may be rotated while we read it
+            candidates = [self.jsonl_file, rotated] if segment == current else [rotated]
+            for path in candidates:
+                try:
+                    with open(path, "rb") as f:
+                        for offset in offsets:
+                            f.seek(offset)
+                            entries.append(json.loads(f.readline()))
+                    break
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def count(self, level: str) -> int:
+        """Number of retained entries of one level"""
+        with self._lock:
+            return sum(len(o) for o in self._index.get(level, {}).values())
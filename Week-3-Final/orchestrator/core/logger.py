@@ -7,9 +7,11 @@ Centralized logging for the attack operation.
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List
 import json
 
+from .log_writer import LogWriter, MAX_BYTES, BACKUP_COUNT
+
 
 class OperationLogger:
     """
@@ -17,36 +19,59 @@ class OperationLogger:
 
     Supports:
     - Console output with timestamps
-    - File logging
-    - Structured JSON logging
+    - File logging (batched on a background writer thread)
+    - Structured JSONL logging (operation.jsonl, append-only, rotating)
+
+    Entries are not kept in memory; level queries read them back from
+    the JSONL stream.
     """
 
-    def __init__(self, output_dir: Path, log_file: str = "operation.log"):
+    def __init__(self, output_dir: Path, log_file: str = "operation.log",
+                 max_bytes: int = MAX_BYTES, rotate_interval: Optional[float] = None,
+                 backup_count: Optional[int] = BACKUP_COUNT):
         """
         Initialize the logger.
 
         Args:
             output_dir: Directory for log files
             log_file: Name of the main log file
+            max_bytes: Rotate log segments after this many bytes (0 disables)
+            rotate_interval: Rotate log segments after this many seconds
+            backup_count: Rotated segments to keep (None, the default, keeps all)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
         self.log_file = self.output_dir / log_file
         self.json_log_file = self.output_dir / "operation.json"
+        self.jsonl_log_file = self.output_dir / "operation.jsonl"
 
-        self.entries: List[dict] = []
         self.console_enabled = True
-        self.file_enabled = True
 
         # Initialize log files
-        self._init_log_files()
-
-    def _init_log_files(self) -> None:
-        """Initialize log files with headers"""
-        with open(self.log_file, "w") as f:
-            f.write(f"# Operation Log - Started {datetime.now().isoformat()}\n")
-            f.write("=" * 60 + "\n\n")
+        self._writer = LogWriter(
+            self.jsonl_log_file,
+            self.log_file,
+            max_bytes=max_bytes,
+            rotate_interval=rotate_interval,
+            backup_count=backup_count,
+            text_header=self._log_header(),
+        )
+
+    @staticmethod
+    def _log_header() -> str:
+        """Header written at the top of each text log segment"""
+        return (f"# Operation Log - Started {datetime.now().isoformat()}\n"
+                + "=" * 60 + "\n\n")
+
+    @property
+    def file_enabled(self) -> bool:
+        """Whether the plain-text log is written (the JSONL stream always is)"""
+        return self._writer.text_enabled
+
+    @file_enabled.setter
+    def file_enabled(self, enabled: bool) -> None:
+        self._writer.text_enabled = enabled
 
     def log(self, message: str, level: str = "INFO") -> None:
         """
@@ -65,7 +90,6 @@ class OperationLogger:
             "level": level,
             "message": message,
         }
-        self.entries.append(entry)
 
         # Format for display
         log_line = f"[{formatted_time}] [{level}] {message}"
@@ -83,10 +107,8 @@ class OperationLogger:
             color = colors.get(level, "")
             print(f"{color}{log_line}{reset if color else ''}")
 
-        # File output
-        if self.file_enabled:
-            with open(self.log_file, "a") as f:
-                f.write(log_line + "\n")
+        # File output (queued for the writer thread)
+        self._writer.write(entry, log_line)
 
     def info(self, message: str) -> None:
         """Log an info message"""
@@ -119,14 +141,43 @@ class OperationLogger:
         prefix = "    " * indent
         self.log(f"{prefix}- {text}")
 
+    def flush(self) -> None:
+        """Wait until every logged entry has been written"""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and stop the background writer"""
+        self._writer.close()
+
     def save_json_log(self) -> None:
-        """Save the complete log as JSON"""
+        """
+        Save the complete log as a JSON array (operation.json).
+
+        Streams from the JSONL segments, so memory stays flat.
+        """
         with open(self.json_log_file, "w") as f:
-            json.dump(self.entries, f, indent=2)
+            f.write("[")
+            for i, entry in enumerate(self.iter_entries()):
+                f.write(",\n" if i else "\n")
+                f.write(json.dumps(entry))
+            f.write("\n]\n")
+
+    def iter_entries(self) -> Iterator[dict]:
+        """Stream all retained entries from disk, oldest first"""
+        return self._writer.iter_entries()
+
+    @property
+    def entries(self) -> List[dict]:
+        """All retained entries (read from disk)"""
+        return list(self.iter_entries())
 
     def get_entries_by_level(self, level: str) -> List[dict]:
         """Get all log entries of a specific level"""
-        return [e for e in self.entries if e["level"] == level]
+        return self._writer.entries_by_level(level)
+
+    def count(self, level: str) -> int:
+        """Number of entries of a specific level"""
+        return self._writer.count(level)
 
     def get_errors(self) -> List[dict]:
         """Get all error entries"""
@@ -5,6 +5,7 @@ Week 3 Orchestrator
 Main orchestrator that chains all attack phases together.
 """
 
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -24,6 +25,7 @@ from ..phases import (
 )
 from .logger import OperationLogger
 from .reporter import ReportGenerator
+from .scheduler import TaskScheduler
 
 
 class Week3Orchestrator:
@@ -62,6 +64,10 @@ class Week3Orchestrator:
         self.logger = OperationLogger(self.output_dir)
         self.reporter = ReportGenerator(self.output_dir)
 
+        # Task timings from the last scheduled run (see execute_full_chain)
+        self.schedule: Optional[dict] = None
+        self._phase_lock = threading.Lock()
+
         # Initialize phases
         self.phases = {
             1: PrivilegeEscalationPhase(self.state, self.logger),
@@ -98,7 +104,7 @@ class Week3Orchestrator:
             system.privilege_level = PrivilegeLevel.ADMIN if platform == Platform.WINDOWS else PrivilegeLevel.ROOT
             self.state.initial_system = system
             self.state.add_system(system)
-            self.state.current_phase = 1
+            self._advance_phase(1)
 
         return result
 
@@ -120,7 +126,7 @@ class Week3Orchestrator:
             return []
 
         credentials = self.phases[2].execute(system)
-        self.state.current_phase = max(self.state.current_phase, 2)
+        self._advance_phase(2)
 
         return credentials
 
@@ -137,13 +143,13 @@ class Week3Orchestrator:
             List of newly compromised systems
         """
         if credentials is None:
-            credentials = self.state.all_credentials
+            credentials = list(self.state.all_credentials)
 
         if targets is None:
             targets = ["192.168.1.0/24"]
 
         newly_compromised = self.phases[3].execute(credentials, targets)
-        self.state.current_phase = max(self.state.current_phase, 3)
+        self._advance_phase(3)
 
         return newly_compromised
 
@@ -167,7 +173,7 @@ class Week3Orchestrator:
             return False
 
         result = self.phases[4].execute(pivot_host, target_network)
-        self.state.current_phase = max(self.state.current_phase, 4)
+        self._advance_phase(4)
 
         return result
 
@@ -195,40 +201,120 @@ class Week3Orchestrator:
                 )
 
         result = self.phases[5].execute(domain_admin_creds, domain)
-        self.state.current_phase = max(self.state.current_phase, 5)
+        self._advance_phase(5)
 
         return result
 
+    def _advance_phase(self, phase_number: int) -> None:
+        """Record phase progress (phases may finish out of order when scheduled)"""
+        with self._phase_lock:
+            self.state.current_phase = max(self.state.current_phase, phase_number)
+
     def execute_full_chain(self, initial_platform: Platform,
-                           targets: Optional[List[str]] = None) -> None:
+                           targets: Optional[List[str]] = None,
+                           pivot_networks: Optional[List[str]] = None,
+                           domain: str = "CORP.LOCAL",
+                           max_workers: int = 4) -> None:
         """
         Execute the complete Week 3 attack chain.
 
+        Each phase invocation becomes a task per system or network, and
+        independent tasks run concurrently: lateral movement into each
+        target network, pivots into each pivot network and harvesting of
+        newly compromised hosts only wait for the state they read.
+
         Args:
             initial_platform: Platform of initial compromised system
             targets: Target networks/hosts for lateral movement
+            pivot_networks: Networks to pivot into from the initial system
+            domain: Target domain for trust exploitation
+            max_workers: Concurrent tasks (1 runs the chain sequentially)
         """
         self.logger.header("EXECUTING COMPLETE WEEK 3 ATTACK CHAIN")
 
         targets = targets or ["192.168.1.0/24"]
+        pivot_networks = pivot_networks or ["10.0.0.0/24"]
 
-        # Phase 1
-        self.phase1_privilege_escalation(initial_platform)
+        scheduler = self.build_chain(initial_platform, targets, pivot_networks, domain, max_workers)
+        scheduler.run()
 
-        # Phase 2
-        credentials = self.phase2_credential_harvesting()
+        self.schedule = scheduler.summary()
+        self.logger.success(
+            f"Chain finished in {self.schedule['wall_time']:.2f}s "
+            f"({self.schedule['total_task_time']:.2f}s of task time, "
+            f"{len(scheduler.tasks)} tasks on {scheduler.max_workers} workers)"
+        )
 
-        # Phase 3
-        self.phase3_lateral_movement(credentials, targets)
+        # Generate reports
+        self.generate_reports()
 
-        # Phase 4
-        self.phase4_network_pivoting()
+    def build_chain(self, initial_platform: Platform, targets: List[str],
+                    pivot_networks: List[str], domain: str = "CORP.LOCAL",
+                    max_workers: int = 4) -> TaskScheduler:
+        """
+        Build the task graph for the full chain.
 
-        # Phase 5
-        self.phase5_domain_trust_exploitation()
+        Resources: "system:initial" (phase 1), "credentials" (phase 2),
+        "systems" (phase 3), "pivot:<network>" (phase 4), "domains" (phase 5).
+        Lateral movement tasks only read the initial harvest, so networks
+        are attacked in parallel; trust exploitation waits for every lateral
+        task and the harvests they spawn, since those may yield DA creds.
 
-        # Generate reports
-        self.generate_reports()
+        Returns:
+            TaskScheduler ready to run
+        """
+        scheduler = TaskScheduler(max_workers=max_workers, logger=self.logger)
+
+        scheduler.add_task(
+            "privesc:initial",
+            lambda: self.phase1_privilege_escalation(initial_platform),
+            phase=1, outputs={"system:initial"},
+        )
+
+        scheduler.add_task(
+            "harvest:initial",
+            self.phase2_credential_harvesting,
+            phase=2, inputs={"system:initial"}, outputs={"credentials"},
+        )
+
+        for network in targets:
+            name = f"lateral:{network}"
+            scheduler.add_task(
+                name,
+                lambda network=network, name=name: self._lateral_task(scheduler, name, network),
+                phase=3, inputs={"credentials"}, outputs={"systems"},
+            )
+
+        for network in pivot_networks:
+            scheduler.add_task(
+                f"pivot:{network}",
+                lambda network=network: self.phase4_network_pivoting(target_network=network),
+                phase=4, inputs={"system:initial"}, outputs={f"pivot:{network}"},
+            )
+
+        scheduler.add_task(
+            f"trust:{domain}",
+            lambda: self.phase5_domain_trust_exploitation(domain=domain),
+            phase=5, inputs={"credentials", "systems"}, outputs={"domains"},
+        )
+
+        return scheduler
+
+    def _lateral_task(self, scheduler: TaskScheduler, name: str,
+                      network: str) -> List[CompromisedSystem]:
+        """Lateral movement into one network, then harvest each new host"""
+        compromised = self.phase3_lateral_movement(targets=[network])
+
+        for system in compromised:
+            if self.state.add_system(system):
+                scheduler.add_task(
+                    f"harvest:{system.ip_address}",
+                    lambda system=system: self.phase2_credential_harvesting(system),
+                    phase=2, inputs={f"system:{system.ip_address}"}, outputs={"credentials"},
+                    parent=name,
+                )
+
+        return compromised
 
     def execute_phase(self, phase_number: int, **kwargs) -> bool:
         """
@@ -262,7 +348,7 @@ class Week3Orchestrator:
         self.logger.info("Generating reports...")
 
         # Markdown report
-        report_path = self.reporter.generate_markdown_report(self.state)
+        report_path = self.reporter.generate_markdown_report(self.state, schedule=self.schedule)
         self.logger.success(f"Markdown report: {report_path}")
 
         # JSON export
@@ -286,9 +372,15 @@ class Week3Orchestrator:
         return self.reporter.generate_json_export(self.state, filename)
 
     def load_state(self, filepath: str) -> None:
-        """Load state from file"""
+        """Load state from a full JSON export or an incremental .jsonl snapshot"""
         import json
         with open(filepath) as f:
-            data = json.load(f)
-        self.state = AttackState.from_dict(data)
+            if Path(filepath).suffix == ".jsonl":
+                self.state = AttackState.from_snapshot(f)
+            else:
+                self.state = AttackState.from_dict(json.load(f))
+
+        for phase in self.phases.values():
+            phase.state = self.state
+
         self.logger.info(f"State loaded from {filepath}")
\ No newline at end of file
@@ -7,7 +7,7 @@ Generate operation reports in various formats.
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import json
 
 from ..models import AttackState
@@ -33,13 +33,18 @@ class ReportGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-    def generate_markdown_report(self, state: AttackState, filename: str = "operation_report.md") -> Path:
+        # Snapshot path -> (state, journal position already written)
+        self._snapshots: Dict[Path, Tuple[AttackState, int]] = {}
+
+    def generate_markdown_report(self, state: AttackState, filename: str = "operation_report.md",
+                                 schedule: Optional[dict] = None) -> Path:
         """
         Generate a comprehensive Markdown report.
 
         Args:
             state: Current attack state
             filename: Output filename
+            schedule: TaskScheduler.summary() of the run, adds a task timing section
 
         Returns:
             Path to the generated report
@@ -148,6 +153,9 @@ class ReportGenerator:
         else:
             report += "*No trust relationships enumerated yet*\n"
 
+        if schedule:
+            report += self._task_timings(schedule)
+
         report += """
 ---
 
@@ -196,23 +204,66 @@ class ReportGenerator:
 
         return report_path
 
-    def generate_json_export(self, state: AttackState, filename: str = "operation_state.json") -> Path:
+    def _task_timings(self, schedule: dict) -> str:
+        """Markdown section with per-task timings and the critical path"""
+        section = f"""
+---
+
+## Task Timings
+
+- **Wall Time:** {schedule['wall_time']:.2f}s on {schedule['workers']} worker(s)
+- **Total Task Time:** {schedule['total_task_time']:.2f}s
+- **Critical Path:** {' → '.join(schedule['critical_path']) or '-'}
+
+| Task | Phase | Status | Start (s) | Duration (s) | Waits On |
+|------|-------|--------|-----------|--------------|----------|
+"""
+        for task in schedule["tasks"]:
+            start = f"{task['started']:.2f}" if task["started"] is not None else "-"
+            waits = ", ".join(task["depends_on"] + ([task["parent"]] if task["parent"] else [])) or "-"
+            section += f"| {task['name']} | {task['phase']} | {task['status']} | {start} | {task['duration']:.2f} | {waits} |\n"
+
+        return section
+
+    def generate_json_export(self, state: AttackState, filename: str = "operation_state.json",
+                             incremental: bool = False) -> Path:
         """
-        Export the complete state as JSON.
+        Export the state as JSON.
+
+        With incremental=True the export goes to a JSON Lines snapshot next
+        to filename (operation_state.jsonl) instead: the first export writes
+        every record, later exports of the same state only append what
+        changed since. Load it back with AttackState.from_snapshot().
 
         Args:
             state: Current attack state
             filename: Output filename
+            incremental: Append to the JSONL snapshot instead of writing full JSON
 
         Returns:
-            Path to the generated JSON file
+            Path to the generated file
         """
         json_path = self.output_dir / filename
 
-        with open(json_path, "w") as f:
-            json.dump(state.to_dict(), f, indent=2)
+        if not incremental:
+            with open(json_path, "w") as f:
+                json.dump(state.to_dict(), f, indent=2)
+            return json_path
+
+        snapshot_path = json_path.with_suffix(".jsonl")
+        previous = self._snapshots.get(snapshot_path)
+
+        if previous is not None and previous[0] is state and snapshot_path.exists():
+            mode, since = "a", previous[1]
+        else:
+            mode, since = "w", 0
+
+        records, position = state.snapshot_records(since)
+        with open(snapshot_path, mode) as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
 
-        return json_path
+        self._snapshots[snapshot_path] = (state, position)
+        return snapshot_path
 
     def generate_executive_summary(self, state: AttackState, filename: str = "executive_summary.md") -> Path:
         """
@@ -0,0 +1,330 @@
+"""
+Task Scheduler
+==============
+
+Dependency-aware scheduler for phase invocations.
+
+Each task declares the AttackState resources it reads (inputs) and
+writes (outputs), e.g. "credentials", "system:<ip>", "pivot:<network>".
+A task waits for every earlier task that writes one of its inputs;
+everything else runs concurrently on a thread pool. Tasks may spawn
+follow-up tasks while running (e.g. harvesting a host that lateral
+movement just compromised); a task only counts as done for its
+dependents once all of its spawned tasks are done as well.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETE = "complete"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass
+class Task:
+    """
+    A single scheduled phase invocation.
+
+    Attributes:
+        name: Unique task name (e.g. "lateral:10.0.0.0/24")
+        func: Callable run with no arguments; its return value is kept
+        phase: Phase number the task belongs to
+        inputs: State resources the task reads
+        outputs: State resources the task writes
+        parent: Task that spawned this one
+    """
+    name: str
+    func: Callable[[], Any]
+    phase: int = 0
+    inputs: Set[str] = field(default_factory=set)
+    outputs: Set[str] = field(default_factory=set)
+    parent: Optional["Task"] = None
+
+    status: str = PENDING
+    result: Any = None
+    error: Optional[BaseException] = None
+    depends_on: List["Task"] = field(default_factory=list)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    settled: Optional[float] = None  # func and all spawned tasks done
+
+    # Scheduling bookkeeping
+    _waiting_on: int = 0
+    _open_children: int = 0
+    _func_done: bool = False
+    _dependents: List["Task"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent running func (0 if it never ran)"""
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "phase": self.phase,
+            "status": self.status,
+            "started": round(self.started, 3) if self.started is not None else None,
+            "duration": round(self.duration, 3),
+            "depends_on": [t.name for t in self.depends_on],
+            "parent": self.parent.name if self.parent else None,
+            "error": str(self.error) if self.error else None,
+        }
+
+
+class TaskScheduler:
+    """
+    Runs tasks on a worker pool as soon as their dependencies are done.
+
+    Ready tasks start in the order they were added, so max_workers=1
+    reproduces a plain sequential run.
+    """
+
+    def __init__(self, max_workers: int = 4, logger: Optional[Callable] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Worker threads
+            logger: Optional logging function (message, level)
+        """
+        self.max_workers = max(1, max_workers)
+        self._logger = logger
+        self.tasks: Dict[str, Task] = {}
+        self._writers: Dict[str, List[Task]] = {}
+        self._cond = threading.Condition()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._open = 0
+        self._t0: Optional[float] = None
+        self.wall_time = 0.0
+
+    def log(self, message: str, level: str = "INFO") -> None:
+        if self._logger:
+            self._logger(message, level)
+
+    # Building
+
+    def add_task(
+            self,
+            name: str,
+            func: Callable[[], Any],
+            phase: int = 0,
+            inputs: Iterable[str] = (),
+            outputs: Iterable[str] = (),
+            after: Iterable[str] = (),
+            parent: Optional[str] = None
+    ) -> Task:
+        """
+        Add a task. Safe to call from inside a running task.
+
+        Args:
+            name: Unique task name
+            func: Callable with no arguments
+            phase: Phase number (for reporting)
+            inputs: State resources read
+            outputs: State resources written
+            after: Names of extra tasks to wait for
+            parent: Name of the spawning task (it stays open until this one is done)
+
+        Returns:
+            The new Task
+        """
+        with self._cond:
+            if name in self.tasks:
+                raise ValueError(f"Duplicate task name: {name}")
+
+            # Resolve every name before touching scheduler state
+            parent_task = self._get(parent) if parent is not None else None
+            deps = {n: self._get(n) for n in after}
+
+            task = Task(name, func, phase, set(inputs), set(outputs), parent_task)
+
+            ancestors = set()
+            node = parent_task
+            while node is not None:
+                ancestors.add(node.name)
+                node = node.parent
+            if parent_task is not None:
+                parent_task._open_children += 1
+
+            for resource in task.inputs:
+                for writer in self._writers.get(resource, ()):
+                    deps.setdefault(writer.name, writer)
+
+            for dep in deps.values():
+                if dep.name in ancestors:
+                    continue  # would wait on itself through the parent
+                task.depends_on.append(dep)
+                if dep.settled is None:
+                    task._waiting_on += 1
+                    dep._dependents.append(task)
+
+            for resource in task.outputs:
+                self._writers.setdefault(resource, []).append(task)
+
+            self.tasks[name] = task
+            self._open += 1
+
+            if self._pool is not None:
+                self._release(task)
+
+            return task
+
+    def _get(self, name: str) -> Task:
+        task = self.tasks.get(name)
+        if task is None:
+            raise ValueError(f"Unknown task: {name}")
+        return task
+
+    # Running
+
+    def run(self) -> List[Task]:
+        """
+        Run every task to completion.
+
+        Returns:
+            Tasks in the order they were added
+        """
+        self._t0 = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="phase") as pool:
+            with self._cond:
+                self._pool = pool
+                for task in list(self.tasks.values()):
+                    if task.status == PENDING:
+                        self._release(task)
+
+                while self._open:
+                    self._cond.wait()
+
+                self._pool = None
+
+        self.wall_time = time.perf_counter() - self._t0
+        return list(self.tasks.values())
+
+    def _release(self, task: Task) -> None:
+        """Start (or skip) a task whose dependencies are all settled. Lock held."""
+        if task._waiting_on or task.status != PENDING:
+            return
+
+        failed = [d.name for d in task.depends_on if d.status in (FAILED, SKIPPED)]
+        if failed:
+            task.status = SKIPPED
+            task.error = RuntimeError(f"dependency failed: {', '.join(failed)}")
+            task._func_done = True
+            self.log(f"[!] Skipping {task.name}: {task.error}", "WARNING")
+            self._try_settle(task)
+            return
+
+        task.status = RUNNING
+        self._pool.submit(self._execute, task)
+
+    def _execute(self, task: Task) -> None:
+        task.started = time.perf_counter() - self._t0
+        status = FAILED
+        try:
+            task.result = task.func()
+            status = COMPLETE
+        except Exception as e:
+            task.error = e
+            self.log(f"[-] Task {task.name} failed: {e}", "ERROR")
+        except BaseException as e:
+            task.error = e
+            raise
+        finally:
+            # Always settle, or run() would wait for this task forever
+            task.finished = time.perf_counter() - self._t0
+            with self._cond:
+                task.status = status
+                task._func_done = True
+                self._try_settle(task)
+
+    def _try_settle(self, task: Task) -> None:
+        """Mark a task done once it and all its spawned tasks are. Lock held."""
+        if task.settled is not None or not task._func_done or task._open_children:
+            return
+
+        task.settled = time.perf_counter() - self._t0
+        self._open -= 1
+
+        for dependent in task._dependents:
+            dependent._waiting_on -= 1
+            self._release(dependent)
+
+        if task.parent is not None:
+            task.parent._open_children -= 1
+            self._try_settle(task.parent)
+
+        self._cond.notify_all()
+
+    # Results
+
+    @property
+    def total_task_time(self) -> float:
+        """Sum of all task durations (the sequential cost)"""
+        return sum(t.duration for t in self.tasks.values())
+
+    def critical_path(self) -> List[Task]:
+        """
+        Chain of tasks that determined the wall time.
+
+        Walks back from the last task to finish, each time following the
+        dependency (or spawning parent) that finished last before it. A
+        dependency held open by its spawned tasks is entered through the
+        last of those to finish. Skipped tasks never ran and are ignored.
+        """
+        finished = [
+            t for t in self.tasks.values()
+            if t.settled is not None and t.started is not None
+        ]
+        if not finished:
+            return []
+
+        def last_descendant(task: Task) -> Task:
+            while True:
+                children = [
+                    t for t in self.tasks.values()
+                    if t.parent is task and t.settled is not None and t.started is not None
+                ]
+                if not children:
+                    return task
+                child = max(children, key=lambda t: t.settled)
+                if task.finished is not None and child.settled <= task.finished:
+                    return task
+                task = child
+
+        path = [last_descendant(max(finished, key=lambda t: t.settled))]
+        while path[-1].started is not None:
+            current = path[-1]
+            blockers = [
+                t for t in current.depends_on
+                if t.settled is not None and t.settled <= current.started
+            ]
+            if blockers:
+                path.append(last_descendant(max(blockers, key=lambda t: t.settled)))
+            elif current.parent is not None:
+                path.append(current.parent)
+            else:
+                break
+
+        path.reverse()
+        return path
+
+    def summary(self) -> dict:
+        """Timings for reporting"""
+        return {
+            "workers": self.max_workers,
+            "wall_time": round(self.wall_time, 3),
+            "total_task_time": round(self.total_task_time, 3),
+            "critical_path": [t.name for t in self.critical_path()],
+            "tasks": [t.to_dict() for t in self.tasks.values()],
+        }
@@ -6,11 +6,11 @@ Represents harvested credentials from compromised systems.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Optional, Tuple
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Credential:
     """
     Represents a harvested credential.
@@ -26,6 +26,11 @@ class Credential:
         harvested_at: Timestamp when credential was harvested
         verified: Whether credential has been tested/verified
     """
+    # Set by AttackState when the object is added; declared first so it
+    # exists before __init__ assigns the fields below
+    _listener: Optional[Callable[[Any], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     username: str
     domain: str = ""
     password: str = ""
@@ -36,18 +41,30 @@ class Credential:
     harvested_at: datetime = field(default_factory=datetime.now)
     verified: bool = False
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self._listener is not None and name[0] != "_":
+            self._listener(self)
+
+    def _changed(self) -> None:
+        """Report an in-place change to the AttackState holding this credential"""
+        if self._listener is not None:
+            self._listener(self)
+
     def __hash__(self):
         """Hash based on username and domain for deduplication"""
-        return hash((self.username.lower(), self.domain.lower()))
+        return hash(self.key)
 
     def __eq__(self, other):
         """Equality based on username and domain"""
         if not isinstance(other, Credential):
             return False
-        return (
-                self.username.lower() == other.username.lower() and
-                self.domain.lower() == other.domain.lower()
-        )
+        return self.key == other.key
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Identity used for deduplication: (username, domain), lowercased"""
+        return self.username.lower(), self.domain.lower()
 
     @property
     def full_username(self) -> str:
@@ -3,21 +3,46 @@ Attack State Model
 ==================
 
 Tracks the overall state of the attack operation.
+
+Systems, credentials and domains are indexed by identity, IP, hostname,
+privilege and domain, so lookups and deduplication stay constant-time
+after large harvesting phases. Every change is also appended to a journal
+that snapshots can be written from incrementally; systems and credentials
+report fields changed in place, so only those are written again.
 """
 
+import json
+import threading
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from functools import wraps
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
 from .credential import Credential
 from .system import CompromisedSystem
 
 
-@dataclass
+def _locked(method):
+    """Serialize a mutating method on the state's lock (phases may run concurrently)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+@dataclass(slots=True)
 class AttackState:
     """
     Tracks the current state of the attack operation.
 
+    The public lists keep insertion order for reporting; add objects
+    through the add_* methods so the indexes and journal stay in sync.
+    Those methods hold an internal lock, so concurrently running phases
+    can share one state. Indexed fields (IP, hostname, username, domain,
+    privilege) must be set before an object is added; other fields may be
+    changed in place and are picked up by the next snapshot.
+
     Attributes:
         initial_system: The first compromised system (entry point)
         compromised_systems: All systems compromised during operation
@@ -37,6 +62,51 @@ class AttackState:
     operation_start: datetime = field(default_factory=datetime.now)
     current_phase: int = 0
 
+    # Indexes
+    _credentials: Dict[Tuple[str, str], Credential] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _credentials_by_privilege: Dict[str, List[Credential]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _credentials_by_domain: Dict[str, List[Credential]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _systems_by_ip: Dict[str, CompromisedSystem] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _systems_by_hostname: Dict[str, CompromisedSystem] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _hostname_keys: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _domain_keys: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False)
+
+    # Change journal: (record type, payload) in the order changes happened
+    _journal: List[Tuple[str, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False)
+    # Systems/credentials changed in place since the last snapshot, by id()
+    _dirty: Dict[int, Tuple[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _lock: Any = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        systems, self.compromised_systems = self.compromised_systems, []
+        credentials, self.all_credentials = self.all_credentials, []
+        pivots, self.active_pivots = self.active_pivots, []
+        domains, self.compromised_domains = self.compromised_domains, []
+        trusts, self.trust_relationships = self.trust_relationships, []
+
+        for system in systems:
+            self.add_system(system)
+        self.add_credentials(credentials)
+        for system in systems:
+            for cred in system.credentials_harvested:
+                self._journal.append(("system_credential", (system.ip_address, cred.key)))
+        for pivot in pivots:
+            self.add_pivot(pivot)
+        for domain in domains:
+            self.add_domain(domain)
+        for trust in trusts:
+            self.add_trust(trust)
+
     @property
     def system_count(self) -> int:
         """Number of compromised systems"""
@@ -57,77 +127,132 @@ class AttackState:
         """Number of active pivots"""
         return len(self.active_pivots)
 
+    @_locked
     def add_system(self, system: CompromisedSystem) -> bool:
         """
         Add a compromised system to the state.
         Returns True if added (not duplicate), False otherwise.
         """
-        if system not in self.compromised_systems:
-            self.compromised_systems.append(system)
-            return True
-        return False
+        if system.ip_address in self._systems_by_ip:
+            return False
+
+        self._systems_by_ip[system.ip_address] = system
+        self._index_hostname(system)
+        self.compromised_systems.append(system)
+        self._journal.append(("system", system))
+        system._listener = self._mark_dirty
+        return True
+
+    def _index_hostname(self, system: CompromisedSystem) -> None:
+        old_key = self._hostname_keys.get(system.ip_address)
+        new_key = system.hostname.lower()
+        if old_key is not None and old_key != new_key:
+            if self._systems_by_hostname.get(old_key) is system:
+                del self._systems_by_hostname[old_key]
+        self._hostname_keys[system.ip_address] = new_key
+        self._systems_by_hostname.setdefault(new_key, system)
 
-    def add_credential(self, credential: Credential) -> bool:
+    @_locked
+    def add_credential(self, credential: Credential,
+                       system: Optional[CompromisedSystem] = None) -> bool:
         """
         Add a credential to the global list.
+
+        Args:
+            credential: Harvested credential
+            system: System it was harvested from (also recorded there)
+
         Returns True if added (not duplicate), False otherwise.
         """
-        if credential not in self.all_credentials:
+        key = credential.key
+        added = key not in self._credentials
+
+        if added:
+            self._credentials[key] = credential
             self.all_credentials.append(credential)
-            return True
-        return False
+            self._index_credential(credential)
+            self._journal.append(("credential", credential))
+            credential._listener = self._mark_dirty
 
-    def add_credentials(self, credentials: List[Credential]) -> int:
+        if system is not None and system.add_credential(credential):
+            self._journal.append(("system_credential", (system.ip_address, key)))
+
+        return added
+
+    def add_credentials(self, credentials: Iterable[Credential],
+                        system: Optional[CompromisedSystem] = None) -> int:
         """
         Add multiple credentials.
         Returns count of new credentials added.
         """
         added = 0
         for cred in credentials:
-            if self.add_credential(cred):
+            if self.add_credential(cred, system):
                 added += 1
         return added
 
+    @_locked
+    def _mark_dirty(self, obj: Any) -> None:
+        """Listener for in-place changes to a held system or credential"""
+        kind = "system" if isinstance(obj, CompromisedSystem) else "credential"
+        self._dirty[id(obj)] = (kind, obj)
+
+    def _index_credential(self, credential: Credential) -> None:
+        self._credentials_by_privilege.setdefault(
+            credential.privilege_level.lower(), []).append(credential)
+        self._credentials_by_domain.setdefault(
+            credential.domain.lower(), []).append(credential)
+
+    @_locked
     def add_pivot(self, pivot_config: Dict) -> None:
         """Add an active pivot configuration"""
         self.active_pivots.append(pivot_config)
+        self._journal.append(("pivot", pivot_config))
 
+    @_locked
     def add_domain(self, domain: str) -> bool:
         """
         Add a compromised domain.
         Returns True if added (not duplicate), False otherwise.
         """
         domain_lower = domain.lower()
-        if domain_lower not in [d.lower() for d in self.compromised_domains]:
-            self.compromised_domains.append(domain)
-            return True
-        return False
+        if domain_lower in self._domain_keys:
+            return False
+
+        self._domain_keys.add(domain_lower)
+        self.compromised_domains.append(domain)
+        self._journal.append(("domain", domain))
+        return True
 
+    @_locked
     def add_trust(self, trust_info: Dict) -> None:
         """Add a discovered trust relationship"""
         self.trust_relationships.append(trust_info)
+        self._journal.append(("trust", trust_info))
+
+    def has_domain(self, domain: str) -> bool:
+        """Check if a domain is compromised"""
+        return domain.lower() in self._domain_keys
 
     def get_system_by_ip(self, ip: str) -> Optional[CompromisedSystem]:
         """Find a compromised system by IP address"""
-        for system in self.compromised_systems:
-            if system.ip_address == ip:
-                return system
-        return None
+        return self._systems_by_ip.get(ip)
 
     def get_system_by_hostname(self, hostname: str) -> Optional[CompromisedSystem]:
         """Find a compromised system by hostname"""
-        hostname_lower = hostname.lower()
-        for system in self.compromised_systems:
-            if system.hostname.lower() == hostname_lower:
-                return system
-        return None
+        return self._systems_by_hostname.get(hostname.lower())
+
+    def get_credential(self, username: str, domain: str = "") -> Optional[Credential]:
+        """Find a credential by username and domain"""
+        return self._credentials.get((username.lower(), domain.lower()))
 
     def get_credentials_by_privilege(self, privilege: str) -> List[Credential]:
         """Get all credentials with a specific privilege level"""
-        return [
-            c for c in self.all_credentials
-            if c.privilege_level.lower() == privilege.lower()
-        ]
+        return list(self._credentials_by_privilege.get(privilege.lower(), ()))
+
+    def get_credentials_by_domain(self, domain: str) -> List[Credential]:
+        """Get all credentials for a domain ("" for local accounts)"""
+        return list(self._credentials_by_domain.get(domain.lower(), ()))
 
     def get_domain_admin_credentials(self) -> List[Credential]:
         """Get all domain admin credentials"""
@@ -184,6 +309,125 @@ class AttackState:
             current_phase=data.get("current_phase", 0),
         )
 
+    # Incremental snapshots
+
+    @property
+    def journal_position(self) -> int:
+        """Number of journaled changes so far"""
+        return len(self._journal)
+
+    @_locked
+    def snapshot_records(self, since: int = 0) -> Tuple[List[dict], int]:
+        """
+        Serialize changes made after a journal position.
+
+        Always starts with a small "state" record (phase, initial system),
+        followed by one record per journaled change and one per system or
+        credential changed in place since the previous call (e.g.
+        privilege_level set directly). Nothing else is serialized.
+
+        Args:
+            since: Journal position returned by the previous call
+
+        Returns:
+            (records, new position)
+        """
+        records = [{
+            "type": "state",
+            "operation_start": self.operation_start.isoformat(),
+            "current_phase": self.current_phase,
+            "initial_system": self.initial_system.ip_address if self.initial_system else None,
+        }]
+
+        position = len(self._journal)
+        dirty, self._dirty = self._dirty, {}
+        written = set()
+
+        def emit(kind, obj):
+            if id(obj) in written:
+                return
+            written.add(id(obj))
+            data = obj.to_dict(include_credentials=False) if kind == "system" else obj.to_dict()
+            records.append({"type": kind, "data": data})
+
+        for kind, payload in self._journal[since:position]:
+            if kind in ("system", "credential"):
+                emit(kind, payload)
+            elif kind == "system_credential":
+                ip, (username, domain) = payload
+                records.append({"type": kind, "ip": ip, "username": username, "domain": domain})
+            elif kind == "domain":
+                records.append({"type": kind, "name": payload})
+            else:
+                records.append({"type": kind, "data": payload})
+
+        # Changes made without going through add_* never reach the journal
+        for kind, obj in dirty.values():
+            emit(kind, obj)
+
+        return records, position
+
+    @classmethod
+    def from_snapshot(cls, lines: Iterable[str]) -> "AttackState":
+        """
+        Rebuild an AttackState from snapshot lines (JSON per line).
+
+        Later "system" and "credential" records replace earlier ones with
+        the same identity; system/credential links are re-applied at the end.
+        """
+        header: Dict[str, Any] = {}
+        systems: Dict[str, dict] = {}
+        credentials: Dict[Tuple[str, str], dict] = {}
+        links: List[Tuple[str, Tuple[str, str]]] = []
+        pivots: List[Dict] = []
+        domains: List[str] = []
+        trusts: List[Dict] = []
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            kind = record.get("type")
+
+            if kind == "state":
+                header = record
+            elif kind == "system":
+                systems[record["data"].get("ip_address", "")] = record["data"]
+            elif kind == "credential":
+                data = record["data"]
+                credentials[(data.get("username", "").lower(), data.get("domain", "").lower())] = data
+            elif kind == "system_credential":
+                links.append((record["ip"], (record["username"], record["domain"])))
+            elif kind == "pivot":
+                pivots.append(record["data"])
+            elif kind == "domain":
+                domains.append(record["name"])
+            elif kind == "trust":
+                trusts.append(record["data"])
+
+        state = cls.from_dict({
+            "compromised_systems": list(systems.values()),
+            "all_credentials": list(credentials.values()),
+            "active_pivots": pivots,
+            "compromised_domains": domains,
+            "trust_relationships": trusts,
+            "operation_start": header.get("operation_start"),
+            "current_phase": header.get("current_phase", 0),
+        })
+
+        for ip, key in links:
+            system = state.get_system_by_ip(ip)
+            credential = state._credentials.get(key)
+            if system is not None and credential is not None:
+                state.add_credential(credential, system)
+
+        initial_ip = header.get("initial_system")
+        if initial_ip is not None:
+            state.initial_system = state.get_system_by_ip(initial_ip)
+
+        return state
+
     def summary(self) -> str:
         """Generate a text summary of the current state"""
         return f"""
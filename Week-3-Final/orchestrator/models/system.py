@@ -6,14 +6,14 @@ Represents a system that has been compromised during the operation.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Set, Tuple
 from datetime import datetime
 
 from .enums import Platform, PrivilegeLevel
 from .credential import Credential
 
 
-@dataclass
+@dataclass(slots=True)
 class CompromisedSystem:
     """
     Represents a compromised system in the operation.
@@ -30,6 +30,11 @@ class CompromisedSystem:
         access_method: How the system was compromised
         notes: Additional notes about the system
     """
+    # Set by AttackState when the object is added; declared first so it
+    # exists before __init__ assigns the fields below
+    _listener: Optional[Callable[[Any], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     hostname: str
     ip_address: str
     platform: Platform
@@ -40,6 +45,22 @@ class CompromisedSystem:
     compromised_at: datetime = field(default_factory=datetime.now)
     access_method: str = ""
     notes: str = ""
+    _credential_keys: Set[Tuple[str, str]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._credential_keys = {c.key for c in self.credentials_harvested}
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self._listener is not None and name[0] != "_":
+            self._listener(self)
+
+    def _changed(self) -> None:
+        """Report an in-place change to the AttackState holding this system"""
+        if self._listener is not None:
+            self._listener(self)
 
     def __hash__(self):
         """Hash based on IP address"""
@@ -76,7 +97,9 @@ class CompromisedSystem:
         Add a credential to this system's harvested list.
         Returns True if added (not duplicate), False otherwise.
         """
-        if credential not in self.credentials_harvested:
+        key = credential.key
+        if key not in self._credential_keys:
+            self._credential_keys.add(key)
             self.credentials_harvested.append(credential)
             return True
         return False
@@ -85,15 +108,25 @@ class CompromisedSystem:
         """Add a network to the reachable list"""
         if network not in self.reachable_networks:
             self.reachable_networks.append(network)
+            self._changed()
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization"""
+    def to_dict(self, include_credentials: bool = True) -> dict:
+        """
+        Convert to dictionary for serialization.
+
+        Args:
+            include_credentials: Embed harvested credentials (snapshots
+                record them as separate links instead)
+        """
         return {
             "hostname": self.hostname,
             "ip_address": self.ip_address,
             "platform": self.platform.value,
             "privilege_level": self.privilege_level.value,
-            "credentials_harvested": [c.to_dict() for c in self.credentials_harvested],
+            "credentials_harvested": (
+                [c.to_dict() for c in self.credentials_harvested]
+                if include_credentials else []
+            ),
             "pivot_capable": self.pivot_capable,
             "reachable_networks": self.reachable_networks,
             "compromised_at": self.compromised_at.isoformat(),
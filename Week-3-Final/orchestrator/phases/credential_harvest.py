@@ -154,9 +154,7 @@ class CredentialHarvestingPhase(BasePhase):
         self._analyze_credentials(credentials)
 
         # Update state
-        for cred in credentials:
-            self.state.add_credential(cred)
-            system.add_credential(cred)
+        self.state.add_credentials(credentials, system)
 
         return credentials
 